@@ -1,17 +1,17 @@
 
-from PIL import Image, ImageTk
-import pandas as pd
-from openpyxl import Workbook
 from pathlib import Path
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.formatting.rule import ColorScaleRule
-import base64
-from datetime import datetime, timedelta  # Added for filename timestamp
-from openpyxl.utils import get_column_letter
+from datetime import datetime  # Added for filename timestamp
 import glob
 import os
-from io import BytesIO
+import sys
+import multiprocessing
+import threading
+import queue
+from gui_assets import photo_image
+from report_jobs import describe_results
+import timings
+# pandas/openpyxl come in through the reports module, which is only imported when a report
+# runs (or by the background warm-up once the window is up), never before the splash closes
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
@@ -23,45 +23,6 @@ def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
 
-img1 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAFcAAAAgCAMAAABQMRQnAAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAAAklQTFRFy88Myc0MubwPfX8XU1QeNDUiJyclJSUlJyckUlMffoAYt7sQw8cMdngYMzMjJycnJiYmMTIjc3UZw8cNtLgPQ0QfKCgoJiYlRUYhs7cPPD0hPT0itLgQQkMgKCglQ0QgKSkpd3kZuLsPLi8iHh4eExMTIiIiMDAjfH8XJiYkT09PkpKSkZGRkJCQjo6ONzc3HBwcICAgT1AeKCgnFhYWgICA////TU1NHR0dIyMjWFhYPT09Hx8fUVIeNTUiFxcXd3d3+/v7+Pj43Nzc1tbW19fX2NjY1NTUQkJCGBgYf39/KioqISEhLS0tra2tuLi4XFxceXl59fX1RUVFLi4uKysr/f39zMzMNTU1Ghoa9PT0Dg4OFRUVFBQUEhISMDAw7e3t/Pz8bm5uBgYGgoKChYWFg4ODioqKUVFRSUlJjY2NiYmJW1tbcXFxVlZWcnJyJCQkNDQ0iIiI9/f3tLS0e3t7Ozs7/v7+j4+PMjIyQUFBUlJS+fn5DAwMmZmZ5eXlWlpaGxsb5ubm5OTk4eHh6enpGRkZOTk55+fn09PTZGRk1dXVLy8vfX19rKysbW1tODg4R0dHLCwsMTExYGBg8vLynp6e8PDwcHBwCAgIDw8P2tra8fHxh4eHdnZ2enp6eHh4RkZGoqKiCgoKc3Nz4uLilJSUdXV1MzMzZmZm6OjotbW1EBAQi4uL8/Pzzc3NdHR0xsbG0NDQz8/P0tLSX19fNjYiub0PLy8iLzAjd3kYwsYMcnQYMDEiNDQkxMgNtroOU1QfUlMeQeXoUQAAAyFJREFUeJy1ll1IU2EYx5//1O0ctzxHW8lctNRlTdOL9YEVJvYhqUGQBXVRmdGFNxXdRl7VlRBRUWTRF1100wcFKVkZKFihBmkf9OG0dOJq6tK5rdS3c46rQXQ23NYDG3/27vx43ud9zvP+QURgpIEcFGNgKhHwyjyCjDXITPhixRLxSoZuCSzxmBH4MZFKo7FzRRpJ1mowCAYwE7wBIQ7QINqjM6BfKoA+9bswFC+qHOke0e0FpU2pYrnUoBidVe3T/XoHsjCuVlne+LtD4AqBuYgHLJL4AUsHM3rUsFq5TWQsfCGwDQ4f8URh6Iz/CTu6VPpWWPino4G3/qC0AxMO30py9YXh5idj3SudShkEG2beFukz3j2TnrAc3+Zwys+9Dv+/n5NjGhxTWxNsaQML0LIuQNw9XupMPwnJZOOS0LzKMN3LrG2DYTKGTnVN5lrHUoBnekf+UGGXA6vnve/ZoP005TdLrxJu8GFKHIFrcBXKe+5bJH218iueCD/WyDMA0jaAN63q4AjckmZZrXea2z1FOjSVNpWisazjKyNpoRwn1SscgZuXKR9b+8oHFbhdSbe2v3SOzC0/fgzOlp3AOVfU+S4olqgZplrt4RRco6r7ZWc4XhC/FC65Uo2DMdTXak+ptxF77ai6WndxkdhpeidxtVicV1/cH64fInBzJnOBe1vdxhPZu85aPxb9fDG5kXXonNWJve+H33qi5VadD8qCYpzectM0duhzd8WpA3ed1W0fa65GzV2+5/5aWWiSJsUPxrTux4efK113yVmQvUxzoSNKLlmGNgXVo02VDa8GzNn6QOPazYGjxG9d0bj4vPqTElerflvW0cmgOlKb6XX5+Pmkf2N3kzRxLFQeHoskzb9XeJt5N8CC/8JRp7RrZTry8oTkw41JEkfvoGhCbU7yln2/5ZUcc9j0/gqWz5Bg8KlVIjckuc5ZYCnLaUID9qreQyE5q/tNpOs1oIc7AqojOLpI9yQM/5d7PmXEG39fovMoviTuPorxio+SfV8TsC0+vo/Ynf2XSxTfp/jUp+UNGxNiPj7GHpdYehSf+gt8oBsIOSqcTwAAAABJRU5ErkJggg==
-"""
-img2 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAI8AAAAgCAIAAACkS7z/AAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAACI5JREFUeJztm/lzE2UYxzPjjNokm2tz7ObOZrObttHCCNNWizojQqECyiEeiNcA3kcpDraIVRFFaOUq4oFYrAciFahUW+kBLa29r/RIOQadcfzBf8Lvm7eNAUH9AdxF03km3bz77pHn8z7P8303bzShyT9ZntjIzhEKi7i9+9j6RkNHj76rL2X/kv3Yra9vMFRWsYVFfG6ucAEX/GmSmzIzxeISrqmVicaYoVF976DyH+D/Zr0Denge/m9uZV4p5SIRMRmYJvEmL084eNg8fpbpG9IjpKgpfvf/N0t4HqECFiCSN4MEmSTFadF/aKqtM42eYtq7UpBUYaAAFiBSW2fMmxGgwAitSCR48JB5JI5K8btMWbJRYKADRoQWoK171YGga+tU/ub+NevsJSUdpvid/K21d5OU+HIxRzJhTq7Q3ML0DCqcABPuSxharty1+oZ0Y6e1o6e03f3K8/hrozWsqYXJzhY0hWt4KBDFUfVHdbGz2rEz2ljcRk9rB4Z1aL/szAiqqO5IrWl9Kbdho+NEG9MzoLtyI+NyAYuOMZhWafZ+ahkcUZJWZw9BdaDaVPQS/3IJV7yOw+trGxz7vzYD2GUf+/ikw+O6rTtsrCUsBKTvjxkRZ+qnBUaYAWvqG43KpsGObhRS7Ztv242GMM/LLBu2mMNOpxwMSk885bwSnzwa01XstgYC0o03inUNVwEtGJIhSGkIJ0VzN2iNjGs3l9v8fikjQ7z99sDMO/3hcEgUQ5xDLt9qQyhcRjlAae18z+r1Sph7Xi206J1rlL8JSqvM5nJJN9wgoqL0DOj3fMJmZoo8Jz/3ghM1DLRwr1R6wJIzAbapry9oT95FNxL65c+06IQ0wSxxKnqUeliqjhbK/rlf0k6cZLBtZeXS1x1jcVrRMR3UBzyLSgZ345WSGxrVDY7okB5Q5NCe7HHsQiO26QauglN19+uGxs6jBZWBPsPjWoySrknFiMsh+eAoZGlsqASYWmi9U2ZzuyXEE/BAAixe4sHbO2b66xuMvYPEm7vet64t4Wq+M2F79Rr+w4/ZoTEt1N3Hlezyh90F83wPLvOgDwQL9TgcXVnFonFugf/xFe5vakxvb7ZDBx6tM0J57tg1Qau23jgcI6MBN9DcagAwoIL0ePJpZ8Fd/sVLvFA9DccNverQjSqi5fFIshwCJI6TvT4JZQziEGkQohFOnDffd921GUiMixZ7rrkmY0u57dS5tNUv8S6X7HDIgiDZ7bLTKb1SyoEToq3sXTt4YBdOixOG00W/j/TZ/SF79ue07RU27M2MIJQNPzQa5y/wGZj0e5d6EUatPzKonVarfPPNwrRpQRxO1OlIitbFaEGnTZ0aTIdz/QAWwtCmOn7JvV60hCQxkhlaucpV32j44CMWhQ3CZEeFradfX1zCQ+ZBm1QfMbV36W+6KQiQM2cGqr6wfFVtXrjIJwjk+fVHe9kzPxFauNyUKSKmXNOnB63WcH6+f/9B83BMhw4BP+lJwndUV1tnUs8MWi20EnULKQuj+3CNCVnI7ZKRG481GQBs0WKv2y2jw5cHzAg4HLJipctsDi9b7kb/LeV2xAfwIGK2V1i/PGDx+cjj6qrPLfSZxeFvTQCAEAQDQmsnkaC0BbOFpfd5ugf0A1Ey80NPMRTyuKWpU8UHlnmgd1J165K04Hr499ffrn9rk53nSCU7eNiEMQ54mIo98pg7GtO2dZLqsuwht5OXsnME9IFzZ832l77hOPCNGZ137LIh74XD4pGjJvSEjjj6vRFRiOlwMi3gxFQBETnj1kDjCVK0OuJTdRyenS2APWIXLHe+Z4PoUMNXEyqiRVXGxk12lJYNG+15eYLPK2VNCTa1GOBBZELMmp8vdMJxbZ3MyCnti6udTh6T6BAQQtpBC6AbKhZqDOIPJBBezzzv6hvSo3FzmT0okDncBK0KghP5dk8lOzvfb7GEH3nUjTNTnflDkwFHIYXecouAyvfkUy5cLkXrD1qbttigEeBNr0dCNsOg5nmiGqDi4GtUDqhEA0NooXN7FwMw0Iegiz45ucKCe3xyWFyxyg0vw93oX3CXD45G3Mya5YcsRPAJAYRR6IM9hNa2nSSUQQvgwQ9XRCSVb7Of+Tlt63Yyblaucr/+pgMV1MqGkWYxQ0/RmqAFDV221SZJoawpYlaWCKEBMTZvnq98m416HzkKec/llNas5dGZTmZBEcMfkREUJIQRgmzp/V6AxDmh7GvrjACGRAcSWVnBp591TZsezMgIQfGfPpdWsdsmh0NogViHsnhouQcF7NbbAsdPGmpqTQsXeXEUcmB6euiFF50qKVqElhqGDC0YLe0Miha1kx1kwQHCCFFCJRla4EqEQkKh4RCUqO4+/aEa8+dfWb6rN0EO0L10hovTom59tt+CiRTQYt4Nw9QKffBK39JAxCu20a2tg0HP/mFd3TEj5AaKGd7SWbPC1h9/8lTfYFB8tQxIAEPyl1uQ4GgEP7qLEk3ASBgdav3xCRbwJO+iAUErGRV1yWfAK7YTDy+64o9N6V5aunA2CFF6oOKxhY/ZQ5/q7tlnVvAbE/gLkXT3Qu/sfN+cub78SZsTt7kFPrRjL/qg56W8Rh/rXXRv8q4L/P5P3irOKUELjD751KIpLOKjY4p+v9WrbzxuaGg2NNDXZIu3YK9KvKYgrWiMKVzDazCxaGphehX9igtp569NcX8piwppsLmFyc0VyCqatcXc+FmmXbklJYm0cylT3GUKWlsnWUWzbr1jYj1hJBKsPmQeTa1QU5+ByMg4U51YoTa5+jOQWv2pKrv46k/y7/yV1bSGpVZWKwWJGqabYFE9ubKarn4/71cLkYi4vpRrTv1qQTmDz+H54RhzvJUpLuEyM//0q4ULfnmSkxMoLOIqq1hMnK+K1az/GUNIwed797Hwf3bORX4R9DsXAKekKoEoXgAAAABJRU5ErkJggg==
-"""
-img3 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAI8AAAAgCAIAAACkS7z/AAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAADEhJREFUeJztm/lzVFUWx/PDTNWkO73v3UnvWxYlrhABFVCHTYQAVo1LTc0oWjqKGpZRNpFNhsUVcBmVVSIgMYgGCIYkJBAC2VcSIC41NX/HfG7f5NF0ggPpYFJlUqc6r+97795zzves971OCfX9RSK9B2PH+QsW23fuMZWe0tbWp11oHKXfiM7VpZWWaXfvMxUsduTl+RNw4S8lfig7O7hsub28WtPWpWntTGtoGX4Bfm/U0JyG5tF/RbVm5Wp7Tk4wHrAU5cuECf7DRwzdPZrG1jRcStKwc/97I0XzuApYgMiEicLJwuEYWvIfQyUn9J2XNDUXRkEaEQQKYAEiJSd0Eyb6JGACrZycwOFiQ0cMqmHncpTiSQIGOmAk0AK0FW/acLqz54efuZui8w0iLY/YSABvEEwmOU9NnQiJbyyzi0g4Ls9fUaWpbxm82FJr0PXGk+d4wEWb2tQXr6g6ulWDuB1hz9VpJHu3gsm6JnxCdfGyqrFVneTMMoeVV2nGjvWnFCxxUIEkAxVa6+oRnMFi4vgVFQqtbx56qJrb1YeKDMtW2jdvtaLr+KVv5PbWTnV3j+CtK0ZoFm4ZTx4zZoAZItj6jTaKum9L9I1tQwBY20UNbVXKzr3Glo5BonW+XkByqEi/aIljxSr76bOa+uZemWHxm6P6JUsdy1bYyyq1cnyo0AIeFL3yTbtKlXnHHYEztax7o4qWZvT5LlPBIie8vbFc0IaNtuKj+pYONYpOkk9uxxUqz2gIXEZD9L0PLe3d6iTDNbeDER1wSukp3aDDYG2d8PcNG62atKjXGz7+g046PrPB4rsfWAz6aLorXHRE35S0fSWg1XlZtXa9zeGI0HjcFFrwBs/Pv+BSp2Y6HRGjMYpOnc4IbczCV5yglSRgEi0MFzNCJ9s/Nrd1JYsWxJwglSImupkwkoAWaWPLOxa3O5ybGzxRdhUtWIRRvy9Mf3fku1uC1pp1Nqs1ct99N40WPL+2yOlyRcbkBqZM8T38iDc3N+D1hW3WyFtr7W0Xk1KugtaYMYGMjPC2j4YGLcl5SlL3x9DavNXicoVvuy14rFRX16QmZFNeNneoP9hu9rjDmZlBgoyCltJ0S1AVFSeUKgkVSnz5FysQEtGSqSK+WLhe7SPRerXAaTJFJ0/xVddoGPz+hH7yFC9STJrkk6so9yYwKc5eK0j8zPJKTKeieujRgoYSrepzmss/pTLS3qX6+b+pn+00JaAl0vtFdUunSA+MtHerZNgRea5VTZ1CjJJegnmCB8SBUrBg9XIGlu64dBUt1uVUZ9/tkjcO+AolFCDxaE15yFdzQXSZ3T2pb66x4Vs4GSmnuV3Mz70sRzJTmIcZeG5oVTM5K2KRCgycbe9St8RG2mIcjly00tPDWVnB15fb122wvrXO9tZa29ubrM8scPl8Aq1v+tCikPtit+lvz6Q/Ntv9lycySDzYL5KjBWqnVatt3H76jIaLT5ZrmQQiWFO/HT6ipxYgtKKRd96zvLbIAXgSLToQOPnyKyMlw9oNtlOiohFzlldp4YQlZJwcEK2HH/G1dAgAqA8XPO+y2yP33OsHv1OntYC3boMNTpj52edcRDbYqKjSLl9pnzvfPSffQ+Y78LWBQYkEV76/zfL0X9OnTvM++VQGrN55ZyAjfeShtWmrBSOi00Za1CfJYongcMFQKBoVaOE6yLP0dQcCWMxR8py4zBKZ97gbz8CKqZ1MxqjfFyo5oePrvkIDmR/a86Wx55fU9RutqtTMKQ95URYH02d4GARLgdY4f12zevc+E3lIr4+uXmPDs1EiyKX+KQu1JnQ8CloWSzQvL7Bxs/Xd9y2vvObMygqx3JNPZ2AHe/cbbbZoKBx6e6PN4xGi4aBEy/Hj/RZzhNoE64TbSDi04xMzJsgS2AryIhqVBdqg/IlGQxyPSLTSwzCH4ohLkhDsrrsCwaBA63CxHhXgVe6MMN728kIndQe6pgBBPAD48T+pH243c+r224PHTuqYs/CggSINwrSv/Jy6aYsVrWVnB5lh1mMerBhvkGixVlWNBp974skMzAVEUQ0WMH68D53u2mcCvHhlSbSAx2GPAAMqBmaU63SGI9HQga+N9AYsijhEC1h64EEfTox35s9zm83Riff7ifCwN3uOG3SR8ex5zdESPVPB4dx57uKjhu+P659d4AoEQr4RiJaSt747rpeaQn0EN9xF5i3i2OWfVAtfdYLNg7E0ju13dKufejqdkTn5bpxp2w4zSIAfaBGa8C35jGBfoUDrX5sFWpgqMRDhG1rU8XlLovXFbjMKQumffm6mnTKZIjNnevp3zfFo4U+wDd19d2D+425Awkua29T7DxgxFMCePcdTW68hoZ4o02IrjGzcZL30o9gKKDxkkAgVHjRu+9iMBrKyRZ0FJ2RW4rCwLXcvWkO1Vz6UaJ0s1xEWpII6LokKXqJFv9XVo3rxJZfZFJ3xqAhN5AbQemmh02yMzpjpIS1zMWiJwvKkDkfcEbsXlfWitcUaWyJARmlspebU9K8JGZ87z0Okmp3veXSWx2yO0FoAfO21ZaESCWFm0mTfsVJ9aZmOtESgpkYgj/IJACCBcYA62ueu747p0D4hTvZPLFdSqsP5wGPXXtP2j8wuZyTntuAPFVrMFEcsq9Qhi4IWc8rSY0SghdERxOi3sHpZYWNfMOr1iOqDSHj559Q16212WwTvQQXchfwTJvpIXX9/Jv3KL6nvbzOjnczM0NESHUgQ1miriaIKWjgN/SZuhC7O1fWiZbNFCLmgBTOtnSq6fSYh/KKm+8b7T5/R9t/0uoqWOfrQwz5Znda39FbnsV0DgZZ8QvHVISNnL4i9cE1ent/hCMNYbaxQXPqGA8fiMsyL+OnzCXRx2TqKplY1RZaIhD6BFqyS3qD6lmQBG4q8tcVit4ukktAdf7jDjMYj4WDRt3rAK6vQTpjot1qi4Jc/N+OuuwOkGVIFOYAk9MlnJiwXCadN98x81IMiUDpfSfigRS1gswnforzGeCVa5C3CHclS6Y5xr3nzPV6vCGKLlzqJltfrt1ArJQm+BQwXGq92VBItImHAH/L7QxxIhyN00zg7YvUFXdqMmV6QwH0xtaZ2YaBTp3kwHW65/wEf0d7lDPv9YS7++N9mHC49PeJwRvYfNDBbMrsEyaJFDqekRrP33BMojfmWRAt4dnxqjkZCOAQ1RUOsJvz+uC5/rpv4hu2DxIOTvF/sNkoBAGD+4xmymiJ4rn/bii1jAYUHjPRwW9+zBIIhinVClkSrI7bjhTlPnuyTaKHT9m5acuHoY24PUluyYv9sIXbFulRL/ulgrekzvEwVn9skWvgKoQLioKWvqcIQ6QcQE5wwJoLEC/9wSbA5RWCcNt2LaIQTYuALL7ruvdePd5JEidvUPnQLdCNSP4NHK8nsh5qYgQBFcYHYsteRBFvVsXF5mdzqxfwRDJslmcneU2k8Ufcnn5kpDssqtYwDDMTksX0KDX1Y1VmNsq4cxNWqajSKojERahmDIYrJ/8oGEveiwcozWsnbAFZYn6asHj+Oh7Hc18WG/QeNJGnafCmX7O65oPhbA6KVnxb8cyXsIRSWKmNsUk9PmmI7T6Vl2mTelsGukVzu03AcT/Hj8QGnMZbPZT0SvxfAV1TcLko+8VV2zdLw+ZTZO0HpymBt7GkAzp2bGyAcFR666hPXA6z/hAlnldXjUeQWOGdyqfr4TSk+m2KnpAMp/EvRktksFuvKXd3P9xgG98QEbrDN2fnuP0/1kGwGpKnTPXSyxIGXX3EqqknYIUxgSzmV8LRpwIdPymAsvoki849/yJo1y3Mjj5R+/WnW9c7K8evxH39qSJ6WKWoBo117jSkFix1tFwf7fKsh7VSllvKhTH4OSJVa0mxltXZI+P51okpc8Fw6bZPYwbsFD6yHi2JVm6ZgiSNl7Fh/eZVI3YMDjIBwI/TbvJpIXlGeAg+7iocQKsJgRZVoIcRbNK8vs3f3aGr6Fbs3QtLf/y/9ZoLdotdAhpHOnhdv0axYZet9nzAnJ1BUbOgcfUNt5BGIdHRripQ31Pre/vSNvv05omjgtz/Fv2vfrJY5bPTN6uECqa85EwGwqO/Navn2+zW/WqA/X7XaXjH6q4XhI3SO5tu7NJXVmmXL7dnZ/X61kPDLk3HjfAWL7bv3mWic+++zjdKtI1wKne/cY0L/Y8cN8Iug/wHCFdBX1sFQkgAAAABJRU5ErkJggg==
-"""
-img4 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAI8AAAAgCAIAAACkS7z/AAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAACmhJREFUeJztm/lXVOcZx/mtYYY7C8MszMbsA0Ks2lhBpTnHxphGk1aNu+bkNLUuSU2CmhrEJXGp0bigpsdEXDAaNcZ9oRIXFAVl3xdRj9r1z+jnzjtMYRxMjnrBNHDeM9x733vf+7zP91m+zzvvxPk7/4LB8MGwTE/OIsuefYbiS5qb1QmVtf2tl9qNqoTii5rC/YacRclZWZ4oXPiL63opPd2Xu9Ry+ZrU1C41tibUNPT9BH5qraY+Ac2j/5Jr0rKVlowMX1fA4iInI0d6jp7U37or1TYm4FKi9bn0P7UW0TyuAhYgMjJbdrJAIISW+Melc+d1rR1SeWU/SM9EAwWwAJFz57Ujs90CMBmtjAzv0RP6lhBUfS5lf+vaBGCgA0YyWoCWt8KM05VV9IE0N6vk1FpR0/d6eWblL6+SQ+JHuRY5EmZmeUpKpeoGBQMgIzMlEY7FQaSr5Zaq7Y6qrknda4DxohtPT8W9IL/IYZdLpWHDPHE5i5NhIApBxRxoDS3q1g5VU5u6sVXdelvFKV1VdbLKNmw05i6zHDmmr2/uDcB4RW2juv2OioYKnuSNnfKbekF+0Glqkyir4vZ8ldjQoghaSF9dn8A0DhzSL8m1zJtvnTvPtmSp5eARPdeZ7fWb0uBBXpUqDaradlvF5HsBqjNF2g+XWJDn/AVtTcNjqlhMrdfkBx0wogKOK76kVSIMivkwgbdn27zeQHJyMDExlWaxBF2uAPbY1KYqLZcoG+hatdaM8ymNVshC1V8UJCUlBRFj/8FEfP3xJh5Bq9fkJxKAVJwsbt3Th6oyFCsmT3EIeKjyJkx0vjHZMXiI12QM5m9LIuJfLZOGD/eYTMFP1vQSWsCzu9BAuk5L8x86QlB5UrR6Wf44hcZtblevW2+yWoMeT2DMKyknzuiq69WhQKRbtsJSXiFhLDFny7MV1WGNRKlS7qr534HgLOKK4A7i/shtMdHatdfg8ci1y8FvwmhF8booKhShJFFvj4mW0ksKiqBFA5ux41LstuCQX3iLvtM231ILxgF9Ihz1NFuuo9CGVjXuXtesBvKIEmW20qquDzEU7iEdNsPHbquwALpqGtUc46+C1MTM+T2hFcXrmttlDkIXp4QHBKMhLWLXNqkxspjyMwglEOPTlKMbTx8tkcyLL2kGDvQRBue/a2Umkbo7YqQx0ULL5NK3fm8H6WnTHVs/NzIUKgulWXXh/sRZb9pfHZvy9h9sOOuGTca85eaTZ3Uo6FyxdvlKy4ZNJkbYdyDxvQ+svLGqe4SPQuvrw4nAX17Rjdchw8Ytxo/yLIUHEjktq5BW/8X88SrzleuabX81Tprs/N34lHUbTAjfVX5ugOvKSXGnAfnrW5QCTBG0sNPjp3Tp6T4y8OpYGTimbQJMbp7Fbg9wxeMOmM1BHl/4YTJOhuJ2FBi8Xj85z+EIWJODDO52BwyG1E35prsP4nfsNHA88Oc+Xmc0yg4te8YjfQu0GtvUMJ0wr1thab+rkkUa4XnuZwPmvWPj9HKphkiOSONec9lsQbMpSLTABDduNrV0yCwJ+XkdMR/vXLg4mTv9Pv/ZIl1tkyIls1JonToro8XE0EIUWiIkdkVr5SrzvX/E79xtsDsCwaB/yzYjvcuWW1Cryx04dERfUZswLNNjswZH/dq97+tEHGviG056fb4AJn/nfnzBnhB3GOCH0YwZ41r/melhwXpCK8zr1pjROCKNftltNqW+n2PltKRUM3iwz+fzYyhr1pm/LEjKzPRazMHZc+wCrawsD7l5wQfW6TMcUM3nn/cBpHKpSxG0SFrwPWpvtIBaw8m8cy1DBKgotO7/K37OXJtenzplqoPrm7cmEXNsdtmusdzjp3VuVwBs9u5PJD+Rz8iFaWm+lJQA0RK0QBq0nM7AzFkO7Lqx7fvzVgStsH+vDqP10mh3kiGVWNqJlhebmzPP1nFP1dSunjzVSR2CqMjAs8wR5+PVyDloUGi59bZaIagUQasyXNmomBLegGHiK0SV8FpGh6yRsu6c8OPV5jsP4mfMdIDu0F96oftMfvTLrpWfmA8fldMJYGDdqPjbEzpOCXEXr2gwZOCJoOX1BHx+P6U3b4m5PP1otAihwINgI7M9xqROtK5pwIDA++lnJtgHI0yaEo0WAZnRUlP9DLt1u5ExlaPySqFFMDxdpMvI8KY4AxQ389+xfVFgQFOr15qyf+XO356Ei+B/I0Z4yE+g8uDf8UtyLdYQutNn2s+e1166qiGTCfp39IQOdYDN3Pk2ank0AhfwevxoKoIWqY5IePKMTrDEmFLh5QW7w2gdOBRCq7Pm4+1//89zm/ON9FqtgQXvh9HCt8hV8BcyK4OAFgkyghbPIv+ixcl5KyxJSalDhnjPX9DWKbYKpRSDlw25TfYJAAMD8jNRy+32W21BSUp77fUUMLh2Q7ZNg0FGq+NePLyO2pmbXxjq+e14J4HuzbfsNaGvRiHo4yc4jcZU4Bn1kmvc6ykul2zL4Je/XUbry10GzMIf8MNuelpjpYzjLUQ8PH7AAB/RFRnghFgMrvzCUO+0GY5gQAYS8P70XhitgQPlRLV+YxitiZOcWm3q7D+G0crM9OBqsMS6pgRyGEBOmeqsbfxR+VZXwE4XaefNt2UN96B92qBBvqnTnDiZyFujRrnhBWs/leNMbUPCN8f0r/zG5fP6gZbQN2Wao7xSYijcpahYC2B4GKgQKnMWWuEdUJLPdxhv34vfXWhIH+AfPMQHoY+JliiejhzXZ2e78ZUXX3TfqJJEcUYMRAaHPQjhJD/NnmMj9C3+czKkHOKemeUhX27KNyIh48yY5QDadxdYm0JRVMgPQ7n/z/hNW4xEkWCqP3+b8bHXtL4HLUVrbxESEf36DenUOR2GT74RBbK4gQlfuS4BCarE9qlUOIBPklTO/k1LbhOURPBMbJauA4f1JH/GJJBevS4J2sKnfFomVfQwHSSBthFmYSvUACQYnEN0MfLhb/XQSOpljhkKlyKBySLVJJSG3yIJSbAwICy7GT6NyF8ZWmkLnWoQo+ppL+ZVhorOuOKLGkV3y4hyGE9CEQR0sewdMRGuRyAROhXqw+T5jBqnsibcJX/ZUd3tWT45ru5hIvSiUPzbbpdjIEUFowmyI0YmJBLoIusXXUWKklCc8vlDep+i0VeLVd1d+/QKfWMSpetIe/h6TIBj554uXVHPxhyqsrMSx+rJT0AF5ZswMeXVsS6YOmVT+J7ua4OPHvYRvT3J8ORogdHerxLjchYlN7UpjlafN5QoQiVR7rvLmoslmgslGo77XLAf0uSKqF3KWZwcByu7XCpXP//3gDFH0eAsov0oNkyKMFhSKq+byLtoKDVu3ZXKFf56ps9b12isUMhSopVVyLto8pabw/sJKYmOndC39u9Qe/YaiLTcko5Fdqh17v509+/+fKZa7N2f8r/uO6tFDuvfWd1XIIlGcQkWxzp3Vovd791+tZCR4Vu+0lLS/6uFvmvoHM03t0tXrkm5Sy3p6Q/9aiHqlyeZme6cRZbC/QYKZ6V3hvS3rg2XQud79hnQ/7DMGL8I+i92NjNZWa9Y3QAAAABJRU5ErkJggg==
-"""
-img5 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAI8AAAAgCAIAAACkS7z/AAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAAC1ZJREFUeJztm/d3VMcVx/WTz5FWu9pepe1FQqI6WJItqjHFJSFASGIbJwEnMcmxASESW4AAY9E7JvReTDGiYzoCCURRQ12iOMlfks/sSM+LCqCwWDKWzj2rt6/MfOd+537vnffexgRa/kKh5o30DG92jnXnHsOFK5rbZfF3K3rsR7JbpfEXLmt27zNk59gyM72teOEvJnJXaqo/d7b1arG6plFdXR9fXtX1A/i5Wfm9eDyP/wuL1XPnW9PS/JGExShfsrK8R0/omh6pK6rjCSlpXY7+52aK5wkVuICRrEEiyILBMFvyH7vOntfW31eX3O0hqVsYLMAFjJw9n5A1yCMJE2ylpfmOHtfVhanqcpQ9FmmSMNiBI8EWpM2ZZyHobt7penBPsDvlIgljXY6kXZPYABn1lktKhSR+kWsVSpiR6S0sUpdVRVMAFc8qRuPPMxKuraxRNTyIq7sfV1rZ6cvp/VapOhJPdN0KJIABD5BRJ0zmsKtF6vR0b0z2LBsVSHSpAnTjo7iGh3GNYWMYNQ2qsnudnhA0JY0Gj57QzsmzLFpiRhzwzrM7hTOr61VNEXjq7ze79fk9SwuAAdKiJZa586zHTmlfEGE1DWqWVTE79+qr6qLG1p0y4dkjBdqcf9i+mG3NnWP9PNc6b4Fl8zbDtRvq2kaVHOGzs36vVnVLaHccPGk0ycGgn3aYa51qZPsuQ/ZMG2CAhC1aajl+SltVp+oU6x21DxggkVS0mpTFyyxAvR1tuYYdOGIFHHPhSkIUZRCgwM1fYk7QJNtsIYMhWa9LNhmT3e7ga695v/zKgoOElD3NR9LL+PTIMR1LEGhescqUlBQcMMB3/WYn2GJc4PnrVIcqNsVuD+n1yTqdAMai5dNp9rsVnQvTjtgCEsCcSaEVq811TdFnC6MXmIoRPHU+EzyBLeAuX2WCnl6p/qFDPW+N9Awb5sE7OAs3Tfmzo7L6KVoBJEIKnnr18vt8gd379A//E7d0udluD/br12m2wDNjpj3REezd2z98uGfkSPerr/qAZzaH5uRZkejnmakKWwBz2EPLV70otuRYYqLcomRrpckR9s7ZC9rScBlacFL763FOjyfocIRWrzXVNDb7SKk+lFWhrAIqa0Vg4QIW8wcO6R7A1oof2CIF0marYqHdilGyNT3bbjKGMl/3IlnsvHg14d33XCB8I8tbckeEl3JtZDXEhkJk23sFypmAKSz+MdjCXixbBK/Mukxh/MvUtttCI95y3w1LUFiOVffqRDKjECCeUDxKkopqwSV7wv5S0wL7aVOyhcdprf6BKBbwlOyX1vha36ZijGTr9Te8xbdEZdj0PVptsZhDvfv4YY5+OYdr6Y5tAbglaGob48qrRHqjR6BGEin3hPO/wP8ysHX+ckJFWPdYzOGOBQstdlsQfTt5Rst+eNp7QD/po8R33nVN/thRcEK7co2Jwu/EGS1UnTmX8GW+OX+x+dzFBAq5ZSsEW336+mH94BEdJcPCfPOVIg2E4U1oWJhvwW7cVisUtmKLSKqoFqX2g3/HTv27w2IJkUo5/1qxZv5CcS2QDhfo/jQlkQkBgMJiTe5c6/gJzl+NdX0y1XHwiF4hDEY3bTVO+kPi6DHuDz5MWvu1qf8An/2lYUvESoNqw0YjCYNVHkVa06PYjVsMfl/AbAohjzBBWeXxBChMVq01Pfpv7KatBlILLtizn7wVK5WwTx//rbL4Q9/qXM6gVptMgVdVr8KzCxeZY2NT0LdWKU2yNS3bTlO/GOhbvMy8ep1pxkwbAkvLE3/rrGuMY23ANgkyf7HF5w243EFaOHcpYdBgj8kkACQmBkHl9wfWrDMJMahVzVtgJREaw9UTtY/VGkpODrCxfOXLwVZpPLlqzTqj0xlk2Lv2GnBrRoYXnoYM8WzbYThxWvu795NwGUfX/8sIPdt2GvyBAF7Y980PbCE4THlC7eO/iOAYPNgjb2wOGeqhx607DGhXZPZqZmuG3WYVdSB+p0eKHTigZcKFUDt2Uku4p6T4cTcN5s23on4fTkqCIRBu2W4klEm6XNJ/gFg/XLicwPmcPOE3zuOndGfPaT/5mwPYDO2nzdZ3FxNKK1XSoSSkyVMSyVupqf7LhZpvj2sZIcGEpJBIUH+SHF5gzOs2CLZwvdcrbmW2ZYs09s1hHYdw/cYtRopGQmfUKHc7eCLYSkkJpPX2g6p/f9/48c79h/QIGpOJcoZ+IXLsOBdpEpxXrmvoCHryFljvfy9S2tHjWsgGG2AAnJhIa0LPaZzgRk4JesBIJaRyeUF3xl8sW0UlGhSPPZCxZr2RETKk8ROSGh7GidDxi0jC72gL114t0pD2n8oWNSGJCkX6YFIS2WjMGDcCaDSGKBxqmddtKjephGgaNeHp77SUFcQHCUzWCHJVJ2ZJUnDzViMnSxlEKqFkwyYjM4Puzl9KYJLBKBq+cbORUfCVhMrlsuhlBihVhiyXfkpsMbDUNP+CrywUDhQXv38/iXQFE6HkAFkH/cFHySliz+QpDuoCZuj6jcZAONoUthBGZrTCFjMAp8DW3XANuWOP3u0RfLtcwYEDqRU1ZW0enypVBtmRKkOu5OhOplJlDc408nmDO3cb7oXrCLyfleUlHCdOdJbcVZNxKWqAyhBOn9MeKdAxjchYn02z0xSdks9CwYAznLdQ6c3bDNQdkcVOt2Zrabh+w49wxga1MkpFtiAy4ABixIqqRoXum4zJXk9w+Jvu937pcrsDXm8Qp6z9WrC1ZbvB5QpAGHUjX5csN1ssVBnN6y18ioiNm+CUeX7adLuyhmsntmbY9bpQRqao4OXKQR5V2AoF/ZQt23camASCnnrVV4ssNhtJLjhsuIeS1esLGA0hlFwEU2U8aBkROwcP8Qwf4XbYgyBnpNRH12+omT1WS+jAIb0M327NFnmeeELB+vbz9+2L+QYM8I0c6c7OsSMdUNXybFR1qVBDVUa2Z3h8fjrNjkMJJvSHInvHbgNqQwsMm6+06fMHOEHey7gV7oiqEqpQLVIIQdMuW5w26582yBj+pkfW95HLJrzPggGEqb1E7VNd39wIUrloiSU9w8tsAB5dUPTfvKMOH1KRj6GQMYpbNin+z6bbkVmfP7hmvYkLx7ztHjHCjXhWPO2uTafZino+lPfai0rUTGTF2E+ulvlJqEdLcOAsHL3/oB7mmIlFN9XMTZiQ9xcgBqO18H1ucagoLIOSBoJp5iybXh/66I9JQsE6GAjX4mVyFZDaPYELmzt6vJYj14L8yDHdgcN6sh3zTMKWyGn22EkdM+nKNQ0c0zhdAFIsIcLTMcpUhSUh5sJlTXTflmH+4p1Wz7fYI/njqLTIpyHwVF4ttnEHYOT9CD7ZbvVVJgPpr4tXReXGxCexKTHREWHKte3PsIiOFKNBLmGGAU+6PjIo+awMH0Ik5JmyBfkM5fnv7rdGIu/qbt+ji9YTExDDx9hxzlGjXWPedo1usTGPG3uo4s6cT1BcoNxza/XMqaOvMhtlz7K98kovasJnyedPfprV0dFW8Noe7Qh5dE0+Mdm1Vx+TnWOraYje863yeJSB5dRl+dmRXYvCm4oL8y2skfcd0Fc9MbBeAgvLvprZGZOe7r1aJNQ2WgMmYp7F/o8H9q0M9SMXRj2TdzeTMlhYpM7M9Iq3aD7PtTY9UpdE6X6JkpCebFEZxgt6caVb2c074i2aOXmW5vcJ09J8Bcd19T1vqHU/g5G6JnWB8oZay9ufnp63P7uVtf/2p/j3+JvVMof1vFndVSTdbl6uCQEsaHmzWr79/tivFlix5823Fvb8aqHrDJ/j+dpG9bVide5sa2pqm18ttPrlSUaGJzvHunufgYVzt3039qU0Qgqf79xjwP/pGe38Iuh/ccD2NLuF6BkAAAAASUVORK5CYII=
-"""
-img6 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAI8AAAAgCAIAAACkS7z/AAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAABxlJREFUeJztm/lTU1cUx/OTM+TlhazkhYTsmxId3AooTO10UxahWrVOO2OtRdS2Totgkc0NtUOpWpTacWpRdGrVEsEdlH2VHQJhU0anM/07+n25GCPrjK3NS03mDHm53Pfm3vvJOed7Xu7jmZ+9rNaJg8goQ1o6U1IqraoRPuwSdPQE7D+ytk5BVbXwwiVpWroyOtowiQtePO+m8HBTVjZT20QPjNDOIUF3v+8n8LpZd58AK4/1r2uicw8wdrvJGxjP8yEmxlBWIR4dp3ucArgUMZ+P/nUzz8rDVcACRGJiWSezWNy0yBua7lSKhsbo1o4AJE4YKIAFiNypDI6J1RNgLC273VhWLna5Ufl8lAHzNgIMdMCIpQVoOfsVcLqWdt8P7hUZvqdI4H4aM1o72ZC4L4thI2FUtKGuke7q5+hk2rvZhYbN1I6DOa/gHKJGHvMHhimfT+cljOSw2kY6MtLAS8tQQoFwFlXvADUyzh9+xO/sndL+mD/8mN/VN8cVup3Ur+el+7KZM2dl3hfxIwOdgWEaZRWv5KKk38VFWu1dLJJrDtGeDGVOHtPQQnf1UVh9WM8Adf2mKGOvMiuHqa4XkvaZ5ukcprZ+pp43b0FiknZ2tJw1zAKMUAHzqmqCuRkGH3YiwfKPfhdCC2w6neXeg+AeJ0sFQx0cpU4UycUim1plcVSIAHU2WkPUri9Ucrlt02aNn9KCIRiCFI/lxMn4AFquUX7hcblGY4mIMFVWP6c1MEIV/ywz6C0oHituzU1rx06VRGLbsMmPaZG58Hw+iNlpff+DXKWyLFxoulsV3NlLQdFCu/a5qKJimVZjmT/fVH7zOS1PRU+gzkSL/Nfzl3SbU61wwfyGVlMb/ehJEFoGR/hP/wr6pUQ6iRYBA+EHKYEWdJuJVr+LQjJD8oOPsv7aw+Y29iLcSwf+R0uttixYYMrMZvKPhhzMVxw8rDhWELItRaXXs7Suu2m58zBVekn6+XbV2iTtR5vDCk/IwYbI9wlaGzWkJXc/s+VT9eVr4lPFsnXrNAlrtSmpqht3RH2DFAfztz/RKvhBHhZmQRnPMNaQkAmTy61wOJPZbLOZQQv+AWC5Bxj0lMlsoMgo2G67vlShHRQ9tJCrQWvVW3qpxAZ/VSqtoaFW0jkiwnjrrqh3kNMe5g+01BZQiYoyrFgxYStXGpYuNZpMLK2yCjGk4+WrEuhGk9FcUBgCBzp8RIHKH/Lk7DnZ2BM+XMebVkKCTqtjFcqhfMVVhzhvPxNuN+HbkLpDBUfksntxnZYnb926J8I6Ins1ttJY9JOn5CRvgRZ4fLNHCR7JydrGFvpkkXz9Bg3iJ/wm/Vvl+J9Bk2klaqVSKxwOiRDZa3Scvy1FDfd6c5W+tYMm0dLn0/dvWvdrg5FXyM0I1xir4AktB/srDx9Lr2SscLjwcBPi4dvv6LNzmctXJC3tNNwldedkWmKxLSNTCadsaBHidFTfUqltZYyh+WGA1j+jBS9ZtIitt7r7KXJ/FhLu9BmZTsuqj7Jy8aOnQYeOKOBJRoN53XoNtP79WmGbu7j2aELA8NCKT9AqFFaIEdQD0JDo/O57OsBOSub6zQ6u0yoolDOMBR4zqTo+9ZNMrbJYLSbHDTF4VNcL4RlY8cWLjYlJWvjcRrdeZ9EOUdtTVcHBtvUfTtBaE6dDkkM6jI3Vb9mqXrbMiEvBik7LA3nr5WmhZjr+oxzab/kbxqoaL1rD1JmzMpvVvGSJseK2CD4H7XfjtigxUQv1qNVaIECSP9DWNwsROaEJv9odCgf9+JMwQisuXgs1GBevi4kxQFwYjeZly43HChTk+j6f+Gy0uPxVwlq3dQgammlohxfWsZd1moYWGgbBjW7krjycCWLktyuS25UiHHvCGrIXyDW30Tju6hUkrmXz1t5MJRLh73+IEUuRrgZH2NO5e5O+133nqapayOXdMlg+DG9qOplo9xo5wUkKLPz17ozTPRcBM6gMKMDdX4eiJzkLUhBSE8xw4PMpTzVw6iJ3dc+Virn5i4k3hmkD1LTt3nf/JrWDFgoAREi93owiGuUwsL2/Wrd6jW51nC4+UYeqGRUYB1MX+cXk/EUJLy1dOTDMaVr/ooFZTb3wYL4iJVVdVCxHIH1QJ6wmVi98UCuEh3EwGLqFFZ2WoeRFRhpqG9l68zUBBikBSeka48OHup3sR2/joIInYbCukY6ONrC7aDKzmNFxunXK3of/pZFQSTbVkFjqbT4f3lRraWd30eTkKSb2E9rtRke5eCiwQ417BiKuUdrh2aH2bPenPrD7k1M2/e5P9u3FndUkhwV2VvsKErEeJxsAHc92VpPd7y88tWC3m/IOMHWBpxZ8Z1hzrPzgCF3fRGdlM+HhU55amPTkSVSUPi2duXBJisJ56rbLgL06g0thzUtKpVj/yKhpngj6G0TX/mpQES4aAAAAAElFTkSuQmCC
-"""
-img7 = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAI8AAAAgCAIAAACkS7z/AAAAAXNSR0IB2cksfwAAAAlwSFlzAAALEwAACxMBAJqcGAAACDRJREFUeJztm/lTE2cYx/OTU7PZnIRs2ITc2SB41I4CCtVqD4TWC6vW/qDVcVTU1qGoGESZekynM04dq+N0rKJ4tla88EI5LCiQgyvhCCid6bQznf4V/b55IQZImeoPZmcM80zYfffdZPf57PN9n+fNG4lj5E8Qhjcys6zFJVxllaa2Xt7ml3k7EvaarNUnq62Tn7ugKS7RZ2dbx3DBnyS6KT3d7i7jGprZYIgN9Mnau+N/A2+atXfJ4Hn4v7GZLa/gMjLs0cAkkZ2cHOu1m6qBIbYjIENIUYv71b9pFvE8QgUsQCQnlwSZ0xmmRf+h6e4DZd8g2+JNQBKFgQJYgMjdB4qcXAsFRmhlZNiu3VD1hlHF/SoTFm0UGOiAEaEFaHv36xB0Tz3xv7iEjbcWH5HEPW6OKGFWtrWxifV3i1EAcUlIk6iO043/2X/izp72sbutPhanjLe4e4DeFMawhiY2M9MqKd6pRwYiNlTwIKy7l+kblAb7mUAf0/dMit2J+5Nug9LeASk6Y3s8GJivU+bvetGOja4eJjQk7X8uDY22/mdSdI67KyiwYD+LskpSeV7d3SsuWvAgHAonXryiKnVzW4pSNm/hS8u4y1dVaP+v/p1B5ux59a5S/Y5ivbucO3NO4+8kT2UETPiepd9+l3zpZzVYYtfjJ59y+RdVyS69ey+3p4wrdevxidjG674KDsOGGIDhUsEIFbCktl4hKhmkrocKbdjI22xOvV5Qq10wjhPMZicwUEdH9/d24pVZv4E3mZxJGhfLulQqF7bz880P6xUUmCfcGdvIftd9YUD8UcFESGFImDRpCk7UJgn4FJ1O0GhcCrnLYBAeP2GjecfRcBkgJSF3LoLH54Xrw2K1cpWR4kF5uLwwdcVK49szbcla4djxJAhj9IiC6+8ZYA4c0iUnCzabIy/PvHU7v2p1qt3unDfP0uJlfYSlrM1HAuvUmSSDwTlzpu1Rg7w9QN4H5x45qp0zx4oTZ8+20imChQstCxZYCgrMza1szGiOi+FOJXG/iDEX1BNiIFYpKYLV6vwoz3SjRunvYjoCTM09Zfl+SFMM90EDP1tj5HTCgvfNbX62q5fpCDK/XldV31RhqKNPABG9Xmb1GiNizmgUyvZxPQgv3/CHNrfKekPS3Xs4RFX2HOtvT1lPuxjrGXHRgoFNwccmAy/MfMd276ECzz7NIIAEURXzFKhE4aepPO+cnWm7c1+J7KC9mwAGM4oqrPvM1WoVQgfxB2Dz5lueekjYedtJKKPDwJAUwxVozZlrxSFxzrqJiBY8CxfX1sunTbNDBou2pWB0iTzgRM1GD1fDJKBmIWlZOUeVEAVJ+X7d3VoFdM87Iq3hkJVu/yoFY1J2thXqCrRHj2nx/lRU8Rp6JkWWQWk9aWOj80bxmLhoIYCu31Ji5EBycfCwDul47KInnIVTCwcHA4Vcu9ZoNDohoTDw3lGcghBBB1KvBGSPGuUzZhBIx05olyw1gUphYWrHSAZBaD1P0Hp5WrfuEFqILYxSY2hF5+JwKAw8vCNpZEdAduKkdvESkyA4kJ4kJbm2FPEQQIBEYCEN0WqFvEXmP/9+68j3ycAGVYyk8glar0ILgxZGeBTtiK3CFanwdWROGg6l2R0aqy6qZ82yYmBDGkIDiCAMH4KWXryizs21mM2OqVPtDxsUaAGw+e9ZEHOfLDZ9c0i37UseDwSAbdzEYyxM0HpFowXsps08nyLY7Y6jP2hDQyNzGYNSGk/YPX1WgyEKAZSVRTwLoQMPUKGTHX/98xaySvCeMsWOynfw98nHTyaZzE4kmajbpJPTUJDxPHn/Kel2jHAIaCBP0HoVWvDd7XvKjAybKdWZluYo2sr/+JMGeA4eTs5914J6C9hQtCKzv3FbWXNf0RZOzdetN6z53Hj+kvpBnQK5+9JlJoxh06ajriLpBio25Bd5+eZdu/UYz77eqd+w0QDBRO1V6tZDJ4GnP0wL+jk3J0HrZYAF+plTZzQABu3SJQtIuC0WRwovsGwahiXEECQRUDt7GGTqXT3MlasqsEHcWCxOSByCBqGj5wSQQF5edUmNdrwJRqmhPyYH+qTgjbNQAqNEm51la25BdSVD3l/q5pRKF7LKBK2XBNbH3L6r2FzEI+FOS7O7XI7p0+2rVqeertTQPjSD94SrJegY8otly03o4xQc6A+FrDjAgSXYbNvOg2Vhock7Mkn/1EP0FjknEg2EL/QW8JDNl1fo0HPBQot4aYlnhpDacF7eQVKGYIiMKDX3FDdrlA1NcrTAp+OnWdEfaoZ6trFZfp3IoxLDWGQOvrmVffxE3upjx5yIG0dGg0NNLcOHWjzDu3F3QgwLl/CS2jq5qOp2mkrA4GU4DtVxpCSiLTRrH2P0mcONEIUMMnR6IsIS7TGn0v3d5FBkKsvXOWpXPIZ78dNZ3dNVKpF8YwI3gcfS5anIy/MLTIvyhy1vUdjySeMHH5rXrjPQbH78O0Tk0Tvu+8aYnxiZEJmgRQxGvzE5e14tKS7RB/tFQYs6q/6xvK5RXkdfx9mjRjkkMe7X+fppBUNs8U69BKVoQxOZxBQJMDIbO6GJSrdfDyrIYGMTi4SLrKJB5jowxLaIYxlCRM0msLhf5Os0ZLCgs3efbng9ISqb6huqvsQKNfEZiPQOsNWRFWojqz8tidWforLYqz/Jv9Erq+kYllhZHS9I1DoCRACrR1ZW09Xvo361kJFh31fBNSZ+tRA/g8/h+Z4Q+7iZdZdx6enjfrUw5pcnWVmW4hLu3AUNCmeRrIB8QwwhBZ9XVmng/8ysGL8I+heBCd7cgo6twwAAAABJRU5ErkJggg==
-"""
-me = \
-"""
-iVBORw0KGgoAAAANSUhEUgAAAQEAAAD8CAYAAAB3lxGOAACHmUlEQVR4nO39ebwl11Ufin/X3ruqznCHnrul1mDLkgfJg4wYA4mBl4mER0iInJDEPDLACwQSyDwiK8nv5ZHhJYGElzAEwhSCeJnIS8IvvwACEgPGA3Ysy1iSLbtltdTjvfdMVbX3Wr8/1t676tzbkmWrNXSrvv25fc9Q0zm31tpr+K61gAEDBgwYMGDAgAEDBgwYMGDAgAEDBgwYMGDAgAEDBgwYMGDAgAEDBgwYMGDAgAEDBlznoJf6AgZcV3im+0le1KsYMGDAiwpz77332k+zjQVgMCw6L0sMf5QBny3SvdNf5cdvuO3YTcaNDjW1n12ctWcuXLiwd4X9BsvgZYRBCQz4bGABBAB40+tuelM5OvxVZVl8QWB5E8AnAbJt23DbtIsQ/LuF5OdI8PMf/ujHfy3ul/cf8NJjUAIDPhMY6CouNx05cvrEjae+abK58fWj0fi0MQZEBBEBMyOEgKZtsFouUa9WqJv6rCD8OIXw/R99/OyH+8d6ST/RgEEJDHjOMAAYAG6/9dY/euTo4T+9tbV1tysKMHMAhET0fhKR/NO2raxWKyyXC9PUKzD4/QD+3iOPnfnx/ccd8NJgUAIDPh1SQC+85oYbPqfaHP31w0eO/d7NrS0Ii7AIDCXhB4j0twgjMMO3LdqmRetbWdUraZvGBB9AIt9ZTLf+9kMPPTTDoAheUgxKYMAzYc1cv+2mG762mkz/z+PHj90ymWywSIAABqDeTST5f2FGXdeYz+eo6xrBBwgYwhICB8MhCCA/WxbFX3r40U+8d//5Brx4GJTAgP1Yi/rffuuNbzWu+N8m0+mf2d4+jKoqA2lgL25NuiWt79jUNXYu72BvbxfetxDpjm6IRAQwhkiAT5Kjb3j00TM/0zv/oAheRAxK4PpE+rvSvQA9/ba35b/zbDaj2267jR944AHGurBR/GEAeMOtN76VRqM/JYw/cPjw4Y3xZAoiYmPIpM2JaO0Oovg/c8Du7i4uXjiP1aoGC4OobzHk/bw11gE4Vxb2L9rHNn/8ITzUvO1tb3MPPvhgur5BIbzAGJTA9QO6916YBx7AfuF+Npi0L2LK7vZTR+4sNja/abK5+Xubujk9Hk0w3dgIBBgylowhEOkuRNTtnQ9EaNoGly5cwO7ODuqmUUOB1h0H6h4yyBhjqLGEH6Oy/rZHHrm42/9c6KyDQSG8ABiUwLWNZxIQuvvu2485Lm6q2/qUoeLkoeNHEVo+4b0fk5VfX57b+e/vf+SRc2mH2247eYJ88VemG5N3HD569GjwATs7O3z0yNEs7cYaWDIA6UtEB8wAQATL5QqXLl3EIsYDAI0YpsChbq7KRK0JEuccOefAIfysJfvDgvChi4998uFzwKz3uYa4wQuAQQlcezD33nsvPfDAA2tkm9e+9oZjW1sn7zJBvqBpmy8pquqNBNls6nZDIKOUwxdhCLO0vvkPLcvfKol4FXhjXBR/cbqx+ZVbW1sgIr508RKBQBsbG2AWGAMYa0FkYQggY7L5D6gwCwQQYDafYXd3V7MCTY2maWCMgXUOzlq4wsE5h6Io4awFWQtrjIBIhNkEH9D6+lJo/ccY+IXVavWfAtwHPvaxjz2VvgMM2YSrhkEJXBu44or/eZ9356l64X/bZDL9Qgl8t2f+XIBK37bw3qNpG4gSd0RYYCwFIpKyGhUijNb78+xDW5blkUOHD1fj8ThY60zwnp5++imMJxNMJlNI9OmttaoIQCBDB/18ACyC5XyO+WIOiICMQdu2IDIoywLOqQKwzsGQgTEWRIAxOYwRABiQEHtG07aoV8u91XL53lDX/2yJ3f/82GOXdtCzPV6E7/+6xqAEXt5YC9YBwF233/6a6fb4rRLkHQz6cmNog5nhA6Ota7Stl8BBiICyLKlpWlhjaDyeoCgcfAio61qapgH7QDDA9tY2JtMNKQpHxlqE1uPpc09jMp5gPBmDRUBEcNbBWQMYCyKCoWQFdJfLIlgu52hWDYyzsMZG7SUwxuiPtTDZnUiuRYwZaLwhCrY6ECJCIXislkss5vOHm2b1fz300Y9/XzzpYBU8TwxK4OWJ/Sb/6C133vFmcvarymL0tcJ8C4hc6z289xK8Z2EmMobIGCqcg7DSd8kAm1tbIDJYLpZYrZZomyZaCSKuLDCZTDGqRjSqKljnEILHuXPnMBqNoiUgcbVWU94aAyKjSiAGCZP8sgjqVY22bWGtKguVZcCQARkLYwkpyZAyDClGoFi/LQUQERGAybee5vN5PZvN/g2a+V/58MfPPo5BETwvDErg5YW1m/nNJzFtt1/1lVU1eYe15kuNsVMWAQdG8J5ZmISFXOFgjAHIIPgWPnj41qP1LY4cPoKyKFE3tZJ2QsBisQBziCa+Q1mWGI9HGI0mqKoSPnicf/o8qlGFyWQCAHHlN3BlAWtsFOh1wVV5FzR1izZ4WEMwxoBZlQgZ01kAZDr9ka2KLtiYaMdrIAAizCxmtVpiPp+9q1ntfdtDHz3zq/fdB3P//YMi+GwwKIGXB1KqjgHQ615zyxeNR9PfZJ37g9a5ewAgcACHIMwsPgSSEKiqSjhXoIkxgLZtISwAiQbziLC1fQjMQZVCq8K5Wizj6iwAGZRFgWpUYTyeYDyeQERw/tzTKMoS0+m0u0hrUbgCrnCdEuiHB2PwsfUtgvfZ/GdW2dRgIkWFpXt2AUYV/BACAgeE1sOzBwfWmAQIxlhYZ+FcIc5aCcxmd+dyu5jP//ePPPb4D2LIHnxWcC/1BbzCkVZ+BoC3vvF1n2uM/d/J2K821h6LxBvhEJhZjPcttb4lDcwZBBaID3DWYjQawbkCgMB7j9VqhbZp0LYNIFCBEkbbNPCh1RWXASKBj8ezpkbhCljnQMbCexVCikE7Dgw2ARIMxALEBhIlWIhgIDlDAERp7ItjZBYCkpWHMINFEIKHZgVa+NbDBw8OHszxmACSpWCtpaqqqKqqsLm5VQjku97wulfThz/ysX+BTqEOiuA5YlACLw3WAn533fXaL65c8cestb/PkD0Uy3EDi5imbsi3jfXeg0VQOIuiLFGWFarRCFVVabQ9+t/JjGZmeN+irmvszeZoW68CpxZF9NWRWDwgb9A0DVxRY2wIhbNYrlYIIcAg+e+CEHRFhiEQSc8OEIhc2bDsRFgfqbES4nWqAmiDh29apMyGDx7MDNmnBJI70TQ1VqvCjscTmUw3NgyZ73nD7bdWH37k8f8bnUUw4DlgUAIvPpKk8Otff8s9pR19u7Xl77XWTuKKyICQbxtb1w3atoWxBqNRhWo0xng0RjkawVmb02rJ/hXmbiUmoCgKOKc/hbPY25upGU8E5l4APgDGeDQtYFcWzjmQNfC+RRtaOLhe5B75GAYEMVGjCaJVoFfDIjCSLAPRykIiwEgWbA6qkFrv0bYevm3Q+gbBaz+CXJIcXX2CybEF5qDKovU0mU65Go0qZv7u1776puY3PnbmB6D1DZ8Je/IVi0EJvLjIgb833PaqP13Y0V8si/J04ICmaQKLmOC9CcEDAjjnsLG5gdFojKIoYa2NK7nHslZOPkAw1sDZaA0kH7uzylGWBTY3t1AUDru7uk1T1wgcYtmv+uKGlPJbtkruEVHXwhqrgih6YG+MBvkMAUwwhsAgkIgqhugHCAvEJEGGXi/rhQVmDXCGVmMaTYu2bRFCAHNACKyWgnQfhEgtGGKBWIERQKSFzGdGZMqj8dgG5v/j9a+66ZGHP37mQXxmHYzoXsA8oGd7RQUYh8DgiwcCIF94003jCxZ/ZzQZ/5nReAzvA3vfkveBfNsqk64s9ccVCOwRQoBvA0I0kVPWLcEYgnMFyrLEaDRBWRYgEy1iSdsKvG+xXK6wXC7RNDXapokBR4YPHgSCdRbj0RjjyRiXLl2CNRaTyaRXJ0AoigJFoeezxkYacXrbwPsA71tlFlrNDqh1IjlQ4EPI3YfaqAA4BDCzugGQmAzoFIFmCwiGABgDGxWRsQ7OWWxubEpRllSvVh9fLurf//Cjj74nFiP5T/N3WeNivNIwKIEXBwYA33rrrYcK8t9jbfG148lYRES896Zt1A9OPr4hE9N8rQbKfFC6byTtqGx3WkCJ/QRLFuPxGBtbW5iMRqAooHFphgiUgbdcom6auPK2gACtb9HUWuxTRAtkPp/Dtx7TjelaCs9ah6J0KMsRisL1mIP6fmAN8AHKLRCJmij6LQxG27Ro2iaa9JrWzCu+oahckPkOyToIrBY+QVOWZHVbMoSyKLG5vcVlUZrFYvlI7Wdv//CHH38f7rvP4P77gXVBTyt/AIDbDh/erg4f/txqa7z7/vd/6N29r/a6dycGJfDCgwDITTfdNB5Z+SEy5u3WWIYxhkOADx4hMCaTCba2ttUMjxFzZg/vA9q0Wvo2BssAgHuLa9fMw5DFeDzCoUOHMJlONR2HqAcIYGa0TY16VaNuGvW9WY/lvcdiuQCJYDQew5DFfL6H8WQCa11OAxpjUBSqBMqqyDGCpASEgwYiRWBcDNZzyv0zvPeomyYLf0oDGmPgilItDKvKI3iP1nsE7+F9q4ogBC1P7rIFMFYJTKNqhM2tTS6KwrS+/Wi9XHz3Bx766Hf3/hYJAgAnT56cHj80+erReOOPlWX1ZW3bXNq9dPEPfeTjZ34GrxAlMMQEXlgQANx++5Et8fxOwLxdRELgYCUEEOmqu7k5wcbmJgpbRIFOzTodrA1aeONauKZF09TwvoUuiJJc7M5fh8d8MUfgABBhPB5H10C3IQDOFeBCEFhrAkJgCBilKcEcsFqu0NQ1RuMxBEDbtKAqrfUGYIEnwJgW1hjAIccQog2vgT9hgLv6AhYV4Lb1CL5FCJqxAAiuKDEejVBWZbYegg8IJvYiiMSjREryQcChizfYqERWqwVE2Bw+coSnk+kdo2r0XZ9/z91vauvVD77vfz78rvSHufHGzaMb1ZGvG09G9043N79oOpkCIN7duXTEg/43AD+DV4ACAAYl8GJAmoX9Rufoz8CACcqXtc6hqiqMRmOUZQlDFFl8iN4wRaqugWUDcmp2G0uoVwZNW6vQsSCaBtlNCAyslivs7O7CGIOyrCKxR0Gkvr8LLt7mhBAAkKAqR9H6UMJPEclI1rpY+isQQxCvGQV9ndZcFYia8RKDg0pJUKajujgePkb/yRiUrkBVqQIgInAIqNsWvq1jLCRkl0Ji6sMaCxGNZ4j2OY3WDmG5WoF2dswRa3k0GtGoGn1DXVdf8wWf9zn/b7ta/UrgcDwwf82oGr9xY3MDzjkhMty2La1WjbR1vXqxb5KXEoMSeOGQTMnSGPu7icgQiI0xZJ1BUVYoXAFhxqpewUQzO/30j0KGQGJgjMAai6oqAQiatgGvRQciRBBEsFjMURZqrrvCQXrWMBkLZ12XKgTAHGCtRVVVmrprPZxzQN0gBH2cBBsCZfd5rwE66jIIXcpSwKQrvbAGHzX/79NFaICxKlE4F7kNHm3ToG6aSBbiHE5AOn68ZGssJEROBMVsQSxUWszngLA5dPgINjY2w3g6PTIWeYefTt8RQiyNNpZjXwQjENO2DVarJYL3/zl+Ja+ImoRBCbxwMADC6ZPbvykwf6ErCIVzZJ2DsVpdx8zgeI8FdPx8a2OhjemlASLHnqyFEaAsSwgErbQAa+EOiPu+AXzrMZ/PUBZl5Pmb3MiDABinVgZEICQADIQFZVmCmbFaLiEisM5EGrAeQ6+XYYKH9wbGElz2nqO4MqvfHgRCBBbO8Q9hVUfWRk4CqKM+Nw1a78EhkYl6Mtjz6BP50DijbkFgMDSAao2FGMF8NtcAZN3Yjc0NKYtSnCuMKxK1kYwGTBlt08p8NjOz2d5jF2cX/8cLc0u8PDEogRcYEswpISlZq2jIkAEJaZSbuqJZALlaz7OBszab2oqu3FZNe6MrM0NjBBIiY68jC4kI2kZZg0VZwFoooycmxTSwZgAjoCBRJBjEhLIs4WPe3jqHelXDioOJQk6iNGJvAqxnGBOgnEBlDQXWgGMqEw5BwD5AQhTqTFpSayJE8k/wmiYMrMFCjtvHDkQxCAmkbAcBMKRcRI6ukTBgDMNai1VdI1w4j/lsj0aTMY2Vc0HGGqJooTRtI/P5DJcvX5ambt65XOIsXkFpw0EJvHAwANiDb3DMpq4bz8yusW1OaSXTPwk6QQN9IL35rWFYZ9U96JNmlDsHQxbWCYIEEAcNDSSlEhWB9x51vcJoPNJ9YxFPStkbIlhDECFYVkHjGHGvRiMsFvNI1TXgEGAcqf8dA38clL9ggoEhkxl+/cIfQIOQgUPPeVGCUuILJDozM7SOgDlnLfQzq1skxuY+BgmaITBgTrUGHsyEIAHGWHBQC2M+n8NpAVJuZsLC0tQNmro2dd0+cHFv9iN4hWXNBiXwwkLAdBIWYA7S1oyW2rwKJ6afiy5C7tsXzWA2ASwO1rq82gHQVT7GCgwMHNsodB6yjx+nU4A0xajnVJ9ZGTcdFZigtN50DSKSW4CF4KOQcWwwEo/NgmA04m9DgFBHE06kn5gsUEuFWZVctFaYpatnYNHqwUglFkkrvSocSUxBEXCMn1Bn0mgBlLMQHwCOmQkhCAmYYlaDCE0DAEsAYIGwiDgOzML8r1os/ww6BfCKyAwAgxJ4oWAAtLfffvomv/K/Q2DAzDZx+zMrrhWNATiHsihiIZCJpjLAQQP/KpA2V96liH7q6WGMhbUBHDoLViDZ1QiB4UMLGwwABxHAiNFI/4FbnTolFQN3qfcAM7IJDtJzZDKPBBV4Vh87fUYtL9Y4ACf2HyNvIzFrECJrkTnEbWPsIKUHhSCRRNRvcsocICGFIiM3inrZCdIXDWKAsvuIBoAJgXcI8nftbPXdM2APrxBuQB+DErj6IABy5503HVnNwvcURXU3GWKtC+jM3gCCD+oHa/lsqz34UvNNY2AMdL1STZCthY4k1GPxGQu2sfAm+cskAFEcB6bpPBVvhojJefdePE+Rom4isDE2kUuKJa7KvW1YAkLQBqQpmJeEWI+dyE8xzSfS+fzMmRKt165p0aqstEKy0MyBddrfsCorGNNVSwbf7ac1EIzlcoHVchl7LHh1T5JyU5OHWeRnhfFLbMx/XCyW7+n/7V74W+TlhUEJvDCQxY7/+2TN/8rCgkAkie5KFtaZHLhqIxOubVv4EFAGRlkWKJwDxGr5LgPwHlYExkVfNp5ozRpwDOMNQlCfIMkpUrOOEHSFFwJst3JCOgslmeFp5QYAaw1aCIi0Y0CXCJBoDWg2QEjyCpyEPHEXWDSCL6J+fqpX8K0KsbEW4+kU0/EE040pyrJEVZawrlDT33QtyXJQsz8ErVdGrbUIDeq6xu7uDhbzBRbLpTZdEYizxmxvbPnjxw7/9Hs/+PB741eZqg5fcXhFBUBeBGiNwI2Hvyiw/TkytgTyPRulsmusCQAcBD7o0E4fhbQoC1RViSLm+Cn67ymlZohiUU30o2PdPQdGHQuDEqkm9QYcj7UuIcUXTKTaajCPwUFiVWEy8ZWaK6Imd71aIYTE3kv9BRA7BqtLoy5DF9XPiiIeJ48tF0ZbN2h9i6IosDHdwHRzAxsbmyicg7MxRgI17TNTMH7JtP5f/C47V15jGtEy4IC2aTGfzzGf7+HihYsgQzi0fQjC3LDIf3XW/H8efvTxd/UO/4qyBgYlcHVhANCNx4/8S2PtHxaRICxWIDmIB9MxAXN3nXizNrUW1LBIbvnlXAEXefEAtNGnddmsZmHtMBSj6W3MBoReas0SoRqPUVXKyVfFYnLpMQRKzOk1JMl+fVBlk4p9KGYzUroSpJaCJZt9ce2DGIBkAURqMAtrhWHbAkTY2NjAkcNHUI0qlEUZ+f+Jz7AvNXpA6PvY/0Inw1o7pQHJEALmizmWiwXaphGKhIng20sk+L/HYv/erz/++GW8QkhCCYM7cPVAAPiGw4dvMcbeoz30hCT2+4MXMGm9PWlUDWSNPo+VeWWlq6xW2LV6yBHBkFPiECFbC9qnLwbqUvaQoM09rc1deQDS4FhcnQkEseoNhAAYUfM+CSuzxEh+ov2GaMD0+AW0vi5rrE8pzCEF+3TIiWYDpAsWhhBQVVUscNpAFWsFUgszAEiNUVTJJAckRS/0u0tNjLKBdYXFu58tBamFMB5PUDiH+XxOy+VCOAgbsodB8leXzK963ete9yc/8pGPvKIChIMSuNqw+B0s8nojAMgYpfzGgKCIBuSs0f5+ECB14AXpio8CREBTa1twQGDMRHv7kAGE4eHhqIj+fv5PBYcI1hikAnoBQ2BjZF6JQDHeiJ6LHS2AkAN4kuIDwBoxOYYi+9nFeB7pOgHFoGAIQBxhHjkDwHQ6xdbWFsbjsbIF47IuLIDpYg2GSAOQAEgi/yCVRROBUrkEAaqC1q0BeYYnJJoiHY1GAEDL5cJ675nICBH+EOrZ4p577vkz73nPexZ4hSiCQQlcZTDwm0kC2FMw1lirJPW4yiYmXOqMY7JFkMzd1CuQAKxqtQhsXYNGFayBknmYlaDTLxPWpRMiMYdOBpKa6vSaciQargiU/ReFSjggpIh+UNWRehjo0WOMAaQuTf9Dp+Afp9VfLQKWEJugUF6FNze34uqvTU9SkxQigDjxJABJ74NAxiO7Aumca+LZuxrqbblPhCV+R2rNEJxzqMoRhJfGBy8EYiL6E5fPnbVve9vbvvHBBx8M+890PWJQAlcHBEBObWwcZw5vRIyiS/SnU0BPWkEQzkU7ZCnn0mMXbiRacFGUEAB13aBpGlhnQQWp4gCiaW/WzOJUC2RIu+5wCDlFkCoOxcQ0HTGYqROM6MvnlTxG8SX91+MH0NrHRhYTjvsFRqYDUwwcFkWB8XiKoiji6q9ZD5NclSiY6dgsOf8RV/1nigcAgFFzX7fOrlF2WqLJJB2dIB0ZxmqnJIFQ0OYtDODrHn/kN34ZwPfiM2tRdk1iUAJXBwRAzIhvYjHHok9LEqv5UiMO6xzE+8wVAJB9e4hVXkAy0UlvThZBW8ehntFiEFYmXEeakU5Ye6SZhJjIU7afsLoioiu6iY15NZqeKvb2KYAkOfF8ibabiUaCGJgUJRRxKv+F0nQLh/FkgqpysVRaXQUCI2StEjMmndsflUKyQOLXTPtdEQJR6PZH71h9tyVqS44pzRh2gESla62FMFMIAiIYBv/t208f+U+PPHHxTPr7frY3x8sdgxK4OiAA8FLcKoITMUOVJSXl5601ACx8G3n3qUKOCDAMsIHpmbOGDMqi1Jy69wittv9OpJ3AAda4TmDj+dS8Ngdu3Y5kxBAYEENLfWO8QJLbgPXfaV+TGXvp5e79EGMJIboqHIJy9K3V9uhVpZYLM1ioM1soHV8ZjhKVQJcNiH0KsiVg4nfT7Zu2zalXim6WSQ4M9c6TPv+6WaC7WZAIiQhbY457cd8M4K/2NrkuFcGgBK4OVAn49pAlWwkRp5yeAAAzAgU4Y+GsBQSRuCJdNWG8kSVxCeL9Zg2hLBxWK2304ZxVvx9K0DHUVe/1o+HJtM53bUr/AdB+xOpOJLM78QOkL/XIIQMAAkspVZnX0BgQ5JiGi70APefiKGctqrLMFYOydvAurpmslSybPeuA4ucBdQKdrKCkMPXbTqXSMQ7BiBev7MsUdOysHsmuTmdkUPoOhAP9kVtOnfrRT5w9+xCu41kGgxK4Ooh3DZ5uEWpjTGVN5OySigsHztV51jmkXnvMjJDuQkswHGsEExuOEPex8LHnoHVxXpkYBCAHCCGShYr6of98lWoBJBljSZ2Lk2BEEZW0+urBRCKvwVhdZHuLaLJCOKR6Ac1LFIWDsQZF7HzMHPZZGb3HvWDlATlLGQLqhF9rAaJSSHGUpCT6yoFMtBgIodfmTAlQ0RJLrEfpYg4kMCzCZOjmIPwOAH/l4IVdPxiUwNUBA0AlW+9e8M6viYQvhhgxxvbc1NjTL7bJdq5QQYjzAwUhVrsl9mqs85cYH3AOodZBHcoZSME1Rgqv9813Stvk6H5ETrXpNaVehan6L20r0o0KA4BUrttPF6aVVQlLHIeJSE79aYCy4ywICIhUYnXL4/X2LJB09L7uIiBmJCgrBaa+ouu2Xiszjp+zz9BMiiNZA5lPkRRoSh+kZ0J/5NZTp3748bNnH8Z1SiIalMDVgQAwZ2dnz21uVj8Api/2gamg1IlHOoHhACIlx7hYmKNDOEXLYF2s72c123MPEKN9BXTbxPpjGDbgaP72dAB6Xrve0qK9CohEBbHnJMs+JQCkt+PqmJp8EkXp7YRGRKsUQ0wHqoLTNmTGGqTBJt1lddZGP/ZwYALxGrRgSS+pFx9AWFNK/Uvfb1TkjxP3zyxEoXhuif0a9UQkZATMxuAmEfkjAP5a96VdXxiUwNUFGYOfk4ALIDnKmgukLp8vucbeWDWXtfefxH4AmlpT31YAXqfPWmO10MgHWINYXqt3ehbS/XmwrAX0ifReizFB9LMBMZqZXRKh1NLb6v45jYioCGI/AK8+dlFqKzMJakkEDl1grncN/dSjxDLf7C70v1Dkt/KVxS8zfzzTE+415A+7X1F0iiDZ/xS7MjEObC4E/NE7Tpz4gY8+/fRj/W/zeoH59JsMeI4QAPLbd+pPEtG7DBECM+dOuWkj1mYaHKsKnUltxNAF5zJ9N5XlavAtDeNkDsrEk1iLL6FbzdacdeTna6tjDhJKJPREJZRKgLMwpnZekZvAjBRZTzGEEHsBqBVgYvPStI10lk788Xn7xKLk3ueMNQuSSpE5uxqBGSFONgpBJyzn+GHvT9AFGNcVVqRJZOakRL5Gqo9I17HmEoGMiAgM3eAL82333HNP8YLcOS8xBkvg6kEQJ9psA+8B8LuNdgrVzjvkdHVHzI5xgIFO97XWgoPp5u8xgUwiFcXcfModkg4TDZSEgAAPBBfTh8kt6JvX0Qcnlk5qJOuDeEHJStBIu0kBOGNgSVN73Q5AzLjnTkAgbX6qbr9eGUP7/SXjPSbsO4tAgI7/21/toT0M9TSxpFm363oMIl+ziH62vivUd9y7WEm+Et0iujc5M9PTKL0JyyTMEoi+/sLZMz8G4FdwnRGIBiXwAsDA/xSL+3ZraAtCeo9y0C64JCARMBsEMCxpoNBahxDaKLw6tAMmJf+0q09SCMIBrEV6+hwC8lAqchxIKmsShRiQU4ahJFZOzO33jfCOY0CRF6DBQJauGIh7U4VDJD8VpTZD4bitIW0HLoZB6AUZOx2Q4yTYf72pCUhctfW6TOx2TNlSoV56L++aiAb7gwKyXzUQqEvg6CtrpkVun07CwtbQJki+DcDX4joLDl6XgY6XEMnqro4e2vg5Y8wXsdqYJKxFMV0tflrhta4fgE4KjqtqSntR8lmRqgYFvvVxX5PTZtqq3MaKPF1l26aJtORueGcX/VZBChxyFaLGKmxuc+asVi/megfum9g64LSuG60LGI00QyGCummyYks+fT/TsCb8ay/Gq0ruSiQ+mdxclDpJ7e8v+w7RqTT0TYy1SsNegDBZKRqATfshfynMwgSQMXSJJHzx409euK4yBYMlcHVBAOTWW0/d1i7bUwJ0tfnESqKBtvbO5nicOpTq+5NvnI6W+uwl85V0+UeIqTZwTHkZjZRbEVAsTEoLpRJ5SM30vsnL+l8KHxBZWEtRYWiaL8T4RK49SFYBM1qvsYhyVOUpyDn3LpTz/6mWondmpCikGhdJoHsBx/i5Ddmc3UhfGkvK7/dN/e4PsL62xWP3sx09JZEIRSnzQNJRlbPOAQyLBANzhIE/COCd+05yTWNQAlcfBq38laoqX80iQQS266CrK7PpEVMgUPqvSGbZied8c6+Z9ukEcSFkFpjULJSNdgYyki0LXb1j0oCz89tZy7FBp5YRGFhnYK2DtToRmGPwrCsr7qwBDpzHlJVFEeWTgF7lYs7+xzJiIIlk7AScswPolEJK0xnl9EuvGar02Y1Zi65/N7Lvd7IGOg9/XUFoXiJaW4mRCMSpT5S3F2YEIkDoi2666abxmTNnrptRZYMSuHogAHzLqeP3guiryVqpjDUsjOAtgtWIdtO24CAwlno3PgBiGKttsznOEBBJoT/JFrBS7k1MaUuMGwBJIljQk8NUF0AwRpAK9vtmczpDiuxbY/O+uXOwmiyxU7BWQraxy1A1HiEVMakKSB4R5R6F/ZxaNuK5W/2TopOcn4tFSik4qCZPHn/WXTnicToVs25ZdMhpsB6rsP8tZAp03MsEsz93ZkTTnW/ws9kJAJ+Mh73mA4SDErg6IABy28npiRb4k9aYTUuWjbXGiAEZgQkmVtkJvPiOmhudWoZAfM8aSP39oolMEBgCpg4ojMASsPKC3QbR3NZFy2qJINZVQ2QGIqzRgXO+3OiAVGNtdFF6jUfjypxbj4loio4Zo9EojkoD9gsiIL3Af+o3SL0ryl/b2iyCxOgDayemNFktWwvScxt6lkZ6tq/TgZ6B+tEA6Z+qvxUgHbOQkWYbIn9n6k3JSWPtCL1er+nyrlUMSuDqwAAIK6neTJAvFMSmODHSboRBZFGiiiue5r2VDthFtTgufcYYtEFAYJQGODIyODopcWhiMC60Z6AhoA2MnRXj/KzFubmHAFgGQsupkKYXBowyn1feeFJDpCPPouLhuBp3gUAg9TLM7cQDoyzL7AYcBCWZ2vd+v0agW7HjGZGM8a6EJwle5/tL7wD7WYa5hqB3GXRALaAz8SU97VyOThH1X5P8p2II26o4+tY3vvbN9eXFmYfOnLmIa1wRDErg6kATeIKvMM5MSGKlDgAQYEHaIccCUhYIwUOaJmezEggq2BaMGyaE4xtjnNie4vjWBNPxCGVZwTmDNEojkW6WyyVmiwXmqxbn9/awu2yxagWzJuDCSuDFwBntHNDVJ8asQmxiyiw67SReifRSganiLikBax2KwiGrlGT2x+Bb/kjSmdf6vCcp0rMY0ntrwXzJWQuO26eDrMs+rbv5fcRjXvHt9N1L7/Fa5kHjEd12lHiVdaj979rZm/+h6ebkide95vR3fOTRJ34O17AiGJTA80fMCNw6apazL7NxJZF4E1ujI7tTP0FXOFRc5aab/ZsxsGC7Irz+5CZef/ooNiYTVGWp7beNye29EXPlufmnHAGgpBrf1ljVDZbLJXb3dnF2d4HHL65wYbbCXhPDEMbAmcQGpG4iUv8DQbrSYukEL3UJAvR6U7wCQJ5QlFKZ2X/vJD//lt7TNVO9t+Jn5uLadt1VJuHfL3lrQp9W8f47sn5iiZYL9TeBUoklUoo13wFilocD+1DXzaunk+mrR+ONH7zrjlu/4kMfffzDuEbThoMSeP4gAOJnl7+InHtrkpX+u32TlMjAuQJlGdC2TW/0NuPmQw6fd9sJnDp2JM4cUONYCwJjQCtOJCZr4mMC4mwCIgNDG9iKq1kIHre3Le5ZzPHkxR08cX4PH7uwh8WqwV7t0TDD+n6LThUsgysLYOIjiDBC6JfsotsoieqaZArWRHjdOOhZDusC3fn+8VlUfOsre8/BF+ldC61dlz7tAqHYfwxA05rotynTY2t1p2oBFvmUMWYBQJbLZdja3rqVi+rvAng7gBWuQYtgUALPHwQATOZ2q6weQerbkTbIN25SEYSisAAVaFsGcYvXn5jgra8+ia2NDaSBoBq0o1hGm4qJurSVQWpMqAogldqq8tB2ZraoUFQjTDe3cdtpj3vqGjuzOS7Pa5y9tIeLuzM8tbvE7kpLmlvWzr2pTiH9aNbRIs1ISANSczlvBCcLoLfa9p0CSsqlh9RVOH3mNQJwF0CIMY7eF9tf0Hvb5ahH8vn1JJ2uiPGHg35COj/2sQfjK2oePVwWxausMSQC431gZ91XvuZVp3//ox9/4kdwDTYfGZTA84cqAZE3WAJBKACpt1fXA1Ct6vQ4rUcWY+tx900beN1NJzEejfT27JNX0AW8KBbzpMcp3YW4QoNSs43o/RuCi6xEFCVEgMkmcOLYCeUagFE3LeaLFc7t7GBvtsDZy3Nc2FtiVddo2hYhBCxbj1mrwqNVwYnqTDDUK0sGcuyg77uvBwCvAJFeqJ07+ZW+wKYIveTvpe86rJ9A1tZjTferajExAyC9gMG6YunFA+IVRcXlAITxePTlRVHeATKwzhKzcOFIyrL6ths3N//Tp/b2LuAaswYGJfD8EQBAhI9160hEctn7Eah4kzIIVlq86cQIr7/5FFxZaloqT/hR7j6lcSX91ylNLu7cgKQUOsXQUYpdeg/Q/eLFERGKCtjYPIQTJ07oSLO2wWrVYLlaom4a+LbFfLnC5cUKO7MlLs+XOLtXY1m32F02aINkTn/PiM52vllbbXvilhbi9Dt+Ndx5DvmbQ+99fcyf3vGWfY8jQUvSMBPqYoFC+1KLcRvaZxIQGVuUoy9IXApjiIhgAgsR6O5ye3oX9vZ+AYMSeEWBAMhxYIOEbohWo8kCTzh4O8Sbr21b3L5l8PqbTsA6F83dvpBQt3GvgpB6qz+i2Y/+82gp6K1r0FnrHU9+LY2WVlmy2kPQWGxUE2xsH0KO7rMAsaTXB4/lcoWd2RyfurCLWd2ibnRQirCg9R6LVQ0fAuZ1i4uLNrMbBZytAy2VjilA6q4vch3hRWMhOmphnzytmeroWQb7LPy1WEX+c60pGX1pv2uw7nJIVgQMCCQyMilaZVohZsgYMq8G8Au4xjAogauAxXQ6mYC3kk+bQM+gBdogOFUFvPGm4yirChDk4p6+6Z92j69m379TBtEaALKbkBUB0IshxPgB0FkLQNeyC2nFtrCEnpJIpnP3aQSC7UPAjSDc9VpVdlrn72O/AI+6rtE0NZZ1rVZFXWO2WKKuayzqFj40WKxa7KwYKx8gHNCGgIICxlYtib1G0DAwawjLsK4LEwFiXWH2Pt4+RdfJvKzJf/pF/QeU7KT9SHsKJQvNOQfN1ASGwBDRlwL4l7jGMgSDErgKcPN5y+XWEtC1Qs3hnv+fOvjEPLthj7fcehjbG1Ow6IhyJF8+C26KL1IcYpqEHHk7isNNs8JIN39PWLJiyCZtTwlg/+O+4lJkdz4pA/04kRKcIvYGcCWsE1gBimqCEFpMvUfbtKjrFZq2Rtt4eK8uhs9lyDqa3bctVqslVvUSrW8gEhCYsPCCWUu4sAQu1kAQgktuVvIneiBQlzXpLh3x0tVhyWb+fhwU/f3vx6LQOCKe8negVoXcsu9g14RLMCiBq4AdYPcY5DyANWtT8g8jLQ6ND3j1lsOJ7Q2wALkVaZK9bHruM3Dz0/7r3U8qNQb1rQZk1yALOPUlaJ8C6CsLJCt5n2CkSL460z2CUBeVN9bAmgpFUaIsA6rRCG3bxB+P4Fu0PmT6sfcevm0xbhqsVkssVnMsljNI22CjDNgsBCfHwMXa4Mk5sFMDXgB7BZlNn0EEfQOh++4kuhfSkYGo9zd4VjVA6fP2ujGHHp2aZSN9dc92mJcbBiXw/JCdRWZZRILQOkmuV30XAmPDtLj9+DbIJL5/d+dlh4AIRmJgsN9llzp3weRV3nQ3Zwr6rcUMqEutZSuBunmCPaWB/BzINsEVpEIX0mStdHe8Hk9yEA4iuV16WZbaDCUJffBgHxBELYK2bdG2LerVCtN6iuVqE6vlEsvVAq1vAO9xfOJxZCTYrYEzM4PLTZc96Mz6pHophxX7arPfPUiTOfs+3LNoAYL2NhDEXpCRV8CS27PtYn0NuCYwKIHnDwNdD36dg7zDOKHUUDsj2tQcPG7adjg0HYFTHOCACZ7cAfTM+GiLx9SfRtDWI+1XMuvXxDkrgH5e/2CQsH/M/YZ2/DDJ80DOsq2l6QyIOLsJecAH9Lm1mrIsUOR+ioG9xhWaBquyRFWXqKoS9WiMST1B07Zo2wareoWmXuGQabBRMj65Czw+izyGpHfSfwTtPEQHP4VmB6Ilk67801kBCdINdU2Ov6ZOA5jlk8/lEC83DErg+SOGAOY/Fbz528bQSFgkCJMNAom9ANvAmBiPW49swZj4tfecVVqXTay7BOjMeHTvCcVxXAdW8l60PFFXeqb9mkfRUz7UO3535mdaKvsClhqfIOfZdUhJVymZXJKunW9nvThbwBoL5yzKqkQ7qlDXI6zqBk2zQtsG+NCibVo0ba3py9USt7kak6LFmVnArLWwJuX/165y32frK4Lu81xJFR4gNQngg3Z1kjhtOX0TIQR4Hz6ZDzFYAq8oCABcvoxPHt4MHyA2n09sxHhDLVqAHCBA07a4ZdthezICi3SxgL4Arz3uIQe6ekSitH3nRPTcip7CELOmAHSD9e3XhKRvUfRPc+ATp60kDzPpHkcxI/R6IqTLIVBsu57T97mcz8JYoKIKzhWoyhZNW8J7HcHm2wZ1O8JkPFEyU11ja7rAkd05Hr7gcX5FcMlCEgETRWsA2F9kfMVVf//3tP9NEbRtm2suUkZHRIg5oJX2w73DD0rgFYQkEkzA4+z58wMFhOinh7hCVvC49fCmClmvi03nd6dnmhXIoH29LXoGQtqanul+O7CI73MhDlgG+0Tgik8OLLN6HdS9JWv7JFcgTWntlEY6tzoYBgZxWCk05uGKAtbqCDPvC/i2xCi0aJoWVVmgrSqsmhHKcoKN6QK/8fQcn9jxOmVRNVCS3e67upKSvdJ3Bf2L9DsfAGl8WYCxNvVBEAgoBN6xIXzwygd/eWNQAs8fBEBO33TTuFnsfY73HsEH8sYAhmFF+fiv3ipwZGOEIIAjjeb3rXHa99Plq6900+5zFZ7t0p7h5s6PD7gAz3S+/Y/74UBZ/z8JtsT110jsnkS9nOO+S8wuQ9R6nKSXej0PCAU7lEWJUVmi9S3GbYvVaITpdIJD0wkOn93BQ0+vULNaW5wUT88WOKAIaO3Xs67jqcTamBz0ZWgLuf/+1KWNjwPza8oKAAYlcDWgC2FYfElRFK8BRES0qbc12i7MesbJDYeu2IbQz1Pnmy91us3aYU0tHMA+m+HTXuaVrIB1CbiSC/Asyibf7n3zv68OsB43SP/n1FwKISQzIq693Nk4BJ2f3GMtaTlz6WCdQVE4FM6haQsUhcNdRYmq3MGvfXIHYT1sseZ6XNki2Pf5ryjKlEewGwIYYiQIIOHfAxfnuAbLiQcl8PwRXVD7pUVhAYBF2JZVhclkDJDF2AoOTUqk+50oGfF9pdAXynUBXVtzI9Fl/y2c+S/U5S2vLL79lXy/ChE8q9AfOM4B+/85bt5TBD2T++A19nelLhUBANltMKjKAoWzqKJCuLMs0AaP953ZA8giFxBLckU6XyRZIetf+RWsnTVjKHIDVOOTD2HV1vzgvp2uGQxK4PmBAITjxyenAPldAoIxlqwtMJ1OUJYjtG2L01ODcVl0BJacvxdkGnA63H7y0H7kNHhMOyKKcm6ekfqZ96SuFz14zugS75/Zfp8O+VIMYs/zT3MRn16qBAQYLZ2eGELpCnzObTcihCfw0LkVghAkDWE9ECegbIik76qvAg64Y4LYbIUhUa34EH7gwt7eR3ANWgHAMIvw+ULvEG9vY8GdIgFkQNWoQlmUAAmMeBwau2x+EigOv0SnDHK6rWP59SkCV14ZJXfvyStpTpJ3uiJB8FxF6rlC1n49O+hKv5732fcbISkTYZ3BdDLF6244hGNTh6KsUJVVHKraD0vs/5YOXvL+FzM5SIRFmNrWn2tD+wN4NuPrZY5BCVwNiH0NEUoIYK2jotDJvE3L2LCMjcpGl7cj53Quaee49v8/+LsT4txxRwSpMIFTxV+s50+3dp+skwto5AoiJAce7Httv0rBZ65PPovd8pVKZwDJAdmVtVKAZHEdO3IIdxwp4QxQVRXGoxFGoxGsc5DeMftYs/rTpOd+YCH+H+tAiEP41zs7i/fFDa7J9uODEnh+0NiX4VvjUA4xpF2Bgmf4tsbhCqicjfP/1k10km6518IXXHHlP3DCKARJFlLqrRf3Qi4DTjf6/qj8FeyCTiiupAh6J77CVWWd9AzvH3iYCpCusPV6FCT9ll48oDtnd/5OOxC0wMm5Ajcf28aRokXLAmsIZVliMh5jXFVII+OvdO5kja25A1GhCgcWZvLe7wbi79t3sdccBiVwFSAkjiUJgjYQbXwLywGHqzwdJAcEE1INgD4BUleydPPRM6zWawZ/dKu7mv3U2Yd7CiH+uuJKLL3joVMafYGXZ/g5eFHd5geUTv9cV9ihv2/vpaQq0re25nBniyc5SP0N9LvY2JjixLSAlQBVlUrXLkcVxpNx7JrcO+S+AC2l+mXOo81FGMTMJCx/6fLl+UP5Aq5RDErgKoDirCwR7cAbvEfTNtiwAVvjotf/siv2MbljRj5K73f86VX1ZcQltxsMyjoCPAbZ+u3BIfq65ALnXhyBZf143ROkz6KbPvPqf9ACWO8inDZbM9+zPb9uOfQtnPVzIFs0naztGz3e11eE7tpZUBQVbjw8RkVB276nDYngXIHxeIyiKLRz01pRFToF3X2y9H2R9+HBC7uzfwbAr13sNYhBCVwNcPYRYytxD996bFcEZwkiPaMy38wJPUHvuwIHlIPufEUDWnoWwNqq3+vzt7bSH1jOsyJ49jt5fQtZ/2/fdvv2oWio5yWerrx90ir7rBjufZb0osb7o1Lov7c2gUmwOZnicKVBwZ7PBYIOXx2NRqoIcqA2Iuph1VsCYWaBUGD+eFu33xQPdM01Ft2PQQlcJUhehbUNV2UEh3tZAW37JTnOtHbX0PrDXCq8/xx9gRbpUlUCnRgcLYM0QFSL3XhtktD6Ci4HT7Bvu84q6KkO6QcmezZEPwgZj5dtjAPRvIOOwboauoK7kLMhsSZAzfN1z2SfkhMBRlWJ7RFgSHR0+1omRqdBV2Wpo9hziXb6e1A6t34CZhYJPzBrmlQncM2lBPdj4AlcRaRF0TNwuAI2KwMRwPTM/nR/rVN39cZjFjQSEFj917KwsNbAWatU40QyEkBIYCDRyjhQ75ZfUwafjjzLMe7UDERUiSivv2uYodvo6r0Wl8ir934BFhyU7/2NFdJrvcOhpzOS3FJv857Cot6jPNtw7SCJwNN1+kmKylmHQ5MK1dzDx9ZgSQEmJW2tQVkWaFroUJie1RI3CQQ4Bn7i8mz1nQAsrgMFAAxK4KqAoSYjMSBGAAk4VjnNCgDoRD6Z/ia/ygLMli0uLz12li1WnuFZ0PgAawymZYmNcYGjGyNsjStMKoeqcEg5a+HYHzAnHrp22YmCS3GaSO6nmVbLaG0cjOp3kpi8l2Rc79/ywAtrK/H6+wfX/rTDMygLIAt4RyvSdCDL2lbouyprWVEAZAjTUQlnWnik6r/+VWimhuJk5m4idE/VGHISeObEfA+AFqoErmk3IGFQAlcBQpKNdwFQEHB4UnT5/9TjM0f8Neh0eeHxxO4K5/YaLFoPH8nulFZ9ITyNJQiEcekwLQtsjUsc2xzj1PYUW9MRrEV0DdTPYAiIDQAtYBLS58YCYAMmxDHl+4SSqDdnt1uSE5uuP8Z036dHv1XXfuHvgnrrmoA72z3+4rytAKDkzsj6rl3cQzr3oHu4JvxpqCoAncVI6xmZdKUEgA1BJ0YYOGfgfciBUQGJMZaI6NHzl/belXZ5htvhmsOgBK4CDAPkdMVhAQ5VhO2RElI6/zP6oIbgRfCxc3M8en6BRcuxNh29BplZEiIlGFg2LRZNi/OzJT5xcQ+bowKnD2/i9JENHNkYo3A2rvYUhVwgEnsMUxQGk8zpWFGXrfhu+CdoTQf0HuxXAPsCdQdW874CWFc4a6b8lY6LzjPgtVfS1Wq2IzsLvbhFypzkDEQ8UiZpGR2ckrgVOckokWkR4wbGaLegzmsgCJlfREcIui6sAGBQAlcNBIqjuQSHR+rHr3X4iTdi7RmPXVzh4xcXuvJDb17PBAj3moaoDW5y/wFlEQiAwIzLixp7qxZPXNrD6cObuOXYFranFQprIQwwMSwDYgyEWfsVMgMGMU6AHBdAXhl1VVdZ6Ipt1iqA1wyCnmhf4bUO/dV7fbVe2yPLevfO2tEOKA3pifHBc0rvRGRMVrCpc3NKp2YQ8ix0a61OapbQu35+LF7ANZ8R6GNQAlcDOoMCAKEwgsMV9VbSGAkwyiH42IUVHruwABHh0LhEVRiMCofSab08oPdh4xm1D9hZtmh8QIijeUwvcu1DwMVZwM6iwdmdGU4f2sDNR7exvVHBECGQlrgYQ9DqXAsSzqPKJPIVsv8bpT0NVNQGIIBw1hMpxtibKdjXEPuxjxwUzf7uOWehz6PLkiIS7iyApBjWTP9+kFGQrPPOGui5D9DAn7Wms4iS1dUz6teyMaT7sHBUBgBEps/hbrjmMCiB54doQZtbQQTPLBsFaFq5ZIRmH98QYe4F8zbgpkNjnNgcYXtSYlw6lM7BWc1Zg9QsDRzQBsGyDdiZNzi3t8L52Qqz2kf2bD4DWBjndpe4OFvhU5fnuP3UIdx6bBOFK6JPvG9+gXA0NEyUX1qr0k3sJpHkGvTEI6Xm8gv6qJfryEb7+rcUH6RsRd42RfoJko1/ObjrfodCRwQj8SP6cQFk16DbI6f+ROMRFtC0TQgQ4Tj+LDkhkq0HYw1C0GsjMscPXMx1gEEJfPboDGOiWwBAhLHlCIWN0X/TuQECQmUN3nByE+NSa9+NNVo/YDR2kEZyEQBnLJwhTEqHw+MKpw9PcWle4xMXZ3ji0gJL77u++3FkF4vg6d0FdpcNGh/w2hsOg0hXP2v15jewGhzU/5AsW4KJQtgrrc1pAc1CAEn1HJSBKwlr33zvuwuSX5B8mhju3+ciqCXD6K3+2cRPyqI7frYC8lXuM/dT2k+0TZhSggkhcD5Gd2yFJQO2VoSJCDix9ne/TjAogecPAmGa5HGjsh3Rh9Iiqu+WjjC2NheuSFxlTRorbkwcNtodGgDICEpDOLk9xqFpiRNbI/zG2V1cmq+QbvYgXcHLomnxiXO7uPnwFOPSIRgVdCNGE1uAJg9goyKIKx26sGEvLZAkXyGfiQTs89/3BQPS84P04WTSJ6Hl9XMmQRdZS+dlq6DvRkQEBkI8jzBrH8KoOJi5J/jSvxKNxZBmVYRk0ruK60YZDErgeeL4ZHISkE0WYGyBQ2OrKwyMGuGpVgC9gSFIAT+jJmf8TaS56rwaJ4oMdwy/qiC86ugmjk5H+OTFGS7s1Zi3LZZtAAcNLI6MwbgwCBzgQwwIOkQBiUHAKCMWNi74Kukc3YK+8joo+c+UMTiIdb997VV0F9JnMAoSeWGNFIT9MYEDKqanXHopyPRcVAmQ6a6dA2LdBfIsgTXZ5t7IdNWjU1xHwp8wKIHPHgRAfFWVpbBjCCaOMHZGV7AoRJo1QJymGSPvcbS4SQVCmRtgut9AF7VPk35EwExgZkxHBV53wzbmhz12lw1mqxaL1oMZGBcWRzYqWAgCh5yjYGOiISCwkV2nQUtVWmuDRAJAJJDERJL+p5Z9UbTurYT9wr+eTuxeWA/+oRNkrD/WGGJc8UmQSQRZgSRbIO7AfcWSvuYuPhNEwAiZYt1xCjRd21c+IgwiAYvciOuIKZgwKIHnCaJVAEoGgI2SEPsM6kqfx+galecYkU58gZS/1sGi6QY1ueVYgna2BYQFZFVJhOAhAkyrAuPC4NhGiTboqmZ6kW0EyXRgYpNveNiuPNeKieMJkkJC7k6WF+Z0MUmm8gvddR5kFe9fMNe5BbJP8FMwUnLWgCAIgMQeAckU4DTDJLoAKXofTxkN+RwwJJJOb8WUKBFArBmblJ3ItRewHa06KhkWgAPv/0DXBQYl8DxhTJiwUGkJ2C47Ie7PDUy+eucexNU1zhrMr5tu367hRfTS1SeFcvwZgI31BgEUB48XFCPmwrpSxoCkGE25EfWINKIR8iQYSioyQD9uEC2AzonoXj7oEtA+me+tpQdEZ93vjkt3Z2HI+nZ5pc8C3qcO95CthXU3QiTFBGKNRrwg5i41iRgfEBGAA7I5kK2W61L+AQxK4HmD6uo4CtkEEUalifId16JogubSQaBTDvkAnf+dTPOuim19ehCJthEjJsBIViYCr0LM3JnE6MaHG46cASKYHqsumcvW6pQkGAEZhmHbWQUpiInuGvW5ms60ph26LfMzkfV3ZL/kdu/lCWX5lY7JqC4AutVfkmzqZ2GR6N+nHbqogIHAc8AyCIpCrzuVfYsIQnIdkI7FWQ8K9HnHZbj+MJQSfxa47777zDfec4+97z7NzLEApRFMSwNN11FOP3UThPcF/ZOPKgSQiWXuXVMLYN1NSMrEGBMtCIs0CsuSjQFG3cfua5vFPcFn1irFEDy8b+JYcJ0SLOwhgcEhgEXz58lnVolbVzLY9/iAdPee5sW0ZzAkpdCPBx4gBeWFunf+vDpzd0W9zEO3b/zM6LkPaTNhLUNeiwd0Cz9z6LkI+eNdIRJy7WOwBD4zEADcf//9el+9Bzh5mG4RYHvDiRRaABDN8/WeAATkzACQLILeKk+mZxEQsLZn2gfR5zdgkkyFNfHOzfU2Ejl/3Anp2iqW0mKIO1gBiCFiYY1yCTRQSLEwQoMElHgD0a9Ox7qCORAP3TtnXtLTSXHAT+hIwNJ7poJIfMDGWPvVHa931mx1pAxL9PmlT2jqqaTe9bCIFnH1HReD5m2APHjFT3vtYlACnxkEAH7oG77sq55ehc/73bfih3/zP373KVOURWERrDUWMehHB2wsWnu83ypIE3zTqtYpDNm3b9qHQGJAFCLHXysLDBkEMIgsQFrrkrsPx9+GJcYXury6iMBYBluGFcBYiXaigRGCkIGBqDKgKETRVekPHe2JTO9LW1cAVzKquxTfOuOQIGCSaJYjWyV9V73jBsR6ACSboXMZDABHOkIMyXwTyXGBbGEkRcQCdLMKKB7t/Q9eB+3E9mNQAs8NdN99oP8VXzn6pUcu/vWzC/8XJ5Op/dkn2q9/y82HHn33J3YxOVQZG1fzHAjspf30KN0KL70b2anj2t2Ewso2DMkN6IQMcZ/sUgjl6kOJj41QDI2ZHEfQIyOfOwksR7acNtI0sCwQK7BsAScgsdH9EHC0BsTEFKagd23S66jcR19WOBsC/RV/7YvOwt7fe3217tKBPWckxQQAoB/xj1tZAgoAC05WT1Io+y6j+5Li99y9yUI/G9+9JoeMPBMGJfAccf/9YPs1T/yNgOIvu8Ji1YrfnG7ddOuJIzd96IldTApDSchNz4fPckGkC0vM/pXOwcX+920QsA9gBBTGonAO6TZXTns/qBifx5s1lQQnd0MkBR4p+t+i8Yneza2KJgmuKgIxAhIDMQwbA2wCwFqBiIFhgTEGZC1Mv8l/Ump5Jd8n1HTgJRzohJQ/I/cCAem5pvK4ZwEgr9pYF2LpDtUNN9LP4ggoLMBN6CyWpIxyELHnPnX/CwQkIk+Kkfc84w1yDWNQAp8G990Hc//94P/jq1//2qf26m+djC2sZRZhB1PIa06fxMlHPkWFkRiU67IB/UlCIoBzBGMNGs949KkLeHJngVXTYme2hGeBMKMsLCrncHxrglffcBQntjcwGlUAYpVrz8/oVtOIfswBgKSoA0VasCTFgM4FjoJFKYUYo+bWpqCgBRkLQ8qEvLwzw6xuYY3B9sYI02qEwhk4a9aye5JM8zWp6vvr+p/yc/hA7UCuMEwC3zcN0kMBcjMSQuQLJGUhMcCHmAEBnBGEoJlQ5qQMe+nKrFi7QCIETERGRD6KS+WZa3Hq8KfDoAQ+HX7+bQZ4kJ+43P42H3jqg4SicLYUhhDR1tZh3P2qk9jbvRD9ZaUBW0oBPs03l45wfrbC//zkBTz69C4uzlbYnc2f9dRHNsa44fAGXnf6GF570wkc3pxGjgA6K+MKq296X33hWCEIG7v/RN+dOC20yMIQl08S7UEgzAhsYIyFNQ47ywa/+uiTuLysUVmHyajExqjE0c0xNscVxlWBzfEIo6pAYV1UiMgrbo60p3W3W47XPkNe2HvBzv4W+jm6diP7dWEX30tmPGAtUFiDID7XDKRNnlmiRQBY7bdI330Jl3ZwnbkCwKAEPi3uf/DBIG+D+4am+ZJ5XYtZrWRjOsFopCkm60rccHgDYbmjXjhR18bKqASUzuHSosH/86uP4olLM4j3AATOGtx4+jS+7Eu/DCKCX37Xf8eZjz+Glgm2rHBxtsTF2RK/8anzeO0nn8LdrzmN1918EmXhIOhSj5x9W72dCQSOBUFZU6QgXvxcBBNdAHTxiZRnD9qhPwjDsAHBwzmPxarBbFmjaQNCEMzrFud3FzhzYQeGCJOywHRcYlqV2JxU2BpX2J6OMS4LVIWFtRYmuiid5S/ZN08m/0GJTm5RSgci/yh9oHtd1n44KzcDQmEIwrFgqhcsTQqp5wKgp2CEhX/28t7yP2Iflel6waAEnh0EQP7J4Ru3y0vudYumpd3ZzFze3cXGZILgG5BxuLwXFYClnO9PxABnLS7OGvz7934MZy7sAexRFAW+5mu+Bl/91V+N/+XLvxznL17Ed/3DfwA/v4S7XvsqfNO3/2Xc8do34Hu/95/hR3/8J9Ay8KEnLuKjZy/hc++4hC+581ZsTydg6k0wAnLeO8UIOoHvApNd7D0avdGMVjc/mvCsgtUV1QBtazA2hFuOjPEbT+0hBK9KTgit130bH3B5sQIAFJbgrJZMb44rHN0YY1IVGJUO47LAuCwwKq1aTCkrghjEDP14SFq1+9Kdrl/2iWw/0h85BNH6YGiBl0Evy3BAnrvnBBIRIRG5TJC/AWCF69AKAAYl8Ky4D6D7AfngpY3jhvD6UQms6pou7+zg2OHD2PAegRssFwsYo5RhQ8q2s0SwRom5D505j4+fvQyA8QVf8AX4a3/tr+F3/o7fgaIscXnnMv7NAw/g//23/xpGGnzLn/9OfN0f/QYAwFvvuQefevIp/OzP/ixGZYFl0+J/PHwG82WNL3/zbTiyNdWS2CiMEnP4vP/mJijzT5DjBur/W4gwrLGRFRdTYtEi4MBIrwirwji9WSD4Mc5cWmLW+Hgs5SuQSVN7CI1od6RF7bEzX+KJC2pJWwMU1mJSOUyqAtuTEY5MR9iaVJhWTnskEGI8Ik5W2hcO4DTFiNbdgb5D0dMXWTFsFFpX0aUC9+/XcyWIJCqn90y3jr3/0t6ZdKbrDoMSeDbcB+B+YATjuKDCEGFTNrG7t4vZYoFDvsVsPkfrPVxRgJBShKS9AYxBGwQfP7eLorD4uq/7o/izf/bP4tWvfjV29/YwGo3w6COP4Rd+7v8HcIuyrHD8xCkAwHKxxHQ6xfETJ7LZStG0/8Dj50AQ/Pa33o6N8QieY5pwn48PoGMcRiFNykLDAwwhA+bUeDSuyjG6LlBFkKcriQ4yOTkhjE2Js3uEnWWLOgQ0PrckgbFKaEqZEtbCBBgTEJjQtAGrtsWl+RKfuriHSVVgoyqwPa1wdDrC4WmFcaGEK6ZU7iudhCbpjjzjvivQ9xWSS5BMfpuzJD0OQca+ACSEiIgM6FfOnDmzxHXqCgCDEnh23K+/Jth9VWOPWjit+/feYzafY7VaYnd3V9tVkXaxTbEAQwRrLcpRCUvAH/8T34D/6+//PSyWS8xmMzjn0DQ13v3uX8Fjj3wE41GFxWKJ7/iOv4ETN5zGW978ZvzQD/0QfuZnfgYAsPRdNR0AvP/x8yAR/Na7b8N4NAJxKkHuVrjEQES6LtJqwZRfEElEn5g3B8UZCqIkpChkIQT4EMAhoPUtQmA4ME6NBEecYOEFezVj3jLqAIRAXdMxoswfEFBWkoFNjA9EN2K+xJmLhMIYTMcFTm2NcXRjhO2Rw7jQYv5exF4VFPoOQfpMAunHG1hy9WFlCaUBlrzOZujSm/GLQ+zULnxO2PyH+MagBF6JeCcg9wMIZG6pypKEtGf3ZDTBol5itaqxqlcw0F50iR9AFEuJQRgXDr/5zlvR1kvs7O7mCkEiwny+xHt/7Vcx37uEw5sbCHD4tff+On7PV30VTp8+jYcffhi7u7t6MT3Cz0blEGDw/k9cwOa4wpfceQuMs8oYzH1wI7Enti1P5+walVJcPTlWI2ow0YoomSZ2KUbiG4gW0gRm+OCjYvAQDhgBKEvgkBO0XlD7gCAEhoHOSQKCsfBswSD9EQNmVQ4cLwdkEJix2gu4PF9hUjgcmpQ4tT3G8Q21DjL9pxcczEG9rCD6FkAXSjCGMLaCZaD9WgC9KAkAMAEWgn93cW/vV4D+W9cfBiXwHDDd2KpCodOFpbAoqwJ122C+WqKuGwBY6wuQOAIAsGwavObGo/i5D/4y/vn3/QC+9Zv/pApFCKjrFeazeWTnEuo2gIjwxBNP4IknnsjH3V+9tmwCDk0L+GDxrkeexI1HNvDa08fg2UMk9QwExFjYPO0oKYIegxEAQ5ttpuIl5enr3MQo/3lfwGJkDFBWudLRWANrbEyNatjRex8blqgDHoLH7nyBvdk8BjMN6gA0LAA5sCkQxKARZSWGSOfdWzXYWzV4erbCsUmJm49McHyqllXmSEhyCLj7X7rOw5K1hCrDSQFcaNZ1QFriu3wAbGCeS8B379vkusSgBJ4F+UYxbqtwFoEFzA6F0xz4Yr5AG7ya/sbkSj6L1DU4+eaEL77jFH7u3/4YmnqFP/XN34ztrU1cihOMjYmluzF1ZaIiyemzfQgi8CC8+vRJPPbE0/iFh87g2OYYW9MROCDV+8AIAxLjFOn6jIWlWBwE3YbJgjmAyXRRdx8LlAzDiEFBBgQLIgtXOHV1ihJFWcI4B2u0dyIZC4JWOlqjBCNmQdu28G0NECGEFhfOX8ByOVeLaLHAclWDrANsASaHVgxWHlh5xsoHPLW7xMV5jTfeuI0btqpOwIE87TwRhNQN6CoOU6aBCHCmX7h1gG6F+JQA+W+X5osPxteuWysAGJTAc0Ir5tTEanJJS+x1dV3VtQbVbFxh0QXiFNHEZMHGZITf+qZb8N5f+i/4oVGBr/qat2NjMkFRlHpzugLWxuZfzyD8fZRliZMnjsNYh4cf+wTe+9hZ/Oa7bomUXpNN3NhbG8aYKKjKALTRVxdhGGYwGwRKgsFKEybWDkSJtmwJxlg45+BcodfsVCFY62Cs7YKiZOIkH1WI1WgEos3c+OPo0ZMqpN5jbzbDajXHYj7H3mwHEtTbd2UJMgUaAZYNw4tgWnYjAEXSVOIejTgKdr9Dcf4uIP3J5D3I2i+F+Sg6Q2hQAq90VGXJmvrr5ZFJZwNAkEdaZ387R96QA3TeMyajCl/+xlvx8Q/+Ir7vox/CV9z7h7GxuY1GDIIItjbGuLC7QGB+VvvTGMKxI4dQliVuuek0jpw8jYc/+D685tQubj6+Dc8hditSIUjkJXVZLKzTVGZi8YswQghddXAsImIOACzIpRbqqgSsc2r55MxD/E6g8Q5VNGbd/UjbmaTkot/uHA4fOgTBNnzbIgSPxWKO3Z0dtG0NYca0KHB8Wub0ZjL3+1kAQHJGozu+dOXU8e9QmN5gld532ntMIsICeXd8+brvuTEogecAQyTGaJ8ApZHoDZ+ENZnauXMwgByhiki+fWDGHadPIATGI//tAdxQOHzeXa/H+fPnAFPgyPYmzl1S8tHa8Mzeinfs8CHcdOMNKIyBrUb4o9/0x/HPv/f78d4Pvxs3H9vOfrLuqAJojIGxFtbpuHMyDmmwmdbOe7DRQaYiHEuNU9CwoyqnHgldKpK1upAZgTwEVl0a0dmIZJB5DOkYHVFHjxKYo8JRV2g63cBkPEFdr7BaLVHXNVg4jVKEyqUWAqXCo+wc5GBh8vK79wFtwbZWANWvSdCAoBHgbBnwIfTfuY4xKIFnhwBAK3SqMgQxXeQo1eMDBGu0JV0qIT5gb6b7Pz6o2wbWlags4XQB3PLFd+PpSzs4e+EiPvrJs/jAxxyeOn8RdRCEfW7BiePH8MbX34HDhw5hZ+cybjp9E+5+y93423/rb+Ibv+4P4/zOLo4fPgTvtZeASZmKWNOgK7ODJQtYdRtIOLsyyglwYBZYy/uEKj5mdRnilL6OmisWYgQSj6vKQDRYmRSaZLZOtkISByDV9nNMRxpjMBqNYa1F2zTwvu2Z/dT9yqn9jjHYtxCyPhQtIipI0EpPlfX0QHz1idF8/kj/HrieMSiB54CWeTv3Ctznf5ocGU8DRNJ7/TRUFyMAoBNwRVdgYYEExqmjR3DDsSN40x234SvqBk899TSeuLCD83tL1PUKy+UKtprg9M03Y7K5jcVygc3tw/itv/0rcPKGG/Hq22/H29/x9Xj0v/6YCr4hGBt/ctDOdOa6s8obACASTfZAMMKw1kX6sIsrfaoojBEDFhhhEBMMB/38MSho4/G9CWpxWBvjAyZaGpQtJQFi5V+I30UA0vkgsaJR3RTr1MLQLsupOjGt8uiIQzFI2FcISVHlv4Jo5qL/d1SOMoiVGPVPHlea8HWdFUgYlMBzgLWGu1p+QNJUTmjqzFobiUKRPhv30ygisk8cU/PqaKbgXwxtt60HrIE1DhuTAofuuAN3vd7CkaD1Hk3r4VkQGPACtH4C4yqMVpfwkXf/Io7feDO+8nf/LvzIe38GIgxnLZyxMDYF7mynDHJaryMHJUGxxoKthWELY0Ln0wtyY04gylxuoa5TmK3xIOeiZREAcoAECFnAWZAooarz7VPknkGsBVkhhMxOROA4EFSZigRlIgZhdMVBeiBtNNqzLtLj2CGoq6mQXifmqIRUUQQAVoT/x3hv8cDlK4QPr1cMSuA5oCsLRuS1Q2+8IECBbAV0PBzquQYm73eQoZJvQABJMQSEoEHHWiLLzgBEFsZqSWwFAKWujOc+8l6c/Z+/CleNUG4extGtKbhdgaDKycUgXcdjSKPOYhRfJLYnS7GNaNmYpNhSDEBTfSn1BgAUSPsIGMZs2WDVMmYrjyd3l2gZkN4wlaSICkuoCoeNUYFD4wqj0mFUWhgICkOoCqMlvyxoGUCQqHxi7j8a7Wm0eF79+18r0Fvlk2Wg+5YWMGC0kkbBSTIaSCTsEeh7PiWy/NIvJfvgg7mV2HWNQQk8ByRGW8exiUZm9rfXf7q2YrojXWFRkRhgTL4zEatZHt9X10JnEqQ94joWAxMqDsZYoAB8vcTi0tOYlA6NqQAIrHE5h58nE/cZgwCQphQbghEDJoojvKMiSJ8lRgBCDOARBD4wnrxU44lLczz85A4uzhuICJqQrJyULdCx4MaoxVA4B2ModlfSc5TWYHNc4MbtCarCYLN0OLZZYWPkYou0rjswYrYjfR+IjyT1C+xnBdFTtQJYitfODGdy0FUAMUTmP1/Ymf1YTPH6n7z3Xvv2Bx7otzS4LjEogeeAbgxIz7uPXXo0/97Rhbt0WErJIT/vjpICY9gn4umB3sgpa09k8utrwosucAdABd46FHF/YyycddkSuKKF26Mjp6OnIKEx1KX6TBzaIYxV0+BjT+/ig5+8iCcuzeOgT6AwqjALa2MKUdCGBuIZq8TXV6JF5Bo4FEURlYLBxRnh0acug5kxsgYblUNVGNxxYhN33ngYhU3pvWibxO+1zxNICnLtJ77GIrBEKAyDWwKnskuAfBC/WDQ//Yl/cO+Rn3z/U7ceKuzFt/+LBx5/7nfJtYtBCTwHJOIJgLiSpq4+iRvQUXMP8POj4K2JH+2zDXpPUtfhHNWOEfvkl0fHdh8iYVYAshYW0b41Npv+sr55PH5SM+gEJqbgkuKwxoBNSg0KLu3N8UsfPYtLsxonDm/jta+6CUc3J9gYlSiLAj5esyEDBrA7W+D85V1c3Ftgtaoxr1u03mNnvsBiXsfPbzAejzAZVeq+WOVNnJ+twBzw+LkdnLkww1e85WadqSCagRARHaAKrH2+LvegNkvXhUhgDGHqgPMLzkVOPjBtlubC133xXb/lP3x4909bN7p9N7Tn/va9n//90+ap7/v2f//4TjRsrkuLYFACzwE51YQuDUiU0m+mKxgim90DEynEqftPZx10acQ8oAQ9s7+vEPZF0rPq6Pu90VROk4sp9jQQkt6Y814LjhxUW9M8WiwU/W4yADHlICGzRVWUsNbi3F6NL3/rXbj55FEc3pqiKit1SWIPQopKMV0LSPkUgRltG7BqaszmS1zem2G+XOHpizt47Ow5XNhd4MJsBTIG1jowhxy8DEHwxKU5QBZF4bTPQQgItE7ky/MWogLVR6mmAPnvd2QkODMT1B6wRPSWm7bxm15384lTp059gxgL5hW8+MNFVf3dJR8bAY//rXe+E7k063rDoASeE7QijdK/XhrQ2DRBOCqIaEJT0hL9AaOmcwskKYNsYRiAOrFfTzEmdO5AjoKHoD8cdIYe0Fkane8SPwNBmCCGIYGQmnKkKPoaXZk0UGhdTBMawqiY4J4jx+CsVgOCDFattke3RmLJskXMBEajSb8L5xycdZiMKhzd3sItchwQgfceq7rG5b0ZPvn0JTx85hzO7S3Qti2a1qP1AeW0xOkjmyjKEs4aePGRXLT+PSUD6sBXJlkjQEDYHhd4zSHGuSXhjpObuPs1N+H4ydMEAjdNjda35FsOPgTyjD/4//yJz//Br7n/V8+kprOf6d3zcsegBJ4LUstrIAelcpq6h/WRYV26MK77+w4aI/K2dxjqK4D+Hp0rkMWWNa8ego4U4xBytFwt4BhXkACCtg8jwxCjaTdrLBKRPk3a6QfWVIlZWKhLoLRinbAUcvbAZgWXUn/9mEj+1EkQEVt7Qa89kYTKwuHUkUM4dXgLb77tRrRtq2XaTY22bSPtWeMIRAIy3fyP5JYlp0vyO/H7ou4xROMrZVHh9hMOd29s4vChIzh6/BRc4eDrpWmaBt43aJrWet+yMN/5K08svwLA96Wms5/h3fOyx6AEngNYREQYIPUpDUjz1mkRyqm3pAi023Cq4e+X7ipi8rDnGuga1R9J3g8bxuuIr3DsBMysFoAE7nLj0pFsEIOKJAZCrLGKyAEQ7QWm19JTOIxkVkerhiwIDjZOXDbWgaxFKphaY+CLmt8Uewho+m49JiLxLLnST8k58Bzi/D/tQjAqLSo3ArOLHAEV8Da0V4z7rbtR6YHEKc1R8ZB2XwYZOFdga3ML24ePoaxKSNugbbQ/RL2qsaqX1LQeZWHhQv0FRPi++x98MOA6xKAEngN8CE5Ye+Mb6CooyWOnHlG4lxVI3Xz6g0k7G/k5nDTF7aDrW+LCZ2ptUgTZ1E+rePSXWTsaE1J0X8uHU1uOAIPkUmvHn16djGqA9dSnjRWDkXcAxDw9B1U+uSsoIEhuSZcm7diWPbcjWgj9PoKIIwgCq6vDIb6fYqWBMzuQ+te7PzyYyUPo3IG0ORFKV2A6maKqKohvUa/mWCzm2JntYXc2Q12vAAFNJ2NMjNzA34CCvhftwRNd+xiUwLODAEjwzfnWe0gMeF1JiLNCSIOI0HMJkqKgfUfuQ9IKHAeA5qh2YrRKHqqpwb2Qm3Eqqy5AggcHnTAcvAciA1CsgRWj159z7X0LJd3XUYlZC01HukhU6o9SS58tpecsgKCXm83+9Jk45le72EcKcSLWH/Ram/beV1ZDiPEXiQNEsvKTkKnF2d1Y/yJ7ForkI0Ni4NQQytJhNKpgwKhXC+zu7uLCpYs4f+kCmqaGNRZlOUIIDLbg63L0UMSgBJ4Dwmr+yXY8FluUBpDcOix5++l+S4YvEcVW2uj8416e/hkNgTUPYC3xnX3qdTs4/o5Cwsw6arxp4INH7v4TUnpMQKwmMgx614VeQFDZeyZWRAqi1bNme/cuNDYvTdTj/R8o9SmUvgZMtQGSrJxn+D4MNIApyc1R9ydIR1/ODVV7V5YXfpacNckfL7ppZVGAALT1Ens7l3H26adw4dJF+OBRFSXKcoSq1LQnxBtcx1pgUALPgvugLcdLWb5vsWpoal1c0TUQ1pmaUSABdKHq9acZa+7AuqcMQMty90mFpNVNut/Jz00FNywaIPS+Rd00YGa4wuVAYv4lAqagTPm1TIMGFHNvIdL1GWyiVdAJWLa+ycCAtUUZAbn3huT/+h9i34P4OyqJZIz0vxri3vWxukLcdx16x+y/1MUh04dOjAD97q3RJiht06BpG5w99zTOXbwAA2BzuomqHKEoHArnpCwcrPfn73kPPK5DVwB4BTRMuBq4MF+8az6fX/KtF8/MfXO9m94DXGmN70UMekHC/nbrN3CnUCS+l8zb7r18Rk6ViAHsPXzbYLVcYtXUAAGFc3C2gC3K2LmoiIVEBl3ZMCP4Fr5t0dYtQmhzoVBu0pGuUgTIbbv29RhIvRR6cRCsfdS+okwrs+TjY+3//oMYPIyKLimCNdeDOncBLHEAoR6iH8pPaVmKk6GWqwWefPopnDt/DmVR4ND2YRzaPoTNzQ1MJxOMxyMpiwIe9hMEyL2497qUl+vyQ10t3A/wfffB7Pzqzie4Xfz7pqnJt8H7NoQQOBMJO3L5PmsA3dN+BD5BEIeMru3fBbE6we/26CzydNNrINC3LVbNCovVCoYomrIlirJCUVRw1QiuLGHLCtaVMFapugKAg8D7Ft43aL1HYB9HlncFOp0CQrZIeh+uCyDGfomJAgUcDIT2exOkj5iKsrpjRx5EJABZk96Pk4ohOXCaLI9kHalxEQud9l2qIc3uhMDY2dvDpcsXUZYVDm0fwnQ6xXg0wriqMB6NMCorIkAWjXwCAO5829PPJaR7zWFQAp8GDz0EegAIq/nu9527cP7S7u7l8uLlC3a5nJk4pqo3DRfIXW76wi2diK/HD+KjNaHqmedr+0l+D9EdYNGCnsAeTdNgNlso774aoSgruLKCK0q4ooIrKtj8u4SJiiANGwnM8D7A+xacavbRv9Yu+7Auvd1WOSWayFKJQt2Piax9zvT/un/fnUuF9uJshXc/8iQWtdcmqb1ofz8EmL+f9D9j7XpNDt4a1E2Di5cua//HjU2MqxFGVYmyLFWBlqUUZWUhfGEblz4AAPjS648jAAwxgU+LBx5AuA8w979/73/8iTc393xqx/6pJghPnBFbTf64CB+Nty/l+vbe7U1YVwBrEW0BiFK8PHbj2bdwZgUg3YqciELC2oEn+BaL5RyL5QqHNjdQliWKooQrR2urvh5KwMGDKMBDYNiDWkBYqwIFLdrWwbnQU2zd9WZLAII1hqMGEtIvNblFPxnFz53f7CuRJMS9lGF3OoYF4fK8xvs/fg7zZY3Pf81JaB+E/r76Xzd4pHMz1sMrlM+7WC5RNytMxlNMRiOUhUPhCq1sLApYYwTCtMPy2Pt+6eJ7AOD++6+/eAAwKIHnhPuja/n9H6g/BuDPA8A//p0bx99znn47gKOid12qDO4JS3zBxBepL1H5Fkbq9acvEmTN6OxZBLmRhuS0YPAt2rrB3nwBEDAaVSiKolv5XQkTG4roMQTBWBC12rUHXYWhCMN7wDpNM7oQYEyR3ZnukiRfl1yhGEqFXrMjOR2J9Dh//Pw9EbQQqB8ATTqBhTEqLDbHBc5cnOENNx7B1qRACPl0+ZKSVZa6NqWIQFeUpT8+BDRti6IoMB5VGjtxDtYZWGdhjJY6c2C40Pzqg4CP131dKoHBHfjMQPcC9l7AjhyERPa0eWhslimJrSc5h4+4OmWtkDwHlYpo2va75OQZWog2f4zHdWO2JRYMcVBFsGobLJYrFNbCFRXIFdpRyFhVAFb7CpjYItwV+ttYbT+eSD0iAh8CgtcsAzOrh52Eulv3O3nI1xu/IHTU4Uw4ArCmKnJFZA8pwNrLqhgQWIAT2xPccmwbpbM6T/DAMTonIF0v9KvrUono3BrPAQJBVVYoiyKnQ1NLdmsNjLVmtapFpP05ALj392vz9usRgyXwmUEeiNGynzw6m/2Ps9VejGqJIPXhk2yOAuq3E7RqT92AuNoxqwBKdwsD/ZLhdMZeNiCvdpEsFFtvtW2LxjcQTKJsUF4ZNZnBumLH1ZDIgKzTFS+2RoMIQtARY97arhYhrqom03rWLi3LIvXEDEAu5pEcGNT5BdocOFoEBiAGeJ+CSbukr8Fag8959UnceeNhlC6u7Pv/MJETkAVfOBKS4vcaD8qxWtIag6IoYLOyNLCx6YkzhskYI6F+X7h09l0AcOcD16cVAAxK4LPHAuyZgukFAtMNqAoBceqv7RRDT6ApruqENA0oCgnQcxv6iKtcr9ovuQea5tNhoa0PMG0LT2oFWJAWDLGJdN8YG4irIZHWATAAzwGt97DOaZ+/2NtPz6PlyUnW41GQyVLUew6gx3nO7gzFMEES8E7fSbcpESS2SU9kJhGgdAaFLeFbjyCJVRkVnfRcpf73Q4lOHcsk8vdIKGycJGW1EjQNZyFjAWNFQoPFYvX+73rP4snoTVyXQUFgUAKfDeRewNIDaO59izxd6goqHJtiBhaYoIQctYgD0vRfYQZbgmEgRGIOjMAw9GaP6au1oAAhZx+yKyCcFrrsc4sIFosF6noVTXJtKMoiMN6ArQGMzX0LmDWtyOzBImh9QF038CGgKENWABwnFIkwGAQrSiBio0HNHNwUE1fw7BcgxQKTtKeR6MkCUGE3qhBTMDFoRyJDBLYGFBjGaHPRPB91f81wVAAhFiCJxLqB6EppCWV06kXHq7migMudkLV3glEXSYwhu7u7WDaznX/KAN75zuuTJJQwKIHPAnfGG6Ik+QQzYEQMY5/PnlYjFrAREKtJDhaI5dhk2EbTOOSmnGLW+wqkwhyG5NoBiStfir6nvn17sxl2dveALTV9hQAXOBf9kNUBKgRt3d22DdqmQb1aYbFcYL5cqmuAcQzK9a0ONXXYxCEg0QLQa45fTDT3DyTTU1AxLql61V3eRIuXYo9FCpAcRYjj1InzbyEDwHexFVEmoc6J1OYleZZB2qhnNQiAwjptkBpLol0co2athTVWIIHELx/8p7/85HsB4HrsIdDHEBh8HjASloFDjNR3lX1pBeXoTzPHvvrCMa0Xb9TYDESP0a2+/f0TXTYpl67zbrzJSWCNwWQ8hueAp849hYuXL2E2n2O1XKBeLrBaLVDXSzTLJZrVAqvl+s9iOcfu3gyraEVY6rIJisiFSKW/6Mzu9Nkzh4B715byc9EHSLUMADqCUSy4So+NUcHPHZJTU5bMNdBDayPi7jsWDvm7WXMLkNSJXoYlbXBi44yEGASMgVIHIsC3Hot69fMC0H333Xfdy8hgCTwPHBvLB882zJbFCLNwYApGYJhBadAn6bhx1giYNu8MnBcokigEIiAjkCC9tmNd2iuNC5PejZ7MfuscppMpNqcbuLyrxTDzxQLbm9uYjMcxAGbz1GTt7+/RNi1WdY292Qx78z1tCV5ousykRiERXflvEnLTZQ3SqhuJRwi631rDjwMmQrQFKEYIEaIXpA1UCQQx1FnyaizkEGrKSqiSDFkhpPSgJOUEgSUbadKAdUVc+WMQMFpRzjkYY4UA2tvbfaxZ7v0YAXIf7j9g2FxvGJTAZ4H74304LeVRXnEjwqOQOO1Iq7yAiUGsZiwnoU4rWswKGImxgBQojE1AktmccufJGkB2B3SVM7FBxmg0wtEjR9B6j/lihouXL2GxXGI8GqEqlTuQB44Iw4eAtqmxXK1QNzpsZ1Tpti7myrVXYOzSC7V0DAAYA0aASRyAtMIz9bIFV6ii5LW0R/dQAwdIccfoDXSB0rSJaEAzTUTi2DwlBIb3rBZVLjLqlRrH/w1RrKeIw1Kc1dhAnAhtiNDUS/L13k9+94NPnBGA6Dp3BYBBCTwvvH++98SEi7PC/KoQdOUJgWEoWgOBYBB0yiURmKB2rDEwQQWIgejvkpbfGwsi3peRT1yDEFdBye+AKCoBbX8OAc5dMNiZ7WG2mGO5WuoK72ycRByP2BMiEDCqJpiMJxiPRiiKUs3jJNEpBkEx0MickwLIGY2k5DowUjERsiI4UEGRU6RAz1foffb4cQXd0ZnXYgAhEqfSmPLMv0DsuBz9/2zpxBiAPtY27SAjRKDFfO8TZu/CvwJA78SBj3RdYlACzwNf9x7U//7u8AQzv4o5CDOTrtgBwtrEwxuBU7ZPt8IBCEQwMSQTpOtaxRTyRusCk+2CnEFUM1mJLqWxKIoCZVliPJ5gZ+eyWgOrFdrWo21bpNkIQLyUWFtflSNsbmxic6qddpwrYGxqo56i6ukaYgWf0YlE/dz+FUKCuRw4Ve9pBV/Xop0j/yHxEbpzrFOCOcUfAscpxqoIQgjwXnstSmB0jVZUGZDtipsK57LprzThEoUrlCtB4FCv7Plz59577peeflg6HX3dY1ACnx0EgH07EN5BeA+LfDGLSGCGZQEzEEwkpQhFhcCx068qBIrR7lyrnznv6fBqIQApHkY90zvl21SoTe4VqGXDtqgwnmxge/sQ5os59vZmWK6W8NyCQ8gC6VyBcTXGZDzBxsYGRpVWHFrnkJqK5rR/ys8ZnUWUfH2WxA2Qg2tmvm7E66M8nDR/luTu5CWfs1JIpKgU8OOQVn2ODVYDfGAE77Ni4JyZ0e/YUDcQtSxc5gfo0BNVAAAQQjDnL14IOzuXvv8BoHn721PLpOsfgxL4LPG2t4EefBBYenywcB4SLHEIYBvAbMBsYEhbe6egYIKuwIDAZDILYp47R/8lbUd5iIjKpAWZyDHIHY1jPb+xcIWBcyWKklGWI0ymW9jabhB8g6au0fgWQPSPiwJVWaEqy0wldnFoKWKUHoisRyIQoiJDWsX1uvXye9mA/VZB3CGPacsTikzmOFA8VuopmElQ3GVesgUQGJ6V3RiCkof6bM3URKQ//kwFv0RRlvmxdQ5kCCIsvqkxn81+9sd+/dJ/JtLCsRfu7nl5YVACnyW+9EvBDz4IHC39Ixcb2nWm2ArM6hKklKFhDfLFPiQiGpQzkUXYb5AtUE5AaD08+5wlMJbgYhWg3tQAWPkEMfgOA+RBJ5ruKlEAKEdjBO8x9m3sTBxTfXFx1mwBdJ8oLEjCnCQ9+dhI8QiKfncXWxBo4DI1He18/3yQHDw0ZEDBIlhVWjY2LU0jzvJqzrGHYojR/+Ah0fT3sc26D51F0KUHQ8y8UDc23hDKokBVFrla0DmXFJBw8LK7c/n8hpndB4C/4ztwXc4XeCYMSuCzRCor/T0783f9wOjQRyDhc30I4pgpMMOaAGYCRaKQroKx1JAZbAxsni3Yp85oYVAbV2xrLeAA6wwAByKdzJMi3wadz5tq9tMYciJCkK4AiVOvf3SDVJGuIDHqOI0GD7F3ISMxAdVA6ZOipIvQx+YmzCljgDiOLbkqyPl/QwGGLawJEOu6suNEAWaOU4YYIbZNS6t/CAGeuziAD1pOHcnanTFC3fh1Zx1GlfYJ0GpBve2FAxjAcj43uzsX/kX70U/9eswIXPfBwD4GJfDZQwDQ73oE9TvuDj9Tc/g84gAfPGzQAR1EDIppNQY6/9oYjRXEA6WiHzJKXDEcQB7wQTsG177VBiEOkfEiMORg0uivODA08QAS+cZYp5N3UzvxXLugQpKi6EpOigVJgQBEBWBUqChH2/ssPTXBdcSYUpC91yEoHGcP2F6TEbP2Y2GZIdbACOe2ZABy1iI1S2HvcwzA+zb+TlaAVysgU6m7/oPp3MYYjKoKo9FYXR5rAeTWauzbxly4cO6xncsX/uGPPonFP3+FZAT6GJTA88B90EakW5Z+4WwTlsaEsZqnjGAERgSGBUyxYCg+tjEKLiwwVs3WVPOe/FhrLGbzGZ46dxFcTGGaS3AEjEYjVNUojvVSvruzVle4sogtxUoUVYWyGoFMsa9xacoQxBUbErn8WriTgoZGTBTmlAtMUQDJP2v9DX2rMYeoDCAE43QVThOIlZbrYK1AjMCIgRUBmy62IUi5/9gwhTvzP6386Xkqpe7KsFXJJTdARGCtRVVVKMtOAUAY3geumwa7ezs7RbPz9T/6gfnT92md0SvGDUgYlMDzwDsBuR/Amw/bX73wdHi3iPwWDhwCs1UaMIENgTgG1lggpNVtzAbGxlUZyFFqAeC4QFEE+KbFxZ0Zlqduxg3Hbka7WmBx/gng/CUUzmE0mUSii9FKOFJLoigcqtEYG5sbmG5tYTQeaxwi+ujr9UmUg3YmDiiJhoAWNjEghhHJDlr62+swxtkl0ClCddNgVa8QQoAxFqOyRFlWKCtBKQAskGcgxsxIHGWi/8csQFIEOkOhzbEAH2MAyQJZowoj+wLMzAAFIpA4Z0GxVDIggDnwqmmwmO2Z3Z2d//BD7z7/i1CF/opTAMCgBJ4XlFYK803/7dLO19658e7W+N/SBiLrY+CL1P9VQeNcY09BCUGSKm+iyUyIZj0ZBN9iurmJW0/dgH/z/vfh3Ktvxz13vwXHX/dmzM48htWl89i79BQMr1A5h6KI1kBRwrcB9bLGfG+G8uJFbB0+hO3tQ3BFEXn4HT0nBQGTMHeFSdK9H+nJIMS+AgYBAjrQb1B/tW2r1YxkEbzP2YVk9huxkdabYo+S8qA5OBi87zU4UWXQth5tfN5PC6bgpFpTlknEsDRgNliuDC2XYxiyQsYL+yCtb+18vofZbOfHJzj/Z4Hrd+Lwc8GgBK4CWICjpfzwJxr/bUVhbAhBgmcyhmHZanBQGCykg0BsSmV1aTUiys0tiCwgDFdUOHXiBG7b/hTe9esfwCcffQyvveMO3PrqW3HzW78EJTdolwvMnvoUFueeBEIA715CGRtmFoX66vWyxmx3hsl0itF4BAIhsNfS4bpG2/Y6CUW+PVE3b8AYA0sGZCmb9QCiwCYBbRF8iHwCRTLlfR6WCmRNGAlUTNHNSMxECCR0g1aTImh93w2Iwct43KQAAIg1bJjlUQL+y8jKxxaz2ZufCv7LN6abN1VVSd571HX9pG2Wf+c19cV/fv9DaPAKjAP0cd0XR7xY+Ml7YX/yw9P/DlN9gXMlV2VpyrJEURYojFV/WLvWwDjbFbK4QpuCFgWMUQEjIgTvsZjvQdjik2c+hZ9410O4VLfYJGCjKnH01Cm8+g134tTpG3HDDTegKkv41QKzp55As1hi58nH0Vw8h6IsQRJgIRorKArNNJCJEX3O5nxSTLmvP9Q60Ec9am8SvDQPEQIvwGK1gohDVVqMxw429jMYVSUm4wlG1SgG5wxsHMdsjP5W4yNmHIKPwb/UKEWVTN028K2Hbz0a30QrI2hjJ603MgL5j5PS/OWf+PX5hwDgPsA8elfxpiVVX1TZ4reKyK+HUP+Xn/zQ8t3dB3rlKgBgUAJXBfcB5n6A3/Hm8bfO2f0jY0uqyhHKsqQqMtOsM0rEsbraK3+9UCVRlNoa3BXat58IHAJWixlaz4A3+LWHfgP/6YMfw1bpMLVqZlPM7W8fPYpjp0/jpltfhRtvvRVFVWFzMoGvV9i7fBnzp55AvXMBTV1DgodfrRCWMyB4tTwSNRhd+W0KsiXyTuf7C1COdcaHdfDCCKbCbiB85JHHcOfhDbz2pqM4deMRgATz+VzJOkWRKckpiwFA4xHZKNJAYwhq9ocQYuu0Vn+3rVotwcP7JlkEwgAsgSqDf/RTDy2+PUp0MvGfScC7AoVXOAZ34CriZEUPPLbgPybCdwduOXhD3lgYG0BMCNQ1F2FIZBQyxHYTcyhGujXKbSBcwxQbeOvtr8JTu3N85MwFuFILglITz8XlS/j4hQt4/KGHUFQVxtMJTt7yKky3t3H48GGcePVrcaQsVXEACE2N1WwPy/kMwoy6XuqwkcgnSI1LmEOe5kOsffkEBLYFvPfKVAgeoWnx5COPYlG3GI0KHD92CIePHgMHr4VTzLGIyeVinv4AkrUOypLSjlrpGDhkqyD40GUO1HJJpOV2ZOkfvuHO+XfIQ8C9gH2go/zSfQA9BJ0fcS9g79SA7isyCHglDJbA1QMBkHe8efqt82C/y7hCyqKiqtKhls45OKNtrY1Rq8BGDntZVCiqCoUrdSIwAJEA3zRYLhdgNnB2jPnuLn7+fQ/jwu4chbM92m4szBHkVTsENdPJGIy3D6Maj1BVFQ4dPYbjp2+EsZpBcNaiqNQdyRaASObk+5iaC61HYG3V3axqtG2D+WwPZ584i0uXLuKpCxdxqDD46s+5A6++7WYcOnIYvm2we/kivPewxsBYlwOAkkaaRzeAU18AjjGA1qONsYb849sYF2jhvReBkCHCBuFbfuKh+T/l3t/hxf7jX8sYLIGrC/qcw/Mf+cWnx39M2LzFh5atN8bE7jiGAigOAg3EoBDA1iJwgAkBxjJcIhGxrnHGGHhfw8NhurGB3/KmO/DBRz+J+aIGQPDMqENAgMRF2wIQiNMKPWbG6tIFzC9oIO0J81HYsgQJYI2uzKOtDYymWzng56qitzoj8/Zb77FY1ZgvFmjaFrPdPTRNDS/AocrhK95yO2655TTKqkRRagByNBqjbZvIIkzTgxghrz8xz4+OdZiyAd7rj7oAXbAwBC8sIoZQb1n+Sz/6P5f/FJ/e/B/wDBiUwNWD3AeYb38Ql//gG+VHWwl3+2DE+gBrA0wwsdpPmYTJJQhB308ThcSkoh1N0muHYIFvF4CbYnN7C2+5/Vac+dR5NHULEGEVPFZtwMoH1MGj9XFSMQAxFM14IDHlNCovYPHgFpifP4+9c+dUicTqvRBpuBwEQQSeGS0DS6idnVmQAG7dnuK3vel2vOqWGwHLGI/HsNYiEMEVFRBrElhE/Xjp2IGSX5ds6isPwMfsgNZShOC1ZwAHYRYYwEwN/fUf/9Diu6Dsg16+csBngkEJXEW8U31NOu7cDz/R8NcA4Yt88GK9JUoltAg5JQ4QKKfCLExIE4ON+uRpK7JgbtC2S6CYYLI5xatutphdmgFeS3zroEpg2baYty3mTYNl26IJAZ6454OTCiXQ49rHsd/xubDAi4DBOqyUlf4cAsME5REEAJuFxT233oDPu+NWHD16GHWoMbIO1Xiqny0GBMlooFOC10voBSE58QLSSLUQ4NnDt0HTgj6u/qkXIwcQgSqS7/zz48V3/YRkfTQogM8SgxK4ikjkofvfPzv3Jz5n8q0XV+GnOfiT3hsYQxRSjz+t2AFxAAfABwPyHiaWDBsb/ywpzG2UqNM2cyUUFRXKyQhHS4fVXo1N0qBb03qsPGPJHsumxd5yhb2mwaxpULetrughBtyki/qn6BqJtupOKz1JCmAqmWjhAzyAibO44+QRfMlrb8Utp04gWINFPYO1jMnWUVjrIBKU+GQtTKoyjAonWxus8w45VgMmTkHrQ04Laj0CI4Qg2lIcPHb4Rz/1oeVf/qn8tQ8K4PlgUAJXGfdHRfDO9yze+zV3jf4twXxz8D4Ea6w3cdoPEchoLp6FIEEbkgar/QiITJyWkWi1WhnYUoO6nmnXH1uCrEO1aSAMbNoxJlsFgggWdY1F6zFrarUMmgZ169FyQOMDGu/RhoA6tGh8FLpU8yCMJgQEFjQhAEEwX7W4zIyNwuGNp4/jrptuwM0nDsOVFVbMaJs9iHhsbR1DWY6AaFGkluFBYsVeovnG6D6kKxPmGP1PxKWUIozBQmEOAoEZG/yjO0fb3yFYpBrMQQE8TwzZgRcAiQT7R948Pb5o8TPk3N3WlqEsS1vGclbtdKvkIBf5/kWhPHvrilhnL9Ec1qh4U2tjUGcqTMZbsNZp2Q0HODHYKsY4sXUYm2UF39TYW8ywWNVYRaFvQ0ATVAk0IWDVdkpg5b2+7lvMVjX2VjX2mhorH3BoawM3HN3GHSeP4uj2Jkzh0ASG9y2W9Q6MAbYPHcbWoaMoqwmMNarYQkDrGzT1Ek1dw7dN9O3VGhHuzP3W+8gDaNE0LVrfwEfl4EMIBsES8L3/5v7FN9PbEXuwDQrgamCwBF4AEHRK0Y9+YP70175h8tcW3v87hrHWG/FG4wO6SnJsR07qb1uNDWgk3XVdg8jAEqMoHEIosFjMQSBMptu5TDcIcKGZY3apwclDR3F8YwuHqwrHYuqtFYaHoG4D6qbGqm6wahss6xqLusVstcKyrrG3IhTWYDqp8NrNKY4d2sL2ZITJuNRVnwW+qdHWC6yaOYw12NjYxngyhS3K2NpbS5MDt/BtE0uA25zfTys893oCeB+iBdBqMDDGATgEJmIbGD99w3Tx7VEB9OOSA54nBkvghYUBwPe+YfJdwdpvNbbisihNWRQ6PtypNdB1v7WZQuxsEQOJMeefVlDfYrFcYrmqsTk+hMnGJtJ4cRMHhECA0hWYlGNMigKboynKooIrCzhjsFousFwsMV/OMVsssbtYomaPAIYYQlE6VKXTrIIhtKIZAi3BbbFY7qL2K4yqEhvTDUw3tjDd2EZRjZXgJIzgWzTNCm29QtM0qgxCj+zTE/42MQKbJpcih9AiaHGABfMjmxP3FT/6vt1HEjvzpf7DXk8YlMALCwKAf/I2TH/+3ORHxRS/x9iSy7IwZVHl9tdab29z7X1RaBts6xxSx+EUQZcoPPPFHMtFjY3JNqbTLZ2eg+iHA3kSEiA6djv190tkncRMTJ15Uydi0hGrnPoFxJ+mrbFYzVA3c5A1mFRjTCZjTCZTjKdbGI2nMFb7Injfom1WaOoV2rpWS4DXGX8hxOBfHILSNDpZ2Xsfm4mEALCFyBPHDb7y+x9avB+DBfCC4LofsfQSQ+4D6FsexGzT2b8Tgl8Gbo33XhITLxXvMHezAEI0k4OPuXFh7TlAqc+gxWQ0xmhUYW9xCbu7FxDaJrbY0tJ/sQZUWJjCAdbAA2iFUXNAzQGNMFowPAnYaN+DFkDDQesBotle10tc3jmPcxefxN78Mqy12IjzCapqhKoaw7kCADTV2azQxPFm9WqFpq1VsFMVYPzdRNM/1QO0vtXy4OARfGABWxE5t+Xwjd//0OL99w0K4AXDYAm8CLgPMO8UyNe+afwtKzbfaW1ZFUVJZVlRWRSRVrzuGtg4ISfxBnK5fa8Lr29bLFcrzBcLlG6MzekWqtFEuwT32nwn5L6h+ZVcv5vrBVLqrm1qLJYzzJczBPGoqgqT0QhlWaIsSpSjCqPRBNVoAldEJeDjkNO6RtvWUbBDb15AcgM8mlQN2DaxUjAqAR3UaCD85Gbp/uSPfXDvPwwuwAuLQQm8eCAAcu8bJn/fG/PnjC1DWVa2LKJQFV15cZqVZ632/09dg1J3YXCv2MYHNE2D+XKJ0HqMRhOMyylcWUbegc1/ZYpNPxUS6wQ0fddGP7xuVlgsZli1NQDW/nzjEapCx5O5VOtQVqhG2uZMJA4BaRq0von5/TaSfyJ7MfMA1AJqmmgF+LZzAYJnETFG5OyRSu79wQ+sfmlQAC88huzAiwtz68b07398Pr9HOHypb9tgyFhrDIIhGBMghrRLMWnDT2vUP4dJA0h7HYIjf6AsS1hrUbcNmrrB7qKBWVoUrkIRS3fTGO7U04Ml5A49PrRYruZo2gYsylMoqxLjarQWt7DO5nbd1howM9qmiRF/De751ueUJnPPAmDODEDvW9RtizamDGO2IAhgCXh6s8I3/uAHVr90L2Dvf4UMAHkpMVgCLyIif0C+9a6t13wK/t8JFW+0ruRRNTJVUcTBGLEBSWxEYnrderUIKVoDuRJX4hhurJndbdsihNSkI8QWX6bnToT4fhzUYbWzkU7miW5JGuFtrQ4pjT0QXJwZAKS2ZD5G9LWTUUg9AuOA0NQWvPU+MwHbtuMBBA6BSKwIPnV0RF//Q++f/1cMMYAXDYMSeJGRat3/0Jsm98xb+o/OFSddUUlVVaaKnX86RWDy9CFr49ofh44kpPLf/vPk+4c4yENTcr35AGmsN1J78tSqnLohJzEA2W8TTib28o9lyxDRsWDZzPcxnRngY0Vgygp0PQITG9CDOUhgFgMxEDxyeETf8C9/ff7zGBTAi4pBCbwESIrg7XeNv62F/YfGlFKWFUZVRWUck6VsQhMFT3+0MbBSivPckishuwxderFfrMMiOYWYpgmlYaUm9jk0MRYBEHR0genNRuyO21kV3ZCQkLkAnOsBfOQCeK9VgRwCs7AhAizws8cr+cvf9/7lu/c1BBnwImBQAi8N6D6AjvxOFL/0ifHf8mT/grElV+WIVBEUKCJPwMZZhDpMA12mgA5md7UuKQb/kstAiO5C7B2YlICkkWTJGkBkJnbHz5mFHr8gH5olWxWcJwTF+oOkDOKgkDZoJsCHNvYCYBYWCwEqQ3/3C8uNv/kXPvDUHIMF8JJgUAIvHQiAyH0wb/+pyT8OsN9iXSWaey+oLEo4W8BGX90Y000YQiL2pMNc6dD5DAeJQbGaLykKMnF2YBR2SZbB2uHi80wL3j8foJsI1B8Q4uNsxZT+Y2YyBGKWD04M/f0HHl78sKDr0/jCfd0DngmDEngJEW98+dp7No6u5uGfkCv+gHUjHleVqSptPJpShmqiWzXNdbAfemLaS/wlRmDsEhx7+KVIos4jlTXBXrMeDhwpnSATFda4CmnVT1V/IVGBOVUGegRuhQMLIMYLeETyr6Zl+Js/8oHmN9ZOOOAlwaAEXnoYAHzfPZg8tNr8GVj3JcYWviorV1UVXErR9Xz1NIB0nQjUyVIW+dTE8xnkK+2R5wD2/j+AaECoa9H5/W1iAcZWYEkxaIrQSwgBwkKxvPhXCmO+898+PPu3vUsYhP8lxkAbfunB9wL2/vdgcWps/jT75iM+NK5pm9A0LXwb1nLtqTdHEu4kQdL7yS8AcYGPK37vpP3HmuaLqUZGHmEuHDsORf8/Bf8a36JpvRJ+6gZ1XaNuGjRtg7qp0fpGWt9wCJ5EmET4N0YGf/1GmK+MCoDue4VP/Xk5YbAEXj4wAPib3lq8+eyq/NeuKF/vXBmKcmRHZZEtAmttjtQbkA4TTdQh2q8EJFsEz7rOZ5chPk3uA6VuwKnhqBYAZdJPiOk+HycIx5SfcDCaPkQ9Ivqu7XH4p//ifavHgQPtwAe8DDAogZcXoiIo33C2Lh+wzt1lXcVVWZmqjCQe5zSNZ7rZfimo108KqE9P3UjxK5xMekHClCpMNQS5xkAYIbYAY+4IPz5OIo7DQYU5MHOwBEFgtAXhP44L/1f/1f9sHo6nG3z/lykGJfDygwHAf+hN27fV7P8BmfKrbVFyVVYoy8IobTcRiQxMHGJqiHJHYXqmVV/i6s7dc5V3yat/Wvkl9gWUWFHoY2VjIvxEcpBO/xU2gCCwsCP83MSa77nj2Pj/e/+D52ZA9kSGyP/LFIMSeBkipcv+3JsxfYKn93lyf8G6CoUqA1M4u88iiEHClPNHP9DXQ2oqmoKHnJRCbwRZiv5DwD4FALtpwN634oMXlqBFDgB8kMZZ+a+lc9/7hdPt//rnfvnMMp5xyPtfAxiUwMsUSREQgN/3hslfFWO+xRXVDa4YcVmUVDhLhbNrDL+cMUg0gZ4WSPUG2T3oC7zEEWR5ElDqcRD9/9ajDS1z8MIcbJohQJAPO5KfNI5++id/3+J9dH8W+GEQyDWEQQm8vJH96D/wptFvboP9P21R/iYXrYLCObLOUSroMSCQ2V8y3EPKKEhPCcT2ZfsLi5iDeB9i8xNvIDoG3Iewx2IeHhn8p6PG/sj3fmj30XT4GPQbZgBcYxiUwDWAZBXc94VbRx7a898UYL69KKqjVlmF7Kwl6yxZUveAEsffAEoNkrwuC5LAI431zkIfRFL7bwkcjLb4U6Vgwe8nol/ZMvaH53fu/coDD+QIfz/VNwj/NYhBCVwj6KfW/sBdG2/w4G8Gintt4U5qea8N1jqy1hIZZfp3ZCKNy7EAwiIsOtGXOUgILMxMzMGKdDTgwMwQ/rgl+cXC0C+d3nT/5h/+8u7F3iWZ+wAMVN9rH4MSuLawFmn/2rsmv6MV88daMv/LuHBHhXTAqCUrseS4zxAgYQGLkMSuRGCGIEACo/XsWXgXgo9PHX6ahT7kLH3gxz6495He+ZPgD/7+dYRBCVyDSDUHiIL4jteXr52h+DZj6HO90FudNY7IqDvQy/lzLCBilqUBn3ckvxGYPuWFH9t0+MDJsvjAh/d2P/lfHkHdO92B9gUDri8MSuDaxhr3/s+9eXri4SW/alTg8xzoSEs4KUwFRLiweMKJeSoIn5kLnjoMP/vcrY2z3/7ui7t8ULTNvQDdCchg7g8YcA0g8vA/2zoQuvde2HiMZ0grDLieMfzBryMIQO8E6P789ADovt6T+4eo/oABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwYMGDBgwIABAwa8+Pj/A3x5xkxoMpcpAAAAAElFTkSuQmCC
-"""
-icon = \
-""" 
-AAABAAkAEBAAAAEAIABoBAAAlgAAABgYAAABACAAiAkAAP4EAAAgIAAAAQAgAKgQAACGDgAAMDAAAAEAIACoJQAALh8AAEBAAAABACAAKEIAANZEAABISAAAAQAgAIhUAAD+hgAAYGAAAAEAIAColAAAhtsAAICAAAABACAAKAgBAC5wAQAAAAAAAQAgAOzKAABWeAIAKAAAABAAAAAgAAAAAQAgAAAAAAAABAAAOCEAADghAAAAAAAAAAAAAAAAAAAAAAAACitWAEdZewAeOV8AFDFYJiM+Zq0nQmn1Iz5lzRg0W1UAAScDDSpRAA8tUwAAAAAAAAAAAAAAAAAAAAAAAAAAABg0WgAZNVwAEi9VKSdCasQzS3X/Ok18/zJHcv8sRm7vHThfdwAcQwYMKlEADS1YAAAAAAAAAAAAAAAAAAstXQARL1YACShPDyZBabU8UXf/LTdX/zU7Xv8qMEz/MkFf/zNNdfcaNl1bJkBoADJQfQArSHMAAAAAABdAfAA+V38AKkRtAB05YU82UHj6Ok9z/zxLaf9AUnL/PVBw/zlNcP9AWYH/K0Zuyx05YTRhfrUBJUJvAAAAAAAwT4AALEdwACtHcTAnQmrDSWGJ/1hulP9PZo7/QVqC/0NchP9dcpn/WW+W/zZPd/8mQWnQPVmEGTpVgAAAAAAALE2BACI8YQAzTneGKkVt/1Bnj/9kd5r/Y3aZ/1Jqkv9Va5L/YHCO/1hpiP8/Vnv/Iz5l9y9Kc0IwS3QAAAAAACZIfAAiM0sALkhxlSlDav9ZaYP/PURP/0dTaP9Va5H/T2WK/ztFV/84Pkf/QVRy/x40VeIoP2EvKUFlAAAAAAAhQ3YAKTNEACg7WUAiN1fnQFZ3/0BPaf8+U3f/R1+H/0VchP9CWH7/QlZ5/zVNdP8YJjrhCgoIIw0QEwAAAAAAIkR3AA4RFAAIBgAZHSs+2zdOc/9AU3L/QVRz/05kiv9QZoz/QlV1/z1Pbf80Sm7/HSg3+RASE0oRFBgADREVAAAAAAASFRkADxERIB4lMOE3T3X/SmCF/1lskP9meZ7/Z3uf/15zmP9PZo7/N1B4/xsjLvwRExVUExYaAB0hJAAAAAAAExYaABMWGSgcICXnLD1X/0hgif9YbJD/WWuL/1Zmhf9MXX3/Nkts/xspPv8NERb/EBMWiwEEBwAVGR0AAAAAABEUFwARFBgbExYZ3BIWHP8ZIzD/HCQw/xofJ/8ZHiT/Exge/w0SGP8KDhH/DA8T/xIVGIIBBAgAGRwgAAAAAAAPEhYADxIVEhMWGcsUFxr/GBse/xcaHf8cHyL/GRwf/xkdIP8iJSj/IiUo/xwfIuoUFxs7FRgcABkcIAAAAAAAGx8iADc5OwAgIyaDJSgs/yQnKv8iJSn/Jiks/x8iJf8gJCf/IyYq/yksL/8nKi6VGR0hBB4iJgAKDxAAAAAAABcaHgAoKy8AJyouGCksMIwpLC/eKCsu5iUoLPYzNjn/MjU4/yMmKfMcHyKZKy4xQi0xNAMnKi4AAAAAAAAAAAATFhwAKCwvACYpLQAzNjoCJSgsJiEkJy4yNThnOjw/4CwvMrE1ODtMMjU4CikrLwAjJSkAHSAkAAAAAADABwAAwAMAAIABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIABAACAAQAAKAAAABgAAAAwAAAAAQAgAAAAAAAACQAAOCEAADghAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACy5dABAtUwAPLFMABCNKCBo1XGUiPWTUJD5m9R86YckWMlliAyJKCxAtUwAhN1UACitXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAVZ/8ADyxSAA8sUgAHJk0QGjZdkClDa/YuSHD/Lkdv/ytFbf8mQWj2GTVcowspTyIUL1UAAAAAAAosWQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMLFUADStSAAcmTQ8ZNVueLklx/zZOeP88T33/RVSH/zlLev8zS3T/MUtz/xw4XsgNK1EuEy9VABYwVAAKMGYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAswYgAJKVQAAAg3AhYyWYMvSXH/Q1qC/y07Yf8vNmP/MDVg/ycsUf8gKUP/QlZ7/zlSev8cN16/CilQFQ8sVAAMLVkACDRxAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0vXAAUMVcAES5WNSVAaOpEXIX/OUlo/yQoN/85QFP/QEhc/zpDV/8nLj3/KjlW/z9Ygf8tSHD/GDRbbCQ+ZQAsSHMALEdxAAQsZAAAAAAAAAAAAAAAAAAAAAAAKUZxACpIdAAtRmwAHThggTVOd/8/WID/Mkhs/0JWef9GXIH/PFN4/z5VfP9FXIT/PFR8/0Nbg/9AWYH/Iz5l0Rw4YFYrSHMNKUZwACNIfgAAAAAAAAAAAAAAAAABCBIAJkNvAC5LdwYdOWFIJD9n00Vehv9RZ4//VGqR/1Nqkv85Unr/QlqA/zZQd/9PZo7/XnKY/1twlv9OZo7/LUhw/yM+Zvk4U35aOFN8ADZQdwAAAAAAAAAAAAAAAAAhRn8AOlaBADxYgzUqRW7qKURs/01ljv9fc5n/Z3qe/2F1m/9IYYr/T2eQ/0VfiP9Zb5b/aXyh/2J3nP9NZY3/L0lw/x45YP81UHqgTHCnAi9OfAAAAAAAAAAAAAAAAAAeR4gAQVuFAEBbhlspRGz+KkRt/0lii/9ec5n/Z3qe/21/oP9XbZT/WG+W/1BokP9rfJz/WmmE/1Jifv9fcZH/NU51/x45X/8qRG3NKkZxECdEbgAAAAAAAAAAAAAAAAARQYcANU92ADRPeW4nQmr/J0Jq/1dsjf9ga37/KTE+/1lfav9UZ4j/XXGX/1Bnjv9QX3j/MTU6/x0fIv9wdHv/NEtu/x41WP4rQ2etJENxDSRAagAAAAAAAAAAAAAAAAATQ4cALEdvACxIclItRGfsJT5k/0lbd/9eY2n/JSku/yY0Sf9CWoH/UWeO/0xjiv89VXz/PE1o/yw3S/87TGj/Mkx0/xgrRfwSFx9gBwcFAP///wAAAAAAAAAAAAAAAAARQYUAP1yKAGeX5AUXIS99ITdX/zpUff9DWHv/RVl7/0lgh/9FXYX/Rl6F/0RchP9CW4P/SGCI/0xkjf9EXYb/Mkx0/xoqQf8NEBOWAAAAAQoNEQAAAAAAAAAAAAAAAAAQOIEAPVqHABcfKAAPEhVzHzBJ/zVOdf9AVXf/RVl7/z1Qb/9DWX3/SmKJ/0xjiv9EWn//OEhj/zpLZ/82R2T/MEht/x8tQf8QExbODA8TEg4RFQAAAAAAAAAAAAAAAAAAAAAADBAVABgbHwATFRh+ISw8/zVOd/87T2//PUxm/0JRa/9UZ4r/X3SZ/2F1mv9abpP/TmCA/0ZZef9AV3z/NVB5/yIuP/8WGRzQDxIWEhEUGAAAAAAAAAAAAAAAAAAAAAAACg4SABgbHgATFhiAHiUv/zRMc/9EX4n/U2qS/15zmf9leJ3/aXyf/2p8oP9meZ7/YHWb/1VslP9GYIr/NE11/xskL/8SFRjZDA8THA0QFAAQFBgAAAAAAAAAAAAAAAAADREVALq+uwAUFxuaHyMn/yw+Wv9CXYj/UmqT/190m/9mep//aHug/2d6nv9jd5v/W3CW/0xji/80TnT/GytB/w0RFf8OERT6EBMXUw8TFgAQFBkAAAAAAAAAAAAAAAAAEBMXACcqLQAZHCCFHSAj/xYcJP8nOFL/OE1v/z1Pbf83RV3/Mj1Q/y03SP8pM0L/ICo6/xUhM/8LFSH/CQ0R/wsOEf8OERX/FxodcBQXGwAWGh4AAAAAAAAAAAAAAAAADxIXAA8SFgAOERRwDxIW/xATFv8OEhX/DxQa/xEWG/8PExb/EhYZ/xUYG/8SFRj/DxIV/w0QE/8MDxL/Cw4S/wsOEv8OERXzFRkcQRMWGgAYHCEAAAAAAAAAAAAAAAAACg8TABEUFwAPExZsERUY/xIVGf8TFhr/GBse/xgcH/8XGh7/GR0g/xseIv8VGBz/HB8j/xwgI/8aHSH/GR0g/xcbHv8VGBzLERUYEhIWGQAWGiAAAAAAAAAAAAAAAAAADhIWABcbHgAXGh4qGR0g4hkcIP8cICP/IyYp/xcaHv8hJCj/JSgr/xoeIf8ZHCD/HCAj/y4xNP81ODv/NTg7/y0wM+geISVWKSwvABsgJAAAAAAAAAAAAAAAAAAAAAAAEBQZABYaHgAMEBQGJCcqqyksMP8sLzP/ISQo/x8iJf8wMjX/IyYq/xwfI/8nKi3/HyIm/xseIv8gIyf/IiUo/yEkKLUhJCcQHyMmABYaHgAAAAAAAAAAAAAAAAAAAAAAAAAAALzB1gAqLTAAJiktJygrLqopLC/3Ky4x/y8yNf8hJCj/ISQn/y0wM/83Oj3/MDM2/yAkJ/8XGh7/HSEkqy8yNX4tMDMnLjE0AAcICgAAAAAAAAAAAAAAAAAAAAAAAAAAABoeIgA3OTsAJyotAC0xNAopLDBNJSgrlSQnKpQiJimbMTQ35D0/Qv81ODv/MzY58jQ3OtIpLDCBKCwvECYoKwAzNjoBNTk8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAfJSkALTAzACsuMgApKy8AAAAAADYyMAA+RksBMTQ3PD1AQ8QvMjXjHCAjYjg7Pxfd4OIAKSwwADA0OAArLzMALDA0AAAAAAAAAAAAAAAAAPgAPwDwAB8A8AAPAOAABwDgAAMAwAADAIAAAwCAAAMAgAADAIAAAwCAAAMAgAADAIAAAwDAAAMAwAABAMAAAQDAAAEAwAABAMAAAQDAAAMAwAADAOAAAwDgAAcA8AAHACgAAAAgAAAAQAAAAAEAIAAAAAAAABAAADghAAA4IQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAs1egALKlIACChQACE6XgAQLVQpGzZdlCA7YucgO2LxGzZdwhQwV2YIJ04RES1TAAYnUQAKKlIACi5dAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALL2YACypSAAopUQAAAC4BEi9WVR86YdUqRGz/LUdw/yxHb/8qRGz/Iz5l+Bg0WrcNKlE9SFNsAAkoUQALKVIACilQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACSxXAAsqUgAKKVAAAB5JBBEuVGwhPGPvL0py/zBKcv8vSHD/MEhw/yxGbf8tR3D/K0Vt/xw3XucPLFJpACJMBQopUQALKlIACTV6AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKLV4ACClSAAANPAERLVRuIDti9TZQeP82UHn/N0x3/0dVh/9MWY7/QE+B/zRIc/82T3n/NU93/x86YfcQLVR7ACNNBQkpUgALK1cAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACTFrAD4xFQAVL1IADixTTx45YO85Unr/RF2F/zVGcP81PnD/OkB3/zU7b/8uM2T/HyZH/zBAYv9KYYn/OlN7/x86YfYQLVNiHjZXAAIoWAAKMF4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALMGIADSxUAAopUhkZNVzLMUtz/05mjf8/UHP/Fhos/x0gNP8nKjv/KSw7/yksO/8eHyr/FBcg/z1OcP9IYIj/Mkx0/xs3XtcMK1QgDy1VAAwsVwAFMW0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA9/wAbNFgAFDFYZydCaf4+V3//R16G/yg1Tv8vN0b/RlFo/1BdeP9QX3z/SFd1/z9ObP8sO1X/JDha/zlTe/89Vn//KkRs/xUyWXQmP2QALklzAEFYfQAbPnAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABM5cgAhO2MAGTdhAAAdTQUdOGCxNE52/0Fagv83UHj/MUlv/0Nagv9JYIj/QFd+/zRMcv85Unn/R1+J/0hgif9CWoL/RFyE/0hgiP86VHz/HDhf2Bo2XnUoRG8sL0pzAD9ZgwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANVJ9AClFbgAdOmMNES5VSiQ/Z+hBWoP/TWSM/05ljP9SaZD/VGuS/0BZgv8vSXD/P1d9/y5Ib/9AWYH/WG6U/1xxl/9bcJb/VWuS/0ZfiP8mQWn/Hzti/zZRe6suTXoHLkt4AAs3cQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoSHcAJ0h5BTNOeZcdOWDwK0Zu/0tkjP9ab5b/YXWa/2R3nP9hdZv/SWGJ/0Rdhv9ccpj/QluE/0hhif9idpv/Z3qe/2J2m/9WbJT/RV2G/yxGbv8aNVv/NE945z1ZhSo7VoIACDZ3AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADlWggA8WYYeOlV/3h86Yf8vSnP/SWKL/1lvlv9kd5z/aXyf/2d6nv9XbZX/R2GL/0tlj/9GYIr/UmmS/2Z5nv9rfaL/ZXme/1hulv9CWoL/LEZt/xk0Wv8rRm78OlWAWj5YgQAAMKEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQFuHAEFdiTQ2UXrvHThe/y5Icf9FX4j/WG6V/2V5nv9pfKD/bX+h/2N3m/9SaZH/YXWb/1Rrk/9Zb5L/fYqj/01bdv9MWnX/YnGM/1dsjv8vSXL/HDZd/yVAZ/8pRGyFL0dsAB08aAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA7VoEAOlaCRDBLc/cfOWD/K0Zu/0lhif9se5b/P0xi/yszQ/9jaXT/dYGV/0lgiP9kd5z/VWuS/0dcfv9eZG3/ICMl/wkKDP9vcnX/dXyI/yxFbP8bNFn/LERo+ClFbnoxTHMAIT5oAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAChEbQAmQmxBLUhv+ChBaP8oQ2v/R1p4/5WXmf9JTE//ExMT/xoeJf88T23/R1+H/1pvlf9SaI//P1iA/zJFZP8/RlH/EhYc/zg9Rv86SmP/L0ly/xkvT/8WIC+0OlaAGDlRdwAVFx0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKkdyAClHdBc4UXebHS9I7iZAaP83T3X/Q09j/0BHU/8mLz7/M0Vj/0Nbg/9GXob/TWSL/0phif9CW4P/RFyE/0JYfv8/U3T/QVZ6/z9Zgv8xTHX/GzBP/w4TGM0ICAgSCgwOABUoRwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAVLU8ACxQfABATFhISGyjMJT1i/zlTff9FXoj/SWCG/01kiv9MZIz/Rl6G/0RchP9GXYX/RFyE/0Fagv9DXIT/SmKK/05mjv9KY4z/Pld//zBKcv8eMU7/DxMX8gwPE0ANEBQADxEUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADVYiwAOEhYADQ8RFhIWHdUjOFj/NU53/z5Vef9JYIf/S2GI/0NZfP9AV3v/RV2F/0hfh/9JYIf/Rl6G/z1Rc/83SGT/PVBw/ztNbP8xQl3/L0hu/yIzTP8SFhn/DRAUgA4SFQAMDxQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4RFQANEBQbEhUY2yIySv80Tnf/NUdl/zNBV/8yPlL/MDpL/z1MZf9TaI7/WW6U/1pvlP9XbZP/Slx8/ztJYP84Rlz/OEhi/zlQdP8zTnj/JDNJ/xcaHf8SFRiPGRweAA0RFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEhUZABEUGCEYGx7hJTA//zROeP8/WYP/R12C/0xggv9TZ4r/W2+U/2J2mv9meZ3/Z3qe/2R3nP9fdJn/Wm+W/1Nqkf9LY4z/P1qE/zNPeP8jMEP/Gx4h/xMWGn0WGh0ADA8SAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwPFgAPExYADxIWHhMWGd4fJS7/MUlv/z5Zg/9KY4z/VWyT/11ymP9jd5z/aHuf/2p8oP9qfaD/aHuf/2R4nf9fdJn/V22U/0tkjf9AW4X/Mktz/xojL/8UFxr/DhIVnwMGCgMLDhIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA4VAA8SFgAOERU4Fhod8SElKf8qPFj/PVmE/0hijP9Ua5P/XnOZ/2R4nf9oe5//an2h/2p9of9ofKD/ZXme/190m/9WbZX/RmCK/zROdv8cK0L/DREV/w0QFP8OERXfEBMXIxATFwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMDxYAExYaABIWGTgbHiLwIiUo/xsiLP8uQ2T/Q12H/09nkf9XbZX/WG2S/1Zpiv9SY4L/Tl58/0pZdv9DU3D/OUpn/yxAX/8ZLkv/DRoq/woOEv8MDxL/DA8T/xATF/gXGh5HFxseAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwPFgATFxoAExYaFhkcINIXGh7/DxIW/xAWHf8aJjf/ITBI/yEtQP8bJDL/FRsk/xYbIf8TFx3/FBgc/xAUGP8LDxT/Cg4T/wgMEf8JCw7/CgwQ/woNEf8LDhL/EhUY9B0hJEAeISUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkMEAAJDBAVCw4S0w4RFP8RFBj/DhIV/w4RFP8NEBP/EhUY/xATFv8RFBf/FRgc/xkcIP8UFxv/EhYZ/xEUGP8PEhX/DhEV/w0QE/8LDxL/DA8S/w0QE/8QExbHGh4hEhoeIQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADREUAA0QFBYPEhbVERUY/xEUGP8TFxr/EhYZ/xcbHv8aHSH/FBcb/xkcIP8XGx7/Gx8i/xcaHv8UGBv/HCAj/xkcIP8WGh3/Fhod/xYZHf8UFxv/FBca/xMWGpAhIyUACAwRAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASFhoADhIWBBYaHZsWGR3/FRgb/xMXGv8YGx//ISUo/xodIf8WGRz/ISUo/x8jJv8aHiH/Gh0h/xQXG/8jJyr/LC8y/ysuMf8rLjH/Ky4y/yksMP8fIibjFxseNhgcHwAQExcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABATGAAYGx8AGBwfPh4hJPMfIiX/IiUo/ygrL/8jJyr/FRkc/x4hJP8vMTX/Jyot/xkdIP8cHyP/Gx8i/xkcH/8oKi7/Njk8/zs+Qf85PD//MTQ33iQnK1F3dXMAGx8jABMYHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFRoeABoeIQAYHCAaJiotziotMP8wMjX/Ki0w/xwfI/8cHyL/MTQ3/y8yNf8fIiX/GR0g/yYpLf8pLDD/HyMm/xgcH/8WGh3/Gh0h/xkcH/8bHiLUHB8jMx8iJQAhJSgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHSMoADY4OwAlKCw6KCsuwiYpLf4qLTH/LjE0/zQ3Ov8qLTD/Gx8i/x8iJf8nKi7/Njk8/zU3Ov8rLjH/ICMn/xcaHv8VGBz/ISQouzI1OKMvMjV2V1lZABMXHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbHyQACxEXACgrLgArLjIWKi4xcygrLs0lJyvzJyot8B0gJOYlKCz7LjE0/zc6Pf89QEP/Nzo9/zo9QP8wMzb/JCcr+SQnKqAqLjEWLTE1BDAzNw5SVFMAFxwiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAfJCkANzg6ACouMQApKi0AKy4xFCUoKz0iJik8ISQoJy0wM14zNjnIP0FE/j0/Qv8jJir/LS8zyjo9QJQ2OT1VMTQ3DCsuMQAsMDMALjI1AEFERQAWGyEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhJywAKS0xACgtMgArLjIAJSgrACEkKAAgIycANjk7ACouMR07PkGdOjw/7yImKawRFRohWFlaADo9QAAsLzMAMTQ3ACAlKgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/wAB//4AAP/8AAB//AAAf/gAAD/4AAAf+AAAD+AAAA/gAAAH4AAAB+AAAAfgAAAH4AAAB+AAAAfgAAAH4AAAB+AAAAfwAAAH4AAAB+AAAAfgAAAH4AAAB+AAAAfgAAAH8AAAB/AAAAfwAAAH8AAAD/gAAA/4AAAP+AAAD/4AAH8oAAAAMAAAAGAAAAABACAAAAAAAAAkAAA4IQAAOCEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABzV6AAwqUQALKlIAHDVZAAwqUR0UMFd3GDRbzho2XfEZNVzmFTFYsRAtVWIJKFEYFC9TAAopUgAMKE0ACi9nAAw0fQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACBAAJKlMADSpPAAwqUQAFJlAIES1UXxo1XMwkPmX7KUNr/ytFbf8pRGv/JT9n/x45YPcWMljHDitTXgYmUAsMKU8ABixfAAosWQAJLlkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACSFHAAouXQARJkMADCpSAAgoURYSLlWWHjlg9ypEbP8vSXH/L0lx/y5IcP8tR2//LUdv/ytFbf8mQGf/HDdd+BAtU6sKKFAvESpMAAkpVAAKKVIACC5vAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjBqABUiLgANKU8ACSlSHxEuVK4gO2L/LUdv/zFLc/8wSnL/Lkhw/y9Jcf8tR2//K0Vt/y1HcP8uSHH/LEZu/yA7Yv8TL1XaCylQVwAlWAIJKVIACipTAAoxYQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJMmwADiZBAAwpTgAKKVElES1UvCA6Yf8wSnP/NU94/zJNdf8tRm//Mkhx/zlNdv85THb/Mkhx/ytDa/8tR2//NE53/zJMdP8kPmX/FTFX8AwqUXUFKVYGCipTAAoqVAAKNG4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAowYwALKU8ADClRAAopURwRLVS5Hzpg/zFLc/89V4D/OFF6/zJJc/89T3v/S1iK/1Relv9TXZf/SVWL/z9Nff81SXP/Mkt0/z9Ygf84Unr/J0Fo/xcyWPcMK1F6BShWBQkqVQAKLFkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAotXQAKKlQABihTDA8sUqEeOF//L0lx/0RchP9CW4T/N054/zxKeP9ASoP/S1GS/0pQkP9GTIr/P0aB/zA2aP8oMFL/Nkdu/0BXgf9NZIz/OlN7/yhCav8WMlj1DCpSYhgsQwAILF0ACjNqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACixZAAYvZwAaK0EADStSbBo1W/stR2//QFmB/1Foj/9BWIH/LTlb/xwiRf8eJEv/GR5B/xEVMv8PEy3/ERUw/w8TLv8EBhX/FRgm/zlJbv9UapH/TGOL/zdQef8mQGj/FDBW3QsqUywNK1IADC1ZAAEFCwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACy9gAAwsVAAKK1UlFTFX2ShCav85Unv/TmWN/1Vrkv8zQmL/CAoU/wwOHP8cHy3/Ki04/zU3Qf84OkT/ODtE/zM1P/8mJy3/Dw8Q/xQZKf9HW4H/TGOL/z9YgP8zTXX/IDti/xEuVpIAJ2QCCy5eAAoxZQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIPpEABzFqACAySQARLlV8IDph/zNNdv9AWYH/TWSM/0pehf8aIDD/Kiwx/0lOWv9WXm7/WGF2/1Vhef9PXHf/SVZx/0NPav8+SWL/MTxR/xUgNP8kOl//OFF6/z9YgP86VHz/LUdv/xk1W+MNLFQsDy1VAA4xYQANUL8ADDNsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASsMADi5aAAorVxIXM1rIK0Vt/zpUfP9BWoL/PFV+/ypBZ/8hMU3/Nkhq/zpNdP8+Unv/R1yE/09li/9NYon/SV6G/0VbhP9CWYP/P1eB/zVOd/8sRm3/NU93/0BZgf9BWoL/N1F6/yM+Zf8SL1aBAAAsAQAADAEoQ2oALUZsABc6awAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEypOAAwvYAANK1wAEi9XABEvWDwfOmHxM052/0BZgf9CWoP/OlN7/zBKcv86VH3/R2CJ/01ljv9PZ4//Q1uB/y1Ga/8lPmP/LUZs/0Fagv9KY4v/TGSM/0piiv9IYIj/SGCI/0piiv9KYor/QVuE/y9Jcv8VMVfoFTFYoydCbI8fPWkYIj9qACA/bwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEPZEAHz5tABw7aQA/WYEAyaqcABMwWIYnQWn/PFZ//0hgif9KYor/SmGJ/0xji/9PZo3/UWiQ/09nj/87VX3/IDti/y5Ibv81TnX/JkBn/yhDav9IYYr/VGuS/1hulP9ab5X/WW6V/1hulP9TapH/SWKL/zlTfP8dOF//GDRa/zRPeP8yTnl5XHCSABU3aAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/T2cAGzppABc4ZwUmQmxgGDVclRUxV+gvSXL/RV6H/1FokP9XbZT/WW+V/1xxl/9dcpj/XHGX/1Vsk/84Unr/N1F5/1pvlv9gdJn/SWGJ/y1IcP9LY4z/XHGY/2J2m/9keJz/Ynab/1xymP9Ua5P/S2SM/z1Xgf8lQGj/FDBV/y1Icf88V4LJL016Ei9NegAbQHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoSn8AME14AC5LeDc4U33sIz5l/xo1W/81T3n/SWKL/1Vsk/9ccZj/Ynab/2V5nf9meZ3/ZHic/11ymf9GX4j/O1aA/1ZtlP9ccZj/RV+I/zlUff9TapL/YXWb/2d6nv9oe5//ZHec/11ymP9TapL/SGCJ/zhSev8qRGz/FTBW/yI8Y/87VoDwOlaDOztXggAYPXEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXP3kASWGJADtXg3E8V4H/Hzph/x45X/82UXv/R2GK/1Nqkv9bcJf/Ynab/2d6nv9pfKD/aHuf/2F1m/9SapL/QVyG/0Vgiv9IYo3/QVyH/0Vfif9WbZT/ZXid/2p8oP9oe5//ZHid/15zmf9VbJP/R1+H/zFIa/8qRW3/GDNY/xs2XP81UHn/OlaBcUhgiAAMN20AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAApToQA////AEJdiJc3Unv/HDdd/yA7Yv81UHr/Q12G/1BokP9bcJf/Ynab/2d6nv9pfJ//anyg/2V5nf9XbZX/TmeQ/1Jqkv9WbZX/UmqS/0xljv9WbZX/Znmd/2p9of9rfqL/aHyh/2B1m/9WbJT/S2SN/ztWf/8qRW3/GjRa/xk0Wv8sR2//NlF8pAUvagMeQXUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtT4EAKEt/BkFch7AzTXb/GzZc/yE7Yv8yTXb/QVuF/1Fokf9bcZj/ZHid/2p9of9rfqL/anyg/26Aov9bcZb/TWWO/190mf9nep7/XXKY/0VeiP9jdpX/n6m7/1lmff9ATWT/QU5m/05bc/9uepD/YHKP/0BZgv8rRW3/GjVb/yI8Y/8jPmX/JUBnwyNAawwhPmkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAuToAAL0+ADD5Zg8IvSXL/HDdd/yA7Yf8wSnP/QVuF/1Foj/9fcJH/VGWD/0dVcP88R1z/WWJy/7e7w/9wfpX/QVqD/1xxl/9oe57/XXKY/0BZg/9IWnf/m52g/ywxNv8BAgP/AAAA/xkcIP+cnqH/rK6x/zpNbP8rRm//GjVb/yM7YP81Tnb/Ij1kxB87ZAwhPWYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlSHsAKEp9DzJNd8koQ2r/JD9m/x86YP8uSXH/QFmB/4GMnv+kp6v/HiQs/wQFB/8AAAD/ICMm/2hqb/9AUm//QFqD/1dtk/9idpr/WnCV/0Rdhf84UXj/Lz1S/yswNf9hYWH/BgcH/xMYHf+EhYf/VFda/y5DY/8sR2//HDZc/xIiOPoyR2fGOFaDaQAASwEoTIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAiQ3UAJkd5CiA8ZL8yTHT/Mktx/x44Xv8sR2//N050/2dqcf+2t7f/TlNZ/2ZnaP8EBAT/Cg0R/yQxRf88VXz/Q1yE/1Joj/9ab5T/VWuR/0dfhv8/V4D/PFR8/zJCXP83PUb/Cw8U/xMYHv8uMzz/L0Bb/zlTfP8sR2//HTde/xEcLP8OERaFsv//ATBMdwAqS30AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkRXgAmZ6kAC9Md3lBW4TlIDBG8xw0V/8qRW3/OFN8/zBBW/9GSlH/QUVJ/zU5Pv8NERn/JDJI/0BXfv9DW4P/RFyE/0xjiv9QZo3/TWSL/0Zehf9BWoL/Q1uD/0Vehf9AVnv/PE9v/zxPcP9CWX7/Q1yF/zpUff8tSHD/Hzlf/xIcKv8NEBO6CQwPCQsNEQAsSHEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhQnUAOViHAENmmwwwRmgzDxUczBswT/8pRG3/N1F7/0Jchf9AVnr/OUto/zZHZf9CVnn/SmGI/0lgiP9FXYX/RVyE/0dfhv9JYIf/R1+G/0Rcg/9BWoL/RFyD/0hfh/9LY4r/TmWN/05ljv9JYor/QlyF/zlUff8uSXL/ITpf/xIbJ/8OERTiDA8TJgwPEwAKDRMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyWZkAPFqIACg8WQAAAAAHEBMXuxkqQ/8pRGz/NVB5/0BahP9JYov/UGeQ/1Jpkf9RaI//TWSM/0lhiP9FXYX/RFyD/0RchP9FXIT/RFyE/0Nbgv9BWYH/QlqC/0Zehv9KYon/TWSM/0xki/9IYIn/QVqE/zZOdf8uSHH/Iztf/xMaI/8OERX8DA8TYg4RFAAJDBIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASXvKAA0RFQANEBQSEBMWzRcjM/8oQ2r/M053/zxVff9FXof/TGSN/09mjv9OZY3/SmKK/0Zehv9DXIT/Q1uD/0VdhP9GXYX/Rl6F/0Zdhf9DW4P/QFh//z1Tdv9AVnn/RVyC/0ZdhP9BWH3/NEZk/yw9WP8vSXL/JDtd/xcdI/8QExb/DA8TrwsOEwYMDxQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0RFQANEBQXDxIV1hYcJv8nQGT/M053/zJFZP8zQ1z/PU9u/0FVdv8/UnL/NkVf/zE+Vf87TWz/SWCI/01ki/9PZYz/UGaN/1Bmjf9NZIz/QFNy/yozQv8oMD3/KzVF/y04Sv8rNUT/LTpQ/zVMcv8xTHb/Jjta/xsgJf8SFRn/DxIWyg0RFRANERUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0QFAANEBQaEBMX2BcbH/8mOlj/M054/zhSev81R2P/LjlK/yw0Qv8rM0D/KzM//zE6Sv9CUm3/VWuR/1pvlf9dcZf/XnKX/11xl/9ab5X/VGiN/0pcfP9DU3D/P05p/z5Oaf8/U3T/QFmB/zlUfv8xTXf/JjlX/x0hJv8WGh3/ExYaxw8SFw8PExcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABATFwAPEhYjFRgc4SAiJf8oN03/Mk13/zlUfv9BXIb/R16F/0legf9MYIL/UWWI/1drkP9ccJb/YHSZ/2N3m/9leZ3/Znmd/2V4nP9idpv/XnOY/1twl/9YbpX/VGuT/1BnkP9JYov/QVuF/zlUfv8yTXf/JTdR/yAjJv8aHSH/ExcasgsOEgYPEhcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIWGgASFRkgFhkd3hweIf8lLz//MUx1/zlUfv9AWoT/SGGL/1BnkP9WbJT/WnCW/15ymP9hdZr/ZXid/2h7n/9pfJ//aXyg/2h7n/9mep7/ZHec/2B0mv9ccZf/V22U/1BokP9JYYv/QVuF/zlUf/8yTnj/IC9F/x0gI/8YGx//EBMXtAkMEAYMDxMADRETAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACwwTAA0QFAANEBQcDhIV2hYZHP8fJS3/LkVq/zlUf/8/WoT/R2GK/09nj/9WbZT/XHGY/2F1m/9leJ3/aHuf/2l8oP9rfaD/a32g/2p8oP9oe5//Znme/2N3nP9fc5n/WW+W/1Jpkv9JY4z/QVyG/ztWgf8vSHD/GSEt/xYZHP8RFBf/DhIV4gsPEiwMDxMADhIVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw0TAA0RFAANEBRCEhUZ9B4hJP8jJin/JzhS/zlUf/8/WoT/RmCK/05nkP9XbZX/XXKY/2J2m/9leZ3/Z3qe/2l8n/9qfKD/anyg/2l8n/9nep7/ZXid/2J2m/9ec5n/WW+W/1Jpkv9JYoz/QFuF/zNOd/8bK0P/DREV/wwPE/8NEBT/DhEU/w4RFXMNEBQADBAUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA8VABEUGAAQExdYFhkd/SEkJ/8kJyr/Hicy/zBJb/8/W4b/RV+K/0xlj/9Ua5T/W3CX/190mv9jd5z/ZXme/2d7n/9pfKH/aXyh/2h8oP9mep//Y3ed/15zmv9Ybpb/UWiQ/0Nchf8yTHX/ITpf/xEgNP8KDxT/Cw4R/wwPE/8NEBT/DhEU/xIVGbMSFhoHEBQYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAXABMXGgATFhlBGBwf9CElKP8jJin/GBwf/xciMf8xSGz/QVyH/0pkjv9RaZP/Vm2W/1lwl/9YbJL/VGeK/1Fjg/9KWnj/Rld0/0NSbf8+TGX/Okli/zJBW/8pOVP/ITNP/xQqR/8LHjb/CBIe/wkMEP8LDhL/DA8T/wwPE/8MDxP/DhEV/xcaHs8YHB8TFhodAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAWABQYGwATFhoWGh4hzR8iJv8ZHB//DxIW/w4RFP8RFyD/Gyk9/yc7Wf8rP1//KTpU/yQzSf8bJTX/FRsl/xUaIf8SFxz/DxMY/w8TGP8SFhn/DxIW/woOEv8JDRD/CQ0R/wgNEv8ICw//CQsO/wkMD/8JDBD/Cg0Q/woNEf8LDhL/DhEV/xsfIsoeIiYQGx4iAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsOEgAIDBAKEBMXvhEUGP8NERT/DxIW/xEUGP8NEBP/Cw4R/wwQFP8KDhP/DA8T/w0RFP8MDxL/DRAT/w8TFv8YGx7/Fhkd/xEVGP8WGR3/EhYZ/w4RFf8NEBT/DA8S/wwPEv8LDhL/Cg0R/woNEP8KDRH/Cg0R/wsOEv8MDxL/DhEV/xodIZE1OkACGR0iAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkMEAAJDBAUCQwP0QsOEf8PEhX/ExYa/xATF/8OERX/ERUY/w8SFf8QExb/FRkc/xUYHP8SFRj/FBcb/xIVGf8WGR3/HB8j/xgbH/8TFhn/ExYa/xMWGf8SFhn/EBQX/w8SFv8PExb/DhIV/wwPE/8MDxL/DA8T/wwPE/8NEBT/DxIV8RIVGTwRFBgAHiEnAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQFAAMEBQWDRAU1A8SFv8SFhn/ERQY/w8SFv8UGBv/FBgb/xEUF/8YGx//Gx8i/xYZHf8TFxr/GBwf/xcbHv8WGR3/Gx4i/x0gJP8UFxv/EhUZ/xkdIP8aHSH/Fxse/xUZHP8UFxv/FBgb/xQYG/8TFhr/EhUZ/xEUGP8SFRj/EhYZ1xIVGRoSFhkADRETAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAUGAAPExgJEhYZtxQXGv8SFRn/ERQY/xUZHP8WGR3/ERQX/xcbHv8fIib/HSEk/xQYG/8VGBv/HB8j/x0gJP8ZHSD/GR0g/xwgI/8YGx//EBQX/x0gJP8kKCv/ISQo/x4iJf8dIST/HiEl/x4hJf8eISX/HSAj/xseIv8ZHCD/Fhodkw8UGQIUGBwAAwMEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABYaHwAYGx8AFhodYRkcIPcXGh7/Fxoe/xQYG/8RFBj/Fxse/yEkJ/8jJyr/HB8j/xIWGf8YGx//IyYp/yUoLP8fIyb/Gh4h/xodIf8aHiH/Exca/xYaHf8qLTD/MDM2/zAzNv8vMjX/MDI2/y8yNf8wMzb/MDM2/yksL/8dICTVFxsfKhgbHwATFxsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMXHAAYHCAAFxsgDRkcILobHiH/GRwg/xkcIP8eIiX/JSgr/yksL/8jJir/GBsf/xIWGf8fIiX/LTAz/y0wM/8lKCv/Gx4i/xgbH/8cICP/Gx4i/xUYHP8ZHCD/LS8z/zo9P/8+QEP/P0FE/z5BQ/89QEL/ODs+/ysuMdUdISREICIlAB4kKwAWGiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgdIAAOEhYAAAAAAhsfIqMoKy7/Ky4x/y0wM/8vMjX/LzI1/yksL/8cICP/FBcb/xYaHf8sLzL/NTg7/y4wM/8jJin/Fxse/xkcIP8iJSn/JCcq/x4hJf8XGx7/ExYa/xseIv8oKy7/MDM2/zI0OP8rLTH/ISQn2xwfIz0hJCcAFRofABsfJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAVFx0AIycqAB0hJVcpLC/zJyot/ywvMv8yNDf/Ki0w/x4hJf8XGx7/GBwf/yotMP86PD//MTQ3/yQnKv8ZHSD/GBsf/x8jJv8tMDP/LTAz/ycqLv8gIyb/HyIl/xMWGv8QFBf/EhYZ/w8SFv8QExf/Fxoe+hodIawWGRwZFxodAAwOEwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATFhsAGR0iAA8UGQUlKCxpKCsv5iUoK/8kJyv/LC8y/y8yNf8xMzb/Njk8/zs9QP8tMDP/HB8i/xodIf8dICP/ISUo/ywvMv83Oj3/MzY5/zEzNv8kJyr/IiUo/yEkKP8XGh7/EhUZ/xYaHf8oKy7cNTg7wjU4O/coKy9eMDM2ABYZHwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWHCEAGx8jABsgJAD///8AKSwwOiwuMrAoKy73KCsu/yotMP8tLzL/MDM2/yksL/8WGRz/Fhkd/yUoK/8mKS3/LjE0/zk8P/89P0L/ODo9/zg6Pf8zNTj/IiUo/xgbH/8VGBz/Gh4h/yQnK7kvMjYsJysvEDE1OFsuMjUvNTg7ABofJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGh8jACAlKQAcIicAKy4yACgsMA0tMDNWKSwvsyQnKukgIyb9IyYp+ycqLuEcHyPsJyot/DM2Of8vMjX/Nzo9/z9CRP89QEP/Njk8/zs9QP8+QUP/Oj1A/y8yNf8qLTD7KSwvrCcrLyAsMDMAJysvADY5PAAxNDcAQUNFABsfJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACUfFAAfJCkALjE1ACksMQAuMTMALzM2CSsuMi8mKSxaIiUpYSElKScfIycxKi0wZTE0N801Nzr+PkBD/0JER/87PkD/IyYp/ycqLf80NzrsOz5B1zo9QLM0NztgLDAzDywvMgAzNTcAIycsACMoLAAmKi4AJiouABwgJgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAICYrACInLQB7cWkALDAzACwvMgAkJyoAHSEkACAkKAAfIiYAMTM2ACAkKBwuMTV6PD9C6EJFR/89P0L/HyMm/xcaHsUcICNAKS0xGB4iKAg9P0IAKi4xADI0NwAaHyUAAwQEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJisxAAwUIAArLjIAVVVQADc7OwAZHSIAAAYMACQnKwAAAAAAMjU5Tjs+Qck2OTzrJiktpxsfIyceISUAKS0xACYqLwAbICQAIygsACQpLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//4AAP//AAD/+AAAf/8AAP/wAAA//wAA//AAAB//AAD/4AAAD/8AAP/AAAAP/wAA/8AAAAf/AAD/gAAAA/8AAP+AAAAD/wAA/wAAAAD/AAD/AAAAAH8AAPwAAAAAfwAA+AAAAAB/AAD4AAAAAD8AAPgAAAAAPwAA+AAAAAA/AAD4AAAAAD8AAPgAAAAAPwAA+AAAAAA/AAD4AAAAAD8AAPgAAAAAPwAA+AAAAAA/AAD4AAAAAD8AAPgAAAAAPwAA/AAAAAA/AAD+AAAAAD8AAP4AAAAAPwAA/gAAAAA/AAD8AAAAAB8AAPwAAAAAHwAA/AAAAAAfAAD8AAAAAB8AAPwAAAAAHwAA/AAAAAAfAAD+AAAAAB8AAP4AAAAAHwAA/gAAAAAfAAD+AAAAAB8AAP4AAAAAPwAA/gAAAAA/AAD+AAAAAH8AAP8AAAAAfwAA/wAAAAB/AAD/AAAAAH8AAP+AAAAAfwAA/8AAAAB/AAD/8AAAB/8AAP/+AAAf/wAAKAAAAEAAAACAAAAAAQAgAAAAAAAAQAAAOCEAADghAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwoTwAKL2QADCpQAAoqVAATLlMACChREhAtVVsTL1axFTFY5BYyWuwVMVjXES5Wng0rVFcJKVUYFy5LAAsqVAAFNX8ACi1dAAsvZQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsxZwAKLV0AADaSAAwqUQAGKFMKDixTVRYyWLgeOF/0Iz5l/yZBaP8nQWj/JT9m/yA7Yf8aNVv0FDBWxw4rUm8JKVMZDilLAAoqVQAKKVAACi9jAAssWgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoybQAKK1kACCtbAA8qSwAKKVInES5Uohs2XPYlP2f/K0Vt/y1IcP8uSHD/LUdw/y1Gb/8rRW3/KEJp/yI8Y/8aNVv9ES5UxgspUVUHKVcICihPAAZJsAAKLmAACzNvAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgzcgALLFwACitbABQqRgALKlJDEi9VzR85YP8pQ2v/Lkhw/y9Jcv8vSXH/Lkhw/y1Hb/8tR2//LUdv/yxHbv8rRW3/KEJp/yA7Yf8UMFb0DCpQmgkoUSMMJ0sACStZAAorVwAILVwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAouXgAKK1UACitYAAA7yQELKVFTEi9V3yA7Yv8rRm7/L0py/zFKc/8vSXL/L0lx/y9Jcf8vSXH/LUdv/yxGbv8uSHD/Lkhw/y1HcP8rRm7/JD9m/xgzWf8OK1HKCilRRQCA/wAKKlUACipUAAorSQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsvZwAKLFsACitYAAQtXwMLKlFjEi5U6SA7Yv8tR2//Mkx1/zNOdv8yTHX/Lkhw/yxGbv8vR3D/MUhx/y5Gbv8pQmr/KEFp/yxGbv8wSnP/Mkx0/zBKcv8nQWn/GzZc/xAsUuYLKVBnBytdBgorVQAKK1UACkSLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAg3fwAKLFYACStZAAAvhQELKVFmEi5U7yA6Yf8tSHD/NlB5/zhSe/81T3j/LUdw/y5Fbf86THb/QVJ8/0RTf/9EU3//QFF8/zdKdP8rQmr/K0Rs/zNNdv86U3z/NE53/ylDa/8eOF7/ES1T9AspUXkHLl0GCitWAAoqVQALMWsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAo0bQAKLl8ACSxaABMmQgAMKlFXEi5U7B86YP8sRm7/OVN8/0BZgv85U3z/MElx/zZKdP9EU4D/TFiL/1VfmP9YYZ7/VV6b/0tWkP9EUIP/QVB+/zZKdf8uR2//OlR9/0Rdhf84UXr/K0Vt/x86YP8SLlT1CypReQgrXAYKK1gACS1gAAwybQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAET8wAFQAAAAspTQAKKVI9EC1S4B45X/8rRm3/OVJ7/0hgif9BW4P/M0x2/ztOef9BTn//RE2J/1BWm/9WW6H/UFec/1BWmv9IT5H/O0F+/yszX/8xO2D/O0x3/zZOd/9JYYn/TGOL/zhSe/8tR2//IDph/xEtU/QLKVFhFCIrAAgvZwAKMGUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIEwsACi1bAAoqVAAJKlYbDitSwxs2XP8qRWz/Nk94/0phif9PZo7/PFV+/zxOeP8xO2T/KjJj/y82bP8uNGb/Jy1Y/yAlSv8gJEr/ICZM/yAkS/8XGzz/CAoY/yEmO/8+TnX/RVyF/1dtk/9JYYn/N1F5/y1Gb/8eOF//EC1T3QoqUzMMKlIADC1WAAoxaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDZ7AAkuYQAAM4MBDCtTgxcyWP8oQmn/M012/0NbhP9WbJP/TWWM/0BUff8jK0X/Cw4j/xEVMv8PEy3/Cw8l/wgLH/8GCBr/Bgkb/wcKHf8ICh3/Bgkb/wECDf8CAgT/GyAx/0BSev9XbZP/UmmQ/0FZgv81T3j/KkRs/xo1W/8OLFOjBy1eCQouXAAKMmgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDFwAA0tWwAMK1MACitWNBIvVeUjPWT/MUt0/zxVfv9NZIv/Wm+V/05ji/8qNVL/AgMI/wQFEP8PER//HyEt/y8xPP89P0f/R0hP/0lLUv9JS1L/RUdO/z0/Rv8tLjL/FhYX/wQEBv8gKkP/TWKL/0tjiv9DXIT/O1V9/zNMdf8lQGf/FTFX8A0tVkYPLFIADidGAAo0bAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoyaAAJMGYAAC6KAQ8tVJAbNlz/LEZv/zdRev9BWoL/TGSL/1Zsk/9AUnf/DhEb/x8fIf9ERkr/XmJp/2pvef9qcX7/Y2t9/1lkev9UXnb/UVxz/01Xbv9HUWj/Q0xf/zlBUf8eJTL/CxUp/y1FbP84Unr/P1iA/z5XgP84Unv/Lkhx/x45X/8RLlWiBStaBgstWgAJNXYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKNHIADS5ZAAstWSAVMVjYJT9m/zNNdv88VX7/QluD/0Nbg/9BWoL/IzRV/x4kMf85Q1j/OUdk/zREZ/8wQmr/M0dw/z1Sev9GXIT/Q1iB/ztQev82S3X/NEl0/zRKdP80SnT/L0Zv/yQ8Y/8iPGP/Lkhw/ztVff8/WIH/PVd//zVQeP8oQmn/FzJZ6Q0sVjMNLFQAETFdABI0ZAAUNF8ACDuOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAL7/ABMuUgAQLldbGzZd+yxHb/84Unv/P1iB/0Fagv86U3v/KkRs/x84Xv8rQmn/OFB6/0BYgv9IX4j/UGaO/1hulP9abpP/UWaL/01ih/9QZYv/UmiP/09nj/9MZI3/SWGK/0Nchf87VH3/NlB4/ztUff9AWYH/RFyF/0Rchf89VoD/MEt0/x45X/8PLFOUBidREQ4tWRYFKVsGGThhAB47ZQATPHMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0oUgAFZ9gADC5hAAszaQAAKYkBFDFZlyI9ZP8zTXb/PleA/0Jbg/9CWoP/PFV+/zROdv81T3f/QFmC/0hhiv9NZY3/TmaO/01ljf9BWYD/KEJn/xs1Wv8ZM1j/Hzpf/zRNdf9FXYb/SmKL/0xkjP9MZIz/S2OL/0xji/9LYor/S2OK/01kjP9LY4v/RF2G/zlTff8nQWn/Ei5U9RAtU8YmQWrRJUFrgxAyYgcYOGYAEjVpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQ9lwAUNGAAEzRgABc0XgAPLlcACixZHRczWtQpQ2v/OVN8/0Rdhv9JYYn/SGCI/0dfh/9IYIj/SmKK/01ljP9QZ4//UGeP/0xkjP85U3z/GzZc/x45YP8tRm3/Lkhv/yE8Yv8aNlz/OFJ6/0tkjP9SaZH/VmyT/1htlP9YbpT/V22U/1dtlP9WbJP/UmmQ/0pjjP9AWoP/L0ly/xg0Wv8TL1T/L0pz/zZRe/IqR3NHMU12AJ6pvgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMOoAAAiZWAAAAHQAUMlwfDy1WKA0rUokaNlz8MEpz/0Bag/9LY4z/UWiQ/1Npkf9TapH/VmyS/1hulP9Zb5X/WW6V/1ZslP9NZY7/MEpz/yhDav9JYIj/VmyS/1Zskv9JYYn/KENq/zFLc/9OZo7/WG6V/11ymP9gdJr/YXWa/2F1mv9ec5n/Wm+W/1Rrkv9NZY7/Q12G/zRPef8fOmH/ES1T/yVAaP88V4H/N1N+oQ0wYgQiQ3IAE0WNAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASVdqAClEbAAjQG00LUhyzyE8ZOYQLVL4Hzph/zVQef9FX4j/UGeQ/1dtlP9ccZf/XnOY/2B0mf9hdZr/YXWa/2B0mv9ccpj/UmmS/zZQef82UHn/Vm2U/2V5nf9leJ3/U2qS/zNOd/84Unv/U2qS/15zmf9jd5z/Znmd/2Z5nv9kd5z/X3SZ/1lvlv9TapH/S2SN/0Ndhv82UXv/JUBn/xMvVP8cN13/NVB5/z9ZhNowTnwfME98ABM/fAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjV/ABxCeQAACWABMk97kzxXgf8oQ2v/FC9V/yQ/Zv84U33/SGGK/1Jpkf9YbpX/XXKY/2J2m/9leZ3/Z3qe/2d6nv9leZ3/Ynab/1pwlv9EXof/NlJ8/0pjjf9acJf/WW+W/0hhi/81UHr/Q12H/1dtlf9gdZr/Znme/2l7n/9oe5//ZXid/2B0mv9Zb5b/UmmR/0lii/89Vn3/NE52/yhDav8WMVf/FjJX/ytGbv8+WYP3OFWCUD9ZhADJqZ0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADNNcAAqSnoAJ0h4FD1ZhMs8V4H/Iz5l/xYxV/8nQmr/OVR+/0dgiv9QZ5D/Vm2U/1xxmP9idpv/Znmd/2h7n/9pfKD/aHuf/2R4nP9ccpj/UGiQ/z9ahP9AW4b/R2KM/0dijP9AXIf/PViD/0tkjf9XbpX/Y3ec/2l8oP9qfKD/aHuf/2V4nf9hdZr/W3CX/1Rrkv9LY4z/M0hp/y5Fav8pRGz/GDNZ/xQwVf8kP2b/OlV+/zpWgYeHjqoAHkJzAAQ2gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgRn0ANVOBADVTgStDXYjmN1J7/x85YP8YM1j/KURs/zhTff9DXYb/TGWN/1Vrk/9ccZf/Ynab/2V5nf9oe5//aXyg/2p9oP9oe5//X3SZ/1Rrk/9LZI7/SWKM/0xlj/9NZpD/S2SO/0pjjf9OZo//WnCX/2d6nv9qfaD/anyg/2h7n/9meZ7/Ynab/1xxl/9WbJT/TWWO/z9Ygf8zTnf/KENr/xo1W/8VMFb/Hjlg/zVPef85VH+5H0FyCyNFdQA5T2sAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMlB9AD9ahQA8WYZCQ12H9DFMdf8cN13/GTRa/ylDa/82UXv/P1qE/0tjjP9VbJP/XXKY/2J2m/9leZ3/aHuf/2l8n/9pfKD/aXyg/2N3nP9VbJT/UGiR/1ZtlP9dcpn/X3Sa/1twl/9QaJH/SmOM/1lvlv9mep7/aXyg/2p8oP9sfqL/an2i/2V5nv9dcpj/VGqR/01ljv9EXoj/NlB6/yhDa/8bNlz/GDJY/x04X/8rRW3/NE543SVFdCEmRXQAEjx0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABDXYcAPFmFWUFbhfsuSXH/HDZd/xs1W/8oQmr/NE94/z5Zg/9LZI3/Vm2U/11ymP9idpz/aHuf/2t+ov9rfqL/aHuf/2t9oP9rfaD/VWuS/0lii/9ZbpX/ZXmd/2l8n/9hdZv/TmaO/z1Xgf91hJ3/usHN/36Hl/84RFr/NkBU/zZBVf9AS2D/VF9z/36Glv9mdIz/SF+G/zhTfP8oQ2r/HDZd/xkzWf8tR2//HThe/yM9ZewkP2gyJD9oACA8ZgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHO40AR1+FADxXgm4/WYL/K0Zu/x03Xf8cNlz/JkFo/zJNdv8/WYP/TWWO/1Rrkv9abpP/XnGV/1xukP9UZIL/Sldx/1hjd/+gprH/yc3U/2Jyjf8+WIL/VGuS/2R4nP9pe5//YXWa/0tji/83UXv/TVtz/8TExP9laW7/BAgM/wAAAP8AAAD/BwgJ/zY6QP+6urv/0tLS/1FdcP82UHn/KENr/xw3Xf8WMVf/N092/zFLc/8cN17uHzphMx86YgAfO2MAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACT6MAExffgA2U4B3OVN9/yZBaP8iPGT/HDZc/yU/Z/8wS3T/QFqE/05kiv90gJT/iI6Y/y03Rf8QFR7/BwkN/wMEBf8iJSn/fH+C/6GipP86TWv/PVeA/1Bnjv9gdZr/ZXic/19zmP9MZIz/O1R9/zRLcP9CSlf/MTY7/ycrL/8wMC//AQAA/wIDBP8lKjH/tre5/52dnP8nLz3/NU93/yhDa/8dOF7/EipM/yExS/hAWoP6M096yyVFdBgoSHYAI0Z3AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4/ggA7Tm0AK0h0eydCaf8mQWj/MEpy/xw2XP8kPmb/Lkly/zxWgP9ean7/2dnZ/7O1tv8WHST/EhMU/wYGBv8AAAD/DQ8S/zI2Ov8yPEz/OVF4/z9Ygf9OZY3/XHCW/190mf9bcJb/TmWM/z9YgP88VX7/M0lt/xQdLP9bXV//h4eH/wYHCP8HDBH/Mzk//3d3d/8oKi7/LUBd/zZRev8pRGz/Hjlf/xMoRv8OFBvmLkNjdz1djjgAG+AALFiXACJEdAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPTKQAIjtfACI+aGUdOV/+PVZ+/z1VfP8aNFr/Iz1k/y1HcP85VH3/LjlK/4iHhv/HyMj/P0ZN/6SmqP9ISEj/AAAA/wcJDP8TGyf/NUpt/0BYgf9BWoL/TGOL/1Zrkv9ZbpT/VWuR/01ki/9CW4L/P1d//0BZgv87Unj/KjhP/x0iLP8HCxD/BwwR/xYZHv8gJzP/MkRh/z1XgP81UHn/KkVt/x86Yf8VKUb/DhMX/gsND2ohMEUAFj1xAChQigAECA4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAG0B6AClGcgAnRXIxNE9640lii/wnN0/4FitK/yI9ZP8rRm//OFN8/zdNcP8jKjX/V1dX/0xOUP9OUVb/ICMm/wIFCP8WHy3/OExv/0NchP9CWoL/Q1uD/0phiP9PZo3/UWeO/09ljf9JYYj/Q1uD/0FZgf9DW4P/RV2F/0Vdhf9AVnv/OUxs/zdJZ/89UXL/RVyD/0Rdh/89WIH/NlB5/ytGbv8hO2P/FSlE/w8TF/8NEBSjCQsRAwsOEwAPGSYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wA4WpAAMleOAz1ci087VX5wDxQazxQlPP8iPGT/K0Vu/zZQev8/WoT/QVd9/zBAWv8lMEH/GiMy/yArPv8yQl7/Q1p//0hgiP9HXob/RFyE/0RchP9HX4b/SmGI/0tiif9JYYj/R16G/0Nbg/9BWoL/Q1uD/0dehv9JYIj/S2KK/01kjP9OZY3/TWSN/0lhif9EXYX/PVeB/zVQef8sR2//Ij1k/xUnQP8PExb/DRAU0AsOExcMDxMACQsPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA2XpoANFWIADJWiwAzR2cAAAAABg8RFLUUIDH/ITti/ypFbf80T3n/PliC/0VeiP9LZIz/TmWN/05ljP9PZo3/T2aO/01kjP9LYon/SGCH/0Vdhf9EXIT/RV2F/0Zehf9HXob/Rl6F/0RchP9CWoL/QVmB/0Jbg/9GXoX/SWGI/0xjiv9OZIz/TmWN/0xkjP9IYIn/Q1yF/zxXgP81UHn/LUhw/yQ/Zv8WJTz/DxIV/w4RFPEMDxNADBATAAsOEwACAgIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEFimABCcLoADhQbAAgNEAUPEhWqExsm/yA4Xf8qRW3/M054/zxWgP9EXYb/SWKK/05ljf9RaJD/UmiQ/1Bnjv9OZYz/S2KJ/0dfhv9EXIT/Q1uD/0Rcg/9FXIT/RVyE/0RchP9DW4P/QlqC/0BZgf9BWYH/Q1uD/0dehv9KYYn/TGOL/01ki/9LYor/R1+H/0FbhP86U3z/MUlv/y5Icf8lQGf/FyQ2/xEUF/8OERX/DA8TiAEDCQEKDRIADA8UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0QFQAMDxQOEBMWwhIXHP8eM1H/KkVu/zJNd/86VH7/QVuF/0dgif9MY4z/T2aO/1Bnjv9OZY3/S2OL/0hgiP9FXYX/Q1uD/0Nbg/9EXIT/RVyE/0VdhP9FXYT/RV2E/0Rcg/9CWoL/QVmB/0BZgP9CWYD/RV2E/0hgiP9JYYn/R2CI/0NchP87Unb/LDtT/y1AX/8vSnP/J0Fn/xokMv8UFxr/DxIW/wwPE9MLDhMaCw8TAAwMFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOERYADRAVFQ8SFtESFRn/HCxD/ytGbv8yTXf/NEtv/zVIZv9AV3z/R1+H/0piiv9LYov/SWCI/0Raf/8/U3b/PlN2/0JagP9FXYX/SF+H/0lgiP9KYYj/S2KJ/0tiif9KYYj/SF+H/0FXfP8xPlX/LDdJ/y46Tv80RF7/OEpn/zZHYv8vPVL/JzA+/ys6Uf8zTXX/L0p0/yhBZv8dJTD/Fxod/xATF/8OERTsDRAUMg0QFAAMDhQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMDRQADRAUAAwQFBYOERXREhUX/xokMv8qRGv/Mk13/zZPd/8uPVb/KjRD/y87Tv81Q1r/NkRd/zI/Vf8qM0L/Ji04/ycuOv85SWP/TWOL/1Bmjf9TaY//VWqR/1Zrkf9Wa5H/VGqQ/1Foj/9JXoH/Mz1Q/yoyP/8nLjj/Ji03/ycuOP8oLzr/KzVE/zRGYf86U3z/NlF6/zBLdP8oQGX/HiUu/xodIP8SFRn/ERQX8g8SFj0PEhYADBAWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAwTAA0QFAANEBQZDxMW1hQXGv8bISj/KUBj/zJNd/83Unz/O1V+/zhLav8vO07/KjI+/ygvOv8pMDv/KzI+/zA6Sf85RVr/Slt7/1dsk/9ab5X/XXKX/19zmP9fdJj/X3OY/11yl/9bcJX/WG2T/1Rpjv9PY4b/Sl1+/0dZeP9FWHj/RVl7/0Vcg/9CXIb/PFeB/zZRe/8xTHX/KD9i/x4kLP8cHyP/Fhkd/xQXG+wRFBgzERUYAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQFQAPEhYADhEVIxMWGeAaHiH/IiYq/yg7V/8yTXf/NlF7/zxXgf9DXYf/R1+H/0hegv9JXX//TF+B/09jhv9UaY7/WW6U/1twlv9ec5j/YXWa/2R3nP9leJz/ZXmd/2V4nP9jd5v/YXWa/15zmP9bcJb/WW+V/1dtlP9Va5P/UWmR/01ljv9IYYr/QlyF/zxXgf82UXv/MUx2/yc9Xv8gJCr/HyMm/xkcIP8UFxvcDxMXHhATFwALDxgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMEBYAEBQYABATFygXGh7kHSEk/yYoK/8oN0z/MUx2/zZRe/87VoD/QlyF/0hhiv9OZo//UmqS/1ZslP9ZbpX/W3CW/11ymP9gdJn/Y3eb/2Z5nf9nep7/aHuf/2l7n/9oe5//Z3qe/2V4nf9idpv/YHSZ/11yl/9ab5X/VmyT/1JpkP9NZY3/R2CJ/0Jchf88V4H/N1J8/zJNd/8kOFb/HiIm/x8iJf8YHB//ERQY2A0QFBoOERUABw8TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRAWABIWGgASFhoaExca1RIVGf8aHR//ISw6/zBKcv82UXv/O1aA/0Fbhf9HYIn/TWWN/1Jpkf9WbJT/WnCW/15ymP9hdZr/ZHec/2Z5nv9oe5//aXyg/2p9oP9qfaD/anyg/2l7n/9nep7/ZXmd/2N3nP9gdZr/XXKY/1lvlf9Ua5L/TmaP/0hhiv9CXIb/PFeB/zdSff8xTXf/Hi5E/xoeIf8bHyL/FBcb/w8TFuUMEBMtDRAUAA0QFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgMEAALDxMACw4SHQ0QE9cSFRn/HB8i/x4kK/8rQmT/NlJ8/ztWgP9AW4X/RmCJ/0xkjf9SaZH/V26V/1xxl/9gdJr/Y3ec/2V5nf9oe57/aXyf/2p8oP9rfaD/a32g/2p9oP9pfKD/aHuf/2Z6nv9keJ3/Ynab/15zmf9acJf/VWyU/09nkP9IYov/Ql2H/z1Ygv84VH//LEZs/xcgK/8WGR3/EhYZ/w8SFv8PEhX/DA8TfhEVFwALDhIADREVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATFxoADRAUAAwPE0oQExf1GRwf/yIlKf8iJSj/JTRM/zZRfP87VoH/QFuF/0Vfif9LZI7/UmmS/1hulf9dcpj/YXWa/2N3nP9leZ7/Z3qe/2h7n/9pfKD/an2g/2p9oP9qfKD/aXuf/2d6nv9leZ3/Y3ec/2F1m/9ec5n/WnCX/1VslP9OZ5D/SGKM/0Jdh/88V4L/Mk13/xsrQv8OEhb/DRAT/wwPE/8NERT/DhEV/w0RFMcOERUTDhEVAAsOEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw0UABEUFwAPEhVuExca/xseIv8kJyr/JCcq/x4mMf8vR27/O1eC/z9bhf9FX4n/SmON/1Bokf9WbZX/W3GX/190mv9idpv/ZHic/2Z5nv9nep7/aHuf/2l8n/9pfJ//aHuf/2d6nv9leZ3/ZHec/2J2m/9fdJr/XHGY/1hulv9SapL/SmOM/0FbhP82UHr/JkBn/xQlPP8KDxT/Cg0R/wsOEv8NEBP/DREU/w0QFP8PExbyERQYQhEVGQAUGR0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsPFgATFhkAERQYaxYZHP8dICT/JCcr/yQnKv8dICT/HStA/zVQef8/W4b/RF6J/0lijP9OZ5D/VGuT/1hvlv9ccpj/X3Sa/2J2m/9keJ3/Znme/2d7n/9oe6D/aHug/2d7n/9leZ//Y3ed/2F1m/9ccZj/VmyT/09ljf9IX4f/PVV9/ytFbf8cOF7/ESpK/woXJ/8JDRH/Cw4R/wwPE/8NEBP/DRAT/w0QFP8NEBT/EhUZ/xUYHHAYGx4ADREWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATFhsAFBcaABMWGkgXGh72HiIl/yQnKv8iJSn/Gh0h/xEVGf8aJzr/M0tx/0Bch/9HYYz/TGaQ/1Fpk/9VbZX/WXCX/1pwl/9XbJH/U2aK/1BjhP9JWnn/QlFt/z9Pav88S2b/N0Rb/zI/Vf8xPlT/KzhP/yQySP8eLEL/GSlB/xEmQv8JHjn/Bxcq/wgPGP8JDA//Cg0R/wwPE/8NEBP/DA8T/wwPE/8NEBP/DRAT/xUYG/8ZHSGIISQnABUZHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAERUaABQYGwATFxoZGRwgziAjJv8gIyf/Gh0h/xATF/8NEBT/DREU/xEZJP8cLET/KkBh/zJLcf80THH/Mkdo/y1BX/8nN1H/HSc4/xUcJ/8UGSL/Ehcd/w8SF/8MEBX/DRAU/xATFv8QFBf/DhEU/woNEf8JDA//CQwP/wkMD/8JDBH/CAsP/wgLDv8ICw7/CQwP/wkMD/8KDRD/Cg0R/woNEf8LDhH/DA8T/wwPE/8XGh7/HyImgicqLQAYHCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIWGgAOEhYABAgNBBQXG6kZHB//FRgc/w4SFf8NEBT/DxMW/xAUF/8MDxL/Cg0Q/wsQFv8MFB7/ChEb/woPFf8LDxT/Cw4S/woNEP8LDhH/DBAT/xQYG/8XGh7/ExYa/w8TFv8SFRn/Fxse/xMWGv8NERT/DBAT/wsPEv8LDhL/Cw4S/wsOEf8KDBD/CQwQ/woNEP8JDBD/CQwQ/wkMEP8KDRH/Cw4S/wsPEv8MDxP/Fxoe+yEkKFokJyoADhIcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARGBwACg0RAAkMEAsLDhG8DA8T/wsOEv8NEBT/EBMX/xMWGv8QExf/DA8T/w0RFP8PEhX/DA8S/wwPEv8PEhX/EhYZ/xATF/8PExb/EBQX/w4SFf8RFBj/Gh0h/xodIf8WGR3/ERQY/xYZHf8UFxv/DxMW/w8TFv8OERX/DRAU/wwPE/8NEBT/DRAU/wsOEv8KDRH/Cg0R/wsOEf8LDhL/DA8S/wwPE/8MDxP/DRAU/xQXGsQhJCcZHyMmABUZHgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkMEAAJDBAUCAsPzgkMD/8NEBP/EBMW/xMXGv8TFhn/DRAU/w8SFv8SFRn/ERUY/w0RFP8SFRn/Fhod/xgcH/8SFRn/ExYZ/xUYHP8UFxv/EhUY/xcaHv8dICT/Gx8i/xYZHf8RFRj/Exca/xIWGf8UFxv/ExYa/xEVGP8QExb/DxIW/xAUF/8QExb/DREU/wwPE/8MDxL/DA8S/wwPE/8NEBT/DREU/w8SFf8QExeBERQWAAQKEAAVGR0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMDxMADA8TFgwPE9EOERX/DxMW/xMWGv8TFhr/DhEV/xATFv8UGBv/Fhkd/xAUF/8SFRn/GBsf/xseIv8aHSD/EhYZ/xQXG/8YGx//GBsf/xUZHP8WGR3/Gx4i/x4hJf8aHiH/ERUY/xIVGP8XGh7/GR0g/xgcH/8XGh7/FRgc/xQXG/8TFhr/FBcb/xQXG/8TFhr/EhUZ/xEUGP8QFBf/EBQX/xEUGP8SFRn7EhUZWBIWGQAGCQ8ACAwNAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxMYAA8TFw0RFBi/ERUY/xMWGv8TFhr/DxIV/xATF/8VGRz/GBsf/xMXGv8QExb/GBwf/x0gJP8dIST/GR0g/xEVGP8VGBz/Gh0h/xsfIv8ZHCD/Fxsf/xkcIP8dICT/HCAj/xUZHP8PEhb/GRwg/yEkJ/8fIyb/HSAj/xseIf8aHSH/GR0g/xkcIP8ZHSD/GR0g/xkcIP8XGx7/Fhod/xYZHf8WGh3/FRkc3hQYGyUUGBwAERUaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABEVGgBCRDMAFBcbhhUYHP8UGBv/ERUY/xMWGf8WGh3/GBsf/xMWGv8OEhX/Fxoe/x4iJf8hJSj/HyIl/xcbHv8RFBj/Fxoe/x0hJP8gIyf/HiEl/xseIv8ZHSD/Gh4h/xwfI/8ZHCD/EBMX/xQXG/8lKCv/KSwv/ycqLf8kKCv/IyYq/yMmKf8jJyr/JCcr/yQnK/8kJyv/JCcq/yImKf8fIib/Gh0h/xcbHokSFx0CFhoeABIXGwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARFBgAFhkdABUZHTAZHCDcGx4h/xgcH/8YGx//Fhkd/xEUGP8QExf/GBsf/x8iJv8kJyv/JCcq/x4hJf8UGBv/ERUY/xodIf8jJir/Jyou/yQoK/8fIyb/Gx4i/xkcIP8aHiH/Gx4i/xUZHP8QFBf/HB8i/y4xNP8yNTj/MjU4/zI1OP8yNTj/MjU4/zI1OP8yNTj/MjU4/zI1OP8wMzb/JSgs/xsfIsMYGyAeGBsfABUZHQAUGB8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhMYABofJAAVFRYAGR0hahoeIfsZHB//Fhkd/xQXG/8XGx7/HiEl/yIlKf8nKi3/KCsv/yMmKf8aHSH/ExYZ/xMXGv8gIyf/Ky4x/y4xNP8pLDD/JCcq/xwgI/8XGx7/GR0g/xwgI/8bHiL/FRkc/xIWGf8dICP/MTM3/zo8P/89P0L/PkBD/z5AQ/89P0L/PD9C/zw+Qf86PD//MjU4/yMnKs4aHiI1Gh0hAAkIAwAZISwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgeIgAXHCAAExcaABEVGUwbHiL4JSgr/yYpLP8mKSz/Jyot/yksL/8tMDP/LTAz/ygrLv8eIiX/Fhkc/xMWGv8XGh7/Ki0w/zM2Of8xNDf/Ky4x/yUoK/8ZHSD/Fxoe/xodIf8hJCf/ISQo/xwgI/8YHCD/EhUZ/xUYG/8lKCv/MzY5/zs9QP8+QUT/QEJF/z9CRf88PkH/NDY5+SwvM6UhJSknJSgsABgeIwAbICUAGBseAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBMZABkcIAAXGx83IiYp7S4xNP8tMDP/MDM2/zM2Of80Nzr/MTQ3/ysuMf8gJCf/Fxse/xQXG/8UFxv/IyYp/zY5PP83Oj3/LzI1/ygrLv8dICT/Fhkc/xgcH/8dIST/KCsu/ygrLv8kJyr/HyIm/xsfIv8UGBv/DRAU/xATFv8XGh7/HiIl/yEkJ/8eIST/Fhkc/w8SFuwKDRFtAAAACwsOEgAVGBwADA4VAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABMYGwAaHiIAGBsgCR4hJZYqLTD/JSgr/yQnKv8wMzb/MDM2/ygrL/8fIib/GBwg/xYaHf8XGh7/IyYp/zc5PP87PkH/MjU4/ycqLf8eISX/Fxse/xgbH/8dICP/JSgs/zAzNv8uMTT/LC8y/yQnK/8fIyb/JCcq/xodIf8RFBj/ERUY/xIVGf8OERX/DA8T/xAUF/8ZHCD/HB8i+RgbHo0MDxMIEBMXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKCRIAGh0iABseIgAYHSEXJSksmiksMPklKCv/ISUo/yUoLP8tMDP/LzI1/y4xNP8tMDP/MjU4/zw/Qv89P0L/MDM2/yAjJv8aHSD/Gh0h/xsfIv8fIib/JSgr/zEzNv83Oj3/MzU4/zI0N/8sLzP/ICMm/yIlKf8oKy7/HiEk/xcaHv8SFhn/ERQY/xkcIP8sLjLzNzo93zo9QP4yNTjuHB8kNB8iJgAPExkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABwjKQAbHyIAHSImABwiJgsoKy9rLS8y2yksL/8iJin/KCsu/y4xNP8zNTj/OTw+/zs9QP83Ojz/Jykt/xQYG/8RFBj/GBsf/yQnKv8iJSj/KSwv/zAzNv86PUD/PD5B/zY5PP82ODv/NDc6/yotMP8cICP/Gh4h/xkcH/8UFxv/FBca/xsfIv8nKi7OMzY5UywwMyUvMzaDNTg7ySYpLTEnKy8AFBkfAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYICgAHiMnACImKgAhJSkAS0lJACgrLyssLzOZLC4y6icqLf8mKSz/JCYq/yIlKP8kJyr/LC8y/x4hJf8WGR3/Gh0g/ygrLv8sLjL/KSwv/zEzNv85PD7/P0FE/z5AQ/84Oz3/OTw+/zs9QP84Oz7/LC8z/x4hJf8XGx7/GBwf/x8jJv8mKi3HKCwvLzY5PAArLzMAExgdAysvMhkrLzMEKS0yABoaGwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhJSwAISUpABsgJQAqLTEAIigtBS0wNDsrLjGWJyot2CIkKPcgIyb/ISQn/yksMOUkJyrgHB8i8iUpLP43OTz/MDM2/zEzN/83Oj3/PkBD/0BDRv89P0L/NTg7/zk7Pv89P0L/P0JE/z9BRP84Oz7/MjU4/y8yNfwsLzO0JiouLCsuMQAaIScAJSktACQoLAAsLzMAKi0yACktMQARFh4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAeJCwALTA0ACYrMAAvMjUAJi4zAi8zNh4rLjJNJikseSMmKoofIyZBISUpIyAjJz8lKSxtMzY5zDI1OP83Oj3/PD9C/0FDRv9CRUf/Ojw//yQnK/8nKi3/MTQ3/zk8P/09P0L5PD9C7Tk8P8EyNThoKSwwEywwMwAABBAAISYrACAmLAAgJSsAJiouACovMgAqLzMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB8mLQAeJCsANjg6ACcsMAAuMjUALC4xACAiJQAEBwcAGRwgACElKQAfIiYALC8xACElKSAnKi2BMzY53T9BRP9CREf/Q0VI/zs9QP8bHiH/FRkc/xkcIOEkKCtzLjE1TysvMzglKC0QRUZIACksMAA1NjkAHCEmACAoLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhJSwAHCIpAAAAAAAnKzAAJSkvACMoLQAiJisAIycsAAIJDwAjJyoAnZqVACYpLTE2ODy1QEJF+0FER/89QEL/Jyot/xoeIcwYHCBAQkNEADAzNgAtMDQAKSwwAB8lKQAjJywAIiUsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAdJScAHSEmABUaHwAvMjUAJCgsFzU4PIM5PD/aMjU44yUoLJ0eIiYqGBseABwhJgAcISUAIiYtACImKwAjKC0ADQ4QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD///gAAP//////8AAAP//////gAAAf/////8AAAA//////gAAAB/////8AAAAD/////gAAAAH////8AAAAAP////wAAAAA////+AAAAAB////4AAAAAH////AAAAAAP///8AAAAAA////wAAAAAAf///AAAAAAA///gAAAAAAD//8AAAAAAAP//wAAAAAAAf//AAAAAAAB//4AAAAAAAH//gAAAAAAAP/+AAAAAAAA//4AAAAAAAD//gAAAAAAAP/+AAAAAAAA//4AAAAAAAD//gAAAAAAAP/+AAAAAAAA//4AAAAAAAH//gAAAAAAAf/+AAAAAAAA//8AAAAAAAD//8AAAAAAAP//wAAAAAAA//+AAAAAAAD//4AAAAAAAP//gAAAAAAA//+AAAAAAAD//4AAAAAAAP//gAAAAAAAf/+AAAAAAAB//4AAAAAAAH//gAAAAAAAf/+AAAAAAAB//4AAAAAAAH//gAAAAAAAf/+AAAAAAAB//8AAAAAAAH//wAAAAAAAf//AAAAAAAD//8AAAAAAAP//wAAAAAAA///AAAAAAAH//8AAAAAAAf//4AAAAAAD///gAAAAAAP//+AAAAAAA///8AAAAAAD///wAAAAAAP///wAAAAAA////gAAAAAH////gAAAAP/////wAAAD///////gAAf//ygAAABIAAAAkAAAAAEAIAAAAAAAAFEAADghAAA4IQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//AAsrWAAJK1oADCtSAOSLXQAMKlMoEC1UeRIvVcMUMFfoFTFY6BMvVs8QLVWUDCtUUQgpVxcZLEAACypSAAgxbAAKLV4ADC9jAAsqVgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAszdgAaAAAACylPAAoqVAAdL0cACilRJBEuVXwXM1nWHjlf+yM9ZP8lP2b/JT9m/yI9ZP8eOV//GDNa8RIvVsUOK1NxCilRHxImPgAKKlUACyVJAAovYAAORpsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACStTAAowYgAOITgACylRAAcoVAoNK1NiFDBX1R45X/8nQWj/K0Vt/y1Hb/8tR2//LUdv/yxGbf8qRGv/JkBn/yE7Yf8ZNFr+ES5UzwwqUWQJKVUOCyhOAAosXQALLFoACixYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANNHIACi5fAAM+kAALKE4ACSpUGw4sU5YYM1n2Iz1k/ypFbP8uSHD/L0lx/y9Jcf8uSHH/Lkdw/y1Hb/8tR2//LEZu/ylEa/8mQGf/Hzpg/xUwVvgNKlGvCilSN54AAAAKKlQACihPABRz/wAKMmkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoyaAAKL2EACDFqAAwoTgAJKVImDixStxk0W/8mQGf/LEZv/y9Jcv8wSnL/L0lx/y5IcP8uSHD/LUdv/yxHbv8tR2//LUdw/y1Hb/8sRm7/KkRs/yQ+Zf8ZNFr/DytR4AspUGgIKlcJCihPAAsdKQAKMXAACjRoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADCxeAAstWwAKLmEADSZEAAoqVDQOK1HFGjVb/ydCaf8uSHH/MUt0/zFLdP8wSnP/L0lx/y9Jcf8wSnL/L0lx/yxHb/8rRW3/LEdv/y5Jcf8vSXH/L0lx/y1Hb/8nQWn/HDdd/xEtU/YLKVCVCSlTGQooTAAJPpsACi5hAAoyZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJLFkACzBpAAsvZQALJkcACipSPg4rUdIZNFr/J0Jp/zBKc/80Tnf/NE93/zNNdv8vSXH/K0Rs/y1Fbf8ySHH/NEpy/zJIcf8sQ2v/Jj9n/yhCav8uSHH/Mkx1/zROdv8xS3T/KUNr/x85YP8TL1X/DCpQtgkpVCsKKEwACTRwAAowYwAKTawAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAg2fQAKL18ACzZ7AAslQgAKKVM7DytR1hk0Wv8mQGj/MUt0/zhSe/85U3z/NlB5/y5Icf8sRGz/OEt1/0NTff9GVYH/R1WC/0dVgv9FVID/P097/zJGb/8oQWn/LUdw/zdRev88VX7/NU93/ytFbf8hO2L/FTBW/wwqUMYKKlQuCydMAAo6gAALMGkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAw7hwALHzcADClPAAsqUi0OK1HNGTRa/yZAZ/8wSnP/PFZ//0Fag/86VH3/MEly/zNIcf9CUn7/SFaG/1BakP9YYp3/WmKh/1Zfnf9MVpH/RVCF/0RRgP8+T3v/L0Zv/y9Jcv9AWYH/RV2G/zdRev8sRm7/Iz1k/xYxV/8NKlHGCipULQooTAAMCQAACy5jAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACi9hAAoqUgAKKlQACSpWGg0qULkXMlj/JUBn/y9Jcf89Vn7/SWGJ/0Fag/8zTHX/OEx2/0NRf/9CTYP/SlKT/1dco/9XXaT/U1mg/1JZnv9LUpb/P0WE/zA2af8tNlv/PUt2/zdMdv83UXr/TWSM/0piiv84Unr/Lkhw/yM+Zf8VMVb/DCpQuwkqVxkKKVIACypVAAoxaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjBkAAosWwAILWEHCypRkhQwVv8kPmX/Lkhw/zlTfP9NZIv/TWWN/zpUff87T3r/O0hz/y43Z/8yOnP/Nj13/zQ6cP8tMmL/JyxW/ycsV/8nLVj/JixX/yAkTf8NECb/ExYm/zhDZ/8+Un3/SGCI/1dtk/9IYIj/N1F6/y5IcP8iPGP/FC9V/gwqUo0IK1wGCitYAAoxYwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIM20AAGf/AA0oSQAKKlRSES1T8iA6Yf8tR2//N1B5/0hfh/9XbJP/SmKK/z9Uf/8yPmH/Excv/xcbPv8ZHkD/FRk3/xAULv8MDyX/CQwg/wkMIv8KDiP/Cw4k/woNIv8GCBn/AAAE/xIUG/8zPl7/R12G/1lulP9TaZD/QVqC/zZQeP8tR2//Hzpg/xEuVO8LK1NJDSlNAAJCkwAKMGYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAgAJL2IACixZAAksWxgOLFPDGzZc/ypFbP80Tnf/QFiB/1JpkP9Zb5X/SmGJ/zhFaf8MDhj/AgMP/wYIG/8HCRv/Cg0d/w4QIP8UFiT/GBom/xsdKf8cHiv/Gx4q/xgaJv8SEx3/BwcL/wAAAf8JDBb/OUht/1Vqkv9RZ4//Rl6G/zxVfv80Tnb/KURr/xo1W/8PLVSzCS5eDgsuXQAJMmcAAQcOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkybAAHMWsAFCg+AAwsVWoVMVf8JUBn/zJMdP87VH3/Rl6G/1Rqkf9ZbpX/RVd//xIXKP8CAgT/ExQa/y4vN/9JS1L/YGNo/21wdf91eH3/dHh//3J2ff9wdHv/bHB3/2Robv9ZXGH/RUdL/ykrLf8KCgz/FiA4/0JZgf9CW4P/QluD/z9YgP85Unv/MUtz/yQ+Zf8VMVfzDS1WTg8sUwAOK1AACjNrAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY2fQALLl0ACS1dEREuVcEeOV//LUdv/zdRev8/WID/R1+H/0xji/9RZ4//LDpa/xASFv84Oj3/VVlg/15kcf9ZYnX/UVx0/0VScP8/T2//OUtv/zVGa/8xQmf/Lj9k/ys7YP8tPF//Lj1d/yw6Wf8bKEL/DyE+/yU+Zv8wSnL/PFV9/z9YgP88Vn7/NlB5/yxGbv8dOF7/ES5VqQcsXAkLLlsACjBqAAgzbQAIM2wABjmIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsyaQAPLVQADS1YRhcyWfImQWj/M011/ztUff9BWYL/Q1uD/z1Wfv82T3f/FiZE/yMtQv8wP17/LT5k/yw/aP8uQm3/NUp0/0BWf/9OZIv/VGqQ/1Fmjf9KYIf/RVuE/0JYgv9BWIH/QFiC/zxVf/81T3n/K0Vt/yU/Z/8vSXH/O1R8/0BYgf9AWYL/PFZ+/zNNdv8lQGf/FjFY6g0sVjYNK1IAEzFbABU1YgAAMYQADjVxAAU6kAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjNrAAk1dAB3JAAAES9Xix04Xv8tR2//OFJ6/z5XgP9BWoL/P1eA/zNNdf8lP2b/Izxj/zFKc/8+VoD/Rl6I/0xkjP9SaZH/WW+V/1xwlv9VaY7/SV6D/0Zcgf9LYYb/UGaN/09nj/9MZI3/SmOL/0dgiP9CW4T/PFV+/ztUfP8+V3//QVqC/0Rdhf9GXob/QluE/zpUff8uSHH/HDdd/w4sUqEIKFEcEC9ZJBAxXxY0R14AAACOABssRQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACChMACTRzAAwwYQAKLmAPFTFZwSQ+Zf8yTXX/PFZ//0Jbg/9DW4P/QFmB/zpTe/80Tnb/N1F5/0Fag/9IYYn/TGSM/01ljv9NZY3/SGCI/zRNc/8eOV7/FjFW/xUwVf8bNVv/LUdu/0Fag/9IYYr/TGSM/01kjP9NZIz/TGSM/01kjP9MY4v/TGOL/01kjP9NZY3/SWGK/0FbhP81UHn/JD5l/xEtU/kPLFHVJEBo3ydDbLwbOWYnIDxoACE/bAAFLGQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABTuQABAtWAAQLloADy5cAA4sVAANLVg9GTRb7ipEbP84Unv/QluE/0hgiP9IYIj/R1+H/0dfh/9IYIj/SmKJ/01kjP9PZo7/UGeP/05ljv9EXYb/KURr/xUwVv8gO2H/K0Vs/ytFbP8fOmH/FjJY/zBKcv9HX4j/T2eP/1Nqkf9WbJP/V22U/1htlP9XbJP/V2yT/1Zsk/9TapL/TmaO/0dgif88VoD/K0Zu/xcyWP8RLVP/LEdv/zhTff8tSnSRAChgAxo8bQAAADwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJO4YAGTtuABQ0YgAAGUUDBiZSDgcoVBYOLFOmHThe/zBKc/8+WIH/SGGK/09mjv9RaI//UWiP/1JpkP9Va5L/V22T/1htlP9XbZT/VmyT/1BokP8/WIL/IDti/zBLcv9KYon/U2mQ/1Jpj/9GXob/KURr/yZBaf9GX4j/U2qS/1pvlv9dcpj/X3SZ/2B0mf9gdJn/XnOZ/1twlv9WbJT/UWiQ/0pii/8/WoP/MUt1/x04X/8QLVL/Ij1k/zpVf/86VYDhKUd0KyxJdQAfQ3cAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFQJMAFThrAAowZwQjQGlwJUBpwhMwVsgQLVL5Ij1k/zVQef9DXYb/TWWO/1Rrkv9ZbpX/W3CW/1xxl/9ecpj/X3OZ/190mf9ec5n/XHGX/1Vrk/9AWoP/KURs/0Rdhv9ccZf/ZXic/2N3nP9VbJP/N1J7/yxHb/9JYov/WG6V/190mf9jd5z/ZXid/2V5nf9kd5z/YHSa/1txl/9WbJP/UGeQ/0lii/9AWoT/NE94/yM9ZP8SLlP/GjVb/zFMdf8/WoT9NlN+Z0dehgAKOHMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAdO2UAKUZyACVEczY1UHvoN1F7/xw3Xf8UL1X/J0Fp/zlTff9HYIn/UGiQ/1dtlP9ccZf/YHSa/2N2m/9keJz/ZXmd/2V5nf9keJz/YXWb/1twl/9KY4z/M054/z9Zg/9YbpX/Y3ec/2B1mv9PZ5D/NlF7/zdSfP9QaJD/XHGY/2J2m/9meZ7/aHuf/2d6nv9keJ3/YHWa/1twl/9Va5P/TmaO/0Zgif8+WIL/NE95/yZBaP8VMFb/FTBW/yhCav89V4H/PVmEpBM8dgUmSX4ACDRuAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUPXcAX22JADNQfXo/WoX/NU95/xs1XP8XMlj/KkVt/zpVf/9HYYr/UGiQ/1ZslP9bcJf/YHSa/2R3nP9mep7/aHuf/2l7n/9nep7/ZHic/15zmf9Ua5P/P1qE/zlVf/9HYYz/UGiR/05nkP9DXoj/N1N9/0Jchv9TapL/XHKY/2R4nf9pe5//aXyg/2h7n/9leJ3/YXWa/1xxl/9WbJP/TmaO/0Rdhv8vQ2T/MEpy/yhCav8YM1n/Ey9U/yE7Yv83UXr/PlmE1y1Mex4uTXsAACFsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhHnQAjR3sAEzlwBj1YhKxBXIb/Lkly/xk0Wf8ZNFr/LEdv/zpVf/9FXoj/TWWO/1Rqkv9ab5b/X3OZ/2N3nP9nep7/aXuf/2p8oP9qfKD/Znme/190mv9WbZX/S2SO/0Bbhv9CXon/RmGM/0Zhi/9DXon/QVyH/0ljjP9Ta5P/X3Sa/2h7n/9qfaD/aXyg/2d6nv9leZ3/Ynab/11ymP9YbpX/UWiQ/0Zeh/8wRWf/MEtz/yhDav8aNFr/FC9V/xw3Xf8xS3T/PViC8zNQfEQ3U34AJEZ7AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABtOmAAuTn8ALE1+E0JdiMo+WYP/KUNr/xgzWf8bNlz/LEdw/zhTff9BW4X/SmOM/1Jqkv9Zb5b/X3SZ/2N3nP9mep7/aHuf/2l8oP9qfaD/anyg/2R3nP9Zb5b/UGiR/0xlj/9OZ5D/UWmS/1Jqkv9QaJH/TWaP/0xljv9Ua5P/Ynec/2l8n/9qfKD/anyg/2l8n/9nep7/Y3ec/15zmf9Zb5b/UmqS/0pii/8+WIL/Mk12/yhCav8bNlz/FTBW/xk0Wv8qRW3/OlR+/zNPe3VSZIUABjZ7AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABFKmwA2VYUANVWFIkReiN46VX7/JUBn/xgzWf8dN13/K0Zv/zZRe/8+WYP/SWKL/1Nqkv9acJb/X3SZ/2N3nP9mep7/aHuf/2l8n/9pfKD/aXyg/2Z5nv9bcJf/T2iR/1Jqkv9acJf/YXWb/2J2nP9dcpn/U2qS/0hhi/9PZ5D/Y3ec/2p8oP9pe5//aXuf/2t+of9qfaH/Znqf/190mf9XbJL/UGeO/0tkjf9BW4X/M053/ydCav8cN13/FjFX/x86YP8gO2L/MUt0/y9Ldp8AJ2oDFj10AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACtLegA3VYMANlSCNENdh+s3Unv/Iz1k/xk0Wv8dOF7/KkVt/zRPef89WIL/SWKL/1Rrk/9acJf/X3Sa/2R4nf9pfKD/a36h/2t+ov9oe5//aXyf/2t9oP9gdZn/SGGK/01mjv9dcpj/Z3qe/2l8n/9idpv/UmmR/z5Zg/9QZYf/rrXC/77Dzf9eaHf/MT1Q/zA6S/8wO07/OEJU/0tXav9yeoj/f4iX/1VnhP9EXYb/NVB5/ydCav8dN13/FjBW/yxGbv8jPmX/HDdd/yQ/Z7YhPWcIIT1lAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABdDiAA6VYAAOFSARUFbhPU1T3n/ITti/xs1W/8dOF7/KUNr/zJNd/8+WIL/S2ON/1Rrk/9XbZT/XnKX/2J1mv9gc5X/WWqK/1Beev9ZZnz/kpmm/8/T2v+Wn67/PVZ+/0ZfiP9acJb/Znme/2l8n/9idpv/UGeP/ztVf/83TXD/j5KY/9DQ0P8zOUD/AwUI/wAAAP8AAAD/AgIC/yUpLv+Agob/6Ofm/6eprP89Tmv/NlF6/ydCaf8dOF7/FTBW/y1Gbf89Vn7/Hjlg/xs2XbgjPmcJHztjAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1BkAA5VH8AM1KBTj1XgfgwSnP/ITxj/x45X/8dN17/J0Jp/zFMdf8/WYP/S2OM/1Zoh/9+h5j/WmNy/yYxQv8VGyT/Cw4U/wcICv8nKi7/a29z/9DQz/9cZXT/N1B5/0JbhP9XbZP/Y3eb/2V5nf9gdJn/UGeO/z1Wf/83UHn/M0Ja/2NlaP8jKjH/Fxoc/xUUFP8AAAD/AAAA/xUZHv9vcnf/5ubm/21tbf8mNEv/NVB6/ydCav8eOF7/FC9T/xksRv4/Vnz9OVR+/ypHcpIGPokBJEh8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABE/fgAxTHYAK0p3UzFMdfoiPWT/LEdv/yM9ZP8dN13/JkFo/y9Kc/8+WIL/UGOB/6+xtv/g4N//Uldd/wQJD/8AAAD/AAAA/wAAAP8MDhD/PEBG/1VXW/8vQl//PFZ//0JbhP9UapH/X3OY/2F1mv9dcZf/UWeP/0FZgv87VHz/OVF4/yAtQv8MERf/h4mK/4+Pj/8EBAX/AwUI/xgfJ/+DhYj/goGB/xodIv8xRmf/NE95/yhDav8eOV//FS5Q/wwUH/kmN1GsQF2KmjRVhS44VX8AEhQYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABJFjwAmQmsAJUNwSR86YPYgO2H/Rl6H/yhCaf8cNl3/JT9n/y5Jcf87VoD/NkNY/5mYmP/s7Oz/YGVq/ywzOv96enr/GBcX/wAAAP8JDA//EhUa/x8sQf88VXz/PleA/0Rchf9RaI//Wm6U/1xwlv9YbZT/UGaN/0RchP8+Vn//P1eA/z1VfP8nN1H/MDU9/zc4Of8DBQf/BgsQ/xUYHf8yMzP/GR0k/y9BXf87Vn//NE54/ylEbP8fOmD/Fi5Q/w8VHv8MDxKmGitECh8uRgAabtsAKFaYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACNKhAAjQW0AI0FuKiQ/Z+Q5VHz/T2WM/yE2Vv8bNVr/JD5m/yxHcP84U37/MUVk/yMlKf+OjYz/lJWX/1ddY/+2uLr/KCkr/wAAAf8FCAz/HCg7/zxUev9BWoL/QVmB/0Vdhf9OZIz/U2mQ/1Vrkf9TaY//TWSL/0VdhP9AWYH/QFmB/0Jbg/9DW4P/OE5w/yY1Tf8cJTb/Fx8s/x0mNv8sOlH/PlN3/0JbhP87Vn//NE94/ypFbf8gO2L/Fy5P/xAWHf8NERTcCw4SIg0RFgAsSnQAKleYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADZadgAtTX8AJkh9BzVTf5BEX4vtNUlo1w8YJPsaMlX/Iz5l/yxGb/82UXr/P1mC/zNFYv8eJC//MzQ2/yAiJP8TFxv/BwsQ/w4UHf8oNk//QVh+/0Vdhf9EXIT/Q1uD/0Vdhf9KYYn/TWSL/05ljP9NZIv/SWGI/0VchP9BWoL/QlqC/0RchP9GXob/SGCI/0lhif9JYIj/SWCG/0piif9KYov/R1+I/0FbhP87Vn//NE94/ytGbv8iPGT/Fy5N/xAVG/8OERT0DA8TRg0QFAALDhEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABI5gQAmQm0ANVOAADpcjhFCZJkzExslaQ8TGfoYLkz/Iz5l/ytGbv81UHn/PViB/0ReiP9EW4H/OUtq/zA/WP8tPFT/Nkdk/0JYfP9JYYn/SWGI/0hfh/9GXoX/RFyE/0Vdhf9HX4b/SWCI/0lhiP9IYIf/Rl6F/0Nbg/9BWoL/QlqC/0VchP9HX4f/SmGI/0tjiv9NZIv/TmWM/01kjP9KYor/Rl+H/0FbhP87VX//NE54/yxHb/8jPmb/Fy1K/xAUGf8OERX/DA8TfQ8SFAALDxMACgwQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyWZYAPFiEADhYiQAlNU0ADRATQRATF/MXKEH/Iz5l/ytFbv80Tnj/PFaA/0Nchv9IYYr/TWWO/1BokP9RaJD/UWiQ/09mjv9NZIz/S2OK/0lgiP9GXob/RFyE/0RchP9FXYX/Rl6F/0Zehf9GXYX/RFyE/0Jagv9BWYH/QVqB/0Nbg/9HXob/SWGI/0xji/9NZIz/TmWN/01kjP9KYor/Rl6H/0Bag/86VX7/M054/y1HcP8lQGj/GCtG/xAUGP8OEhX/DRAUtQsNEgoLDhIACQwTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAArUYcAOl2RAA8VHAAOERUADREUOxATFvAVIjT/Ijxj/ytFbv8zTXf/O1V//0Jbhf9HYIn/TGSM/09njv9SaJD/UmiQ/1Bnjv9OZYz/S2KK/0hgh/9FXYX/Q1yD/0Nbg/9EXIT/RVyE/0VchP9EXIT/RFyD/0Jagv9BWYH/QFmB/0Fagv9EXIT/R1+G/0phif9MY4v/TWSL/0tji/9IYYn/RF2G/z9Zgv83UHb/MElu/y1Icf8mQWn/GilB/xIVGP8PExb/DRAU6QsNEToLDhEADxIUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkSHwAOEhUADhEVVBEUF/kTGyX/ITld/ytGbv8yTXb/OVR9/0BahP9FXof/SmKK/01ljf9QZ47/UGeO/09ljf9MY4v/SWCI/0Zehv9DXIT/Q1uD/0Nbg/9EXIT/RVyE/0VdhP9FXYT/RV2E/0RchP9CW4L/QVmB/0BZgf9BWoH/Q1uD/0Zehv9IYIj/SWGJ/0hgif9GXof/QVqC/zhNb/8qN03/LkNl/y5Jcv8oQmr/Gyk7/xUYG/8RFBf/DRAU/wsOE4cTEggACw4UAAwMFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8RGAAOEhUADhEVaBATF/4UGB3/HzRS/ytGb/8yTXb/NU50/zZKa/9AWH7/Rl+I/0pii/9MY4z/TGOL/0piiv9HX4b/Q1qA/0FYff9CWoH/RFyE/0Vdhf9HX4b/SGCH/0lgh/9JYYj/SmGI/0lhiP9HX4b/RV2E/z1SdP8yQFj/MD5U/zNCW/85TGr/PlJz/z1Rcv84Smf/LjxR/yYuO/8sPFX/M012/y9Kc/8oQmr/HSg4/xkcH/8SFRj/DhEV/w0QFLAMDxQHDA8UAAwLEwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0RFgAOERQADRAVag8SFv8TFhn/HSxB/ytGb/8xTHb/NU93/y09Vf8rNUf/M0Ja/ztNav8/UnL/P1Jy/ztMaf8xP1T/KzVF/yo0RP8zQVf/RlyB/0tiiv9OZYz/UGaN/1Fnjv9SaI//UmmP/1Jojv9QZo3/TWSL/zpJY/8mLTf/JCky/yMoMP8kKjP/Jiw3/yYsN/8lKzX/KDA9/zJDX/84Unv/NE95/zBKdP8pQ2n/Hyg0/xsfIv8UFxr/EBMW/w8TFsAMEBQNDRAVAAwPFQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0QFAAOERUADREUbBATFv8UFxr/GyUy/ytEa/8xTHb/NlF7/zlTe/8zRF//KTJA/yYsNv8mLDb/Jiw2/yUqM/8kKTH/JSoz/yguOf8yPU7/TWGF/1Rqkf9YbZP/Wm+V/1xwlv9ccZb/XHGW/1twlf9YbpT/VmyS/1Fmiv9HWXj/QVFs/ztJYP84RFr/N0RZ/zhGXf88TGn/QFZ7/0Bag/86VX//NVB6/zBLdP8pQmj/HyYy/x0gI/8WGR3/Exca/xIVGb8NERYNDhIXAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwPFAASFhgADxIVehIWGf8ZHB//HiQr/ylAYv8xTXf/NlF7/ztWgP9AWoT/QVh9/z1Oa/85Rl3/N0RZ/zlGW/89SmL/RFNv/0xefv9UaIz/WW6U/1xxlv9fc5j/YXWa/2J2m/9jd5v/Ynab/2F1mv9fdJn/XXGX/1pvlf9ZbpX/V22U/1Vrkv9TaZH/UWiP/05mjv9KY4z/Rl+I/0BahP86VX//NVB6/zBMdf8oQGX/HiUu/yAjJv8aHSD/Fhkd/xMXGqMLDxQEEBQYAAwQGQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQFQA/PTcAERUYiRcaHv8gIyf/Jiot/yk7V/8xTXf/NVB6/zpVf/9AWoT/Rl+J/0tkjf9PZ4//UmmQ/1Vrkv9XbZT/WW+V/1twlv9ccZf/X3OY/2J1mv9kd5z/Znmd/2d6nv9nep7/Znqe/2V5nf9kd5z/YXWa/19zmf9ccZf/Wm+V/1dtlP9Va5L/UmmQ/05mjv9KYov/RV6H/z9ahP86VX//NVB6/zFMdv8nPmH/HyQr/yEkJ/8cHyP/Fhkd/xEUGJJKU0YADA4VAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQFgA6PTkAFBcbiBodIP8dICP/JSgr/yc2S/8xTHb/NVB6/zpVf/8/WYP/RV6I/0pii/9OZo//U2mR/1Zsk/9ZbpX/W3CW/11ymP9gdJn/Y3ab/2V4nf9nep7/aHuf/2l8n/9pfJ//aXuf/2h7n/9mep7/ZXid/2J2m/9gdJr/XXKY/1pwlv9XbZT/U2qR/05mj/9KYov/RV6H/z9ahP86VYD/NlF7/zJNd/8kOFf/HSEm/x4iJf8bHiL/Exca/w8SFo8ZGx0ACw8TAAoOEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABASGAATFxoAEhYabBEUGP8RFBf/Gh0g/yAqOP8vSXH/NlF7/zpVf/8+WYP/RF2H/0lii/9OZo7/U2qR/1dtlP9acJb/XnKY/2B1mv9jd5z/ZXmd/2d6nv9pe5//anyg/2p9oP9qfaD/anyg/2l8oP9oe5//Z3qe/2V4nf9jd5v/YHSa/11ymP9Zb5b/VWyT/1BokP9KY4z/RV+I/0BahP87VoD/NlJ8/zFMdv8dLUP/GRwg/xsfIv8WGR3/ERQX/w4SFbQJDBAMCg4SAAwPEwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQwRAAgMEQAOERMACw4Sdw4RFP8VGBz/HiEk/x4jKv8qQGH/NlF8/zpVf/8+WYP/Q12H/0hii/9OZo//U2qS/1hulf9ccZf/YHSa/2J2m/9leJ3/Z3qe/2h7n/9pfKD/an2g/2t9oP9rfaD/an2g/2p8oP9oe5//Z3qe/2V5nf9jd5z/YXWb/15zmf9bcJf/Vm2U/1Fpkf9LZI3/RV+J/0Bbhf87V4H/OFN+/ytEav8WHyr/Fxod/xMXGv8PEhb/DxIW/w0RFPELDhJGDA8SAA8SFwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsOEgAKDREKDRAUtBMWGv8bHiL/IyYq/yIlKP8kMkj/NVB6/zpVgP8+WYP/Q12H/0hhi/9NZo//U2qS/1hulf9ccpj/YHSa/2N3nP9leZ3/Z3qe/2h7n/9pfJ//anyg/2p9oP9qfaD/anyg/2l8n/9oe5//Znqe/2V4nf9jd5z/YHWa/15zmf9acJf/VmyU/1Bokf9KZI3/RV+J/0Bbhf87VoH/Mk13/xoqQv8OEhb/DRAU/wwPE/8NEBT/DhEV/w0RFP8NERSODhEcAQ0QFQAEAwcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw0UAA0QFAAMDxMcEBMX1xYZHf8dIST/JSgr/yQnKf8eJjD/LkZs/zpVgf8+WYP/Ql2H/0dhi/9MZY//UmmS/1dtlf9bcZj/X3Sa/2J2m/9jd5z/ZXmd/2d6nv9oe5//aHuf/2l8oP9pfKD/aXyf/2h7n/9mep7/ZXmd/2N3nP9hdZv/X3OZ/1xxmP9Yb5b/VGuT/05nkP9IYYv/QFqE/zdRe/8oQmn/Fic//woPFf8KDRD/Cw4S/wwPE/8NEBT/DREU/w0RFP8QExfQEBQXGQ8TFwANERYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAWAA8SFgAOERYfEhUZ2xgbH/8fIib/JSgs/yQnKv8dIST/Hi1D/zVQev89WYT/QVyH/0Zgiv9LZI7/UGiR/1VslP9Zb5b/XXKY/190mv9hdpv/Y3ec/2V4nf9meZ7/Z3qf/2h7n/9oe5//aHuf/2d7n/9meZ7/ZHid/2J2nP9fdJr/W3CX/1ZslP9RaJD/SmGJ/z1Vff8uSHD/ITxj/xQtUP8LGSv/CQ0S/woNEf8LDxL/DA8T/w0QE/8NEBT/DRAU/w4RFP8TFhrxExYaPhMWGgALDhQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAWABEUGAAQExcSFBcbyBkdIP8gIyf/JSgr/yMmKv8dICT/FBkf/x4uRv82UXr/QVyH/0Vfiv9JY43/TmaQ/1Jqk/9WbZX/WnCX/11ymf9fdJr/YHWb/2F2m/9idpv/X3OX/1xvk/9abpL/WWyQ/1Voiv9RYoP/TmGC/0tegP9DV3j/O09w/zNHaf8sQmX/Ijtg/xQvVP8LJkf/CB02/wgRHP8JDBD/Cg0R/wwPE/8NEBP/DA8T/wwPE/8MEBP/DRAU/w4RFP8WGh37FxoeWRcbHgATFxsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAWABIWGgAIDRMCFRgclhseIf8hJCj/IyYp/x8iJv8VGBz/DhEV/w0RFv8XIzT/K0Fj/zlTfP9DXYj/SGKN/0tkjv9NZY7/TWWN/0tiiP9DV3n/N0dj/zA+Vv8sOEv/Iiw9/xwkMf8aIi//GCAt/xcdJ/8UGiH/FBkh/xEXH/8PFBz/DRIa/wwRGf8KERr/CBMf/wcRHv8HDhf/CAsP/wkLDv8KDRD/Cg0Q/wsOEv8MDxL/Cw4S/wsOEv8MDxP/DQ8T/w4QFP8aHSH+Gx8iYhwfIwAYGx8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIlJQAWGh0AFRkcTBwfIvQgIyb/HB8j/xQXG/8NEBT/DREU/w4SFf8OERT/DBEY/xEbKf8ZKUH/HjJQ/x0vS/8aKT7/FSI0/xIdLP8OFB3/Cw4T/woNEf8OERT/ERQX/xATFv8NEBP/DA8S/xATF/8UFxv/Exca/w4RFf8LDhL/Cw4R/woNEP8KDRD/Cg0Q/wkMD/8JCw7/CQsP/wkMD/8JDA//CQwP/wkMD/8JDA//CQwQ/woNEf8LDhL/DA8T/w4QFP8dICP4HyImTh8iJgAYHCEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwRFQANEBQADBAUPBMWGvAUGBv/EBMX/wwQE/8NERT/EBMW/xIVGP8OERX/Cw4R/wsOEf8MDxL/Cg4T/wkMEP8KDRD/DA8S/w0QE/8MDxL/DRAT/wwQE/8OERX/Fhkd/xkcIP8WGRz/EhUY/xATFv8WGh3/Fxoe/xAUF/8OERX/DRAU/wwPE/8LDhL/Cw4S/wsOEv8LDhH/Cg0Q/woNEP8KDRH/Cg0Q/woNEP8KDRH/Cg4R/wsOEv8LDxL/DA8T/w4RFP8cHyLdHyMnJx4hJQAJDRkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoMDQAJDBAACQwQUgoNEfkKDhH/Cw4R/w4RFf8QExf/ExYa/xEVGP8MDxP/DRAU/w8SFv8PEhb/Cw8S/w0QFP8QExf/FBcb/xIVGf8PEhb/ERQY/xEUGP8PEhX/EhUY/xodIf8bHyL/GBsf/xMWGv8SFRn/Fxoe/xEUGP8QExf/EBMX/w8SFv8NERT/DBAT/w0QFP8OERX/DRAT/wsOEv8KDRH/Cg0R/wsOEf8LDhL/DA8S/wwPE/8MDxP/DRAU/w4RFf4WGR1/PEJDAhgcHwAOEhsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkOEgAICw4ACQwPZggLDv4KDRD/DREU/xATF/8TFxr/FBcb/w0QFP8OERX/ERQY/xMWGv8QExf/DhEU/xIWGf8WGh3/GRwg/xQXG/8RFBj/FRgc/xUZHP8TFxr/EhUZ/xcaHv8dICT/HCAj/xgcH/8RFBj/Exca/xIVGf8TFxr/FBcb/xMWGv8SFRn/EBQX/w8SFv8QExb/ERQX/w8SFv8NEBT/DA8T/wwPE/8MDxL/DA8T/wwQE/8NEBT/DhEV/w8TFvIQExc/ERQYABgcHwABAQMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsPEwAMDxIACw8SawwPE/8OEhX/DxMW/xMWGv8UFxv/DhIV/w4RFf8TFhn/FRkc/xUZHP8OEhX/ExYa/xgbH/8bHiL/Gh4h/xQXG/8SFRj/Fhoe/xgcH/8XGx7/FRgc/xYZHf8bHiL/HiEl/xwfI/8VGBz/EBMW/xMXGv8YGx//GRwg/xgbH/8WGh3/FRgc/xQXG/8SFhn/ExYa/xQXG/8UFxr/ExYZ/xIVGP8RFBf/EBMX/xATF/8QFBf/ERQY/xIVGdwSFRkiEhUZABEVGgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwTFwAQExcAEBMXWREUF/sRFBf/ExYZ/xQXGv8PEhb/DhIV/xMWGv8XGh7/Fxse/xEUGP8QFBf/GRwg/xwgI/8dIST/Gx4h/xMWGv8SFRn/GBsf/xoeIf8aHiH/GBsf/xcbHv8ZHCD/HSAk/x0hJP8ZHCD/DxMW/xIVGf8cHyP/HyMm/x4hJP8bHyL/Gh0h/xkcIP8YHB//Fxse/xcbHv8YHB//GBsf/xgbHv8WGh3/FRkc/xUYHP8WGRz/Fhkc/xQYHKsSFxsHExcbAA4PFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABATGQASFRkAEhUZMBMXGuYVGBv/FBcb/xAUF/8RFBf/FBcb/xcbHv8XGx//ERUY/w4RFf8YGx//HSEk/yEkJ/8fIiX/Gh0h/xIVGP8TFhr/Gh4h/x0hJP8eIiX/HB8j/xkdIf8ZHCD/Gh4h/x0gJP8bHiL/ExYa/w8SFv8bHiH/Jikt/yYpLP8kJyr/ISQo/x8jJv8fIib/HyMm/yAjJ/8gIyf/ICMn/yAjJv8fIiX/HiEk/xwgI/8aHiH/GBsf9RYaHVQWGh0AGR0sABIYHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0PFAAUGBwAExgbBxYZHaQXGh7/Fhkd/xUZHP8XGh7/GBwf/xYZHf8QExf/DxIV/xcbHv8eISX/IyYp/yMmKf8fIib/Fxse/xEUF/8UGBv/HSEk/yIlKf8lKCv/ISUo/x0hJP8aHiH/GRwg/xseIv8bHiL/Fxse/xATF/8TFhr/JCcr/y4xNP8uMTT/LTA0/ywvM/8sLzL/LC8y/ywvM/8sLzP/LTAz/y4wNP8uMTT/LTAz/ycqLv8eISX/GRwgpRcbIAwXGyAAFBgfAAIDBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABUZIgATFhkAGRwgABgcIDMdICTWHiEl/xodIf8XGh7/ExYa/xATF/8TFhr/Gx4i/yAjJv8kJyv/Jyot/yMmKv8dICT/FBcb/xEVGP8XGh7/IyYq/yksL/8rLjH/Jikt/yElKP8dICP/GBsf/xkdIP8bHiL/Gx4i/xUZHP8RFRj/Fxoe/yotMP81ODv/Nzo9/zg7Pv85PD7/OTw+/zk7Pv84Oz7/Nzo9/zc6Pf83OTz/NDY5/yksL/8dISTFGR0hJBkdIQAXGx8AFxshAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUGyAAFRsgABoXFAAUFxuLFxse/xodIP8ZHSD/Gh0g/x0gJP8hJCj/JCcq/ygrLv8rLjH/KCsu/yEkKP8YHB//ExYZ/xMWGv8cHyP/Ky4x/zAzNv8vMjX/Ki0w/yUoK/8cICP/Fxoe/xkcIP8cHyP/HyIm/xseIv8XGx7/ExYa/xQXG/8mKSz/Njk8/z0/Qv8/QUT/QEJF/0BCRf8/QkX/P0FE/z5AQ/87PkH/MzY5/iUpLLsbHyMxHSAjABstYwAZHSMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWHB8ADhIWADQ2NgAVGRyIIiUo/ysuMf8rLjH/Ki0w/yotMP8rLjH/LjE0/y8yNf8sLzL/JSgs/xwfI/8VGBz/ExYa/xUYHP8mKSz/MzY5/zU3Ov8wMjX/Ki0w/yMmKf8YHB//Fhod/xkdIP8fIib/JSgr/yEkJ/8dIST/Gh0h/xQXG/8PEhb/Fxod/yUoK/8xMzb/ODo9/zs+Qf89P0L/Oz5B/zU4O/8sLjL3KCsvkCMoLBYfIiYAGB4lABkdIwAcHyUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxIYACAjJgAaHSFgJCcr+y4xNP8sLzL/MDI2/zU4O/82ODv/NDc6/y8xNP8mKi3/HSAk/xYaHf8UFxv/FBcb/x8iJf80Njn/OTs+/zQ3Ov8sLzL/JSgr/xseIf8VGRz/GBwf/xwfI/8lKCz/Ky4x/ycqLf8kJyv/HyIl/x0gJP8YGx//DhIV/wsPEv8PEhb/FRgb/xkdIP8ZHCD/FBgb/w8SFf8LDhH1CQwQmQUIDCsZGx4AAAAAAA4RFQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFBgdABoeIgAZHSIVHiIlsisuMf8lKCv/ICMn/y0vM/8xNDf/LC8y/yMmKv8cHyL/Fxsf/xYaHf8XGh7/ICQn/zQ3Ov88PkH/ODs9/ywvMv8lKCv/HB8i/xcaHv8XGx7/HCAj/yIlKP8uMTT/MTQ3/y0wM/8sLzL/IiYp/yAjJv8lKCv/HSAk/xMWGv8RFRj/ExYa/xEVGP8NEBT/DBAT/xEVGP8aHSH/HSAk/xkcIMoSFRkoFBcbAA8TGQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGRwiABodIAAbHiIAGR4iJiYpLbEqLTD+JSgr/yEkKP8jJir/Ki4x/y8yNf8vMTX/LC8y/ysuMf8wMzb/Oz1A/z9BRP85Oz7/KSwv/x4hJP8ZHCD/Gh4h/xseIf8fIiX/IyYp/ywvMv82OTz/Njg7/zEzNv8xNDf/Ki0w/x4iJf8iJSn/Kiww/yEkJ/8ZHCD/FRgc/xEUF/8RFBj/Gh0h/y0vM/o4Oj7qOz1A/jc6Pf8jJip/b3FtAAsPFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFxwhAB0jKAAdGxwAHiImAB4jKBUoKy+FLTAz6iotMP8iJSn/IyYp/ywvMv8xNDf/ODs+/z1AQ/8/QUT/PD9B/zE0N/8dICT/EhUZ/xIVGf8ZHSD/Iycq/yAjJ/8nKi3/LC8y/zc5PP88PkH/OTs+/zQ3Ov81ODv/MjU4/ycqLf8bHyL/HB8j/x0gI/8WGh3/ExYZ/xQXG/8cHyP/KSwv2jQ3OmovMjY0LTE0jzg6Pe4sLzOH////ABEVHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABsgJwAeIycAJyotACImKgATGiADKCsvQSwvM7QsLzL4Jyou/ycqLv8oKy7/JCcq/yUoK/8nKi3/LC8y/yEkJ/8VGBv/FBcb/xkcIP8oKy7/KSwv/ycqLv8uMTT/NTg7/z0/Qv8/QUT/Oj1A/zg6Pf85Oz7/OTw//zQ3Ov8nKi7/Gx4i/xUYHP8UFxv/Fxoe/x8iJf8nKi3OKCwwOEdISwAvMjYAFRkfBi0wNDktMDQgOj0/AAMLFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhKC4AISYtACImKgAfJCkALC8yACQpLhAsMDNbLC8yvSgrLvQjJin/ICMn/yEkJ/8hJCj/LTAz/ygrLv8bHiL/HCAj/yksL/81Nzr/Ky4x/y8xNf80Nzr/Oz5B/z9CRf9AQkX/OTw//zg7Pf86PT//PT9C/z5BQ/86PUD/MDM2/ycqLf8kKCv/KCsu/yktMMkmKi42LTAzAB0iJwAiJioAICQoAC8yNgAtMTUAQkRGAAAGEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8ADwAgJSoAPz8/ACYqLwAwMjUAKS0yES0wM0grLjGNJSgsxCEkKOIgIyfuISQoriUpLHseISWdHyMmvy4xNOk6PT//MDM2/zU4O/85PD//P0FE/0FDRv9AQ0b/MzU4/zAzNv82ODv/PD9B/z9CRP9BQ0b/QENG/z1AQv83Oj3rMTM3mScrLyQzNTgAGyEmACEmKwAeJS0ALi8wACMnKwAnKy8AJysvACwyNgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhKzQAICUqACAmLAAAAAAAKS0xAC0wMwBZZ3gAMTQ4ECsvMicpLTA0IycrFi0uMAAkLDICKCwwDSQnKzsuMTSuLjE09jk7Pv8+QUP/QUNG/0JFSP9BREb/KSwv/xkcIP8eISX/Jyot/zM1OeM3Oj3VNjk9wjQ3OogtMTQ8HSEmBiktMAAGDhUAHyQpAB4mMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB8nMQAeJCgAIiguADIxNAAqLTIALC80ACotMQAqLjEAJSktABQeJgAgJSkAJSktACouMQAaHyMOIiUpVjAzN749QEP/QkRH/0JFSP9CREf/LC8y/xYaHf8WGR39FhoerB0hJTEjKCwaHiIoD////wAvMzYAJSktACwvMgAhJisAGBwhAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJyswACgsMgAYHSUAFhsjABYbIwAcISUAEhUaADo/QgAgJSkAKSwvACAkKBoxNDeTPkBD8UFDRv9AQ0X/NDc6/yEkKPEaHiKOGh8jEx0hJQAlKS0AIyctACElKwAjJywAKygpACAlLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB8kKAAeIykASUlGACYqLgAXHCEJMTQ4Xjc6PsM0NzvmKS0wwyAjJ2AeIycJGh4jABcaHgAcISgAHiMnAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD///+AAAf///8AAAD///4AAAP///8AAAD///wAAAH///8AAAD///gAAAB///8AAAD///AAAAA///8AAAD//+AAAAAf//8AAAD//8AAAAAP//8AAAD//4AAAAAP//8AAAD//4AAAAAH//8AAAD//wAAAAAD//8AAAD//wAAAAAD//8AAAD//gAAAAAB//8AAAD//AAAAAAA//8AAAD//AAAAAAA//8AAAD//AAAAAAAH/8AAAD//AAAAAAAD/8AAAD/+AAAAAAAD/8AAAD/8AAAAAAAB/8AAAD/wAAAAAAAB/8AAAD/gAAAAAAAB/8AAAD/gAAAAAAAB/8AAAD/gAAAAAAAA/8AAAD/gAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAA/8AAAD/AAAAAAAAB/8AAAD/AAAAAAAAA/8AAAD/gAAAAAAAA/8AAAD/gAAAAAAAA/8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/wAAAAAAAAf8AAAD/wAAAAAAAAP8AAAD/wAAAAAAAAP8AAAD/wAAAAAAAAP8AAAD/wAAAAAAAAP8AAAD/wAAAAAAAAP8AAAD/wAAAAAAAAP8AAAD/4AAAAAAAAP8AAAD/4AAAAAAAAP8AAAD/4AAAAAAAAP8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAAf8AAAD/4AAAAAAAA/8AAAD/8AAAAAAAB/8AAAD/8AAAAAAAB/8AAAD/+AAAAAAAD/8AAAD/+AAAAAAAD/8AAAD/+AAAAAAAD/8AAAD/+AAAAAAAD/8AAAD//AAAAAAAD/8AAAD//gAAAAAAD/8AAAD//4AAAAAAD/8AAAD//8AAAAAD//8AAAD///AAAAAH//8AAAD///+AAAAf//8AAAD/////AAH///8AAAAoAAAAYAAAAMAAAAABACAAAAAAAACQAAA4IQAAOCEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKLl8ACi1eAAoqVAAJK1cADStSAAMnVgQNK1YtDSpTdA8sU7YQLVXdES9W4hEuVtoPLFO1DStUeQsrVz4JKVgTFCQrAAsrVgAMLFkADCxXAAsrWwAKL2UADT2PAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACixZAAokQwAKK1cACS1eAAsqUgAAJ1gDCytTMQ8tVI0VMFfYGTRa+R03Xv8fOWD/IDph/x85YP8cN13/GDNZ+xMvVucPLFS4DCtUbworVyQGKV4CCypVAAovZwAKLmIADDBnAAsqVgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMNoMACjNvAAskQgAKKlQAMxwAAAoqUy0OLFKOFTBX3xw3Xf8jPWT/J0Fo/ylDav8qRGv/KURr/ylDa/8nQmn/JT9m/yE7Yv8cNlz/FjFX/BAtU9YMKlGFCipWJSAAAAAKK1cACjuAAAovYAAKMGIACStSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwwZAAowZQAMLmEADjaBAAoqUgAJKlYNDCpTZBEuVNUZNFr/Ijxj/yhCav8rRW3/LUdv/y1IcP8uSHD/LUdv/y1Hb/8sRm7/K0Vt/ylDav8mQGf/Ijxj/x03Xf8VMFb+DitS0QspUWgKKlgSCidLAAotXgAKK1UAAAAAAA08jQAAAgQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACStWAAouXwAKL2UACSdJAAkrWBwNK1KYFC9V9R04Xv8lQGf/KkVs/y1Hb/8uSHH/L0lx/y9Jcf8uSHH/Lkhw/y5HcP8tR2//LUdv/yxGbv8qRWz/KUNq/yZAZ/8iPGP/GjVb/xEtUvcMKVCzCilTPQg3fwIJKlIABxolAAw3ewAJJ0wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALNHUACi9kAAovZQALJ0cACipVMg0qUbwVMVb9IDth/yhCaf8sRm7/Lkhx/y9Jcv8vSXL/L0lx/y5IcP8tSHD/LUdv/yxGbv8sRm7/LUdv/y1Hb/8tR2//LEZu/ypFbP8pQ2r/JT9m/x44Xv8UL1X/DSpQ4gopUHYJKlURCSdKAAs0cQALMGUACi1cAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjFkAAowYgAKL2UACi9mAAwPAAAJKVI8DSpRyRUxV/8hPGP/KURr/y1HcP8vSXL/MEpz/zBKc/8vSXH/Lkhw/y5IcP8uSHD/L0lx/y5IcP8tR2//LEZu/y1Hb/8uSHD/Lkhw/y1Hb/8sR2//K0Vt/yhCaf8hO2L/FzJY/w8rUPkLKVCkCSpTKQkfNgAKLFsACSlRAAsqUgAKMmYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACy5fAAosWAAKLV4AAG7/AAoqVU0NKlDYFTFW/yI8Y/8qRGz/Lklx/zFLc/8yTHT/MUx0/zBKc/8vSXH/L0ly/zBKc/8xS3P/MUtz/y9Jcf8sR2//K0Vt/yxGbv8tR3D/L0lx/y9Jcv8vSXL/L0ly/y5IcP8qRGz/Iz1k/xo0Wv8RLVL/DClQygopUkcAO5oBCitWAAoqVAAKLV4ACjJnAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALLV4ACytYAAosWgAINXACCipTWg0qUOEVMFb/ITti/ypFbf8wSnP/M012/zROd/80Tnf/Mk11/zFLc/8uSHD/K0Rs/ypDa/8tRW3/L0Zv/y9Gbv8sQ2z/KEBo/yQ9ZP8lP2f/K0Vt/y9Jcv8xS3T/Mkx1/zNNdv8xS3P/K0Zu/yQ+Zf8cNlz/Ey5U/wwqT+EKKVJkCS9lBwosWQAKK1YACjZvAAoyZwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAotWgAML2QADC1eAAsxcgILKVJdDSpQ5hUxVv8gOmH/KkRs/zFLdP82UHj/N1F6/zdRev81T3j/MUx0/ypEbP8oQGj/MUZv/zxOeP9CUnz/RFR+/0VUf/9EVH//QVF8/zlLdv8tQmv/JD1k/ydBaP8vSXH/NE52/zhRev84Unv/M012/yxHb/8lQGf/Hjhe/xQwVf8NKk/wCilRdgkvYwcKLFkACixWAAovXwAKMGEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjNoAAkuWwAML2MAAAAAAAoqVFINKlDlFjFX/yA6Yf8pQ2v/MUt0/zhSe/88Vn//PFV+/zhSe/8yTHX/KUNr/y9Fbv8/UHv/R1aC/0hWg/9IVoX/SVaG/0lWh/9IVYb/R1WF/0dWhP9GVYL/PU55/y1Ca/8mP2f/Lkhw/zdRev8/WIH/PliA/zZQeP8tSHD/J0Fo/x85YP8VMVb/DSpQ8goqUnYJMWMHCixZAAoqVQAKKlMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIK1MACS9iAAkxZgAPJ0sACypSQQ0qUNwVMVb/IDth/yhCav8wSnL/OVN8/0Fag/9CW4T/O1V+/zNNdf8rRGz/N0p0/0VVgf9IVoT/SVWJ/1Nclf9dZaL/X2ao/19mqP9aYaL/T1iX/0VPif9CTYD/RVKB/0VUgv84S3b/K0Nr/y9Jcv89V3//SWGJ/0NchP83UXn/Lkhx/yhCav8gO2H/FjFW/w0qUPIKKlJ2Ci9kBwosWgAKLl8ACTR5AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAg5igART9EACyI8AAsoTgAJK1cuDCpQzBQvVf8gOmD/KEJq/y9Jcf84Unv/RV2G/0lhiv9AWoP/NU94/y5Gb/88Tnn/RlWC/0NPg/9FTov/U1id/15iqv9dY6z/V16o/1heqP9YX6b/UVie/0dNkf87QH3/LjVm/zE7Y/9CT3z/QFF9/zFIcf80Tnf/SGCI/1Fnj/9FXob/N1F6/zBKcv8pQ2v/IDth/xUxVv8NKlDxCipTYQ8EAAAKMGUACjFoAAozbAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAg5hwAJLFkACSpVAAkrWRULKVCuES1T/x44X/8oQmn/Lkhx/zZQef9EXYX/UGeO/0lhiv86VH3/Mkp0/z9QfP9DUX7/N0J0/zhAfP9AR4n/REqN/0NJiv8/RoP/OUB4/zg+dv84P3b/Nz51/zY8c/8xN23/Jitb/xEULv8WGi7/NUFn/0JSf/83Tnj/QFmC/1Rqkf9TapH/RFyF/zhRev8wSnP/KUNr/yA6YP8UL1X/DCpQ2QkrWDYKKE4AA///AAowZQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDyNAAo0cgAKL2QACDd9AwoqU30PLFH7GzVb/yZBaP8uSHD/NE53/0BZgv9RZ4//VGqR/0Rdhf83UHn/QFJ9/ztIcf8jK1H/JCta/ysyZP8qMWL/Jy5a/yMpUf8dIkX/Fxs6/xYaOP8XGzr/GB08/xkdPf8ZHD7/Fho6/w4RKv8BAQj/Cw0V/zQ8Wf9DVH7/P1aA/1Bnjv9ab5X/UGeO/0BZgv83UHn/MEpz/yhDav8eOF//Ei5U/wwqUbMKK1gVCytXAAovYAAKMmYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACiE2AAgjQAAKKVEACitYPA0rUeQXMlj/JD5l/y1Hb/80TXb/PFZ//0xji/9YbpT/UmmQ/0BZgv9BVH//N0Np/xAUJv8OESr/Fhs8/xUaOf8SFzL/DxMr/w0QJv8LDiL/CQsf/wkLH/8JDCD/Cg0g/woNIf8KDSD/CQse/wYJGv8CAwz/AAAC/xARFf8pMk3/Q1WA/01ji/9bcJb/VmuS/0hgiP89Vn//Nk94/y9Jcv8mQWj/GzZc/xAsUvkLK1RoWwAAAAoxZAAKMWgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKJkIACDNzAAkuXwAIL2QPDCtSqRMvVP8gO2H/K0Vt/zJMdf85U3v/RV2F/1Rqkf9bcJb/UGeP/0VahP89SnD/ERQh/wEBB/8HCRr/CAoe/wcKHf8HChz/Bgkb/wYIGv8GCRn/BwgX/wcJGP8JCxr/Cgwb/woNHP8KDBv/CAoZ/wYIFf8CAgr/AAAC/wAAAf8EBQz/LDdY/0tgif9YbpT/U2qR/0piiv9BWoL/OlR8/zROd/8tR2//Iz5k/xcyWP8OLFPNCi5dIgsuWgALMWUACjZvAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJMGkAAF7/AA0nQwALLFdUEC1T8xs2XP8oQmr/MUtz/zdRev8/WID/S2KK/1dsk/9bcJb/UGaO/0JTfP8XHTD/AAAC/wAABv8DBBH/CQsY/xUXJP8kJjH/ODpD/0RGTv9XWV7/YmRo/2Vna/9naW3/Zmhs/2Nmaf9fYWX/V1ld/01OUv85Ojz/IiMk/wwMDv8BAQL/DBEg/ztNdf9PZo3/SWGJ/0Zehv9CW4P/PVZ//zhSe/8yTHX/KkRs/x85YP8TL1X6DS1XcwBY/wAKMmoACitOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIMnAACS5fAAguYQ8OLFOzFjFX/yM9ZP8uSHD/NU94/ztVfv9DW4T/TGOL/1NqkP9Zb5X/T2SM/yg0VP8BAgf/BwcJ/x8fIv8/QET/X2Fk/3Z5e/+Dhoj/iYyQ/4OIjv99gov/cXeE/2pygf9mbX3/ZW18/2Rrev9gZ3X/WmFv/1heav9TWGL/TFBX/zs/Rf8aHCD/AQMK/x0uUP86U3z/OlN7/z5Xf/9AWYL/PliA/ztUff82UHn/L0ly/yZAZ/8aNVr/EC1UyAstWxkMLloACjBfAAoyaQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPa0ADStTAAwtWj8SLlTsHThe/ylDa/8yTHX/OVJ7/z5XgP9EXIX/SGCI/0piif9RaI//QlV9/xAWKP8WFhf/QkRG/1xfZP9hZm//WWBw/01Xbv9BTWr/Okdo/y8/Zf8uQGf/LUFp/yxAaf8oO2b/JThj/yM1YP8hM17/HzFc/yEyW/8iM1v/IjRa/yI0WP8dLk//ECA+/xUsUP8lP2b/LEZu/zdQef8+V3//P1iA/z1Xf/86VHz/NE53/yxGbv8gO2L/FDBW+A0sVWQVJTkACjNpAAozbwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkzbQAKMWcAADeJAg4tVosXMlj/JD5l/y5Icf82UHn/PFV+/0BZgf9DXIT/QluD/z1Wf/89Vn//Jjti/w0VJf8sNET/LzxX/yg4W/8jNV3/IzZh/yU5Zf8pPmr/MUZx/zpQev9IX4f/U2mP/1RqkP9PZYv/R12F/0NYgf9AVn7/PlR+/z5Vfv8/VoD/PlaA/zpTff81T3j/Lkhx/yU/Z/8jPWP/K0Vt/zZQeP89Vn7/P1iB/0BZgf8+V4D/OFJ7/zFLdP8nQWn/GjVb/xAtVbIJLl8MCy5cAAcqWgAHMGcAADaBAAY1ewAKOIQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABTJwAAk1dAAMLl0ACy5dGxIvVs0dOF7/KUNr/zJNdf85U3z/PleA/0FZgv9BWoL/PVZ+/zJMdP8oQmn/GzRb/xsxV/8oP2j/MUlz/zlRfP9AV4D/RlyG/0xiiv9SaI//WW6U/19zmP9gdJj/W2+U/1drj/9Xa4//WGyR/1htk/9WbJP/UmmR/05mj/9MZI3/SWGK/0Veh/9AWYL/OVN8/zNMdf8yTHT/N1B5/zxVfv9AWYH/QluD/0NchP9CW4T/PVeA/zZQef8tR3D/IDth/xMvVe4MK1VMDShLABMwVgAuQFwAGjZfAAczegANNncACTiCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjRsAA0qSwAQLVMADi9cRhYxWPEiPWP/LUhw/zZQef88Vn//QFmB/0Fagv9AWYH/O1R9/zJLdP8oQmn/J0Fp/zJMdf89VoD/RV6H/0pji/9OZo7/UGiQ/1Nqkf9WbZT/WG6U/1Nojv9HXYP/OVF2/zJKb/8zS3D/OFB2/0FZf/9IYIj/S2OL/0pii/9KYov/SWKK/0hhif9GX4f/RFyF/0Jbg/9DXIT/RFyE/0Rdhf9GXob/SF+H/0lgif9HX4j/QluE/ztVf/8yTXb/JkFo/xczWP8MKlDICihPURAuVk4XNV9uFDRiMwAHvwAGMnQAEThtAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDRqAAk3dgA7GgAAEC9ZfBo1W/8nQWn/MUx1/zpUff9AWYL/Q1yE/0NchP9CWoP/P1iA/ztUfP83UHn/N1F5/zxWfv9DXIT/SGCJ/0tji/9MZI3/TWWN/0xkjP9JYYr/Pld//yhCaf8WMlf/DytQ/w4qTv8PKk//ES1S/x45X/8zTXX/QVqD/0dgif9LY4z/TWWN/05ljf9OZY3/TmWN/05ljf9OZY3/TWWM/01kjP9NZYz/T2aN/09mjv9MZIz/R2CJ/0FahP84U3z/LEdv/x04Xv8PLFH/DSlP9B45YPMtSHD+JkJr1Ro4ZTkiPGYAAABfABI5bwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJNGoADTVlAA42ZwAZM1YACTBjAAswYAAJL2IQEi9XvR45X/8rRm7/NlB5/z5Ygf9EXYb/R1+I/0dfh/9GXof/RV2G/0Vehv9GXob/R1+H/0lhif9MY4v/TmWN/09mj/9PZo//TWWN/0dgif85U3v/HTlf/w8rUP8YM1n/Ij1j/ydBaP8lP2b/GzZd/xEtUv8cN13/NlB5/0Zeh/9NZY3/UGiQ/1Nqkf9Va5L/VmyT/1dsk/9WbJP/VmyS/1Vrkv9WbJL/VmyT/1Nqkf9QZ4//S2SM/0VeiP89V4H/MUx1/yM9ZP8TL1T/DitQ/yI8Y/83Unv/N1J8/ypHcaYWOmwKHT9uABE2bAAAABoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//8AEjJgABIyXwAWM1wADy1WAA8mQwALLFdVFDBW8CM9ZP8wSnP/OlV+/0Nchf9JYYr/TWSM/01ljP9NZIz/TWSM/05ljf9RZ4//UmmQ/1Nqkf9UapL/VWuS/1Rrkv9TapH/TmaP/0Rdhv8tR2//FjJY/yhDav88VX3/R1+G/0phif9IYIf/Pld//ytGbv8XM1n/LEdv/0Rdhv9PZo//VGuS/1hulf9acJb/XHGX/11yl/9dcpf/XXKX/11yl/9ccZf/Wm+W/1ZslP9SaZH/TmaO/0hhiv9AWoT/NVB6/yhDav8YM1n/DytQ/xs2XP8xTHX/PViC/zdTfe0nRXFEMU13AKqwsQAeQXIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAk7hwAXPHMAEjRlAAkqVwcSL1oyDSxWLQsqU0MNK1HLFzJY/ydBaf80T3j/P1mC/0dgif9NZY7/UmmR/1Vrkv9Va5L/VWuS/1Zsk/9YbpT/Wm+V/1twlv9bcJb/WnCW/1lvlf9WbZT/UWiQ/0Nchv8oQmr/JD9m/0Jbg/9SaZD/Wm+V/1xwlv9ab5X/UWiQ/0Fag/8kP2b/KURs/0Rdhv9RaZH/WG6V/1xxmP9fdJn/YXWa/2J2m/9id5v/Ynab/2F1mv9ec5n/W3CW/1dtlP9TapL/T2aP/0lii/9CXIX/OFN9/yxHb/8dOF7/ECxR/xUxVv8pQ2v/OlV//z9ahP8yT3uRAB9aAx0/cQAXOWoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACD2NAAA5qAATN24ABTBwBCA9Z3EpRG3jITxk5BEtU+sPLFH+GzZc/ypFbf84Unz/Q1yG/0tjjP9RaJD/VmyT/1lvlf9ccZf/XXKX/11ymP9ec5j/X3SZ/2B0mv9gdJr/X3SZ/15ymP9bcJf/VGuT/0Zfif8tR3D/Lkly/0pjjP9ccZf/ZXid/2d6nv9keJ3/WW+W/0VfiP8sR3D/L0py/0hhiv9VbJP/XHGY/2B1mv9jd5z/ZXid/2Z5nv9meZ3/ZHic/2J2m/9ec5n/WnCW/1Zsk/9SaZH/TWWO/0hhiv9BW4X/OVR+/y9Jcv8hPGL/Ey5U/xIuU/8hPGL/M053/0Fbhf88V4LLJUV0GSlIdgAfQ3UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASUFtACs+XQAmQm4AHz9wMzBMduE7VoD/MEt0/xgzWf8RLVL/Hjlf/y5Icf86VX//RV+I/01ljv9TapL/WG6V/1twl/9ec5n/YXWa/2N2m/9kd5z/ZHic/2V4nf9keJ3/Y3ec/2J2m/9fc5n/WW+W/01ljv83Unv/MUx1/0ReiP9XbpX/Y3ec/2Z5nv9hdpv/VGuT/0BahP8vSnP/OFN9/01mjv9Zb5b/X3OZ/2J3nP9leZ3/Z3qe/2h7nv9nep7/ZXid/2J2m/9ec5n/WnCW/1Zsk/9RaJD/S2SM/0ZfiP9AWoT/OVR+/zBLdP8kPmX/FjFW/xEtUv8bNlz/LEZv/zxXgP9BW4buMFB/QTdTfwAaQ3oAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJUJmABVBfgCWgHIALUt4fDxXgv8+WYP/LUhw/xgzWf8TL1T/ITxj/zBLdP88VoH/RmCJ/05mj/9TapL/V22V/1twl/9ec5n/YXWb/2R4nP9meZ7/Z3qe/2h7n/9oe5//Z3qe/2R4nf9idpv/XXKY/1Rrk/9DXYf/NE95/zxXgf9LZY7/VWyU/1hulv9Ua5T/SmON/zpWgP8zTnj/QlyG/1Fokf9Zb5b/X3SZ/2R4nP9nep//aXyg/2l8n/9ne57/ZXmd/2N2m/9fdJn/W3CW/1Zsk/9RaJD/S2OM/0Reh/85UXf/NE11/zBLdP8mQGj/GDNZ/xItU/8XMlj/JkBo/zZRe/9CXIb/N1SAe7uvswARO3UADDhyAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFz5zAB5DdwAWPXMNN1N/tUJdh/87VoD/KENr/xcyV/8VMVb/JD5m/zFMdv88V4H/RV+J/0xljv9SaZH/VmyU/1lvlv9dcpj/YXWa/2R3nP9mep7/aHuf/2l8oP9pfKD/aHuf/2Z6nv9idpz/XnOZ/1dulf9MZY7/PVmD/zlVgP9BXYj/R2KN/0ljjv9HYYz/QV2I/zpWgf87V4H/SGGL/1Jpkv9Zb5b/YHWa/2d6nv9qfKD/anyg/2l8n/9nep7/Znmd/2N3nP9gdJn/XHGX/1dtlP9SaZH/TGSN/0Rdhv8nN1H/K0Bi/zBLdf8mQWj/GjVb/xMuVP8VMFb/ITxj/zFMdf8/WoP/OlWAsRk+cAohQ3QAAzRxAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAG0J+AC1MewAqSnohP1qF2EReiP82UXv/JD9m/xYxV/8XMlj/JUBn/zJNd/87VoD/Q12H/0pijP9PZ4//VGuT/1lvlf9dcpj/YXWa/2R3nP9mep7/aHuf/2l8oP9qfaD/an2g/2h7n/9keJ3/XnOZ/1hulf9RaZH/R2GL/0Fchv9CXon/RWCL/0ZhjP9GYYv/RF+K/0JdiP9EX4n/S2SO/1Jqkv9bcJf/ZHid/2p8oP9rfaD/anyg/2h7n/9nep7/Znmd/2N3nP9hdZr/XXKY/1lulf9Ua5L/TmaO/0Veh/8zSGv/Mktz/y9Kc/8mQWn/GzZc/xQvVf8VMFX/HTde/y5Icf88VoD/PFaB2ChIdSIqSXcAKUh2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIUiAADVTggAwUIE5Q16I60Fchv8xTHX/ITxj/xYxV/8ZNFr/JkFo/zJNd/86VX//QFuF/0dgif9NZY7/VGqS/1lvlf9dcpj/YXWa/2R3nP9meZ7/aHue/2l7n/9qfKD/an2g/2p9oP9oe5//Ynab/1lvlv9SapL/TmaQ/0pkjv9LZY//TmeQ/1Bokf9QaJH/TmeQ/0xlj/9LZI7/TWWP/1Jpkv9ec5n/Z3qe/2p9oP9qfaD/anyg/2l8oP9oe5//Z3qe/2R4nf9hdZr/XXKY/1lvlv9VbJP/T2eP/0hhiv8/WoP/NlF7/y5Jcv8mQWj/HDdd/xUwVv8WMVf/GTRa/ylDa/84Unv/O1aA8itKd0ozTnkABTV8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP1JwAEBZggA5VYJURl+J+D5Zg/8uSHH/Hzlg/xcxV/8aNVv/JkFo/zFMdv84U33/PliD/0VfiP9NZY7/VGuS/1lvlv9dc5j/YXWa/2R3nP9meZ7/Z3qe/2h7n/9pe5//aXyg/2p9oP9qfKD/Znme/11ymP9TapP/UGiR/1Jqkv9WbZX/WnCX/11ymf9dcpj/WnCX/1VslP9PZ5D/SmON/1Bokf9ccpj/ZXid/2d6nv9oe5//anyg/2t9oP9rfaD/aXyg/2d6nv9idpz/XnOZ/1pwl/9WbJT/UWiR/0pjjP9CXIX/N1J8/y5Jcv8mQWj/HThe/xYxVv8YM1n/GzZc/yE8Y/8yTHX/OFJ8/ixJd3Zub3oACzh3AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABEObAFVlgQA5WIhnRV+J/DtWgP8rRm7/HThf/xgyWP8bNlz/JkBo/zBLdP82UXv/PFeB/0ReiP9NZY7/VWuT/1pwlv9ec5j/YXWb/2R4nP9nep7/aHuf/2l8oP9pfKD/aXyg/2h7n/9nep//ZXid/1xxmP9QaJH/TGWO/1Nqkv9ccZf/Ynac/2d6nv9mep7/YXab/1lvlv9NZY7/Q12H/0hhi/9keJv/coOj/3aHpv9rfZ3/YHOW/2V4m/9oep3/Z3qe/2V4nP9jd5v/XXCV/1dqjP9RZYj/TWSL/0tkjf9EXof/OlV+/y5Jcv8mQWj/Hjhe/xYxV/8YM1n/KEJq/xs2XP8lQGf/L0py/ylGcZQALG0CHD9wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJkd3ANbM0QA6VoOERF6I/zlUff8qRGz/HTdd/xkzWf8cNlz/JT9n/y5Jcv81UHr/PFeB/0VeiP9OZo//VWyT/1pvlv9dcpj/YXWb/2R4nf9oe5//an2g/2t9of9qfaH/Z3uf/2Z6nv9oe57/aHuf/2R3m/9LZIz/RV+I/05mj/9ccZf/ZHic/2p8oP9pfJ//ZHic/1lvlv9JYor/PFeA/0BYff+gp7P/19re/9PV2f9obnf/JzJC/yIqN/8gJzP/ISk5/yEoNP85QU//SFJh/3B1ff+doKf/c3uJ/01ffP9FX4j/PVeB/y9Jcv8mQGj/Hjhf/xcyV/8XMlj/NE52/ypEbP8UMFX/Hzlg/yQ+ZakgOmIGIjxjAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJEd9AAAPUgE7VoGXQlyG/zdSfP8nQmr/HTdd/xo1Wv8cN13/JD9m/y1IcP80T3j/PFeB/0Zfif9PZ4//VWyU/1pwl/9dcpn/Ynac/2Z6n/9pfKH/aXuf/2N1mP9dbo7/X26K/3J9kf+3vcj/yM3W/7K4w/9LYYT/PViC/0lhiv9Zb5b/Y3ec/2l8n/9pfJ//ZHic/1lulf9HX4j/OVN8/zRNdP9bZHD/3t3c/9LT0/83PUT/DRIZ/wAAAP8AAAD/AAAA/wAAAP8LDA3/MDU7/2lscP/i4eH/5OTj/5yeov8+T2v/PFeA/y9Kc/8mQGj/Hjlf/xgyWP8VMFb/NU52/0Fag/8iPmX/FTBW/xw2XaojPmUGHzpgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEUKOAAA0iQU5VYKkQFqD/zVQef8kPmb/Hzph/xw2XP8cNl3/JD5l/yxGb/8yTXf/PVeB/0dgiv9PZ5D/UmmP/1Znhv9gbon/T196/0NUcP80QVj/KDFD/xkgLf8VGR//Oj5F/1RYX/+6urv/8fDv/5GUmP83TW//O1V//0Vehv9WbJP/YXWa/2d6nv9nep7/Ynab/1hulP9HX4j/OVN8/zdRev8rPVn/a21x/66urv8sMzv/BQoP/wAAAP8AAAD/AAAA/wAAAP8CAwP/ICQr/1JWW//Y2Nn/7e3t/4eHhv8jLT3/OlR9/zBKc/8mQGj/Hjlf/xgzWf8SLVH/Jz5g/0ZdhP88VoD/KURs/yM/aZUeSYUCIkJxAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEkOJAAU6hgY1Un6oO1V+/zBKc/8fOmH/J0Jq/x03Xf8cNlz/Iz1k/ytFbv8xTHX/PVeB/0hii/9LYYb/Z3KD/66ws/+bnJ7/ISky/w0SGf8AAAH/AAAA/wAAAP8AAAD/DxET/zM4QP+ChIf/ubi4/zdAT/83T3f/O1V+/0Rchf9UapH/XnOY/2N3nP9kd5z/YHSZ/1htlP9JYYn/PFV+/zlSe/85UXn/IjBG/zI0Nv8cIyr/HCIo/1xcXP8tLS3/AAAA/wAAAP8DBAX/GR8m/1FVWv/j4+P/tLS0/yAgH/8hLkL/OVN9/zBKc/8mQWj/Hzlf/xk0Wv8QJkX/EBko/DVKbu9DXYf/OFR/8i1NfFIwSG0ALmGrAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFD55AA06dwgtSnWvMEpz/yE8Yv8jPmX/NU94/x04Xv8cNlz/Ij1k/ylEbP8wS3T/PVeB/0Rbgv9weIf/1dXU//Ly8f+Zm53/Exwm/wUIDf8AAAD/AAAA/wAAAP8AAAD/BQUG/yUqMf9MT1P/OTxA/yo9W/89Vn//PFV+/0Rdhf9SaZD/XHCW/2B0mf9gdJn/XXKX/1Zsk/9LYor/P1iB/ztUfP88VX7/OVF4/x0qP/8DBwv/RklM/+Xl5f+RkZH/AwMD/wABAv8KDhP/GiIr/31/gv+mpqb/MC8v/xIWHf81Sm3/OFJ8/zBKc/8nQWn/Hzpg/xk0W/8QJUH/DBAU+hklN5hBXoyHO1qJaytUjwowWJEAMWClAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFEaNABFImAUmQ22kHzpg/xYyV/83UXn/RV6H/x85YP8cNlz/Ijxj/yhDa/8vSnP/OlV//zpPc/9JTFH/ysnJ//X09P+mqKn/FyAp/yMoLv9paWj/Jycn/wAAAP8AAAD/BQcI/xgdJP8NDxL/HitB/zxVfP8+V3//PleA/0Vdhv9QZ47/WG2T/1xxlv9ccZb/Wm+V/1Rqkf9LY4r/QluD/z1Wfv89Vn7/P1iA/zxUfP8mNlH/FRoi/0pLS/88PD3/AgQH/wYLEf8LExv/HSIn/0ZGRv8ZGRj/EhYd/zJEYv88V4D/N1J7/zBLdP8nQmr/IDph/xo1W/8SJUD/DhIX/wwPEsILERkYDwQAAC9XkAAwU4YAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIEmEAAAAAAAiPmiFGzZc/ylEbP9MZIz/TmWL/x03Xf8bNVv/ITti/ydCaf8uSXL/OFN9/ztTev8XHij/Q0JC/83Nzf/X19f/OkFI/2dtdP/4+Pj/fHx8/wAAAP8BAQL/BgkM/wcKDf8ZJDX/OlJ4/0BZgf9AWID/QFmB/0Zehv9OZYz/VGqQ/1dtk/9YbZP/VWuR/1Fnjv9KYon/RFyE/z9YgP8/WID/QFmB/0Fagv9BWYL/NUps/x0pPf8MERr/BggN/wQGCf8DBQj/CAoN/xEVHf8mMUT/O1By/0FbhP88VoD/N1J7/zBLdP8oQ2v/ITti/xo1XP8TJT7/EBMX/w0QFPEMDhNGDhIXACdBZgAsY60AKVeZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIE+pACpFagAmRHFPLkly8z1Ygv9RaZL/OExr/hEhN/8aNFn/ITti/yZBaf8tSHH/NlF6/z1Ygv80RmT/ExYc/zIxMf+MjIv/eHp8/z1DSv+Bhov/Nzs//wEEB/8BAgT/BQcL/x0pPP88U3n/QluD/0Jbgv9CWoL/QlqC/0Zehv9MY4r/UGaN/1Joj/9SaI//UWeO/05kjP9JYIj/RFyE/0FZgf9AWYH/QlqC/0Nbg/9EXIT/RV2F/0RchP8+VHj/N0lo/zBAW/8yQlz/OUtq/0JYfP9HX4f/RV6H/0Fag/88VoD/N1J7/zFLdP8pRGz/Ijxj/xs2XP8TJDz/EBMX/w4RFf4MEBRzDxIVAAoOEgAOERUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKlGOADNUhwAyVIgQN1WCn0JeifRFYIvSFyIx2A0UHP8YMFP/ITti/yZBaP8tSHD/NU95/zxWgP9BW4T/Ok1t/x4nNv8RExf/HyAg/w8QEv8BBAf/AgUI/wYJDv8SGSX/LDxX/0JZf/9GXoX/RV2F/0RchP9DW4P/Q1uD/0Zehf9JYYj/TGOK/01ki/9OZIv/TGOL/0piif9HX4b/RFyE/0Jagv9BWoL/Q1uD/0VdhP9GXob/R1+H/0hgiP9KYYn/S2OL/0xkjP9MZIz/TGSM/0pii/9IYIj/RV2G/0Fag/88VoD/N1J7/zFLdP8qRW3/Iz5l/xw2Xf8TIzj/EBMW/w4SFf8NEBSiCgwRBgsOEwALDhMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMlePAC02RAA5VH4AOFqMFj9glEcuSHAzDREVtw8UGf8XLEn/IDti/yZAaP8tR2//NE94/zpVf/9AWoT/RV6I/0Zehf8+UnL/MD9Z/yczSP8lMUX/KjhP/zdJaP9DWX7/SWGI/0lhiP9IYIf/R1+H/0Zehf9EXIT/RFyE/0Vdhf9HX4b/SWCI/0phiP9KYYj/SWCI/0hfh/9GXYX/Q1uD/0Jagv9BWoL/Q1uD/0Vdhf9HX4b/SWCI/0piif9LY4r/TWSL/01kjP9NZIz/TWSM/0tji/9IYIn/RV6G/0Fag/88VoD/N1F7/zFMdf8rRm7/JD9m/x03Xv8TITT/DxIV/w4SFf8NEBTRCw8THQsPEwALDhMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMViVADRblwBDUWcANleHADlRdwAAAAAEDxIVpRATF/8WJz//IDti/yZAaP8sR2//M053/zpUfv8/WYP/RF2G/0hhiv9LZIz/TmaO/09mjv9PZo7/T2aO/09mjv9OZYz/TGSL/0tjiv9KYon/SGCH/0dehv9FXIT/RFyE/0VchP9GXYX/R16G/0dfhv9HX4b/R16G/0Zdhf9EXIT/QluC/0Fagv9BWYH/QluC/0RchP9HXob/SWCI/0tiif9MY4v/TWSM/05ljf9OZY3/TWSM/0tji/9IYIj/RF2G/0Bag/87Vn//NlF6/zBLdP8sRm7/JkBn/x04Xv8SHi//DxIV/w4SFf8NEBTxDA8TRgwPEwAKDREACgwQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACtRhwA2U38AMlKCAA0RFQAgHA4ADhEVhhATFv8UITP/Hzpg/yZAaP8sR2//Mk12/zlTff8+WYL/Q12G/0dgif9LY4v/TmWN/1Bnj/9RaI//UmiP/1Fnj/9QZo7/TmWM/01ki/9LYon/SGCH/0Zehv9EXIT/RFyE/0RchP9EXIT/RV2E/0Zdhf9GXYT/RVyE/0RchP9DW4P/QlqC/0FZgf9AWYH/QVqC/0Nbg/9FXYX/SF+H/0phif9MY4r/TWSM/05ljP9OZYz/TGSM/0piiv9HX4j/Q1yF/z9Zgv87VX//NlB6/zBLdP8sR2//J0Fp/x84Xf8THSn/EBMW/w8SFv8NERT/DA8TgP///wAKDBAACgwSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsPEwAAAAQBDhIVjREUF/8TGyf/HTZa/yZAaP8sRm//Mkx2/zdSfP89V4H/QlyF/0ZfiP9KYov/TWWN/1Bnj/9SaJD/UmmQ/1Joj/9QZ47/TmWN/0xji/9KYYn/R1+H/0Vdhf9EXIT/Q1uD/0Nbg/9EXIP/RFyE/0RchP9EXIT/RFyE/0Rcg/9DW4P/QlqC/0FZgf9AWYH/QFmB/0Fagv9DW4P/RV2F/0hfh/9KYYn/S2OK/0xji/9MY4v/S2OK/0lhif9GXob/QluE/z5Ygf84Unr/MEZo/zBKcf8tSHD/KEJq/x83Wv8VHCX/EhUY/xATF/8OERX/DA4SygoNESALDREADBASAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw8UAAwPEwAKDhIHDhIVqhEVGP8SFxz/Gy9O/yZBaf8sRm//MUx1/zdRe/88VoD/QVqE/0Veh/9IYYn/S2OM/05ljf9QZ4//UGeP/1Bnjv9PZo3/TWSL/0piif9IYIf/Rl2F/0RchP9DW4P/Q1uD/0Nbg/9EXIP/RVyE/0VchP9FXIT/RVyE/0VchP9FXIT/RFyD/0Jagv9BWYH/QFiB/0BZgf9BWoL/Q1uE/0Vdhf9HX4f/SGCI/0lhif9JYYn/SGCI/0Zfh/9EXYX/QFqD/zpRd/8sO1P/KDdO/zFKcv8tSHH/KUNs/yA2V/8XHST/FRgb/xEUF/8OERX/DA8T+AsOEmAMDxEACg0UAAwLFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADREWAA0RFgANEBURDxIWwREVGP8TFhn/GSk//yZBaf8sRm//MUx1/zZQev85Unn/PleA/0Nchv9GX4j/SWGK/0tji/9NZIz/TWWM/01kjP9MY4r/SmGJ/0hfiP9GXob/RFyE/0Nbg/9CW4P/Q1uD/0RchP9FXYX/Rl6F/0dehv9HXob/R1+G/0dfhv9HX4b/R16G/0Vdhf9DW4P/QlqC/0BYfv88UXT/O09w/zxRcv8/VXn/Q1qB/0Vdhf9GXob/RV2F/0Nagv8+VHj/NEZi/ycyQv8kLTv/MEZo/zJNdv8uSXH/KkVt/yA0Uv8aHyT/Fxse/xIVGP8OEhX/DRAU/wwPE48KDxYBDA8UAAwNFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxEXAA4RFgAOERYUDhEVyBATF/8TFhn/GCIx/yU/Zv8sR2//MUx1/zVQev8xRGP/LjxT/zlNbv9CWYD/Rl6H/0lhif9KYor/SmKK/0lhif9IYIf/RVyC/0BUd/88UHH/PE9w/0BVev9EXIP/RV2F/0dfhv9JYIj/SmGI/0tiif9LYon/TGOK/0xjiv9MY4r/TGOK/0phif9IYIf/Rl2D/zZFX/8oMT//Ji05/yYtOf8oMD7/LTlM/zJBWP80Q1z/MkFY/y46Tf8oMD3/Iyky/yUuO/8yRWX/NlB6/zJNdv8vSXL/KkVu/yAzTv8cICX/GR0g/xMWGv8PEhb/DhEV/w4RFagMDhMGDQ8UAAwNFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADREVAA0QFAAMEBQUDREVyA8TFv8SFRn/Fhwk/yM6W/8sSHD/MUt1/zVQev82T3X/LDlP/yUtOf8rNUb/M0FY/zlKZf88Tm3/PVBv/zxObP82RmD/LjlL/ycvPP8mLTn/Ji45/yw2R/8/UnL/S2KJ/0xji/9PZYz/UWeO/1Joj/9TaY//VGmQ/1RqkP9UapD/U2mP/1Fnjv9PZo3/TGKI/zZCWP8mLDb/JCoy/yMpMf8jKDD/Iygw/yMoMP8jKTH/Iykw/yMpMf8mLTf/LTlM/zhNcP86VH7/NlF7/zNOd/8vSnP/K0Zv/yEySv8eISX/Gx8i/xUYHP8QFBf/EBQX/w8TFrULDxQLDRAVAAwPFQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAUAAwQFAAMEBQUDhEVyRATF/8TFhr/Fxsf/yEzTf8tSHH/MUx1/zRPef84U33/OlN6/zJCXf8oMD3/JCkx/yQqM/8lKzT/Jiw1/yUrNf8kKjL/Iygw/yMpMP8kKTH/JSoy/ygvOv9BUW3/UWiP/1NpkP9WbJL/WG6T/1pvlP9bb5X/W3CV/1twlf9bcJX/Wm+U/1htk/9WbJL/VGqQ/09kiP9FVnT/P05o/zlGXf80P1L/MjxN/zE7S/8xPE7/Mz5S/zdFXf89UHD/QVmB/z9Zg/87VX//N1J7/zNOeP8vSnP/K0Zv/yEwRv8eISX/HCAk/xYaHf8TFhr/ExYa/xEUGLUMEBYLDhEXAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADQ8UAA0QFAANEBQaDxIV0xIVGP8WGRz/Gh0g/x8sPf8sR2//MUx1/zRPef84U3z/O1aB/z9Zg/8+VHf/NkZf/y85Sv8rMj//KTA6/ykwOv8qMTz/LDNA/y84R/82QVX/P01l/0haeP9TaI7/WG2T/1pvlf9ccZb/XnOY/2B0mf9gdJn/YXWZ/2F1mf9gdJn/X3OY/11yl/9bcJb/WW+V/1htlP9XbZP/VWuS/1RqkP9SaI7/UGWL/09kiv9OZIr/TGOK/0pji/9IYYr/Q12H/z9Zg/87VoD/N1J8/zNOeP8vS3T/K0Zu/x8sQP8eIST/HiIl/xgcH/8WGR3/FRgc/xIWGaAMEBYFDxMYAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADA8UAA4RFQANEBQkERQX2xUYG/8aHiH/ICMm/yEpNP8rRGn/MUx2/zRPef83U3z/O1aA/z9ahP9EXYf/SGGJ/0hfhf9IXH7/R1p6/0hbe/9KXX7/TWCC/1Flif9VapD/WG2U/1lvlf9bcJb/XXGX/19zmP9hdZr/Y3ab/2R3nP9keJz/ZHic/2R4nP9kd5z/Y3eb/2J1mv9gdJn/XnKY/1xxlv9ab5X/WG6U/1dtk/9WbJP/VWuS/1Npkf9QaJD/TmWO/0pji/9HYIn/Q12G/z9Zg/87VoD/N1J8/zRPeP8wS3T/K0Vu/x4qO/8hJCb/ISQo/xsfIv8YGx//FRgc/xIVGXkYGxwADxMYAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAVAA8SFgAOEhYwExca4xkcH/8gIyb/Jyot/yYrMf8qP2D/MUx2/zRPef83Unz/O1WA/z9Zg/9DXYf/R2CK/0tkjf9PZ5D/UmmR/1Rrkv9WbJT/V22U/1hulf9ab5X/W3CW/1xxl/9ec5j/YHSZ/2J2m/9keJz/ZXmd/2Z6nv9nep7/Z3qe/2d6nv9nep7/ZXmd/2R4nP9jd5v/YXWa/19zmf9dcpj/W3CW/1lvlf9XbZT/VWyT/1Nqkf9QaI//TWWN/0pii/9HYIn/Q12G/z9Zg/87VoD/N1J8/zRPef8wS3X/KkRr/x0nNf8hJCf/ICQn/x0gJP8YHB//Exca/w4SFnUTFxkACw0UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRAWABATGAAPEhcvFhkc4xwfIv8eIST/JSgr/ygrL/8oOlb/MUx2/zRPef83Unz/OlV//z5Zg/9CXYb/R2CJ/0pjjP9OZo7/UWiQ/1Rqkv9WbJP/WG6U/1pvlf9ccZb/XXKY/19zmf9hdZr/Y3eb/2V4nf9nep7/aHue/2l7n/9pfJ//aXyf/2l8n/9oe5//aHqe/2Z6nv9leZ3/ZHec/2J2m/9gdJr/XnOY/1xxl/9ab5X/V22U/1Rrkv9RaJD/TmaO/0pjjP9HYIn/Q12G/z9Zg/87VoD/OFN9/zRPef8xTHb/J0Bl/xsjLf8fIiX/HyIl/xwgI/8XGh7/ERQY/w4RFW8QExYADA8UAAoOEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxEXABIVGQARFBkdFRkc1RUZHP8SFhn/GBsf/yAkJ/8jMUb/MEt0/zRPef83Unz/OlV//z5Ygv9CXIb/Rl+J/0pii/9OZo7/UWiQ/1Rrkv9XbZT/WW+V/1xxl/9ecpj/YHSZ/2J2m/9kd5z/ZXmd/2d6nv9oe5//aXyf/2p8oP9qfKD/an2g/2p8oP9pfKD/aXuf/2h7n/9nep7/ZXmd/2R4nP9idpv/YHWa/15zmf9ccZf/WW+V/1ZslP9TapH/T2eP/0tjjP9HYIn/Q12G/z9Zg/87VoD/OFN9/zVQev8xTXf/IjhY/xkeJP8bHyL/HSAj/xoeIf8UFxr/EBMX/w4RFYAjIyYACQ4RAAoOEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAExgdABAUGAAQFRkQDxIWwQ0QFP8PEhb/FRkc/xwfIv8dJjL/LEVs/zRPef83Unz/OlV//z1Ygv9BXIb/RV+I/0lii/9NZY7/UWiR/1Rrk/9YbpX/WnCW/11ymP9gdJn/Ynab/2R3nP9leZ3/Z3qe/2h7n/9pfJ//anyg/2p9oP9rfaD/a32g/2t9oP9qfKD/aXyg/2l7n/9oe57/Znqe/2V5nf9jd5z/Ynab/2B0mv9dcpj/W3CX/1hulf9Ua5P/UGiQ/0tkjf9HYYr/Q12H/z9ahP87V4H/OFR+/zVRe/8vS3T/GipB/xcbHv8aHSH/Gh0h/xQXG/8QExb/EBMW/w0QFMgKDREbCw4SAAsPEwAMDRMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJDBEACg0SAAoNEgAKDRIjCw4S2A8SFf8VGRz/HCAj/yEkJ/8eIif/JjpZ/zRPev83Unz/OlWA/z1Ygv9BXIb/RV+I/0lii/9NZY7/UWmR/1Vsk/9YbpX/XHGX/15zmf9hdZr/Y3ec/2R4nf9mep7/Z3ue/2h7n/9pfKD/anyg/2p9oP9rfaD/a32g/2t9oP9qfaD/aXyg/2l7n/9oe5//Znqe/2V5nf9kd5z/Ynab/2B1mv9ec5n/W3GX/1hulf9UbJP/UGiR/0tkjv9HYYv/Q12I/z9ahP88V4H/OVR//zZRfP8oQGX/FR0n/xcaHf8WGR3/ERQY/w4RFf8OEhX/DxMW/w0QFPoLDhJkDA8TAAsOEgAMDxUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALDBMACBkVAAwPEwALDhJWDhEV9hQXGv8aHSD/ISQn/yQoK/8hJCf/IS1A/zJMdv83Un3/OlWA/z1Zg/9BW4b/RV+I/0hii/9NZY//UWmR/1VslP9Zb5b/XHGY/19zmf9hdZv/Y3ec/2V4nf9mep7/Z3qe/2h7n/9pfJ//anyg/2p8oP9qfaD/an2g/2p9oP9qfKD/aXyf/2h7n/9nep7/Znme/2R4nf9jd5z/Ynab/2B0mv9dcpn/W3CX/1hulf9Ua5P/T2iQ/0tkjv9HYYv/Q16I/z9ahf88V4L/OVR//zBLdf8YKD//EBQY/w8SFv8MDxP/DA8T/w0QFP8OERX/DhIV/w0RFP8NEBSoDRAWCA0QFQAJCRMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKDBIACgwRAFxlVAANEBSJERQY/xYZHf8bHyL/IiUp/yYpLP8jJin/HSQs/ytCZv83U33/OlWA/z1Zg/9BW4b/RF6I/0hhi/9MZY7/UGiR/1Rrk/9Ybpb/W3GY/15zmf9hdZv/Yneb/2R4nP9leZ3/Znqe/2d6nv9oe5//aXuf/2l8oP9qfKD/anyg/2l8oP9pfJ//aHuf/2d6nv9mep7/ZXmd/2N3nP9idpv/YHWa/15zmf9ccZj/WW+W/1Ztlf9TapL/TmeQ/0pkjv9GYIv/Ql2H/z1Yg/82UXv/K0Vu/xgqRP8LEBb/Cg0Q/woNEf8LDhL/DA8T/w0QFP8NERX/DREU/w0RFP8PEhbgDxIWLg8SFgAOEhYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMDhQADA4UAAgLEgQPEhafExYZ/xgbHv8dICT/JCcq/yYpLP8kJyr/HiIl/x4uRf8zT3n/OlaB/z1Zg/9AW4b/Q16I/0dhi/9LZI7/T2eQ/1Nrk/9XbZX/WnCX/11ymP9fdJr/YXWb/2N3nP9keJz/ZXmd/2Z5nv9nep7/aHuf/2h7n/9oe5//aHuf/2h7n/9oe5//Z3qe/2Z6nv9leZ3/Y3ec/2J2m/9hdZv/X3Oa/11ymP9bcJf/WG6W/1VslP9RaZH/S2SN/0Veh/8+V4H/NU94/ypFbf8cNlv/DyA2/wkPFf8JDBD/Cg0R/wsOEv8MDxP/DRAT/w0QFP8NERT/DRAU/w0QFP8RFBj7ERUYZhQXGwAJCwwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMEBcADBAWAAcLEwMQExecFBcb/xkcIP8eISX/JCcq/yYpLP8jJir/HyIl/xgeJf8iOFj/OFR//z1Yg/8/W4X/Q12I/0Zgi/9KY43/TWaQ/1Jpkv9VbJT/WG+W/1txl/9dc5n/X3Sa/2F1m/9idpv/Y3ec/2R4nf9leZ3/Znqe/2d6nv9ne5//aHuf/2d7nv9nep7/Znqe/2V5nf9keJ3/Ynec/2F1m/9fc5n/XHGY/1hulf9Ua5L/UGeP/0tji/9DW4P/N1B3/ytEa/8gO2L/FjJY/w0mRv8JFib/CQ0R/woNEP8LDhH/Cw8S/wwPE/8NEBP/DRAT/w0QFP8NEBT/DRAU/w4RFP8UFxv/FBcalgACCAILDhMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMEBUADhEWACEjJAASFRmEFRkc/xodIf8fIiX/JCcq/yUoK/8jJin/HyIl/xkcH/8UHCf/JTtb/zpVgP8/W4b/Ql2I/0Vfiv9IYoz/TGWP/09okf9TapP/Vm2V/1lvlv9bcZf/XXKZ/190mv9gdZr/Ynac/2N3nf9keZ7/ZXme/2R4nf9jd5z/Y3ec/2J2m/9idpv/YHSZ/11xlf9ab5P/WW6T/1VqkP9OZIr/R12D/z9WfP85UHb/NEty/y5Gbf8iPGP/FTFX/wwqT/8JJEf/CBw1/wgRG/8JDA//Cg0Q/wsOEv8MDxP/DRAT/w0QE/8MDxP/DA8T/wwPE/8NEBT/DRAU/w4RFP8WGR3/FxoeshAUGQkSFhsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMEBUADwAAABQXGgATFhpVFhkd9xseIv8gIyf/JCcq/yMnKv8hJSj/Gx4i/xMWGf8OERX/DxYe/x8wSv81T3j/QFuG/0Rfiv9HYoz/S2SO/05nkP9RaZL/VGuU/1dulv9ZcJf/WnGY/1lvlf9UaZD/UGSJ/05hhP9LXX7/QlRy/zlJZP80Qlr/MkBZ/y8+Vv8sOVD/JzFE/yIrOv8gKjn/ISs7/x4oOP8aJDT/GCIx/xUfLv8THSz/EBws/w0dM/8JHTf/Bxox/wcWKP8IEBr/CQwR/wkMD/8KDRD/Cg0Q/wsOEf8MDxP/DRAT/wwPE/8MDxP/Cw4S/wwPE/8NEBP/DRAT/w4QFP8ZHCD/Gh0hwhUYHA4WGh0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAQAEhYbABMXGwATFxsjFxod1h0gI/8hJCj/IiUo/yAjJ/8bHiL/EhUZ/w0QFP8NERT/DRAU/w0RFv8THy//IDNQ/y1Fav84Unv/P1mD/0Jchv9CW4X/QVqC/z5Wff87Unf/NUtu/ys8WP8gLED/FyAt/xQbJv8TGCD/DxQa/wwQFf8LDhL/Cg4R/woNEf8MDxP/DhEU/w8SFf8PEhX/DhEU/wsNEf8JDA//CQwP/wkLDv8JCw7/CQsO/wkMD/8IDBD/CAsO/wgKDf8ICg3/CAsO/wgLDv8JDA//CQwP/woNEP8KDRH/Cw4S/wsOEf8KDRH/Cg0R/wsOEv8MDxP/DA8T/w4QFP8cHyL/HiElvRgbHwwaHSEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEw4TABMYHAAMExgDFhoekR0gI/8gIyb/HSAk/xgcH/8RFRj/DA8T/w0QFP8OEhX/DxIW/w8SFv8LDxL/Cg0S/wsTHP8QHS7/EyY//xUoRP8SIzr/EB0u/w0YJv8LFCD/CxIb/wkNEv8JDA//CgwQ/woNEf8OERX/FBca/xQXG/8SFRn/DxMW/w4RFP8NERT/ExYa/xUZHf8VGRz/Exca/w4RFf8MDxP/DA8S/wsOEv8KDRH/Cg0R/woNEf8KDRH/CQwQ/wkMD/8JCw//CQwP/wkMD/8JDA//CQsP/wgLD/8ICw//CQwP/wkMD/8KDRD/Cg0R/wsOEv8MDxL/DA8T/w0QE/8dICP/ICMnoA0SGQQXGyEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFBUaAAoPEwDRwa4ADxIWhxUZHP8XGh3/Exca/w8SFv8MDxP/DRAU/w4SFf8QExf/EhUZ/w8SFv8LDhL/Cw4S/wsOEv8MDhL/Cw8T/wkNEf8JDA//CgwP/wsOEf8NEBP/DRAT/wwPEv8MDxP/DBAT/wwPE/8NEBP/Exca/xkdIP8YHB//FRkc/xIWGf8PEhb/EBMW/xcaHv8XGx//FRkc/w8SFv8OERX/DRAU/wwPE/8MDxL/Cw4S/wsOEv8LDhL/Cw4S/woNEf8KDRD/CQwQ/woNEP8KDRH/Cg0Q/woNEP8KDBD/Cg0Q/woNEf8LDhH/Cw4S/wsPEv8LDxL/DA8T/w0QFP8cHyP+ICQncjU3OAAMEBkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw8VAAsPEwALDxQFCg0Row0QFP8NEBT/DA8T/wsOEv8NERT/DxIW/xATF/8TFhr/EhUZ/wwPE/8LDxL/DRAU/w0RFP8OEhX/DBAT/woNEf8MDxL/DRAU/w8TFv8SFRn/EBMX/w4RFP8PEhb/EBMW/w8SFf8NEBT/DxIW/xcbHv8bHyL/Gh0h/xcaHv8UGBv/EBMW/xMWGf8YGx//Fhkc/w8TFv8PEhb/DxIW/w4RFf8NEBT/DBAT/wwPE/8MDxP/DRAU/w0QFP8MDxP/Cw4R/woNEf8KDRD/Cg0R/wsOEf8LDhL/Cw4S/wsOEv8MDxL/DA8T/wwPE/8MDxP/DRAU/w4RFP8ZHCDNHyMmJiAkJwASFh0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQ0RAAkNEQAJDRELCQwPswkMD/8JDA//Cg0Q/w0QFP8PExb/EBQX/xQXG/8UGBv/DxIV/wwPE/8NERT/DxMW/xAUF/8RFBf/DA8T/wwQE/8PExb/EhUZ/xUZHP8WGh7/EhUZ/w8TFv8SFRn/ExYa/xMWGv8QFBf/DxIW/xMWGv8aHSH/HSAk/xseIv8YHB//FRgc/w8TFv8VGRz/FRkc/xATF/8RFBj/ERUY/xEUGP8QExf/DxIW/w4RFf8NEBT/DREU/w8SFv8PEhX/DRAU/wwPE/8LDhL/Cg0R/woNEf8KDRH/Cw4S/wsOEv8MDxP/DA8T/wwPE/8NEBT/DREU/w4SFf0SFhluAAEFAB4kJwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQ0RAAkNEQAJDRETCAsPxwgLDv8KDRD/DRAU/w8SFv8QFBf/Exca/xUZHP8RFBj/DA8T/w0QFP8RFBf/EhYZ/xQXGv8RFBj/DA8T/xAUF/8TFxr/Fxoe/xkdIP8ZHCD/ExYa/xEUF/8UFxv/Fhkd/xYZHf8UGBv/EhUZ/xIWGf8XGx7/HSAj/x4hJf8bHyL/GRwg/xIVGf8RFBf/FBgc/xEVGP8UFxv/FRgc/xUYG/8UFxv/ExYZ/xEVGP8QFBf/DxIW/w8TFv8RFRj/ERQY/w8SFv8OERX/DRAU/w0QE/8MDxP/DA8T/wwPE/8MDxP/DRAU/w0RFP8OERX/DhIV/xATFvMQFBdJERQYABYaHgANEhIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw8TAAsPEgALDxIVCw4RygwPEv8OERX/DxMW/xATF/8TFhr/FRkc/xIVGf8MEBP/DhEU/xEVGf8UFxv/Fhkd/xUZHP8PEhb/DxIW/xUYHP8XGx7/Gh4h/xseIv8ZHSD/ExYZ/xEUGP8VGBz/Fxse/xgbH/8XGx7/FRgc/xQYG/8WGh3/Gh0h/x4iJf8dIST/Gx8i/xYaHf8OERX/EhYZ/xMXGv8XGh7/GBwf/xgcH/8XGx7/Fhod/xUYHP8UFxv/ExYa/xIVGP8SFRj/FBca/xQXG/8TFhr/EhUZ/xEVGP8RFBf/EBMX/w8TFv8PExb/DxMW/w8TFv8QExf/ERQX/xIVGd4RFRkoEhUZABAUGQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhIWAA4TFwAOExYQDxMWvxATF/8QExf/EBMX/xIWGf8VGBz/EhUZ/w0QFP8OERX/EhUY/xUYHP8XGh7/Fxse/xMWGv8NEBT/FBgb/xgcIP8bHiL/HSAk/xwfIv8ZHSD/EhUZ/xEUGP8WGR3/GRwg/xodIf8ZHSD/GBsf/xYaHf8XGh7/GBwf/xwfI/8fIiX/HCAj/xkdIP8QFBf/DxIW/xQXG/8aHSH/HSAk/xwgI/8bHiL/Gh0h/xgcH/8XGx7/Fxoe/xYaHf8VGRz/FRgc/xYZHf8XGh7/Fxoe/xcaHf8WGR3/FRgc/xQXG/8TFhr/ExYa/xQXGv8UFxv/FBcb/xQXG7gSFxsOExcbABUeHwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhMYAA4SGAANERgGERQYpREUGP8RFRj/ExYa/xUYHP8SFRj/DhEV/w8SFf8SFRn/FRkc/xgbHv8YGx//FRgc/w0QFP8RFBj/GR0g/xwfI/8fIib/HiIl/xwfI/8YGx//ERUY/xEVGP8XGh7/Gh4h/xsfIv8cHyP/Gh4h/xgcH/8YGx//GBsf/xodIf8eISX/HSAk/xseIv8UGBv/DRAU/xIVGf8bHiL/IiUp/yIlKP8gIyf/HiEl/xwgI/8bHyL/Gx4i/xoeIf8aHiH/Gh4h/xodIf8aHSH/Gh0h/xodIf8ZHSD/GBwf/xcbHv8XGh7/Fxoe/xcbHv8XGh7/Fhkd/BUYHHEaGxsAExgcABQWGgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhMYABEUGQAWGRsAExYaahQYG/sVGRz/FRkc/xIWGf8QExb/ERQY/xMXGv8WGR3/GBsf/xgbH/8UFxv/DRAT/w8SFf8YHB//HCAj/x8jJv8hJSj/HyIm/xwgI/8XGh3/EBQX/xIVGf8YHB//HCAj/x4hJf8fIyb/HiEl/xsfIv8aHSH/GRwg/xkcIP8cHyP/HCAj/xsfIv8YGx//EBMX/w4SFf8YGx7/JCgr/ygrL/8nKi3/JSgs/yMmKv8iJSj/ICQn/yAjJ/8gJCf/ISQo/yIlKP8iJSn/IiUp/yElKP8hJCj/ICQn/x8jJv8eIiX/HSEk/xwfIv8ZHSD/Fxoe0hYaHiQWGh0AExgZAA8YHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhIYABEVGQAUGBwAFBgcJhYZHNcWGh3/FRgc/xQXG/8UGBv/Fhkd/xgbH/8ZHCD/Fxse/xIVGf8MDxP/DxIW/xgbH/8dICT/ICMn/yQnKv8jJin/HyIm/xwfI/8UFxv/EBQX/xMWGv8aHiH/HyIm/yIlKf8kJyv/IiUp/x8iJv8cICP/Gh4h/xgcIP8aHSH/Gx8i/xseIv8aHSH/FBcb/w8SFf8SFRn/HyIl/ysuMf8uMTT/LTAz/ywvM/8rLjL/Ki4x/yotMP8qLTD/Ki0x/ysuMf8rLjH/Ky4x/ywvMv8sMDP/LTAz/y0wM/8rLjH/Jiks/x8iJv8ZHSD3GBsfaRYRCAAYHSQAFhojAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQZHQAVGh4AExkcAxcbHncbHiH2HiEk/xsfIv8aHSH/GR0g/xgcH/8VGBz/DxIW/w0QFP8SFRn/Gh0h/x4hJf8gJCf/JSgr/yYpLf8jJin/HyIm/xkcIP8SFRn/ERQY/xQXG/8dIST/IyYq/yYqLf8pLC//Jiot/yImKf8fIyb/HSAj/xkcIP8YHB//Gh0h/xseIv8bHiL/Fxsf/xMWGv8QExf/FRgc/yYoLP8xMzf/MzY5/zQ3Ov81ODv/NTg7/zU4O/81ODv/NTg7/zU3Ov80Nzr/NDc6/zQ2Of80Njn/NDc6/zM2Of8wMzb/KCsv/x8iJf0aHiGYGRwhDRkdIQAXHCEAGBwkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATFxsAGR4iABogJQ0bHyOfHiIl/xwfI/8YHB//FRkc/xIVGf8QExf/EhUZ/xgcH/8eISX/ICMn/yIlKf8nKi3/KSwv/ycpLf8iJSn/HSAk/xUYHP8SFRj/EhUZ/xYaHf8iJSn/KCsv/ywvMv8tMDT/Ki0w/yYpLP8iJSn/HiIl/xgcH/8YGx//GRwg/xoeIf8cICT/Gx4i/xcbHv8TFxr/ERQY/xUYG/8nKS3/NDc6/zg7Pv86PD//Oz5B/zw/Qf89P0L/PT9C/zw/Qv88PkH/Oz5B/zs9QP86PT//OTw//zc6Pf8xNDf/Jiks/xwgJLEaHiIaGR0hABcaHQAYGBkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYICMAHR8iABMWGQAQFBhjExca+xcbHv8aHSH/Gh4h/xsfIv8eIST/ISQo/yMmKf8jJyr/Jiks/yotMP8sLzL/Ki0w/yUpLP8gIyb/GRwg/xMXGv8TFhn/ExYa/xodIf8oLC//LjE0/zE0N/8wMzb/LC8y/ygrLv8lKCv/HiEk/xYaHf8XGh7/GRwg/xseIv8fIyb/HyIm/xseIv8YHB//Fhod/xEUGP8QExf/ICMm/zE0N/86PT//PkBD/z9BRP9AQkX/QEJF/0BDRv9AQkX/QEJF/z9BRP8+QEP/PD9C/zc6Pf8tMDT1IiUpnBoeIh8eISMADRYtAB0iKgAQCBUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgJCwADREVABcaHQASFhlsGx4h/ScqLf8rLjH/Ki0w/yksL/8pLC//KCsv/yksL/8rLjH/LjE0/y8yNf8tMDP/KSwv/yMmKf8bHyL/FRkc/xMWGv8TFhr/FBgb/yEkKP8wMzb/NDc6/zU3Ov8wMzb/LC8y/ykrL/8jJin/Gh0h/xUYHP8YGx//GR0g/x0gJP8jJyr/Iycq/x8iJv8dICT/Gx4i/xgbH/8SFRn/DRAU/xMWGf8hJCf/LjE0/zc5PP88PkH/PkFE/0BCRf9BQ0b/QUNG/z9CRf88PkH/NDY6/ywvM98mKi1qHSInDRwgJAAAADIAFhwiABoeIQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADREWABoeIQAWGh5UICMn9ywvMv8vMjX/LzI1/zAzNv8xNDf/MTQ3/zI1OP80Nzr/MzY5/zAyNf8rLjH/JSgr/x0gI/8XGh7/FRgb/xQXG/8TFxr/Gh0h/y0wM/82OTz/ODo9/zU4Ov8vMTT/Ki0w/yYpLP8cHyP/Fhod/xUYHP8ZHCD/Gx4i/yEkKP8pLC//KCsu/yQnKv8iJSn/HiIl/xwfI/8aHSH/FBgb/w0RFP8LDhH/DhEU/xQXG/8bHiL/IiUo/yYpLP8oKy7/Jyot/yAjJv8YGx7/EBMW/Q4RFZUICg4eISUqAAYJDQAKDhIACg8TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGh4iABodIQAYHCAhHSAkzyYpLf8vMjX/Jyot/yYqLf8yNTj/ODo9/zc6Pf81ODv/MTM3/ysuMf8jJyr/HB8j/xcbHv8VGRz/FBgb/xQXG/8YGx7/KSww/zg6Pf86PUD/ODs+/zEzNv8qLTD/Jiks/x0gJP8XGx7/FRgb/xgbH/8bHiL/HiEl/ycqLf8uMTT/LTAz/ygrL/8oKy//IiYp/x4hJf8fIyb/HiEl/xcaHv8QExb/DA8T/wwPE/8OERX/ERQY/xEVGP8PEhb/Cw4S/wkMEP8KDRD/Cg4R/wsOEvUKDRHJCAsPSgAAAAEFCA0ACg0SAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFhwgABcdIQAAAAAAGx8jVCAjJ+suMTT/Jyot/xwgI/8gIyf/LC8y/y8yNf8sLzL/JSks/x8iJv8aHiH/GBsf/xcaHv8WGh3/Fhod/xwfIv8rLjH/Ojw//zw/Qv87PkD/MzU4/yksL/8lKCv/HiEl/xcaHv8YGx//Fhod/xwfI/8eISX/JCcq/y4xNP8yNTj/MDM2/ywvMv8uMTT/KCsu/x8iJv8gIyf/KCsu/yQnK/8aHSD/Exca/xIWGf8TFxr/FBcb/xEVGP8NERT/DRAU/w8SFv8UFxv/HB8i/yElKP8hJCf/GRwf3BATFzoVGBwABAUKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFxwhABgdIQAZHiMAFx0jBBsfI2YnKy7jLC8y/yUoK/8hJSj/HyMm/yQnK/8rLjH/MDM2/y8xNf8rLjH/KCsu/yYpLP8mKSz/Ky4x/zU4O/89P0L/P0FE/z0/Qv8zNjn/Jiks/yAjJv8cHyL/Fxoe/xwfI/8ZHB//HSAk/yAjJ/8jJir/LC8y/zU4O/82OTz/MzY5/y8yNf8yNDf/LjE0/yMnKv8cICP/IiUp/ywvMv8oKy7/HiEk/xkcIP8WGh7/FBcb/xATF/8QExf/ExYa/xwfI/8uMTT/Ojw//T0/Qv8+QUT/NTg7/yAjJ5kAAQgGDxIYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEhkcABshJgAbICQAHCAlABEZHwEgJSlIKCsvySwvMv8sLzL/JCgr/x4hJf8eIib/Jyou/zEzNv85Oz7/PUBD/z5BQ/8/QUT/QEJF/0FDRv9AQkX/Oz1A/y0vMv8cHyP/FBgb/xMWGv8VGBz/HCAj/yIlKP8cICP/JCcr/yYpLP8sLjL/NTg7/zo8P/86PD//NTg7/zM1OP80Njn/MjU4/ywvMv8gJCf/Gh0h/x8iJf8mKSz/IiUp/xseIf8VGRz/EhUY/xIVGf8VGRz/HiIl/y4xNPU3Oj2yNTg8cy0xNLE3Oj35PT9C/yotMb0NERcPFhofAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1MTQAHiMnABwhJgArLCwAICUpJCksMJAtMDPqLTAz/ygrLv8jJir/Jikt/ywvMv8oKy//Ky0x/zI1OP84Oz7/OTw//zg7Pf8yNDj/JCcq/xQXG/8PExb/EBMX/xMWGv8bHiL/KCsu/yMmKf8jJir/Ki0w/ywvMv80Nzr/Oz1A/z0/Qv89P0L/Njk8/zY5PP83OTz/Njk8/zM2Of8qLTH/HyIm/xgbH/8XGh3/Fhkd/xQXGv8SFRn/Exca/xcbHv8fIyb/KSww4CsuMmcpLjEPT05QABkeIhQqLTF1NTg70y0wNIgFCxMFGR0jAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJCgsAHyYqAB4kKgAZISgAIyYrABYbIAYnKi5GKy8yuC0wM/crLjD/Jiks/yYpLf8qLTD/Jigs/yEkJ/8gIyb/ISQn/ygrLv8qLC//HyMm/xYZHP8VGBz/FRkc/xwfIv8nKi7/MDI1/yMmKf8rLjH/LjE0/zI1OP86PT//PkBD/z9BRP89QEP/Nzo9/zk7Pv85Oz7/Oj1A/zo9QP81ODv/Ky4x/yAjJ/8ZHCD/FRgc/xQYG/8WGR3/Gh0h/yIlKP8oLC/eJysuT861ogAtMTQAHCIoACAlKAAAAQoCJywvHisvMxAwNDcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABohJwAfJCoAISQoAB8jKAAuMTMAIycsFSsvM2AuMTS/Ky4x9yYpLP8iJSj/ICMn/yMlKf8jJin/ISQn/yotMf8yNTj/Jigs/xoeIf8aHiH/HyIl/ygsL/8zNjn/MTQ3/yYpLf8wMzb/MjU4/zg6Pf8+QEP/QEJF/0BDRv89QEP/Njk8/zk8P/86PD//PD5B/z5AQ/8+QUT/Oj1A/zE0N/8nKi7/ISQo/x8jJv8iJSn/KCsv/yotMd4mKi5PAAAAACInKwAkKS4AICYoACMoLAAcICYAKi0xACsvMwA/Q0MAFxsiAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAdICQAHB8lAB4kKwABDR4AJCkuADg4OgApLTIWKy8yXSwvMqcqLTDeJCYq+h4hJf8eIST/HyIl/yEkJ/snKy7UJiot2R4hJe4cHyL5IiUo/zM2OP88PkH/MzU4/ywvMv81Nzr/Njk8/zw+Qf8/QkX/QENG/0FDRv87PkD/MzY5/zc5PP85Oz7/PD9B/z5AQ/8/QkX/QUNG/0BCRf89P0L/OTw//zc6Pf80Nzr9LzI1viUpLUAACBABHyUpACEmKwAgJysAERUZAB4lLQAUHCYAIycsACgsMAAoLDAALTI2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACEpMgAqMzEAJSovAB4lKwAqLjIANTc5ACsvNAgwMzcqLjA0XSsuMYwmKS2zJSgrxCAjJ6kdIiUwISYqIh8jJjwiJilaIiYqhisuMsk5Oz79NTg7/zI0N/85Oz7/Oj1A/z5BQ/9BQ0b/QkRH/0JER/83Oj3/KCsu/ykrL/8uMTT/Nzk8/zw/Qf8+QUT/QEJF/0BDRv8/QkX/PD9B+DU5O9EuMTV2JSktHSwvMgAeIygAICYqACAmLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAISgwACAmKwAgJSoAAg4VACouMgAvMzYALjE0ABolMQEuMjYJMDQ4ECwwNQwMDhQAIiYrACAjJwAbHyIAAAAAABwhJSAnKi6MLjE05i8yNf88PkH/PkFD/0BDRf9CREf/Q0VI/0NFSP82OTz/Gx4i/xUZHP8ZHCD/HyEl/ycqLfwwMzfaNDc60jM2OccxNDifLTA0XSUpLSH///8AJysuAAAACwAhJiwAHCInAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhKDAAODo8ACsvNAApLjMAHSImAB4kKgAqLTEAKy4zACYqLgArMDIAJywwABccIABCRksAIiYsACMoKwARFx0FHyQnPSMnKps0NzrpP0FE/0FER/9CRUf/Q0VI/0NFSP85PD//HB8j/xQYG/8WGR3/FRkd9BgbH5IdIiYnISUpGx8jKRQQFR0GOTs+ACcrLwAhJysAIyksACUqLwAiJy0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADEzNwAAAAAAGR4mABYbIwASGSIANTY3AAAAAAAeIygACw8UADY8QQAdIicAJSktAA8VHAUlKCxTMzY51T9CRf9CREf/QkRH/0JER/89QEL/Ki0w/x0gI/8ZHSDrGR0hbhsgJQoeISUAJCgsACQoLgAhJiwAIiYrACMmLAAfLTkAIygvAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACAnKwAXHB8ARElYAB0hJgBMTEwAIiYqMTM2Oac9QEPzQEJF/z9BRP85Oz7/Ky4y/CAkJ8wcICRUICgtBBsfJAAWGR0AISkuAB0hJQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAjKTIAHSIpACAkKQAYHSMAKy0wAB8jKBEvMjZoNDc6uDI1Od4qLTHLICQohR0hJSoWFxYAHSInABwhJQAcIScAGBseAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/////+AAAD///////////4AAAB///////////wAAAAf//////////AAAAAH//////////AAAAAH/////////+AAAAAD/////////4AAAAAA/////////4AAAAAAf////////wAAAAAAP////////gAAAAAAH////////AAAAAAAH///////+AAAAAAAD///////8AAAAAAAB///////8AAAAAAAB///////4AAAAAAAA///////4AAAAAAAA///////wAAAAAAAAf//////wAAAAAAAAf//////wAAAAAAAAP//////wAAAAAAAAP//////gAAAAAAAAA//////AAAAAAAAAAf/////AAAAAAAAAAf/////AAAAAAAAAAP////wAAAAAAAAAAH////wAAAAAAAAAAH////gAAAAAAAAAAH////AAAAAAAAAAAH////AAAAAAAAAAAH////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAD////AAAAAAAAAAAH////AAAAAAAAAAAH////AAAAAAAAAAAH////AAAAAAAAAAAD////gAAAAAAAAAAD////4AAAAAAAAAAD////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAD////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////wAAAAAAAAAAA////4AAAAAAAAAAA////4AAAAAAAAAAA////4AAAAAAAAAAA////4AAAAAAAAAAA////4AAAAAAAAAAA////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAB////4AAAAAAAAAAD////8AAAAAAAAAAD////8AAAAAAAAAAH////+AAAAAAAAAAH////+AAAAAAAAAAP/////AAAAAAAAAAf/////AAAAAAAAAAf/////AAAAAAAAAAf/////AAAAAAAAAAf/////AAAAAAAAAAf/////wAAAAAAAAAf/////wAAAAAAAAAf/////8AAAAAAAAAf/////+AAAAAAAAAf//////gAAAAAAB////////4AAAAAAD////////+AAAAAAH/////////8CAAAAf///////////gAAP////////////wAAf/////KAAAAIAAAAAAAQAAAQAgAAAAAAAAAAEAOCEAADghAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAomQQAKLVoACjFmAAoqUQAKLVsADCxVAAsgKAAMLF0SCilTQgwqU30NK1K2DixU1A8tVdUOLVXTDitUvgwrUpILK1VZCSxcKQgsYwwQJBEACytXAAotXwAMAAAACy5fAAwtWgALKlcACyxaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALL2IADS5fAAkrVgAKLFkACipTACAgIgAJK1UaDStTYBAtVawSLlTiFTBW+RcyWP8ZNFr/GjVb/xo1W/8YM1n/FjFX/BIvVO8PLVTPDStTpAsrVl8KLFslBy5pBgwpTwALKlQADC9mAAssWwAKKlYAD0yyAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKLFkACiREAAorVwAJL2IACitXABweJgAJKlQaDCtTYhAtVL4VMFb0GjVb/x85YP8iPGP/JD5l/yU/Zv8lP2b/JD5m/yM+Zf8iPGL/Hzlf/xs1W/8WMVf/Ei5U9A4rUtMMK1SGCypVNwopVAoKKlIACi1gAAohPAALNHMADDNxAAsqVgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjFpAAsuYgAJJUIACitXAAwpUQAJK1oRCypRYQ4sUr0UMFb0GzZc/yE8Yv8lP2f/KEJp/ylEa/8qRGz/K0Vs/ypFbP8qRGz/KUNr/yhCav8mQWj/JD5l/yE7Yv8dN13/GDNZ/xMvVfwPK1HhDClQlgorVzIIM3MECylSAAsvZgALKVQADT6RAAswdQABBQ0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjBkAAwwaAAKMGcACyU9AAosWQAHLWkBCitWMw0rUp8RLlTyGTRa/yA6Yf8lP2f/KUNr/ytFbf8sRm7/LUdv/y1Hb/8tR2//LUdv/y1Hb/8sRm7/LEZu/ypFbP8pQ2v/J0Jp/yU/Zv8iPGP/Hjhe/xkzWf8SLlT+DSpR2AoqU3wKK1YdBhMAAAorWQAOSMMACzFvAAsycAAMNH0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkrVgAKMGYACy9gAAo2cgALK1YACS9kCQsqUmYOK1LQFDBV/xw3Xf8jPWT/KEJp/ytFbf8tR2//Lkhw/y5Icf8uSXH/Lklx/y5Icf8uSHD/Lkhw/y1HcP8tR2//LEdu/yxGbv8rRW3/KUNr/ydBaP8lP2b/Ijxj/x03Xv8WMVf/DytR+QspUL4KKVNYCS5gCwooTAALMGgACy1gAA07hgANPIwACzJqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACStWAAouXwAKMGYACidNAAorWhoLKlN+DyxS6xcyV/8fOWD/JT9m/ylDa/8sRm7/Lkhw/y9Jcf8vSXH/L0lx/y9Jcf8vSXH/Lkhx/y5IcP8uR3D/LUdv/y1Hb/8tR2//LUdv/yxGbv8rRm3/KkRs/ylDav8nQWn/JT9m/yA7Yf8ZNFr/ES1S/wwpT+sKKVGSCitXKAAAAAAKLFsABhcbAAs2dwAJLFcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDZ6ACG+/wAJKlIACS9kAAooSgAKLFkkCypRqQ8sUfkYM1n/ITti/ydBaP8qRGz/LUdv/y5Jcf8vSXL/MEpy/zBKcv8vSXH/Lkhx/y5IcP8tR2//LUdv/yxGbv8sRm7/LEZu/y1Hb/8tR2//LUdv/y1Hb/8sRm7/K0Zt/ypFbP8pQ2v/J0Fo/yM9ZP8cN13/FC9V/w4qT/0LKU/ICilSVQkuXgYJJ0wACz6OAAouYAALMWcACjJpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoxZQAMKU0ACy1fAAovZAALJUcACSpTLAspUa8PLFL9GTRa/yI8Y/8oQmr/LEZu/y5IcP8vSXL/MEpz/zBKc/8wSnL/L0lx/y5IcP8uSHD/Lkdw/y5IcP8uSHD/LUhv/y1Hb/8sRm7/LEZu/y1Hb/8uR3D/Lkhw/y5IcP8tR2//LUdv/yxGbv8rRW3/KUNq/yU/Zv8eOV//FjFX/xAsUf8LKU7mCilSfAkrVxcKKE4ACi9hAAouXgAKL2IACypXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKMWQACgAAAAosWgAKL2MAcv//AAorWTwLKU+/DyxR/xk0Wv8iPGP/KUNq/yxHb/8vSXH/MEpz/zFLdP8xS3T/MUpz/zBKcv8uSXH/Lkhx/y9Jcf8wSnL/Mkx0/zJMdP8xS3T/MEpy/y5IcP8tR2//LEdv/y1Hb/8uSHD/Lklx/y5Jcf8uSHH/Lkhx/y5IcP8tR2//KkVs/yZAaP8gOmH/GTNZ/xItU/8MKU/4CilQpQosWS4KAwAACi5iAAopUAACZP8ACjVpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADC5iAAAAAAAKLFcACi5eAAc9hwIKK1lFCylQzxAsUf8YM1n/Ijxj/ylDav8tSHD/MEpz/zFLdP8yTHX/Mk11/zJMdf8xS3T/MEpy/y9Jcv8wSnL/MEpy/zBKcv8vSXH/L0lx/y1Hb/8rRW3/KURr/ylDa/8pQ2v/K0Vt/y1Hb/8uSXH/L0ly/zBKcv8wSnP/MEpz/zBKc/8vSXL/LEZu/yhCaf8iPGL/GzVb/xQvVf8OKlD+CylPxwkpUkUJN4cCCitXAAokQQAKMmoACi5lAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAk4gwAAAAAACytXAAstWwAJN3MDCitUUwspT9cQLFH/GDNZ/yE7Yv8pQ2r/Lkhw/zFLdP8zTXb/NE53/zVPeP80Tnf/M012/zFLdP8wSnL/LUdw/ypEa/8nQWn/KUFq/yxDbP8vRW7/MEZv/y9Fbv8tQ2z/Jz9n/yI7Yv8hO2L/JD5m/ypEbP8uSHD/MEpz/zFLdP8zTXX/M052/zNNdv8xS3T/LUdv/yhCav8jPWP/HDZd/xUwVv8PK1D/CylO2woqVWMKMWYICixaAAogPwAKN3EACjh0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPN3gADTFpAAouYwALLmEADjJuAwoqVFQLKU/cECxS/xgzWf8gO2H/KEJq/y5IcP8yTHX/NU94/zdRev83UXr/N1F6/zVPeP8zTXb/L0ly/yhDav8kPWX/KkFp/zVJcv89T3n/QVJ8/0NTff9EVH7/RFR//0RUfv9BUXz/O013/zFFbv8lPWX/IDph/yU/Zv8tR2//MUtz/zNNdv82UHn/OFJ7/zdQev8zTXb/Lkhx/ylDa/8kPmX/HThe/xcyV/8PLFH/CyhO6wopU3QKL2UKCixZAAomRwAKOXkACiY0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAouXAAQL2AADTBnAAD//wAKKlVQDClP3BEtUv8YM1n/IDph/ydBaf8uSHD/M012/zdRev86VH3/O1R9/zlTfP83UXr/NE53/y5IcP8mQGf/KkBp/zhLdP9DU37/SFeB/0lXgv9IV4P/SFeD/0hWg/9IVoP/SFaD/0hWg/9HVoL/RlWB/0FRfP81SHL/Jj1m/yM8Y/8qRGz/MUtz/zZQef87VX7/PleA/zpUff81T3f/L0lx/ypEa/8lP2b/Hzlg/xgyWP8QLFH/CylP7QoqVHQKMmQKCi1ZAAooSgAKNHMADki/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJNHAACS5cAA8xZQAAERoACytZQgspUNMQLFL/GTRZ/yA7Yf8nQWj/LUdv/zNNdv84U3z/PVeA/z9Ygf89VoD/OVN8/zVPeP8tR2//J0Bo/zJGcP9BUn3/SFeC/0hXhP9IVoT/SFWG/0pXif9MWIz/TFiO/0tWjP9JVIr/R1SI/0dUhf9HVYX/R1aE/0dVgv9AUXz/MUVv/yU9Zf8pQ2v/MUt0/zlTfP9CW4T/RF2F/z5XgP82UHj/L0py/ytFbf8mQGf/IDph/xgzWf8QLVL/CylP7QorVHMKMWQKCi1bAAomRwAPUtsACjNoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDiCAAg1dwAJM2wADCdMAAsqUzAMKU/IDyxR/xgzWf8gO2H/J0Fo/yxGbv8yTHX/OVN8/0BZgv9EXYb/QluE/zxVfv82UHn/LUhw/ypBav85S3b/RlWA/0hXhP9HVYX/SFSJ/09Ykf9cY5//ZWur/2Rrr/9kaq//ZGqt/11kp/9SW53/SFCP/0JKg/9AS37/RFGC/0dWhP9FVYH/O014/ytCa/8pQ2v/M012/z5Ygf9KYYr/SmGJ/0Bagv82UHn/MEpy/yxGbv8nQWj/ITth/xgzWf8QLVH/CylP7QoqVHQKMGYKCitXAAknSAAKMWcACDuSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAw/pQAKOH0AB03JAAolQwAJLVsiCilQtA4rUP8XMlj/IDph/ydBaP8sRm7/MUtz/zhSe/9CW4P/SWGJ/0hgiP9AWYL/N1F7/y5Jcf8tRG3/PU55/0dWgv9HVYT/Q0+D/0ZPiv9SWJz/XmOp/2RosP9fZa//WmCs/1pgrP9cYqz/W2Kq/1VcpP9NVJr/REmL/zg+ef8vNmj/Mjxm/0BNe/9HVoT/QVJ9/zFHcf8sRm7/N1F6/0dfh/9RaI//TWSM/0Fag/83UHn/MUt0/yxHb/8nQmn/ITth/xgzWf8QLFL/CylP7AoqVWIKV9oBCi9lAAkxbQAJMnAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIOYoACzFpAAorVwAJLFkACC1cDwopUpcNKk/8FTFW/x85X/8mQGj/K0Zu/zBKc/83UXn/QVqC/0tji/9OZo7/Rl6H/ztVfv8xS3T/MEdx/z9Qe/9HVoP/Qk9//zpFe/89RYT/Rk2R/0xTmf9OU5z/TVOa/0pRlv9GTY//RkyN/0ZMjf9FTI3/Q0qK/0FIh/8+RIH/Nz14/yswZf8YHD7/Fhow/y44Xf9DUX//RFSA/zdMdv8yS3T/QFmC/1Fnj/9WbJL/TWWM/0BZgv83UXr/Mkx0/y1Hb/8oQmn/IDph/xcyWP8PLFH/CylP0gorWTkMIjUACTR5AAwvZAAIN3QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAg5hwAJMnAACjBoAAw4gQQKKlRwDClP8hMvVP8dN13/JUBn/ytGbf8wSnL/NU94/z9Ygf9LY4v/U2qR/05ljf9BWoP/NU94/zNKdP9AUn3/RlWC/zlFc/8sNWf/MThy/zg/fP86QX//OkF9/zk/ev83PXT/Mjhr/ywyYf8qMF3/KzBd/ysxX/8rMl//KzJg/yowX/8oLlz/JClW/xofRP8IChr/BQYO/x4kPP89SnT/RVWB/ztQev86U33/TGSM/1hulP9WbJP/S2OL/z9Ygf83UXn/Mkx0/y1HcP8nQWn/Hzlg/xYxV/8PK1H/CipSrwktXxgJK1cAHDufAAowZQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIOYUACTyMAAk3gwALIjQACixZPAspUNsRLVL/GjVb/yQ+Zf8rRW3/MEpy/zROd/88VX7/SWCI/1Vqkf9Wa5L/SmKL/zxWf/82Tnf/QVN+/0RSf/8rNVr/GiBE/yIoVv8oL2D/KS9f/yctW/8kKlX/ICdN/x0iRf8YHDv/ExYy/xEVL/8SFjH/Excy/xMYNP8UGTX/FRk2/xUZN/8UFzX/ERUw/wgLHv8AAAX/AgIF/yAjMf89SGz/RlaC/z9Vfv9GX4f/WG2U/1twlv9UapH/R1+H/zxWfv83UHn/Mkt0/y1Hb/8mQGj/Hjhe/xUwVv8OKlD4CypTgwsvZAYLLVwACjBjAAoxZQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAg1dgAJMWkACS9jAAgxahILKlOqDytQ/xcyWP8hPGL/KkRr/y9Jcf80TXb/OVN8/0Rdhf9SaI//WW6V/1Vrkv9HX4j/O1R9/0FUf/9CUXz/IytG/wgKGv8RFTP/GB5B/xkeQP8XGzv/Exg0/xEVLv8OEir/DRAm/wsOI/8KDCD/CQwg/woNIf8KDSL/Cg4i/wsOIv8LDiL/Cw0h/woMH/8ICx3/BggY/wECCf8AAAL/CQkK/x8iK/80P2P/R1iC/0VchP9WbJL/XHGX/1dtlP9NZIz/Q1uE/ztVff82UHn/MUt0/ytGbv8kPmX/HDZc/xMuVP8NKlDcCixYNQsoTQAJMmoACjZxAAowZgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAINn4ACDiBAAkybQAAdP8ACitWYA0qUPEVMFX/Hzlf/yhCaf8uSHD/M011/zhSev9AWYL/TGOL/1dtk/9acJb/VGqR/0Rdhv9CV4H/RVR//yQrRv8DBAn/AwQQ/woNI/8LDiX/Cw4k/wsOIv8KDSH/Cg0g/wkMH/8ICx7/Bwoc/wYIGf8FBxj/BQgZ/wYIGv8GCRr/Bwob/wcKG/8HCRr/BggZ/wUHF/8EBRT/AQIK/wAAA/8AAAP/AgED/w0RH/82RGv/SFyF/1Joj/9ccZb/VmyT/09mjf9GXof/P1iB/zpTfP81T3j/MEpz/ypEbP8iPGP/GTNZ/xAtUv4MLFWcCTFlDgovYAAKMGMACjFnAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgybQAMFxcACixXAAkvYSYMK1LJEi5T/xs2XP8lP2b/LUdv/zJMdf83UHn/PFV+/0Vehv9RaI//WW+V/1twlv9TaZH/Rl2F/0dXgv8tN1X/CAkP/wAAAv8DBA//BQcX/wYIGf8GCBn/Bgka/wYIGv8GCRn/BggZ/wkKGf8NDxz/EBEd/xITHv8UFSH/Fhck/xcZJf8YGSb/Fxkl/xYXI/8TFSH/ERId/wwNFv8EBQr/AQED/wAAAv8AAAL/AAAD/xUcMv9AUXr/T2SM/1htlP9SaI//TGOL/0dfh/9BWoL/PFV+/zhSe/80TXb/Lkhx/ydCaf8fOWD/FjFW/w8sU+QLLlxFDihEAAkybQAJMWwACjRqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDJvAAkybQABRbUCCyxXdw8sUfsYM1j/ITxi/ypEbP8xS3P/NU94/ztUfP9BWYL/SmGJ/1NqkP9ZbpX/XHGW/1Foj/9JXYb/M0Bl/wkMFv8AAAL/AAAD/wEBCv8DBBH/BwgW/w8QHf8dHyr/Kiw2/0JFTP9NT1X/XF5j/25wc/93enz/en1//3x+gf99gIL/e31//3l8fv92eXv/cnR2/2ttb/9kZWf/V1hb/0JERf8uLzD/FhcY/wUGCP8AAAL/AwUM/yUzVf9HXIX/TmWN/0hgiP9GXob/RV2F/0Jag/8+V4D/O1R9/zdQef8yTHX/LEZu/yQ/Zv8bNlz/Ey5U/g0tVp4JMWcPCy9hAAoxZAAKMWoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0AAAAFMm8ACi1aAAkuXyYNK1PMFC9U/x04Xv8nQWn/Lkhx/zROd/84Unv/PVd//0RchP9LY4r/UWiP/1dsk/9bcJb/UWaO/0JTff8VHTP/AAAC/wAAAv8HBwr/GRoe/zI0Of9SU1j/aGtu/4CDhP+LjY7/lJeY/5SYmf+RlZf/jZCU/4SIj/9+g4z/e4CI/3Z7hP91eoP/dnuD/3J3f/9vdHz/aW52/2Zrcv9kZ2z/XWBl/1daXf9LTU7/NTc4/xMTFP8AAAL/DRgv/zNKc/8/WID/O1V9/z1Xf/9BWYL/QVmC/z9YgP88Vn7/OVN7/zVPeP8wSnL/KUNr/yE7Yv8XMlj/EC1U4QwuWjkNLFUA/wAAAAovYgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACTBiAAg2fQASHR0ACyxXZhEtU/gZNFr/Iz1k/ytFbf8yTHX/N1F5/ztVff8/WYH/RV2F/0lhif9MZIv/UWeO/1dtk/9OY4v/LDpf/wMGDv8GBgf/IyQl/0lLTP9maGn/d3l6/3x/gv95fYL/cHWA/2Vsev9dZXb/S1Vv/0JNav88SWf/Lz5i/yk6Yf8pOmD/KDhf/yg4X/8pOF//JjZd/yQ0W/8iMlj/JDNY/yg2V/8nNVX/KjZT/yk2Uv8pNE7/GyQ5/wUMHv8FEyz/Hjde/yxGbv8vSXH/Nk93/zxVff8/WID/P1iA/z5Xf/87VX7/OFJ6/zNNdv8tSHD/JUBn/xw3Xf8TL1X9DSxUiwcvZQYKLl0ACjFnAAoyaQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJM24ACy9iAAkwZxEOLVatFTBW/x45X/8nQmn/L0lx/zVOd/85U3v/PVZ//0Fagv9FXYX/Rl6G/0Vehv9HX4f/TWSL/0FWgP8VIDz/DQ4P/zEyM/9QU1f/VFli/0pSYv9BSmH/M0Be/yw6Xf8lNV3/IzRe/yQ2Yf8kN2P/Jztn/y1Dbv81THb/OVB5/zZNdv8wRnD/K0Fs/yg8aP8mOmb/JDlk/yQ4Y/8jOGP/JDhk/yU6Zf8lOmX/JDpl/yM5ZP8hOGH/HjVd/xs0W/8dN17/ITti/yhCaf8xS3P/OVN7/z5Xf/8/WID/P1iB/z1Xf/87VH3/NlB5/zFLdP8qRWz/ITxj/xgzWP8QLVPbCy5bMQwsVQAFVcMACjNvAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACTV1AAc+kAANK1EACy5dPREuVOUaNFr/Iz1k/ytGbf8yTHX/N1F6/ztVff8/WID/QVqD/0NchP9CW4P/Pld//zpTfP86VHz/KkFq/wgTK/8aIC3/LTdN/yUzU/8fMVf/HjFa/x8yXv8iNmL/JTll/yk9aP8tQm3/M0lz/zpRev9GXIT/UWiO/1lulP9bcJb/WW+U/1Vrkf9PZoz/S2GJ/0lfhv9HXYX/RlyF/0Vchf9GXYb/Rl6H/0Vdh/9CW4T/PleB/zlSfP8yTHX/K0Vt/yQ+ZP8kPmX/K0Rs/zNNdf85U3v/Pld//0BYgf9AWYH/QFmB/z5XgP86VH3/NU94/y5Jcf8mQWj/HDdd/xMvVfgNLVdrIB0WAAowZQALMHQACi1eAAgyaQAHN3wABzZ4AAY5iAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHPI4ACjFnAAA5jwIOLVeAFDBW/B45X/8nQWn/L0lx/zVPeP86U3z/PVZ//0BZgf9BWoP/QlqC/z9Xf/83UXn/L0hx/yhCaf8cNl3/EihN/xsxWP8kO2X/LENt/zNLdf84UHr/PVR9/0NZgv9IXof/TWOK/1Fnjv9XbZP/XXKX/2F1mv9idpr/X3OX/1tvk/9abpL/Wm6S/1tvlP9bb5X/WW+V/1dtlP9TapL/UGiQ/05mjv9LZIz/SWGK/0ZfiP9DXIX/PliB/zlTfP8zTXX/L0lx/zBKcv81Tnf/OVJ7/z1Wfv9AWIH/QVqD/0Nbg/9DW4T/QVqD/z1XgP84Unv/Mkx2/ytFbf8hPGL/FjJX/w4sU8AKLF0dCypRAAssWwANLFcADzJhAA4zZgAANZoACjNzAAg5igAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB0OWAAowYwAML2AACjBkFBAuVrsYM1n/Ijxj/ytFbf8yTHX/OFJ6/zxVfv8/WIH/QFmC/0Fagv9AWYH/PFV+/zVOd/8rRW3/Iz1k/yE7Yv8oQ2r/Mkx1/ztVfv9CXIX/SGGK/0xkjf9PZ4//UWmR/1Rqkv9WbZT/WnCW/11ymP9dcZf/Wm6T/1Rpjf9MYYb/RluA/0RZfv9EWn//R1yB/0pghv9NZIr/T2aO/05mjv9MZI3/S2OM/0pii/9JYYr/SGCJ/0Zeh/9DXIT/QFmC/z1Wf/88Vn7/Pld//z9Ygf9AWYL/QlqD/0NchP9FXYX/Rl6G/0Zfh/9FXYb/QVqD/zxWf/82UXr/L0pz/yZAaP8aNVv/EC1T+AoqU4AJKVMOBSxjAwgpVRQKL2EcBC5pBhY0YAAAJrQACjN1AAw6dwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJNG4AuwAAAA4uWQAMMWQyEy9W3xw2Xf8lQGf/Lkhx/zRPeP86VH3/PleA/0Fagv9CW4P/QlqD/0BZgf89Vn7/N1F5/zFKc/8sRm3/LEZt/zJMdP85U3z/QFmC/0Vdhv9IYYn/S2OL/01kjf9OZo7/T2eP/1FokP9TaZH/U2mR/01jiv9CWX//M0tx/ydBZ/8hOmD/Hzle/yE7Yf8nQGb/MUlw/zpTe/9DW4T/R1+I/0lhiv9JYor/SmOL/0tji/9KY4v/SmKK/0lhif9IYIj/SGCI/0hgiP9IYIj/SGCI/0dfh/9IYIf/SWCI/0phif9LYor/S2KK/0hhif9FXof/QFqD/ztVfv8zTnf/KkVt/x86YP8UMFX/CylO7QooTqkNK1OMGDRbtx46Y8kZN2KFDzNqGRg2YQDBcwAAFDZjAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACDd/AAk1bQAJN3cAHB4gAA4vWmQWMVf3IDph/ylDa/8xS3T/OFJ7/z1XgP9BWoP/Q1yE/0RchP9DXIT/QlqD/0BZgf89Vn//O1R9/zlSe/85Unv/PFV9/0BZgv9EXYb/SGCJ/0pii/9MZIz/TWSN/01ljf9MZI3/SmOL/0ZfiP89Vn7/K0Vs/xg0Wf8OKk7/CydL/wsnS/8LJ0v/CydL/wwoTP8SLlP/ITxi/zNNdf8+WIH/RV6H/0liiv9MZIz/TWWN/05mjv9PZo7/T2aO/09mjv9QZo7/UGeO/09mjv9PZo3/TmWN/05ljf9PZY3/T2aO/1Bnjv9PZo7/TGSM/0hhiv9EXYb/P1iC/zdSfP8vSXL/JD5l/xgzWf8OK1D/DClO/xUxVv8qRW3/Mkx1/ypFbfodOmWODTFmChQ2ZgAVOm0ABzp+AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHO48ACTNvAAsxYwAIMmsLEC5XphkzWf8jPWX/LEdv/zRPeP87VX7/QFqD/0Rdhf9HX4f/R1+H/0Zeh/9FXob/RF2F/0Rchf9EXYX/RV2F/0Vehv9GX4f/SWGI/0tji/9MZIz/TmWO/05mjv9OZo7/TWWN/0pii/9EXYb/OVN7/yQ+Zv8PLFH/DSlO/xQwVf8cN13/ITti/yI8Y/8fOWD/GDNZ/w8rUP8PK1D/ITxj/zZQef9CW4T/SWKK/01ljf9QZ4//UmmQ/1Nqkf9UapL/VWuS/1Zsk/9WbJL/VmuS/1Vrkv9UapH/VWqR/1Vrkv9Va5L/VGuS/1Jpkf9PZo//S2SM/0dgif9CW4X/O1aA/zNNd/8oQ2r/HDdd/xEtUv8NKk//GDNZ/y5Icf85VH7/OFN9/y1IcegfPmtGK0FmAA08eAA7TW0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACy9hAAopVwAKHkcACCpdAA9b6gAKRakADSpOAAouXTQRLlXcHDZc/ydBaP8wSnP/N1J7/z5Ygf9EXYX/SGCJ/0piiv9LY4v/S2KK/0piiv9KYor/S2KK/0xji/9NZYz/T2aN/1Bmjv9QZ4//UWiQ/1JpkP9SaZH/UmmR/1FokP9OZo//SWKL/z9Zg/8uSHD/FTBW/xMwVf8kP2b/Mkx0/zxVff9AWID/QFmB/z5Xf/82T3f/KUNr/xczWf8VMVf/LUdw/z9Zgv9JYor/T2aP/1Npkf9VbJP/V22U/1lulf9ab5X/WnCW/1twlv9bb5b/Wm+W/1pvlv9acJb/Wm+W/1lvlf9XbZT/VGuS/1FokP9OZo7/SmKL/0Veh/8+WIL/NlB6/yxHb/8gO2L/FDBV/w0qT/8VMFb/JkFp/zdSfP89WIL/OVR+/ytIdKETN2oMHT5uAB0/bwAAIm0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAzYgAQM2EACDJjABMzXwAZNFwAEC1VAAopUgAIMGYQCytUoBMvVP4fOWD/KURs/zNOd/87VX7/QVuE/0dgif9LY4z/TmaO/1Bnj/9QZ4//UGeP/1Bnjv9RZ4//UmmQ/1Rqkf9Va5L/VmyT/1dtk/9XbZP/V22U/1ZtlP9WbJP/VGqS/1BnkP9JYov/PFaA/yVAaP8WMlj/K0Vt/z1Xf/9JYYj/T2aN/1Foj/9SaI//UGeO/0lhif8+V4D/LEdv/xcyWP8mQWj/PFaA/0lii/9RaJD/VWyT/1hulf9bcJb/XHGX/15ymP9fc5n/X3SZ/190mf9fdJn/X3OZ/19zmf9dcpj/W3CW/1hulf9WbJP/U2mR/09nj/9LZIz/RmCJ/0BahP84U33/L0pz/yQ/Zv8YM1n/DitQ/xIuU/8gOmH/Mkx2/zxXgf8/WoT/NVF75SJBbz8tSnQABSxlACFCcgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHO48ACTmCAAAuewAbNWAADS1ZFxEvWkUNLFo2CihPMQsrVHwNKlDxFjFX/yI8Y/8sR3D/NlF6/z5Ygv9FXof/SmOL/09mj/9SaZH/VWuS/1Zsk/9WbJP/VmyT/1dtk/9YbZT/WW+V/1pwlv9bcJb/XHGX/1xxl/9bcJb/WnCW/1lvlf9WbZT/UmmR/0pjjP87VX//Iz5l/yE8Y/87VX7/S2OL/1Vrkv9bcJb/XXKX/11yl/9bcJb/VWuS/0pii/86VH3/ITti/yVAZ/88VoD/SmOM/1Nqkv9YbpX/XHGX/15zmf9gdJr/Ynab/2J2m/9jd5v/Y3eb/2N3m/9idpv/YHWa/15zmP9bcZf/WG6V/1Vsk/9TaZH/T2eP/0tkjf9HYIn/QVuF/zlUfv8xTHb/J0Jq/xw2Xf8RLVL/ECxR/xo1W/8rRW3/N1N9/0Bbhf8+WYP9Lkx4gAAeXwIdQHIAGz9yAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACD2MABI8eACdQAAAHTdbABY2Yh4fO2ShJUBp6h86YuMSLlPhDitR9Q8rUf8YM1n/JD9m/y9Kc/85VH3/QVuF/0hgiv9NZY7/UWmQ/1Vrk/9YbpX/Wm+W/1twlv9ccZf/XHGX/11ymP9ecpj/X3OZ/190mf9gdJn/YHSZ/19zmf9ec5j/XHGX/1pvlv9VbJP/TGWO/z1Xgf8oQmr/KURs/0Jchf9SaZH/XXKY/2R4nP9meZ7/Znme/2N3nP9ccZf/TmaP/z1Xgf8oQ2v/KkVt/z9Zg/9OZo7/VmyU/1twl/9fc5n/YXab/2N3nP9keJ3/ZXmd/2Z5nf9leZ3/ZHid/2N3nP9hdZv/XnOY/1txl/9YbpX/VWuT/1Jpkf9OZo//SmOM/0Zfif9AW4T/OlV//zNNd/8qRG3/Hzlg/xMvVP8PLFH/FjJX/yQ/Zv8xTHb/PViC/0Ndh/83U368HkBvFCZGdAAZP3UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALQpEACT2JABI6dgAAMn4FIT9sgjBKc/w5U33/M012/x45X/8SLlP/ECxS/xs2XP8nQmn/Mk12/ztWgP9DXYb/SmKL/09nj/9TapL/V22U/1lvlv9ccZf/XnOZ/2B0mv9hdZr/Ynab/2J2m/9jdpv/Y3eb/2N3m/9jd5v/Ynab/2F1m/9fdJr/XXKY/1hulv9QaJH/QlyG/y9Kc/8tSHH/P1qE/1BokP9dcpn/ZXme/2l8n/9oe5//ZHec/1pwl/9KZI3/OlV//yxGb/8xTHb/RF6I/1Jpkf9Zb5b/XXKY/2F1mv9jd5z/ZXid/2d6nv9nep7/Z3qe/2Z6nv9leZ3/Y3ec/2F1m/9ec5j/W3CX/1dtlP9Ua5L/UGiQ/01ljf9JYYv/RF6H/z9ag/86VX//M054/ytGbv8hPGL/FjFW/xAsUv8UMFX/Hzpg/yxGb/84U33/Q12H/z5Zg+IqS3s2Mk96AGVTOwAAAEIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAdDlADlLgAAJEFtABs+ci0uSnXWPFeB/z5Zg/80Tnj/IDti/xIuU/8SLlP/HThe/ypEbP8zTnj/PFeB/0VeiP9LZI3/UGiQ/1Rrkv9XbZX/Wm+W/1xymP9fc5n/YXWb/2N3nP9keJ3/ZXmd/2Z5nf9mep7/Znqe/2Z5nv9leZ3/ZHic/2J2m/9gdJr/XHGY/1VslP9KY4z/OFN9/zBLdP86VX//SGKM/1VslP9ec5n/Ynab/2F1m/9ccZj/UmqT/0Vfif82Unz/Lklz/zlUfv9JYoz/VGuT/1pwl/9ec5n/Ynab/2R4nf9mep7/aHuf/2h7n/9oe5//Z3qe/2V5nf9jd5z/YXWb/15zmP9bcJf/V22U/1Rqkv9QZ4//TGSN/0dgif9CXIb/PliD/zlUfv8zTnj/LUdw/yM+ZP8YM1j/ES1S/xMuU/8bNlz/J0Jq/zNOd/9AWoT/QlyG+DJRgGvOs5IAHkV/ABdAeAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADzZmABhCfABRWnEAKEh4ZDlUf/hBXIb/PViC/y9Kc/8eOWD/Ey5U/xQvVf8gOmH/LEZv/zVQev89WIL/RV+I/0tkjf9QaJD/VGuS/1dtlP9Zb5b/XHGX/15zmf9hdZr/Y3ec/2V4nf9mep7/Z3qe/2h7n/9oe5//aHuf/2d6nv9meZ7/ZHid/2F2m/9ec5n/WW+W/1Bokf9CXIb/NVB6/zVRe/9BXIb/TGWP/1Nqk/9WbZX/Vm2V/1Fpkv9KZI7/P1uF/zRQev80T3n/QVuF/01ljv9VbJT/WnCX/15zmf9idpv/Znme/2h7n/9pfKD/aXyg/2h7n/9nep7/Znme/2R3nP9idpv/X3OZ/1txl/9YbpX/VGuS/1BokP9LY4z/R2CJ/0FbhP81THH/Mktx/zNOeP8tSHD/JD9m/xk0Wv8TLlT/Ei5T/xgzWP8jPmX/L0pz/zxWgP9DXYf/N1SApBQ8cwsjRXgADzt2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMOXYAGkB3AAY0dAgwTnudQFuF/0Jdh/86VYD/K0Zu/x03Xf8SLlP/FjFX/yI8Y/8tSHD/NVF6/z1Yg/9FXoj/SmOM/09nkP9TapL/VmyT/1hulf9bcJf/XnOZ/2F1mv9jd5z/ZXid/2d6nv9oe57/aXuf/2l8oP9pfKD/aHuf/2d6nv9leJ3/Ynab/15zmf9acJf/VGuT/0pjjf89WYP/N1N9/ztXgv9DXon/SGKN/0tkj/9KZI7/R2KM/0Neif88WIP/N1N+/ztWgf9GYIr/TmeQ/1RslP9acJb/X3Sa/2R4nP9oe5//anyg/2p8oP9pfKD/aHuf/2d6nv9meZ7/ZHec/2J2m/9fdJn/XHGX/1lvlf9VbJP/UWiR/0xkjf9HYIn/Pld//x8sQv8oPFv/M054/y1HcP8lP2f/GzZc/xQvVf8SLlP/FjFW/yA6Yf8sR2//OFJ8/0Jchf86VoHSJkZ1IitKeAAlRXMABTFqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACBDdgAoSHgAIkR1GzhVgcZFX4n/QVuG/zZRe/8oQ2v/GzZb/xMvVP8YMlj/Iz1l/y5Jcv82UXv/PViC/0Ndh/9JYov/TWWO/1Fokf9Ua5P/V22V/1pwlv9ecpj/YXWa/2N3m/9leJ3/Z3qe/2h7n/9pfKD/anyg/2p8oP9qfKD/aXuf/2Z5nv9id5z/XnOZ/1pwl/9VbJT/T2eQ/0Zgiv8+WYT/PVmE/0FdiP9DX4r/RWCL/0Vgi/9DX4r/Ql2I/z9bhv8+WYT/Ql2H/0ljjP9PaJD/VGyT/1twl/9hdpv/Z3qe/2p8oP9rfaD/an2g/2l8oP9oe5//Z3qe/2Z5nv9keJz/Ynab/2B0mf9dcpj/Wm+W/1ZtlP9TapL/TmaO/0hhi/8+Vn3/JDRN/y5Faf8yTXf/LEdw/yVAZ/8cN13/FTBW/xMuVP8VMVb/HDZd/ypEbP80T3n/P1mD/z1YguwqSnhFNVF8AAExbwAJNG0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANUlqADBOfQApSn0tP1qE3kdgiv8+WYP/Mk12/yVAZ/8aNFr/FC9V/xk0Wv8kPmb/Lkly/zVRe/88V4H/QVyF/0Zfif9LY4z/T2eP/1Nqkv9XbZT/WnCW/15ymP9hdZr/Y3eb/2V4nf9nep7/aHuf/2l7n/9qfKD/an2g/2t9oP9qfKD/aHuf/2V4nf9gdZr/WnCX/1VslP9RaZL/S2SO/0Zgiv9EX4n/RmGL/0hijf9JY43/SWOO/0ljjf9IYo3/RmGL/0Vgiv9IYYz/TGSO/09nkP9VbJT/XXKZ/2V4nf9pfKD/a32g/2p9oP9qfKD/aXyf/2h7n/9nep7/Znme/2V4nf9jd5v/YHSa/11ymP9acJb/V26V/1Rrkv9PZ4//SmKL/0Nchf85U3v/NlF6/zFMdf8sR2//JUBn/x03Xf8WMVf/FC9U/xYxVv8YM1n/JkBo/zJMdv88VoD/PliC/DBNeHP///8AFDptAAQxagAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhHnAAXPnYAO1iGAC5PgUlCXYjtRmCK/ztWgP8vSXP/Iz1k/xkzWf8VMFb/GjVb/yQ/Zv8uSXL/NVB6/zpWgP8/WYT/RF6H/0lii/9OZo//U2qS/1dtlP9acJb/XnKY/2F1mv9jd5v/ZHid/2Z6nv9nep7/aHuf/2l8n/9qfKD/an2g/2t9oP9qfaD/aHuf/2N3nP9dcpj/Vm2V/1Jqkv9PZ5D/TGWP/0tljv9NZpD/T2eR/1Fpkf9RaZL/UWmS/1Bokf9PZ5D/TWaP/0xlj/9MZY//TmeQ/1ZtlP9gdJr/Z3qe/2p8oP9qfaD/an2g/2p8oP9qfKD/aXyg/2l7n/9oep7/Znme/2N3nP9hdZr/XnOY/1pwl/9YbpX/VGuT/1BokP9LZI3/RV+I/z5Zg/83Unz/MUx1/yxGb/8lQGf/HThe/xcyWP8UL1X/GDNY/xcyWP8hO2L/L0ly/zhTfP89V4H/ME16ohA5cAscQXQAFj52AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADSNACpKewBIYIcAOFSAZkVfiflFXoj/OFN9/y1Hb/8hO2H/GDNZ/xYxV/8bNlz/JT9m/y5Jcv80T3n/OVR+/z1Ygv9CXIb/SGGK/05mjv9TapL/V26U/1txl/9ec5n/YXWa/2N3m/9keJ3/Znqe/2d6nv9oe57/aHuf/2l8n/9pfKD/anyg/2t9oP9qfKD/Z3qe/2F1mv9Yb5b/UmmS/1Bokf9RaZH/U2qT/1ZtlP9Yb5b/WnCX/1xxmP9bcZf/WXCX/1Ztlf9SapL/TmaP/0pjjf9MZY//VWyU/190mf9meZ3/aHuf/2h7n/9pfJ//aXyg/2p9oP9rfaD/an2g/2l8oP9oep//ZXid/2J2m/9ec5n/W3CX/1hulf9Va5P/UWmR/0xljv9HYIn/QFqE/zhTff8xTHX/K0Zu/yVAZ/8eOF//GDNY/xQvVf8ZNFr/GzZc/xo1W/8rRW3/NE94/zpUfv8yTXnKGz90HSJDdQAaP3wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOS6IAGUyVAP//AAA4V4Z4R2CJ/UNdhv82UHr/KkVt/x86YP8ZNFn/FzJX/xw2Xf8kP2b/LUhx/zNOeP83U33/PFeB/0Fbhf9HYYr/TmaP/1Rqkv9YbpX/W3GX/15zmf9hdZr/Y3ec/2V4nf9nep7/aHue/2h7n/9pe5//aXyf/2l8oP9pfKD/aXyg/2l8oP9nep//Ynab/1lvlv9RaZH/TWaP/1Fpkf9WbZX/W3GX/2B1mv9jd5z/ZXmd/2R3nP9gdZr/W3GY/1Vsk/9NZY7/RmCK/0dhi/9QaJH/XHGY/2J2m/9kd5z/ZHid/2d6n/9pfKD/an2h/2t+of9sfqH/a32h/2l8of9nep//Y3ec/190mv9ccpj/WG6W/1VslP9SapL/TmaP/0hhi/9CXIb/O1V//zJNdv8rRm7/JUBn/x45X/8ZM1n/FC9V/xk0Wv8lQGf/GTRa/yE8Y/8uSHH/NE53/y9LdeAcQHMyIkNzACxHcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB1JiAAgS4kAADmJBDlYh4xGYIr/QFqE/zRPeP8pRGv/Hjhf/xk0Wv8XMlj/HTdd/yQ+Zv8sR3D/Mk12/zZSe/87VoD/QVuF/0hhiv9OZ4//VGuT/1hulf9bcZf/XnOZ/2F1mv9jd5z/ZXmd/2h7nv9pfJ//anyg/2p8oP9pfKD/aHuf/2d7n/9mep7/Znme/2R4nf9gdJr/VmyV/01lj/9JYoz/TWaP/1ZtlP9dcpj/Y3ec/2d7nv9pfKD/aHuf/2R4nP9ec5n/VWyT/0lii/9BW4X/PlmD/1Jojv9+jKj/jJmx/5Sgtv+RnrT/aXeR/1Bhgf9WaIn/WmyM/11ujv9db5H/W22O/1ttjf9fcZP/WmyN/1Nifv9YZoD/UF96/0ldf/9LY4v/SWKM/0Reh/89V4H/M013/ytGbv8lQGf/Hzlf/xk0Wf8UL1X/GDNZ/y9Jcf8mQWj/FTBW/yE7Yv8qRGz/K0Vu7SRBbEUmQm0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKkl4ACtKeQAhQnMMOlWBq0Zfif8+WYP/M054/ydCav8dN13/GjVb/xgzWf8dN17/JD5l/ytGbv8xTHX/NlF6/ztWgP9BW4X/SGKL/09nkP9Ua5P/WG6V/1txl/9ec5j/YXWa/2N3nP9mep7/aXuf/2p9oP9rfaD/an2g/2l8oP9ne5//Znqe/2V5nv9meZ3/Z3qe/2Z5nf9dcZb/RV+J/0Reh/9IYYv/VGuS/11ymP9jd5z/aHuf/2t9oP9pfJ//ZXid/15zmf9Ua5L/Rl+I/zxXgP83UXz/VGWC/8TGyf/m5+j/6uvr/8zMzf9LT1b/Hic0/xogKv8QExr/EBQa/xAXIv8QFR3/FRge/zY8Rf9IT1v/TlNa/6eoqf+ys7X/homP/1Vgcv9FWn7/Rl+J/z9Zgv80Tnj/K0Vu/yVAZ/8fOWD/GjRa/xUwVf8XMlj/M011/ztVfv8dOF7/ES1S/xs1W/8iPGP1IjxjUiM9ZAAcNl0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtS3oAMU15ACxJdRA8VoC6RF6H/z1Xgf8yTXf/JUBo/xw3Xf8cNlz/GTNZ/x03Xv8jPWT/KkVt/zBLdP81UHn/O1V//0Jchv9JYoz/UGiQ/1Rrk/9YbpX/W3GX/15ymf9hdZv/ZHid/2d7n/9qfaH/bH6i/2x+ov9pfKD/Znib/2N1l/9gb4z/jZiq/7W8yf++xM//wsfR/5Sdrv8/V3//PliC/0Ndhv9QZ4//W3GX/2N2m/9oe5//anyg/2l8n/9leZ3/XnOZ/1Npkf9EXYb/OlR9/zZRev8yR2n/cHR5/+bl5f/y8vL/oaKj/yEoMf8SGiL/BAUH/wAAAP8AAAD/AAAA/wAAAP8AAAD/DxAS/zQ5QP8+Q0r/paan/+7u7f/o6Oj/xMTE/2Ztev89U3b/P1mD/zRPeP8rRW7/JT9n/x85YP8aNVv/FTBW/xUwVv8yS3L/R1+H/zVPeP8ZNVv/EC1S/xo0WvUfOWBSHjhfACA8YgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4/jQAoS4EAIUeAFztWgsZDXIb/O1V//zFMdf8iPWT/Hjhe/x44Xv8ZNFr/HTde/yM9ZP8pRGz/L0ly/zROeP87VoD/Q12H/0pjjP9QaJD/VWyT/1hulv9XbZP/W3CV/2BzmP9gdJj/XHCU/1dpi/9PYH7/QVBt/zE9U/8vOEb/T1Zi/1JYYv+Ehor/4eHg//Dv7//n5uX/dn2I/zdQdv87VX//QFmD/01kjf9Zb5b/YXWa/2Z5nv9pe5//Z3ue/2R4nP9ecpj/UmmR/0Rdhv85U3z/NlB5/zVOdf8mMkT/j5CQ/+zs7P+LjI//GCEq/wsRGP8AAQH/AAAA/wAAAP8AAAD/AAAA/wAAAP8DBAX/Iygt/zI4QP+Ki47/6Ojo/+zs7P/k5OT/ZWVm/yYzSf89V4D/NE95/ytGbv8lP2b/Hzpg/xo1W/8WMVb/Ey5U/ylDaf9HXYP/RF6H/zJNdv8gO2L/HTde8R87ZEsfO2MAHEBtAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADUKUACRLhgAeR4ccOVWCzEBag/85U33/L0py/x45YP8iPWT/IDph/xo0Wv8dN13/Ijxj/ylDa/8uSXH/M053/ztWgP9EXoj/S2ON/1Bokf9QZov/UWB7/2hxgP9vd4P/OkVV/yw5TP8dJzb/DhQd/wgLD/8DBQj/AAAB/wEBAf8eICL/QERM/05SWP+1trf/8fHx/6urq/8yPU//OFF5/zpUff8+WIH/S2KL/1htlP9fdJn/ZHic/2Z6nv9leZ3/Y3ab/11yl/9TaZD/Rl6H/ztUff82UHn/OlN8/y5DZf8jKjT/f39//3t9f/8YIiz/Bw4U/wAAAP8BAQH/AAAA/wAAAP8AAAD/AAAA/wICAv8bICX/KjA4/4GDhv/q6ur/7u7u/6SkpP8eHh7/IS5D/ztVf/80T3j/K0Zu/yU/Z/8fOmD/GzVb/xYxV/8PKUv/FylE/zhOcv9IYIj/P1mD/zNOd/8rR3HYJ0p9KSlKegAwWpoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPQosAIkiBAB1GgR41UX3OPFZ//zVPeP8oQ2r/HDde/ytGb/8iPGP/GjRa/x03Xf8iPGP/KEJq/y1IcP8yTXb/O1aA/0VfiP9LZI7/SV6B/11mdf+oqar/2dnY/5qam/8cJCz/ERgh/wMFBv8AAAD/AAAA/wAAAP8AAAD/AAAA/wUFBv8pLTP/Nz1E/4yOkP/MzMz/RUdL/yg6Wf88Vn7/OlR9/z5YgP9KYor/VmyS/11yl/9idpr/ZHec/2N3m/9hdZr/XHGW/1NpkP9HYIj/PVZ//zhSev86U3v/O1R8/yc6WP8SFh3/Kyss/xMbJP8SGiL/XF1d/3l5ef8kJCT/AAAA/wAAAP8AAAD/AwQF/xogJ/8jKTL/jpCS//Pz8//Hx8f/MjIy/wgJCv8rO1b/OlR+/zNOd/8sR2//JUBn/yA6YP8bNVv/FzJY/w4jQP8KDxf/Hy9I7kBZgvRDXYf/OlaA/zBPfZYmUIoKKk+FACxZmAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABI8dQAfQnQAG0B0JS9Ldtc0Tnb/LEZu/xw3Xf8iPWT/OFJ8/yQ+Zv8aNFr/HTdd/yE8Y/8nQmn/LEdv/zFMdf87VX//RV+J/0ddgf9zeob/zMvL/+7t7f/u7u7/goSH/xIbJf8MExz/AAEC/wAAAP8AAAD/AAAA/wAAAP8AAAD/AQEB/xoeI/8vNT3/ZWdq/1BQUP8YIjL/OFB2/z1Wfv87VX3/P1iB/0liiv9UapH/W3CW/19zmP9hdZr/YXWa/19zmP9ab5X/U2mQ/0lhif9AWYH/O1R8/zpUfP88VX3/PFR9/yg5Vv8JDhX/AAMG/zA0Ov/W1tf//Pz8/3t7e/8CAgL/AAAA/wABAf8LDxP/Fx8p/zQ6QP+8vb3/vLy8/0ZGRv8IBwf/GyMv/zhQdv85U33/M013/yxHb/8lQGf/IDth/xs2W/8XMlj/DiE7/wsPE/8OFR7BM053eUJejLU7WYedMFeNJUZcfgAJTKYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEUSLAB9EfAAcRH8fKkZxzylDav8cN13/FTFW/zVOd/9FX4j/J0Fp/xkzWf8cN13/ITxi/yZBaP8rRm7/MEt0/zlUfv9DXYb/NkZg/4GBgv/n5+f/7+/v/+3t7f+Ehoj/Ehsl/woSG/8LDA3/Hh4d/wcHB/8AAAD/AAAA/wAAAP8BAQH/Fhkf/yMpMf8ZGxz/DhMb/y9DZP8+V3//PVZ//z1Wf/9BWYL/SWGJ/1NpkP9ZbpT/XHGX/15zmP9ecpj/XHCW/1htlP9SaI//SmGJ/0Jbg/89Vn7/PFV9/z1Wfv8+V3//PVZ+/yw/Xv8OFSH/DxAS/2ZmZv+4ubn/W1tc/wECBP8CBAf/CA0T/xAZI/8XHyn/XmBj/4KCgv8nJyf/BQUE/xYbI/80SWn/PFeA/zhSfP8zTXf/LUdw/yZAaP8hO2L/HDZc/xgyWf8PIjv/DhIW/w0QE+0LDxNUSHa8Dj5opQs8TXsAJVaZAB9RlwAbSosAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATSZcAIEN3AB5FfRUkQGnCHDZc/xEtU/8kP2f/Rl+I/1Nqkv8rRW3/GTNZ/x03Xf8hO2L/JUBn/ypFbf8vSnP/N1J8/0BahP8tPVj/HR4e/46Ojv/r6+v/9PT0/6mqqv8fJzD/Ex0n/4GDhf/Ly8v/YWFh/wICAv8AAAD/AAAA/wMEBv8TGB//DA8S/wUJDf8nOFT/Pld//z9XgP8+V3//PleA/0Jbg/9JYYn/UWeP/1Zskv9ZbpT/W3CV/1tvlf9ZbpT/VmuS/1Bnjv9KYon/RFyE/z9YgP89Vn//Pld//z9YgP8/WID/P1iB/zZLb/8cKDz/CQwS/xUVFf8ICQr/AQQH/wQJDv8IDhX/BwwS/w4QE/8dHR3/CQkJ/wkJC/8eJjL/N0tr/z9Zgv88VoD/N1J7/zNOd/8tSHD/J0Fp/yE8Yv8cNl3/GDNZ/xAhOf8QExf/DhEU/wwPE6QEAwMKIjVRADFclgAyWpEAKV6nABFRqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACZJfQAmR3kAKk6GCSI/aaAbNVv/ITxj/zlUff9SaZH/V22U/ypDaf8WMVb/HDdd/yA7Yf8lP2b/KURs/y9Kc/82UXv/PViC/zZLbP8RFBr/GBgY/5CQkP/u7u7/2tra/0tQVf8fKTP/yMrN//////+npqb/CwsL/wAAAP8BAgP/BgkN/wcJDP8GCQ7/IzJL/z1Vff9AWYH/QFmB/0BYgP9AWYH/Q1yE/0lhiP9PZY3/U2mQ/1Zrkv9XbJP/V2yS/1Vrkf9TaY//TmWM/0phiP9FXYT/QVmB/z9YgP8/WID/QFmB/0Fagv9BWoL/QlqD/z9Wff8wQ2H/GyY5/w0SG/8GCAz/AwQG/wECA/8CAgT/BQYI/wwPFP8dJTL/M0Jc/0BXfP9CXIX/P1mC/zxWf/83Unv/M053/y1Icf8nQmn/Ijxj/x03Xf8YM1n/ESE3/xATF/8OERX/DRAU1gsOEygMDxMADxIQADtttwABAwUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHUSHAB1DggD/TgAAJUNwbypFbfo1UHn/Q16I/1Ztlf9GXYL/GSg+/xEnRv8cN13/IDth/yQ/Zv8pQ2v/Lkly/zVQef87Vn//P1mC/y49Vv8ODxL/FhYW/2VlZf+6urr/m5yd/y41PP9nbXP/rbC0/09SVv8EBwr/AgQH/wIEBv8BAgT/CAwT/yc2UP8/Vn7/QlqD/0Jbgv9CWoL/QVqB/0Jagv9EXIT/SGCH/01ji/9QZo3/UmiP/1NpkP9TaY//UmiP/1Bmjf9MY4v/SGCH/0RdhP9CWoL/QFiB/0BZgf9CWoL/Q1uD/0RchP9EXIT/RV2E/0Vdhf9DWoH/PFF0/zRHZf8tPFX/KTZN/yw7Uv80RGD/PlJz/0Vcg/9HYIj/RV6H/0Jchf8/WYL/PFZ//zhSfP8zTnf/Lkhx/yhDav8jPWT/HThe/xgzWf8SIDT/EBMX/w8SFf8NEBTuDA8TSw0QEwALDxMACw4TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlTIkAH0iRADJRgAAwUYMoNFF+yj1Yg/9IYoz/TWaQ9yY4U+oMEBT/EB80/xs2XP8gOmH/JD5m/yhDa/8uSXH/NE94/zpUfv8+WYL/QFmB/zFBWv8VGSD/BgYH/x4dHf9ISEj/Njg5/w4TGP8QFh3/BwwT/wMGCv8BAgT/AwQH/xIaJv8vQF7/QlmA/0RchP9EXIT/RFyE/0Nbg/9DW4P/QluD/0RchP9HX4f/S2KJ/01ki/9PZYz/T2aN/09mjf9OZYz/TGOL/0piif9HX4b/RFyE/0Jagv9BWYH/QVqC/0Jbg/9EXIT/RV2F/0Zehf9HXob/R1+G/0hfh/9JYIj/SWGJ/0piiv9LYor/S2OL/0tji/9KY4v/SWGJ/0dgiP9FXob/QluE/z9Zgv88Vn//OFJ8/zNOd/8uSXH/KURr/yQ+Zf8eOF//GTNZ/xIfMf8QExb/DxIV/w0RFPsMDxNyHB4eAAoNEgAKDRIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAagAsUY4AM1mSADNirQI1VodOPVqIwkRgjdQ7WIWMDxYgsA0QE/8PGin/GjNZ/yA6Yf8kPmX/KENr/y5Icf8zTnj/OVR9/z1Ygf9CW4X/RV6H/z5Sdf8sOU7/Fxwm/woNEv8HCAn/AwQF/wECBP8EBgn/Cw8W/xcfLf8qOVP/PlN3/0Zehf9HX4b/R16G/0Zehv9GXYX/RVyE/0Ncg/9DW4P/RFyE/0dfhv9JYIj/SmKJ/0tjiv9MY4r/TGOK/0tiif9KYYn/SGCH/0Zehf9EXIT/QlqC/0Fagv9CWoL/Q1uD/0RchP9GXoX/R1+G/0hgh/9JYIj/SmGJ/0piif9LYor/TGOL/0xki/9MZIv/TGSL/0tji/9JYor/R2CI/0Veh/9CW4T/P1mC/zxWf/84Unz/M053/y5Jcv8qRGz/JT9m/x85YP8ZM1j/Eh0s/xATFf8PEhX/DhEV/wwPE6QLDhMKCw4TAAsOEwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADNalAAzVYsAMlaLACNNhgI/ZZ8aOmCbJRkqRhMNERSmDxMV/xAXIP8YMFL/IDph/yQ+Zf8oQmr/LUhw/zNNd/84U33/PVeB/0FahP9EXYf/SGCK/0lhif9GXIH/PlFx/zVFYP8wP1n/Lz9Y/zJDX/89UHL/RVuA/0lhiP9KYon/SWGI/0lgiP9IYIj/SF+H/0dehv9GXYX/RFyE/0RchP9EXIT/Rl6F/0dfhv9IYIf/SWGI/0phiP9JYYj/SWCI/0hfh/9HXob/RV2E/0Nbg/9CWoL/QVqC/0Fagv9CW4P/RFyE/0Zehf9HX4f/SWCI/0phif9LYor/TGOK/01ki/9NZIz/TmWM/05ljP9NZIz/TGOL/0piiv9HYIj/RV6H/0JbhP8/WYL/O1Z//zdSe/8zTnf/Lkly/ypFbf8mQGf/IDph/xkzWP8RHCn/EBMV/w8SFf8OERX/DA8T0QsPEyMLDxMACw8UAAoLDwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMliVACM5WQAyVIYAMFSHAD5glAAyTXcABAMDBA8SFpQPEhX/EBYc/xcsS/8fOmL/JD5l/yhCav8tR3D/Mk12/zdSfP88VoD/QFqE/0Rdhv9HX4j/SWKK/0tjjP9NZY7/T2aP/09njv9PZo7/T2aO/05ljf9OZYz/TWSL/0xji/9MY4r/S2KK/0phif9JYIj/R1+H/0Zehf9FXIT/RFyE/0RchP9FXYX/Rl6F/0dehv9HX4b/SF+G/0hfhv9HX4b/Rl6F/0Vdhf9EXIP/Q1uC/0Jagv9BWoH/QVqB/0Jagv9DXIP/Rl2F/0dfhv9JYIj/SmKJ/0tjiv9NZIv/TWSM/05ljP9OZY3/TmWN/01kjP9MY4v/SmKK/0dgiP9FXYb/QluE/z5Ygv87VX//N1J7/zJNd/8vSXL/K0Vu/yZBaP8hO2L/GTJV/xEaJf8QExX/DxIW/w4RFf8NEBPvDA8TTw0QEwAJDRMACgwQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAK1GHADJViQAxV44AM0djAA0RFQAREhMADhEVcw8SFfsRFRn/FidA/x86Yf8jPmX/KEJq/y1HcP8xTHb/NlF7/ztWgP8/WoP/Q12G/0ZfiP9JYor/S2OM/05ljf9PZo7/UGeP/1Foj/9RZ4//UGeO/1Bnjv9PZo3/TmWM/01ki/9MY4r/SmKJ/0lgiP9HX4b/Rl2F/0RchP9EXIT/RFyE/0RchP9FXIT/Rl2F/0Zehf9GXoX/Rl2F/0Zdhf9FXYT/RFyE/0Nbg/9CWoL/QVqB/0FZgf9BWYH/QVqC/0Nbg/9EXIT/Rl6G/0hgh/9KYYn/S2KK/0xji/9NZIz/TmWM/05ljf9OZY3/TWSM/0tji/9JYYn/R1+I/0Rdhv9BWoP/PliB/zpVfv82UXv/Mk12/y9Kcv8rRm7/J0Fp/yI8ZP8aMVP/ERgh/xATFv8PExb/DhIV/w0QFPwMDxOACAoQAgsOEgAKDBAACgwSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIDBAADBAVAA4SFAANERRgDxMW9hEUGP8TITT/Hjhf/yM+Zf8oQmr/LEdw/zFMdf82UXv/O1V//z9Zgv9CXIX/Rl+I/0lhiv9LY4z/TWWN/09njv9RaI//UmiQ/1JokP9SaI//UWiP/1Bnjv9PZY3/TWSM/0xjiv9KYon/SGCH/0dfhv9FXYX/RFyE/0Ncg/9DXIP/RFyE/0RchP9FXIT/RVyE/0VchP9FXIT/RVyE/0RchP9EXIP/Q1uD/0Jagv9BWYH/QFmB/0BZgf9BWYH/QlqC/0Nbg/9FXYX/R16G/0hgiP9KYon/TGOK/01ki/9NZIz/TmWM/01kjP9MZIv/SmKK/0hhif9GX4f/Q1yF/0Bag/89V4D/OlR+/zZQev8yTXX/L0pz/yxGb/8oQmr/Iz5l/xswT/8TGB7/ERQX/xATF/8PEhX/DREU/wwPE74KDBAaCg0RAAoNEwAKDRMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACBgALDxMAHR4hAA0RFHUQExf8EhUY/xIbJ/8cNFj/JD5l/yhCav8sR3D/MUx1/zVQev85VH7/PliC/0Fbhf9FXof/SGCJ/0pii/9NZIz/T2aO/1Bnj/9SaJD/UmmQ/1Joj/9RaI//UGeO/09ljf9NZIv/S2OK/0lhiP9HX4f/Rl6F/0VchP9EXIT/Q1uD/0Nbg/9DW4P/RFyD/0RchP9EXIT/RFyE/0RchP9EXIT/RFyD/0Rcg/9DW4P/Q1uC/0Fagf9BWYH/QFiB/0BYgf9BWYH/QlqC/0Nbg/9FXYX/R16G/0hgiP9KYYn/S2KK/0xji/9MY4v/TGOL/0tjiv9JYYn/R2CI/0Vehv9CW4T/P1mC/zxWgP83UXj/L0Nj/y9HbP8vSnP/LEdv/ylDa/8kPmb/Gy1I/xQYHf8TFhn/ERQY/w8TFv8OERX/DA8S7woNEV0FBxgBCg0SAAoMEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACw8TAAsPEwAHCxAEDREVkBAUF/8SFRn/ERYd/xkuS/8kPmb/KEJq/yxHcP8xS3T/NU95/zlTff88V4H/QFqE/0Rdhv9GX4j/SWKK/0tjjP9OZY3/T2aO/1Boj/9RaI//UWeP/1Bnjv9PZo3/TWSM/0xjiv9KYYn/SF+H/0Zehv9FXIT/Q1yD/0Nbg/9DW4P/Q1uD/0Nbg/9EXIP/RFyE/0VchP9FXIT/RVyE/0VchP9FXIT/RVyE/0RchP9DW4P/QluC/0Fagv9AWYH/QFiB/0BYgf9AWYH/QVqC/0Nbg/9EXIT/Rl6G/0dfh/9JYIj/SmGJ/0phif9KYYn/SWGJ/0hgiP9GXob/Q1yF/0Fag/8+WIH/OVB2/yw7VP8lMEL/L0Zq/zBLdP8tR3D/KURs/yU/Z/8bK0P/Fhoe/xUYHP8SFRj/EBMW/w4RFf8MDxP/Cw4SrQoNExAKDhMACQ0TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMEBUADRAVAAwPFQwOERWqEBQX/xMWGf8SFRn/FyY8/yM+Zf8oQ2v/LEdw/zBLdP80T3j/OFJ8/ztWgP8/WYP/QlyF/0Veh/9HYIn/SmKK/0xkjP9NZY3/TmaN/09mjf9PZo3/TmWM/01ki/9LYor/SWGJ/0dfh/9GXob/RFyE/0Nbg/9DW4P/QluC/0Nbg/9DW4P/RFyE/0VchP9GXYX/Rl2F/0Zdhf9GXoX/Rl6F/0Zehf9GXoX/Rl6F/0Vdhf9FXIT/Q1uD/0Jagv9BWYH/QVmB/0BZgf9AWID/QVmA/0Jagf9DW4P/RV2F/0Zehv9GXof/R1+H/0dfh/9GX4f/RV6G/0Rchf9CW4T/PlZ9/zZJaP8pNUj/Iik0/ys7Vv8yTXX/MEt0/y1Icf8qRW3/JT9n/xspPf8ZHB//Fxse/xMWGv8QExf/DhEV/w0QE/8MDxPZCw8UKwsPEwAKDhQADAsUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4RFwAOERYADhEWEg4RFr0QExf/EhYZ/xQXGv8WIS//Ijxh/ylEbP8sR3D/MEt0/zRPeP82UXn/NUtu/zpRdv9AWoP/Q12G/0Zeh/9IYIj/SWKK/0tjiv9MY4v/TGSL/0xji/9LYor/SmGJ/0hgiP9HX4f/Rl6G/0RchP9DW4P/Q1uD/0Nbg/9DW4P/Q1uD/0RchP9GXYX/R16G/0dfhv9IX4b/SF+H/0hgh/9IYIf/SGCH/0lgh/9JYIf/SGCH/0dfhv9GXoX/RVyE/0Rcg/9CWYD/PFBx/zVFYP8zQlv/M0Jb/zREX/84S2n/PlN2/0FYfv9DWoH/Q1uC/0JagP9AV3z/PVF0/zZHY/8tOUz/JCs2/yEnL/8pNkv/NExz/zNOeP8wS3T/Lkhx/ytFbv8lP2b/Gyc5/xsfIv8ZHCD/FBcb/xEUF/8OEhX/DREU/w0QFOsNEBRBDRAUAAwPFAAMDRQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxEXAA4RFgAPERYTDhEVvg8SFv8RFBj/ExYa/xYcJP8gN1j/KURs/y1IcP8wS3T/NE54/zZQef8tPlj/KDNE/zJDXv88UXT/QlqB/0Zeh/9IYIj/SWGJ/0lhif9JYYn/SWGJ/0hgiP9HX4f/RV2D/0FWev88UHH/Ok1s/zpNa/89UXL/Qlh+/0VchP9FXYX/R16G/0hgh/9KYYj/SmKJ/0tiif9MY4r/TGOK/01jiv9NZIv/TWSL/01ki/9NY4v/S2OK/0phif9JYIf/R1+G/z1Qb/8rNUX/JCs1/yQqM/8kKTP/Iyky/yQrNf8oMT//LTdK/y88Uf8wPVL/LztP/ys2R/8nLzz/JCoz/yInL/8jKDL/KzhN/zZNc/82UXv/NE54/zFMdf8uSXL/K0Zu/yY/Zf8cJjT/HSAk/xoeIf8VGBz/EhUY/w4SFf8OERX/DhIV9Q0QFFMOERQACwsUAAwMFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANERUADRAVAA0QFRMNEBS+DxIV/xAUF/8TFhn/FRke/x0vSf8pRGz/LUhw/zBLdP8zTnj/NlF7/zVNc/8qN0z/Iyo0/ycvPf8vO0//NkVf/zxObP9AVHX/Qld6/0NYe/9CV3r/QFN1/zpLaP8yP1X/KjNC/yYuOv8mLjr/Ji45/ykyQP80Qln/RFl9/0lhiP9LYon/TWOL/05ljP9QZo3/UWeO/1Fnjv9SaI//UmiP/1Npj/9TaY//U2mP/1Joj/9RZ47/T2aN/05kjP9MY4v/Pk9r/ycuOf8jKTH/Iykw/yMoMP8jKDH/Iygx/yMoMP8jKDD/Iykx/yMpMf8jKTD/Iykw/yMpMP8kKjL/JzA9/zFBW/86Unn/OlR+/zZRe/80T3j/MUx1/y9Jcv8rRm//Jj9k/x0lMP8fIiX/HB8j/xcaHv8TFhn/DxMW/xATFv8QExb4DhEVYREVFQAMDhQADA8UAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQFAAMEBQADBAUEg0QFL0PEhX/ERQX/xMWGv8WGRz/Gyc4/yhCaf8tSHH/MEt0/zNOeP82UXv/OVR+/zhQdv8uPVT/JSw3/yMoMP8kKTL/Jiw3/ygwPP8pMT7/KjJA/yoyP/8oMD3/Jiw2/yMpMf8jKDD/Iykx/yMpMf8jKTH/Iygw/ygvOv9BU3H/TmWN/1Bmjf9SaI//VGmQ/1Vrkf9WbJL/V22T/1htk/9ZbpT/WW6U/1lulP9YbZP/WG2T/1Zskv9Va5H/U2mQ/1Joj/9NY4f/QFBr/zVBVP8wOkr/LTVD/ykwO/8nLTj/Jy02/yYsNf8mLDb/Jy02/yctN/8pMD3/LDZF/zRDWv88UXP/QFmC/z1Ygv86VX7/N1J8/zRPef8xTHb/L0py/yxHcP8mPmL/HSQu/x8iJf8dIST/GBwf/xMXG/8RFRj/EhUZ/xEVGPkOEhZjExYVAAwQFwAMEBcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRAUAA0QFAAMEBQUDREUwg8TFv8SFRj/FBgb/xgbHv8bIi3/Jj9i/y5Jcv8wS3T/M054/zZRev84U33/O1aA/zxWfv83Smn/LTlL/yYtN/8kKjL/JCky/yQpMf8kKTH/JCkx/yQpMf8kKTL/JCoy/yQqMv8lKjL/Jis0/yguOP8rMj//NkJW/0xgg/9UapH/VWuR/1dtk/9ZbpT/W3CV/1xwlv9dcZf/XXKX/15yl/9ecpf/XnKX/11xl/9ccZb/W3CV/1lvlP9YbZP/VmyS/1Vrkv9UapD/UWaL/05jhv9LXoD/Rlh3/0JTb/9AT2r/Pk1n/z5NaP8/T2v/QFFu/0JVdv9FWn//Rl6G/0Reh/9BW4X/PViC/zpVf/83Unz/NE95/zJMdv8vSnP/LEdw/yU8X/8dIyz/HyEl/x0hJf8ZHSD/FRgc/xQXG/8UFxv/EhYZ9w8TF10TFhcACw8YAAwQGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANEBQADRAUAA0PFBsOERXOERQX/xMXGv8XGh3/Gh4h/xwhJv8kOFX/Lkly/zBLdf8zTnj/NVB6/zhTff87VoD/PlmD/0Fbhf9BWX//PE5t/zRCWP8uN0f/KzM//ykwO/8pMDr/KjE8/yoyPv8sNEH/LzdF/zQ+UP87SV//Q1Nv/0pdff9SZov/V2yS/1htlP9ab5X/XHCW/11yl/9fc5j/YHSZ/2F1mf9hdZr/YXWa/2F1mv9hdZr/YXWZ/2B0mf9fc5j/XXKX/1xxlv9ab5X/WW6U/1htk/9XbZP/VmyT/1Zsk/9Va5L/VGqS/1Nqkf9SaZD/UWiQ/1Bnj/9OZo7/TGSN/0pii/9HYIn/RF2H/0FahP89WIL/OlV//zdSfP81UHr/Mk12/y9Kc/8sSHH/IzlZ/xwhKf8fIiX/HyMm/xsfIv8XGx7/Fhod/xUZHP8TFxrsERUZQxIVGQAAARgADBAYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIWFwAOERUADRAUJxATFtcTFhn/Fhkd/xoeIf8fIib/ICMn/yMySf8tSHH/MEt1/zNOeP81UHr/OFN9/ztWgP8+WIL/QVuF/0ReiP9HYYr/SWCI/0hdgf9GWXv/RVd2/0VXdf9HWXj/SFt6/0tefv9OYoT/UmeL/1Vrkf9XbZP/WG6V/1lvlf9ab5X/XHGW/15ymP9fc5j/YXWa/2J2mv9jd5v/ZHec/2R4nP9keJz/ZHic/2R3nP9jd5v/Y3ab/2J2mv9hdZr/X3OY/11yl/9ccZb/W3CW/1lvlf9YbpT/V22T/1Zsk/9Va5L/VGqS/1Nqkf9SaZD/UGeP/05ljv9LZIz/SWKL/0dfif9EXYf/QVqE/z1Ygv87VX//N1J8/zVQev8yTXb/L0pz/y1Icf8iNlX/HCEn/yIlKP8iJSn/HSAk/xodIP8XGx7/Fhkd/xMXGtMQExgjERQYAA8SGAAMEBgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACg4UAA8SFgANERUxEhUY3RUZHP8ZHCD/HyIm/yUoK/8mKSv/JC49/yxGbf8wS3X/M054/zVQev83U3z/OlWA/z1Ygv9BW4X/RF2H/0dgiv9KY4z/TWWO/09nkP9RaZH/U2qR/1Vrkv9WbJP/V22U/1dtlP9YbpT/WW6V/1pvlf9bcJb/XHGW/11yl/9fc5j/YXWa/2J2m/9jd5v/ZHic/2V5nf9meZ3/Znmd/2Z6nv9mep3/Znmd/2V5nf9leJz/ZHec/2N3m/9idpr/YHSZ/19zmP9dcpf/XHGX/1pvlv9ZbpX/WG2U/1Zsk/9Va5L/VGqR/1JpkP9QZ4//TmWN/0tjjP9JYor/Rl+I/0Ndhv9AWoT/PViC/ztVgP84U3z/NVB6/zJNd/8wS3T/LUhx/yA0T/8eISb/IyYo/yEkJ/8eIiX/Gx8i/xcbH/8VGRz/ERQYzgwPFBwNEBUADA4VAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALDxUADxMXAA4RFjwTFhrlGRwf/xwgI/8hJCj/KCsu/yotL/8lLDb/K0No/zBMdf8zTnj/NVB6/zdSfP86VX//PViC/0BbhP9DXYf/R2CJ/0lii/9MZI3/T2aP/1FokP9TapH/VWuS/1Zsk/9XbZT/WG6V/1lvlf9bcJb/XHGW/11yl/9ec5j/YHSZ/2F1mv9jdpv/ZHic/2V5nf9mep7/Z3qe/2h7nv9oe57/aHuf/2h7nv9oe57/Z3qe/2d6nv9meZ3/ZXic/2R3nP9idpv/YXWa/190mf9ec5j/XHGX/1twlv9Zb5X/WG6U/1Zsk/9Va5L/U2mR/1Boj/9OZo7/S2OM/0lhiv9GX4j/Q12G/0BahP89WIL/O1aA/zhTff81UHr/Mk13/zBLdP8sR3D/HS5H/x4hJf8hJCf/ICMm/x8iJf8bHiL/Fxse/xMXGv8PEhbRDA8UIA0QFAAMDxQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAkOFQARFBgADxIXNRQYG+AaHiH/HSAj/x0gJP8jJin/KSwv/yYrMf8oPV7/MEx1/zNOeP81UHr/N1J8/zpVf/89V4H/QFqE/0Ndhv9GYIn/SWKL/0xkjf9OZo//UWiQ/1Nqkf9Va5L/Vm2U/1hulP9ab5X/W3CW/1xxl/9dcpj/X3OZ/2B0mv9idpr/Y3ec/2V4nf9meZ7/Z3qe/2h7nv9oe5//aXyf/2l8n/9pfJ//aXyf/2l8n/9pe5//aHue/2d6nv9mep7/ZXmd/2R4nP9jd5v/YXab/2B0mv9fc5n/XXKY/1xxl/9ab5X/WG6U/1Vsk/9UapL/UWiQ/05mjv9MZI3/SWKL/0ZfiP9DXYb/QFqE/z1Ygv87VoD/OFN9/zVRe/8zTnj/MEt1/ytFbv8bKTz/HSAj/x8iJf8fIiX/HiEl/xoeIf8WGR3/ERQY/w8SFskNERUXDhEVAA0QFAAKDhIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFRcbABIVGQARExghFRgc0xgbH/8WGRz/ExYa/xcbHv8gIyf/IiYq/yQ2UP8wS3X/M054/zVQev83Unz/OlV//zxXgf8/WoT/QlyG/0Zfif9IYYv/S2SM/05mjv9RaJD/U2qR/1Vrk/9XbZT/WW6V/1twlv9ccZf/XnKY/19zmf9gdZr/Ynab/2R3nP9leJ3/Znqe/2d6nv9oe5//aXuf/2l8oP9qfKD/anyg/2p8oP9qfKD/anyg/2l8oP9pe5//aHuf/2d6nv9nep7/ZXmd/2R4nP9jd5z/Ynab/2B1mv9fc5n/XXKY/1txl/9Zb5X/V22U/1Vrkv9SaZH/T2eP/0xkjf9JYov/Rl+J/0Ndh/9AW4X/PViC/ztWgP84U37/NlF7/zNOeP8xTHb/Jj9l/xgiL/8bHiH/HB8i/x0gI/8dICP/GBwf/xMWGv8QFBf/DxIW0gwPEyAMEBQACw4SAAoOEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASFhoAEhYaABIXGxISFhq7EBQX/w0QFP8OERX/Exca/xkdIP8dICP/His9/y1IcP8zTnj/NVB6/zdSfP86VX//PFeB/z9ahP9CXIb/RV+I/0hhiv9LZI3/TmaO/1FokP9TapL/VWyT/1hulf9ab5b/XHGX/15ymP9fc5n/YXWa/2J2m/9kd5z/ZXid/2Z6nv9nep7/aHuf/2l8n/9pfKD/anyg/2p9oP9rfaD/a32g/2p9oP9qfaD/anyg/2l8oP9pe5//aHuf/2d6nv9mep7/ZXmd/2R4nP9jd5z/Ynab/2B0mv9ec5n/XHKY/1twlv9YbpX/VmyU/1Nqkv9QaJD/TWWO/0pjjP9HYIn/Q12H/0Bbhf8+WIP/O1aB/zhUfv82Unz/NE95/zFMdv8fNVX/Fhwj/xkcIP8aHiH/HB8j/xodIf8UFxv/EBQX/xAUF/8OEhXxCw8SVw0RFAAKDREACQsPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQFAANEBUADREWEAwQE7UMDhL/DRAU/xIVGf8XGh7/Gx8i/x4hJP8bIiz/KD9j/zNOeP81UHr/N1J8/zpVf/88V4H/P1qE/0Jchv9FX4j/R2GK/0pjjf9NZY7/UWiQ/1Nqkv9WbJT/WG6V/1twl/9dcpj/X3OZ/2B1mv9idpv/Y3ec/2V4nf9mep7/Z3qe/2h7n/9pe5//aXyg/2p8oP9qfaD/a32g/2t9oP9rfaD/a32g/2p9oP9qfaD/anyg/2l8n/9oe5//Z3ue/2d6nv9meZ7/ZXid/2R3nP9idpv/YXWa/190mf9dcpj/W3GX/1lvlv9XbZT/VGuT/1Fpkf9NZo//SmOM/0dgiv9DXoj/QFuF/z5Zg/87VoH/OVR//zdSfP80UHr/LUhx/xcnPP8WGh3/GBwf/xkdIf8YHCD/ExYa/w8SFv8PEhb/EBMX/w4SFf8LDhKxCg0RFQsOEgALEBQADA0TAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGDA4ABQsOAAoNEgAKDRItCw4S2g0QFP8SFRn/Fxoe/xwgI/8hJCj/IiUo/x0hJf8hM07/Mk13/zVQev83Un3/OlV//zxXgf8/WoT/QVyG/0RfiP9HYYr/SmON/01lj/9RaZD/VGuS/1ZtlP9Zb5b/W3GX/11ymP9gdJr/YXab/2N3nP9keJ3/ZXmd/2Z6nv9ne57/aHuf/2l8n/9pfKD/anyg/2p9oP9rfaD/a32g/2t9oP9rfaD/an2g/2p8oP9qfKD/aXyf/2h7n/9ne57/Z3qe/2V5nv9leJ3/ZHec/2J2m/9hdZv/X3Sa/15zmf9ccZj/WW+W/1dtlf9Ua5P/UWmR/01mj/9KY43/R2CK/0NeiP9AW4X/PlmD/zxXgf85VH//N1J9/zRQev8jOl3/Exsk/xYaHf8XGh7/FRgc/xATF/8NEBT/DREU/w4SFf8PExb/DhIV/wwPE+4LDhJLCw8TAAsOEgAMDxUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgMEAAJDREADxAUAAsOEmENEBP2ERQY/xYZHP8aHSH/HyMm/yQnKv8kJyr/ICMm/x4pOP8uSHD/NVB7/zdSff86VYD/PFeB/z9ahP9BXIb/RF6I/0dhiv9KY43/TWWP/1FpkP9Ua5P/Vm2U/1lvlv9ccZj/XnOZ/2B0mv9idpv/Y3ec/2R4nf9leZ3/Znqe/2d6nv9oe5//aXuf/2l8oP9qfKD/anyg/2p9oP9qfaD/a32g/2p9oP9qfaD/anyg/2l8oP9oe5//aHuf/2d6nv9mep7/ZXmd/2R4nf9jd5z/Ynab/2F1mv9fdJn/XXKY/1txl/9Zb5b/Vm2V/1Rrk/9QaJH/TWWP/0pjjf9GYIr/Q16I/0Bbhv8+WYT/PFeC/zlVf/83Un3/LUhx/xYlO/8SFRn/ERUY/w8SFv8MDxP/Cw8S/w0QE/8NERT/DhEV/w4SFf8OERX/DRAU/g0QFIgMDxYEDRAVAAwPFQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQwNAAsPEwAJDREHDRATmQ8TFv8TFxr/Fxoe/xsfIv8hJCf/JSgr/yUoK/8iJSj/HSEo/yY7W/81UHv/N1J9/zpVgP88V4L/P1qE/0Fchv9EXoj/R2CK/0pjjf9NZY//UGiQ/1Nrk/9WbZT/WW+W/1txmP9ec5n/YHSa/2F2m/9jd5z/ZHic/2V5nf9mep7/Z3qe/2h7nv9oe5//aHuf/2l8oP9pfKD/anyg/2p8oP9qfKD/anyg/2p8oP9pfKD/aXuf/2h7n/9nep7/Znqe/2V5nf9keJ3/Y3ec/2J2m/9hdZv/YHSa/15zmf9ccpj/WnCX/1hulv9WbJT/U2qS/09okf9MZY//SWON/0Zgiv9DXoj/QVyG/z5ZhP86VYD/NVB6/yxGb/8ZLEf/DBIZ/wsOEf8KDRH/Cg0R/wsOEv8MDxP/DRAT/w0RFP8OERX/DhEV/w0RFP8NERT/DhIVxA4RFh0OERYAAQoOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKDBIADA8TAAsNEhEOERW5ERQY/xUYHP8YHB//HSAj/yIlKf8mKSz/JSgs/yMmKf8fIiX/HSxA/zFMdf84U33/OlWA/zxXgv8/WoT/QVyG/0ReiP9GYIr/SWON/0xlj/9PZ5D/U2qS/1VslP9Yb5b/W3GX/11ymP9fdJr/YHWb/2J2m/9jd5z/ZHid/2V5nf9meZ7/Z3qe/2d6nv9oe5//aHuf/2l7n/9pfKD/aXyg/2l8oP9pfKD/aXyf/2l7n/9oe5//Z3qe/2d6nv9leZ3/ZHid/2N3nP9jd5v/YXWb/2B0mv9fc5n/XXKY/1txmP9Zb5b/V22V/1VrlP9SaZL/TmeQ/0tljv9IYoz/RV+J/0Fchv89V4H/N1F7/y5Jcf8iPWT/FCdC/woQGP8JDA//Cg0Q/woNEf8LDhL/Cw4S/wwPE/8NEBT/DREU/w4RFf8NERT/DRAU/w4RFf8QFBfwDxMXUhIVGQALEBQABwcLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwPFQANEBUADA8UGw8SFsYSFRn/Fhkd/xodIP8eIST/IyYp/yYpLf8mKSz/IyYp/yAjJf8ZICj/Izla/zZSfP86VYD/O1eC/z5ahP9AW4b/Q16I/0Zgiv9IYoz/S2SO/05nkP9SaZL/VGuU/1dulf9ZcJf/XHGY/15zmf9fdJr/YXWb/2J2m/9jd5z/ZHic/2V4nf9leZ7/Znqe/2d6nv9ne57/aHuf/2h7n/9oe5//aHuf/2h7n/9oe5//aHuf/2d6nv9mep7/ZXmd/2R4nf9jd5z/Y3eb/2F2m/9gdJr/X3OZ/11ymf9ccZj/WnCX/1hulv9WbZX/U2uT/1Bokf9MZI7/Rl+J/0Fag/87VH3/NE12/yxGbv8hPGP/Fi9T/wwdMv8JDxb/CQwP/woNEP8KDRH/Cw4S/wsPEv8MDxP/DRAT/w0QFP8NEBT/DREU/w0RFP8NEBP/DhEV/xMWGv8RFRiJCg4RAw8SFgAKDhMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBAXAA4RFgANEBYYEBMXwhMXGv8XGh7/Gx4h/x8iJf8jJyr/Jiks/yUoLP8iJin/HyMm/xseIf8WITH/KUNq/zlVgP87V4L/PlmE/0Bbhv9CXYj/RV+K/0hijP9KZI7/TWaQ/1Bokf9Ta5P/Vm2V/1hulv9acJf/XHKY/15zmf9fdJr/YHWb/2J2m/9jd5z/Y3ec/2R4nf9leZ3/Znme/2Z6nv9nep7/Z3qe/2d7nv9oe5//aHue/2d6nv9nep7/Znqe/2V5nf9keJ3/Y3ec/2N3m/9hdpv/YHWa/190mv9dcpn/W3GY/1lvlv9XbZT/VGuS/1BokP9MZIz/Rl6G/z1Wff80TXT/LEVs/yQ+ZP8bNlz/Ei5U/wskQ/8IFSb/CQwR/woMEP8KDRH/Cw4R/wsOEv8MDxP/DRAT/w0QE/8NEBP/DRAT/w0QFP8NERT/DRAU/w0QE/8PEhb/FRgc/xMWGrYMDxMRDhEVAAkLEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMEBYADxMWAA4RFQ4RFRi1FBgb/xgbH/8cHyL/HyIm/yQnKv8lKCz/JCcr/yImKf8fIyb/HB8i/xYbIP8XJjv/LUdv/ztXgv89WYT/P1uG/0Jdh/9EX4n/R2GL/0ljjf9MZY//T2eR/1Jpkv9Ua5T/Vm2V/1lvlv9bcJf/XHKY/15zmf9fdJr/YHWa/2F2m/9idpv/Y3ec/2R4nP9keJ3/ZXmd/2Z5nv9mep7/Z3qe/2d6nv9nep7/Znqe/2Z6nv9leZ7/ZXie/2R4nf9id5z/YXWb/190mv9ccZj/WW6U/1Rqkf9PZYz/SmCH/0ZdhP9CWYD/PlV8/zhQd/8vR27/Iz1j/xk0Wf8RLlP/DCpP/wgmSf8HHTf/CBAa/wkMD/8KDRD/Cw4R/wsOEv8MDxP/DA8T/w0QE/8NEBP/DA8T/wwPE/8MDxP/DRAU/w0QFP8NEBT/DRAT/w8TFv8XGh7/FRkdzhAUGSARFRkADxIYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwQGAARFRkADxMYBRIWGZMVGBz/GRwf/xwfI/8gIyb/JCcq/yUoK/8kJyr/IiYp/x8jJv8aHiH/FRgc/xEVGv8WJDf/LEVq/ztXgv8/W4b/QVyH/0Neif9GYIr/SGKM/0tkjv9NZpD/UGiR/1Nqk/9VbJT/V26V/1lvlv9bcJf/XHGY/11ymf9ec5n/X3SZ/2B1mv9hdpv/Y3ec/2N4nf9id5z/YHSa/15yl/9ccJX/W2+V/1pvlP9ZbpP/WG2R/1Zpjf9RZIb/TmGD/0xfgv9NYIP/Sl6B/0RYfP8+U3b/OU5x/zNJbP8uRGf/K0Bk/yY9YP8iOl//HDZb/xMvVf8LKU7/CCZK/wcjRf8HHTj/CBUl/wkOFP8JDA//Cg0Q/woNEP8KDRH/Cw8T/wwPE/8NEBP/DRAT/wwPE/8MDxP/DA8T/wwPE/8NEBP/DRAU/w0QFP8NEBP/EBMW/xkcIP8YGx/fFRgcLBUZHQAUGBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBASABEVGwAWGBkAExYaYhUYHPcZHCD/HSAk/yEkJ/8kJyr/Iycq/yImKf8hJCf/HB8j/xQXG/8PEhb/DhEU/w0RFf8RGyj/JDhY/zdSe/8/Wob/Q16J/0Vgiv9HYYz/SmOO/0xlj/9OZ5H/UWmS/1Nrk/9VbZX/WG6W/1lvl/9acJf/WW+W/1Zsk/9SZ47/TmOH/0tfg/9JXX//RVd3/zxOa/8zQ17/LDlP/yk1Sv8oNEn/JjNI/yMvRP8fKj3/GyQy/xcdJ/8VHCX/FRwm/xYdJ/8VGyb/Ehkk/xEYIv8QFyH/DxYf/w0UHv8NFB7/DBMe/woVJP8IGCz/Bxoy/wcXK/8HFCX/CBAa/wgMEf8JCw7/CQwP/woNEP8KDRD/Cg0Q/woNEf8LDhL/DRAT/w0QE/8MDxP/DA8T/wsPEv8LDhL/Cw8S/wwPE/8NEBP/DRAT/w0PE/8QExb/HB8i/xoeIegXGh40FxseABYaHQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFRgaABMXGwATFxstFRkc2hodIP8eIiX/IiUo/yIlKf8hJSj/ICMm/xwfI/8UGBv/DhEV/w0QFP8NERT/DREU/wwQE/8OExv/FiU7/yM5W/8wSXD/OVV+/0Bbhf9FX4n/R2GL/0hii/9JYov/SWKL/0lhiv9HYIj/RV2F/0BYf/84TnL/LkFe/yMxSP8bJTT/Fh8s/xQbJv8RFx7/DhMZ/wwQFf8KDRH/Cg0Q/wkMD/8JDBD/Cg0R/wwPEv8NEBT/DhEU/w4SFf8OEhX/DhEU/wwOEv8KDRD/CQwP/wkMD/8JDA//CQsP/wkLDv8JCw//CQsP/wkLDv8ICw//CAoN/wgKDf8ICg3/CAoN/wgKDv8ICw7/CQwP/wkMD/8KDRD/Cg0Q/woNEf8LDhL/Cw4S/wsOEv8LDhL/Cw4R/wsOEf8LDhL/DA8T/wwPE/8NDxP/DA8T/xETF/8fIib/HSEk5RodITEaHiEAGh0hAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATFxsAFBgcABIXGwkWGh2aGx4h/yAjJv8hJCf/ICMn/x4hJf8aHSH/FBcb/w4RFP8MDxP/DREU/w4RFf8OERX/DhEV/w4RFf8LDxP/ChAY/w4XJf8UJTz/HDJR/yE6X/8lP2X/JT5k/yE5XP8fM1L/Gi1J/xQmPv8SIjj/EB4x/wwVIf8KDxX/CQ0Q/wkMD/8JDBD/Cw4S/w8TFv8SFBj/ERQY/xAUF/8PEhb/DREU/w0QE/8MDxP/DhEV/xIWGf8UFxv/FBcb/xQXG/8TFhn/DxIW/wwPE/8LDxL/Cw4S/woOEf8KDRH/Cg0R/woNEP8KDRH/Cg0R/woNEP8JDA//CAsO/wgLDv8JCw//CQsP/wgLDv8ICw7/CAsO/wgLDv8ICw//CQwP/wkMD/8JDA//CQwQ/wkMEP8KDRD/Cg0R/wsOEf8LDhL/DA8T/wwPE/8MDxP/DxIW/yEkJ/8fIyfTGR0iIxoeIwAZHSIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABIVGQAPFBkAFxoeABMWG1oZHCD1HiEl/x4hJP8bHiH/Fxod/xIVGf8NERT/Cw4S/w0QFP8OEhX/DxIW/w8TFv8RFBj/DhEV/wsOEv8KDRD/Cg0Q/woNEv8KEBb/ChMg/woWJv8JEyL/CA8Y/wgNE/8JDRL/CQwQ/woNEf8LDRH/Cg0Q/wsNEf8LDhL/Cw4S/wsOEv8LDhL/DhIV/xUYG/8XGh7/Fhod/xQYG/8SFhn/EBMX/w4SFf8NEBT/ERQY/xYaHv8WGh7/Fhoe/xUZHP8QFBf/DREU/w0QFP8MDxP/DA8S/wsOEv8LDhL/Cw4R/woNEf8LDhH/Cw4R/woNEf8KDRD/CQwP/wkMD/8JDA//Cg0Q/woNEP8JDBD/CQwP/wkMD/8JCw//CQsP/wkLD/8JDA//CQwQ/woNEP8KDRH/Cw4S/wsOEv8LDxL/DA8T/wwPE/8PEhX/ISQn/yAjJ7UUGR8QGBwhABIWHgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADQANAAsPEwASEhUADA8TbhIVGfoWGR3/FRgb/xMWGf8QExb/DBAT/wwPEv8NEBT/DhIV/w8SFv8RFBf/EhYZ/xEUGP8MDxP/Cg4R/wsOEv8MDxL/DA8T/wwPE/8MDxP/Cg0Q/wkMD/8KDBD/Cg0R/wsOEf8MDxP/DhEV/w4RFf8MDxP/DA8T/wwPE/8NEBT/DA8T/wwPE/8MEBP/EhUZ/xgcH/8aHSH/GBwg/xYaHf8UGBv/EhUZ/w8SFv8OERT/FRgb/xgcH/8YGx//Fhoe/xEUF/8OERX/DhEV/w0QFP8NEBT/DA8T/wwPE/8LDhL/Cw4S/wsOEv8LDhL/Cw4S/wsOEv8KDRH/Cg0Q/wkMEP8KDBD/Cg0R/woNEf8KDRH/Cg0R/woNEf8KDRH/Cg0R/woNEf8LDhH/Cw4S/wsOEv8LDxL/Cw8S/wwPE/8MDxP/DRAT/w8SFv8gIyb+HyMmhwYMEQMWGh4AAAALAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMERcACxAUAA0VGwIKDRGKDA8T/w8SFv8NEBT/DBAU/wsOEv8LDhL/DREU/w8SFf8PExb/ERQX/xMWGv8TFxr/DxIV/wsOEv8LDxL/DBAT/w0QFP8NERT/DhIV/w0QFP8KDRH/Cg4R/wsPEv8MDxP/DREU/xATF/8SFRj/EBMX/w0RFP8NERT/DxIV/w8TFv8PEhX/DREU/w0QFP8OEhX/FRgc/xoeIf8cHyL/Gh0h/xcbHv8WGRz/Exca/w8SFv8PExb/Fxse/xgcH/8XGh7/ERQX/w8SFf8PEhb/DhIV/w4RFf8NERT/DRAU/wwPE/8MDxP/Cw4S/wwPE/8NEBT/DRAU/wwPE/8LDhL/Cw4R/woNEP8KDRD/Cg0R/woNEf8LDhH/Cw4R/wsOEv8LDhL/Cw4S/wsOEv8LDxL/DA8T/wwPE/8MDxP/DA8T/w0QE/8NEBT/DxIW/x4hJNYdISQ1JSgrAAkNEQAKDhcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoNEgAJDREACg0TBQkMEJUJDBD/Cg0R/woNEP8KDRD/Cg0R/w0QFP8PEhb/EBMW/xEUGP8TFhr/FRgc/xEUGP8MDxP/Cw8S/w0QFP8OERX/DxIW/xATFv8QFBf/DRAU/wsOEf8MEBP/DhEV/xATFv8SFRn/FBgb/xUZHP8SFRn/DxIV/w8TFv8RFRj/EhUZ/xIVGf8QFBf/DxIV/w4RFf8RFBj/Fxse/xwfIv8dICP/Gh4h/xgcH/8XGh7/FBcb/w4SFf8SFhn/Fxsf/xYaHf8RFBf/EBMW/xAUF/8QFBf/EBMX/w8TFv8PEhX/DhEV/w0RFP8NEBP/DA8T/w0QFP8OEhX/DhEV/w0RFP8MDxP/Cw4S/wsOEf8KDRH/Cg0Q/woNEf8LDhH/Cw4S/wsOEv8LDxL/DA8T/wwPE/8MDxP/DA8T/wwPE/8NEBP/DRAU/w0RFP8PEhb3GBwgcCcvMAMdISQAERUYAAgMFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQ0RAAkNEQAJDREOCQwPsAgLDv8ICw7/CQsP/woNEf8NEBT/DxIW/xATFv8RFBj/FBcb/xYZHf8TFhr/DhEU/wsOEv8NEBT/DxIW/xATF/8RFBj/EhUZ/xEVGP8MDxP/DA8T/w8TFv8RFRj/Exca/xYaHf8XGx//GBsf/xMXGv8PExb/ERQY/xQXGv8UGBv/FBgb/xQXG/8SFRj/EBMX/xAUF/8VGBz/Gh0h/x0hJP8dIST/Gx4i/xkdIP8YGx7/EhYZ/w4RFf8VGBz/Fhkd/xEUGP8RFBj/ExYZ/xMWGv8TFhn/EhUZ/xEUGP8QFBf/DxMW/w8SFv8OERX/DRAU/w8SFf8QExf/EBMW/w8SFf8NERT/DA8T/wwPE/8LDhL/Cg0R/woNEf8KDRH/Cw4R/wsOEv8LDhL/DA8T/wwPE/8MDxP/DRAU/w0RFP8OERX/DhIV/w8TFuEQFBgxERQYABUZGgAcIB8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJDREACQ0RAAkNERMIDA++CAoN/wgLDv8LDRH/DRAU/w8SFf8PExb/ERQX/xMXGv8WGR3/FBgb/w8SFv8MDxP/DA8T/w8SFv8RFRj/ExYa/xQXG/8UFxv/EBQX/wsPEv8PEhb/ExYa/xQYG/8XGh7/GR0g/xkdIf8ZHSD/Exca/xATF/8SFRj/FRgc/xYZHf8WGh3/Fhod/xUYHP8TFhr/EhUZ/xQXG/8YGx//HB8i/x8iJv8dIST/Gx8i/xkdIP8WGh3/DxIV/xEUF/8VGRz/EhUZ/xIVGf8VGBz/FRgc/xUYHP8VGBz/FBcb/xMWGv8SFhn/EhUY/xEUF/8PExb/DxIV/xAUF/8SFRn/EhUY/xAUF/8PEhb/DhEV/w4RFP8NEBT/DRAU/w0QE/8MDxP/DA8T/wwPE/8MDxP/DRAU/w0QFP8NERT/DhEV/w4SFf8PExb/EBQX0REUGCQRFBgAERUZAAwQEQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoOEgAKDhIACg4SFAoNEcEKDRD/DA8S/w4RFf8PEhb/DxMW/xATF/8TFhr/FRkc/xUYHP8QExf/DA8T/wwPE/8PExb/EhYZ/xQXG/8VGRz/Fhkd/xQYG/8OERX/DRAU/xMWGv8VGR3/Fxoe/xodIf8bHiL/Gh4h/xkdIP8TFxr/EBMX/xIVGf8WGR3/Fxse/xgbHv8YGx//Fxoe/xUYHP8UFxv/FBgb/xYaHv8aHSH/HSEk/x8iJv8dICT/Gx8i/xkcIP8SFRn/DRAU/xMXGv8TFhr/FBcb/xcbHv8YGx//GBsf/xcbHv8XGh7/Fhkd/xUYHP8UGBv/FBca/xMWGv8SFRj/ERQX/xIVGP8UFxr/FBcb/xMWGv8SFRn/ERUY/xEUGP8RFBf/EBMX/xATFv8PEhb/DxIW/w8SFv8PEhb/DxMW/w8TFv8QExb/EBQX/xEUGP8RFRmtERUZDhEVGQAQFBkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADREVAA4RFQANERUSDhEVvA8SFf8PExb/EBMW/xATFv8QExf/EhYZ/xUYHP8UGBz/EBMX/w0QE/8NEBT/EBMW/xMWGv8VGBz/Fhod/xcbHv8WGh3/EhUZ/wwPEv8RFRj/Fxoe/xgbH/8aHSH/HCAj/xwfI/8bHiL/GR0g/xMWGf8QFBf/EhUZ/xYaHf8YGx//GRwg/xkdIP8ZHCD/Fxoe/xYZHf8VGRz/Fhoe/xgcIP8bHiL/HyIm/x4iJf8cICP/Gh4h/xYZHf8NERT/DxMW/xMXGv8VGRz/Gh0h/xseIv8bHiL/Gh4h/xkdIP8YHB//GBsf/xcaHv8WGh3/Fhkd/xUZHP8UGBv/ExYa/xMXGv8VGBz/Fhkd/xYZHf8WGR3/FRgc/xUYG/8UFxv/ExYa/xIWGf8SFRn/EhUY/xEVGP8SFRj/EhYZ/xMWGf8TFhr/ExYa/hMWGoMRGR0CEhcbABIYGwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOExgADhMYAA4TGAsQFBelERQX/xEUF/8QFBf/ERQX/xMWGf8VGBz/FBcb/xATF/8NEBT/DRAU/xATFv8TFhn/FRkc/xcaHv8YGx//Fxsf/xQYG/8NEBT/DhEU/xYZHf8ZHSD/Gh4h/x0gJP8eISX/HCAj/xseIv8ZHCD/EhUY/xEUF/8TFhn/Fxoe/xkcIP8aHSH/Gx4i/xodIf8ZHCD/Fxse/xcaHv8XGx7/GBsf/xkcIP8dIST/HyIm/x0gJP8bHyL/GBwg/xAUF/8NEBP/EhUZ/xYZHf8dICT/HyIm/x8iJf8eIST/HCAj/xsfIv8aHiH/GR0g/xkcIP8YHB//GBsf/xgbH/8XGx//Fhod/xYaHf8XGh7/GBsf/xgcH/8YGx//GBsf/xcbHv8WGh3/Fhkd/xUYHP8VGBv/FBgb/xUYHP8VGBz/FRkc/xUYHP8VGBvvExcbSxUXGwAQGB0AERkdAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0RGAAOEhgACg4ZAhATF4oRFBj/ERUY/xIVGP8TFhr/Fhkc/xQYG/8QFBf/DREU/w4RFf8QFBf/ExYa/xYZHP8XGx7/GBwf/xgbH/8VGRz/DhIV/wwPEv8UFxr/GR0g/xsfIv8dIST/HyMm/x8iJf8dICT/Gx8i/xcbHv8RFRj/EBQX/xMWGf8YGx//Gh4h/xsfIv8cHyP/HCAj/xseIv8ZHSD/GBwf/xgbH/8YHB//GRwg/xsfIv8eISX/HSEk/xwfI/8aHSH/FBcb/w0RFP8OERX/FBgb/x0gI/8jJir/IyYp/yIlKf8hJCf/HyIm/x0hJP8cICP/HB8j/xseIv8bHiL/Gx4i/xseIv8bHiL/Gx4i/xseIv8aHiH/Gh0h/xodIf8aHSH/GR0g/xkcIP8YHB//GBsf/xcbHv8YGx7/GBse/xgbH/8YGx7/Fhod/xUZHL0UGB0YFRgdABQYHgARGBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRIYABEUGgAUFxoAEhYaUxMXGu8VGBv/FRkc/xYZHf8UGBv/ERQX/w8SFf8QExf/EhUZ/xQXG/8WGR3/GBsf/xkcIP8YGx//FRgc/w4RFf8LDhH/ERQY/xkcIP8cHyP/HSEk/yAkJ/8hJCj/HyIm/x0gJP8bHyL/Fhkd/xEUF/8QFBf/Exca/xkcIP8bHyL/HSAk/x4iJf8fIib/HSEl/xsfIv8aHiH/GR0g/xkcIP8YHCD/GR0g/x0gJP8dICT/HB8j/xseIv8XGh7/EBQX/w0QE/8SFRj/Gh0g/yQnKv8oKy7/Jyot/yYpLP8lKCv/IyYq/yElKP8gJCf/HyMm/x8jJv8fIyb/HyMm/yAjJ/8gJCf/ISQo/yEkKP8hJCf/ICMn/yAjJ/8fIyb/HiIl/x0hJP8dICP/HCAj/xwfI/8cHyL/Gh4h/xkcIP8XGh72FhoeahUaLwAWGh8AFRkgABAYHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOEhgAERUZABMYGwATGBwaFRkcvxYZHf8WGR3/FRgc/xMWGv8RFRj/EhYZ/xQXG/8VGBz/Fxoe/xkcIP8ZHCD/Fxse/xMWGv8NEBT/Cw4R/xAUF/8ZHCD/HCAj/x4hJf8hJCf/IyYq/yIlKP8gIyb/HiAk/xoeIf8UFxr/EBQX/xEUGP8UGBv/Gx4h/x0hJP8fIyb/ISUo/yIlKf8hJCj/HyIl/xwgI/8bHiL/Gh4h/xkdIP8YHB//Gx4i/xwfI/8bHyL/Gx4i/xkcIP8UFxr/DhIV/w4SFf8VGBz/ICMm/yotMP8sLzL/Ky4x/yotMP8pLTD/KCsv/ycqLv8mKS3/Jiks/yYpLP8mKSz/Jikt/ycqLf8nKi7/Jyou/ygrLv8oKy//KSwv/yksMP8pLTD/KSwv/ygsL/8nKi3/JCcr/yAjJ/8cICP/GRwg/xcbH7gXHCEZFxsgABUZHQAVGSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANERYAExgbAAwUFwIVGRx0Fhkd+xcaHv8XGh3/Fhkd/xYZHf8XGh7/GBse/xgcH/8ZHCD/GBwg/xYZHf8RFBj/DA8T/wwPEv8SFRn/GRwg/x0gJP8eIiX/ISQo/yQoK/8lKCv/IiUp/yAjJ/8dICT/GBsf/xIVGP8QFBf/ERUY/xYZHP8cICP/ICMn/yIlKf8kKCv/Jikt/yQoK/8hJSj/HyMm/x0gJP8bHyL/Gh0h/xgbH/8aHSD/Gx4i/xseIv8bHiL/Gh0h/xYaHf8SFRn/DhEV/xEUF/8ZHB//Jiks/y4xNP8wMzb/MDM2/zAzNv8wMzb/LzI1/y8yNf8uMTX/LjE0/y4xNP8uMTT/LjE1/y4xNf8uMTT/LjE0/y8yNf8vMjX/LzI1/zAzNv8wMzb/MDM2/y4xNP8pLC//IiYp/xwgI/8ZHCDiGBwgSRcWFgAYHiQAGB0lABUZIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4SFwARCQUAFxseABcbHyEYHCCyHCAj/h8jJv8eIST/Gx8i/xoeIf8aHSH/GRwg/xcaHv8TFhr/DxIV/wwPE/8PEhX/FRgc/xseIv8eIST/HyIm/yElKP8lKCz/Jyot/yUoLP8iJin/HyMm/xwfI/8VGBz/ERQY/xEUGP8SFhn/Fxse/x8iJv8jJyr/Jiks/yksL/8qLTD/KCsu/yQoK/8hJSj/HyMm/x0hJP8bHiH/Fxse/xkcIP8aHSH/Gh4h/xseIv8bHyL/GBwf/xUZHP8RFRj/DxMW/xIWGf8dICP/Ky4x/zI0N/80Njn/NDc6/zU4O/82OTz/Njk8/zc5PP83OTz/Nzk8/zY5PP82OTz/Njg7/zU4O/81ODv/NTc6/zU3Ov81Nzr/NTc7/zQ3Ov8zNjn/MDM2/yotMP8iJSj/HB8j7hoeImwbHyYFGh4jABgdIwAYHycAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhIWABUcIQAdJSoAFhkdABofJC8cICTNISUo/yAjJ/8bHyL/GRwg/xcaHf8UFxv/ERQX/w4SFf8PEhb/FBcb/xkdIP8dISX/HyMm/yAkJ/8jJin/Jyot/yksL/8oKy7/JSgs/yIlKP8eISX/GRwg/xMWGv8RFRj/EhUZ/xMXGv8ZHSD/IyYq/ycqLv8qLTD/LTAz/y0wM/8qLTD/Jyot/yQoK/8hJSj/HyIm/xoeIf8XGh7/GBwf/xkcIP8aHSH/Gx8i/x0gJP8bHiL/GBwf/xUYHP8SFhn/EBQX/xEUGP8dICT/LTAz/zU3Ov83Oj3/OTs+/zo8P/87PUD/Oz5B/zw/Qf88P0H/PD9B/zw+Qf87PkH/Oz1A/zo9QP86PUD/Ojw//zk8P/85Oz7/ODo9/zU4O/8xMzb/KCsv/x8iJvgbHiKGGyAlChoeIgAZHCAAGR0jAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGB4iABogJAAVGyAAFB4pAhMXG4AUGBv8Fhkc/xYZHf8WGR3/FRgc/xQYG/8VGBz/Fxse/xseIv8fIib/ISQo/yIlKP8jJin/JSgr/ygsL/8rLjH/Ki0w/ygrLv8kJyv/ICQn/xsfI/8VGRz/ExYZ/xIVGf8TFhr/FBgb/x0gJP8oKy7/LC8y/y4xNP8wMzb/LzI1/ywvMv8pLC//Jykt/yQnKv8gIyf/GRwg/xYaHf8XGx7/GRwg/xodIf8cHyP/HiIl/x0hJP8aHiH/GBwf/xYaHf8VGBv/ERQY/w4RFf8ZHCD/Ky0w/zU4O/86PD//PD5B/z1AQv8+QEP/PkFE/z9BRP8/QUT/P0JF/z9CRf8/QUT/PkFE/z5BQ/8+QEP/PT9C/zw+Qf86PD//Njk8/y8xNf8kJyvuHCAkihgdIhUbICMAISgiAB4jKgAQCBYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAZHyMABAcLAAwQFQAECRACDxIWgxMWGv4ZHB//HiEk/yAjJ/8hJCj/IiUo/yMmKf8kJyv/JSgs/yUoLP8lKCv/Jiks/ygrL/8sLzL/LTAz/y0vMv8qLTD/Jyot/yMmKf8dIST/GBsf/xQXG/8TFhr/ExYZ/xMWGv8WGR3/IiYp/y0wM/8wMzb/MjU4/zM2Of8wMzb/LS8y/yotMP8oKi7/JScr/x4hJf8XGx7/Fhkc/xgbH/8ZHCD/Gh4h/x0gJP8hJSj/ISQo/x0hJP8bHiL/Gh0h/xgcH/8WGR3/ERQY/wwPE/8RFBf/ICMm/y8xNf84Oj3/PD9C/z5BRP8/QkX/QEJF/0BDRv9AQ0b/QUNG/0FDRv9AQ0b/QENF/z9CRf8+QUT/PT9C/zk8P/8yNTj/KCwv0iAkKGYcISULGx8kACAkIQAXGyMAGh4hAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPExcADxMXAAUKDwMSFhqJGh4h/yYpLP8sLzL/LTAz/ywvMv8rLjH/Ki0w/yotMP8pLC//KSwv/yotMP8tMDP/LzI1/zAzNv8vMjX/LS8y/yksL/8lKCz/HyMm/xodIf8VGRz/FBcb/xMWGv8TFhr/FBcb/xseIf8qLTH/MjU4/zQ3Ov82ODv/NDc6/zAyNf8sLzL/Ki0w/ycqLf8iJSj/Gh0h/xUZHP8WGRz/GBwf/xkdIP8bHiL/ICMn/yUoK/8kKCv/ISQo/x4hJf8dIST/Gx8i/xodIf8XGx7/ExYZ/w0QFP8LDhL/EhUY/x0gJP8pLC//MjU4/zg7Pf88PkH/PkFE/z9CRf9AQ0b/QUNG/0FDRv9AQ0b/P0FE/zs+Qf80Njr/LC8y9iUpLLchJio3DhkfARwhJAAkJCQAGR4jABUcKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABEVGgAQFBkA////ABYZHXAeIiX6KSwv/y8yNf8wMzX/LzI1/y8yNf8vMjX/LzI1/y8yNf8wMzb/MjU4/zM2Of8zNjn/MTQ3/y4xNP8rLjH/Jyot/yEkKP8aHiH/Fxoe/xUYG/8UFxv/Exca/xQXGv8WGR3/JCcq/zI1OP82OTz/Nzo9/zc6Pf8zNjj/LjE0/ysuMf8oKy7/JCcq/xseIv8XGx7/Exca/xcaHv8ZHCD/Gh0h/x0gJP8jJyr/KSwv/ygrLv8lKCv/IiUp/yElKP8eISX/HB8j/xseIv8ZHCD/FBgc/w8SFv8KDhH/Cg0R/w0QFP8TFhn/Gh0g/x8iJv8mKSz/Ky0x/y0vM/8uMTT/LjE0/yosMP8iJSj/Gh0h/xEUF/8QExfKEhUZNgAAAAIOEhYAAAAAAAoOEgAKDxIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhAYAAQDDwAcHyMAFxofQB0gJOgkJyv/LTAz/y8yNf8sLzL/LC8y/zI1OP83Oj3/ODo9/zg6Pf83Oj3/Njg7/zM2Of8wMzb/LC8y/ycqLf8hJCf/Gx4h/xcaHf8VGRz/FRgb/xQXG/8UFxr/FRgc/x4iJf8wMzb/ODo9/zk8P/85PD//Njk8/zAyNf8rLjH/KCsu/yUoK/8cICP/Fxse/xYZHf8UFxv/GRwg/xoeIf8cHyL/ISQn/ygrL/8sLzP/LC8y/ygrL/8mKSz/Jikt/yElKP8eISX/HiEl/x0gJP8aHiH/Fhkd/xAUF/8MDxP/Cw4S/wsOEv8LDxL/DRAU/xAUF/8SFRn/EhYZ/xEVGP8PEhb/Cw4S/wkMEP8ICw//CQsP/wkMD/MJCw/DCAsOegcKDhkKDREAAgYJAAgLDwAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPERgAFhkfABkdIgAZHSIOGx8jmh4iJfwqLTD/MDM2/yQnKv8dISX/ICQn/y4xNP82ODv/Njg7/zU4Ov8yNTj/LzE1/yosMP8kJyv/HiEl/xkcIP8XGh7/Fhkd/xUZHP8VGBv/FBcb/xUZHP8eIST/LzI1/zk8P/87PUD/Oz5A/zk7Pv8yNDf/Ky4x/ygrLv8mKCz/HiEk/xYZHf8YGx//Exca/xgbH/8bHiL/HB8j/x8iJf8lKCz/LTAz/zAzNv8vMjX/Ky4x/yksMP8rLjH/JSgs/x8iJv8eIiX/IiUo/yMmKf8eISX/Fxse/xIVGf8PEhb/DhEV/w4SFf8RFBf/EhUZ/xIWGv8RFBj/DREU/wsOEv8KDhH/Cw8S/w0QFP8OERX/DhIW/w4RFf8NEBT5Cg4SowkMEB4MDxQAAAAAAAwPEwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwMFAAACQAADhcZACEjKAAbICQjGx8juyMnKv8xNDf/Ki0x/yAjJ/8aHiH/HyIm/yksL/8uMTT/LTAz/yksL/8jJir/HyIm/xsfIv8ZHSD/GBsf/xcbH/8XGh7/Fxoe/xYaHv8ZHCD/IiUp/zE0N/87PUD/PT9C/zw/Qv87PUD/MzY5/yotMP8mKSz/JCcr/x8iJf8WGh3/GRwf/xgbH/8WGR3/HB8j/x0gJP8eIiX/IyYq/ywvMv8yNTj/MzY4/zI0N/8tMDP/LTAz/y8yNf8qLTD/IiUo/x0hJP8gJCf/KCsu/yotMP8iJSj/GR0g/xUYHP8TFxr/Exca/xQYG/8UGBv/ExYa/w8TFv8NEBT/DRAU/w8SFv8SFRj/Fhkd/x0gJP8kJyr/Jyot/yUoK/8cHyP8EhUZkAgKDgoMDxMACQwRAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQaHgAWHCAAGB4jABkbHgAZHiI5HiElvysuMf4uMTT/Jiks/yIlKf8fIyb/HyIm/yMmKv8pLTD/LzI2/zE0N/8uMDT/KSwv/yYpLP8kJyr/IiUo/yEkJ/8iJSj/JSgs/y4wM/84Oj3/PUBD/z5BQ/8+QEP/PD5B/zQ3Ov8qLDD/IyYp/yEjJ/8dICP/Fxod/xgbH/8eIST/Fhod/xwfI/8fIyb/ICMn/yMmKf8qLTD/MjU4/zU4O/82OTv/NDc6/y8yNf8wMjb/MjQ3/y4xNP8nKi3/HyIm/xwfI/8iJSj/LC8y/y0wM/8lKCv/HCAj/xkcIP8XGx7/Fhod/xUYHP8RFRj/DhIV/w8TFv8SFRn/FRgc/x4hJf8uMTT/OTw//z5AQ/8/QkX/P0FE/zg7Pv8kJyriExYbPBwfIwAGCA8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEhkcABshJgAaHyQAGR8jACorLAAcISUoIiYqnyotMPcrLjH/Ki0w/yksL/8hJSj/HCAk/x0hJP8hJCj/Ki0x/zQ3Ov87PkD/PD9C/zs9QP84Oz7/Nzo9/zg7Pv87PkH/PkFE/0BCRf8/QkX/P0FE/zw+Qf8yNTj/JCcq/xwfIv8YGx7/Fhod/xUYHP8XGh7/HyMm/x8iJf8ZHSD/IiUo/yMmKv8kJyv/KSwv/zE0N/83Oj3/OTs+/zk7Pv82ODv/MTM2/zI1OP8zNjn/MTQ3/y0wM/8kJyr/HCAj/xodIf8gIyf/Ki0w/ysuMv8lKCv/HiEk/xodIP8WGh3/ExYZ/xAUF/8RFBj/FBcb/xcaHv8hJSj/MjU4/zo9QO86PEDINDc62DY5PP4+QEP/QEJF/zAzNvkZHSFpc3NtAAsPFgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABUZHAAYHSIAFx0iAB0hJQAdIygVIiYqeCstMd8uMTT/LjEz/yotMP8iJin/HiIm/x4iJv8kKCv/KSwv/ystMP8zNjn/PD5B/0BCRf9CRUf/QkVI/0JFR/9BREf/QEJF/z5AQ/82OTz/KCsu/xkcIP8RFRj/EBMX/xATF/8SFRn/Fxoe/x4iJf8oKy7/HSAk/yAjJv8nKi3/Jyou/yotMP8wMzb/Nzo9/zs9QP87PkH/Oz1A/zc5PP8zNTn/NTg7/zU3Ov80Nzr/MjU3/ysuMf8iJin/Gx4i/xgbH/8bHiL/ICMm/x8jJv8bHiL/Fhod/xMWGv8RFRj/EhYZ/xUZHP8ZHCD/IiUp/y0wM/kyNTi2MjU5VSktMh0fJCc2JiotozM1OfI9P0L/NDc6+h8jKGheXVgAExgeAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxgdABsgJAAeJCkAHCkyAB4jKAASGSEFIicrQSksMK0tMDPzLjE0/ywvMv8oKy7/IyYq/yQnK/8uMTT/LC8y/yUoK/8lKCv/Kiwv/zM1OP82OTz/Nzo9/zY5PP81ODr/LTAz/yEkKP8WGRz/EBMX/xATFv8QExb/EhUZ/xYaHf8dIST/KCsv/yotMP8dICT/Jyot/ystMf8rLjH/LzI1/zY5PP87PkH/PT9C/z1AQ/89P0L/Nzk8/zU4O/84Oj3/Nzk8/zc5PP82ODv/MTQ4/yotMf8hJSj/Gh4h/xYaHv8VGBz/FBcb/xMWGv8SFRn/EhUZ/xMXGv8WGh3/Gh4h/yMmKf8rLjHsKS0wgSEmKRs5Oj4ALTE1ACsuMgAaHyQRJiktaDM2OccyNTnEICQpMy0wNAALERkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACEqMQAfJS4AHCEjABwhJwArLTEAHSEmFCcqLmQrLzLOLjAz/SwvMv8qLTD/JSgs/yQnKv8qLTH/LC8y/yYpLP8gIyb/HyIm/x8iJf8hJCj/IiUp/ysuMf8oKi3/ISQn/xgbHv8UFxv/FBcb/xQXG/8XGh7/HiEk/ycqLf8xNDf/Jyot/yEkKP8sLzL/LjA0/y8yNf81Nzr/Oz1A/z1AQ/8+QUT/P0FE/z1AQ/83Ojz/Nzo9/zk7Pv84Oz7/Ojw//zo9QP84Oz7/MzY5/ystMf8iJSj/Gx4i/xcaHv8UGBv/Exca/xQXG/8VGBz/GBsf/xwfI/8kJyv/Ki0w7SYqLnMfJSoKJisuACkuMgAlKi8ADhYaACElKQAAAAABJCktHyouMiIoLDICJiowABcdIwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABohJwAdJCgAHiMnABshJgAhJCkAAAAKASMnLS0qLjKHLjE02C0wM/wqLC//JSgr/yMlKf8jJin/Jiks/ycqLf8kJyr/ISQn/x4hJP8iJSn/MjU4/y8yNP8lKCv/Gx4i/xgcH/8ZHSD/Gh0h/x8jJv8nKi7/MTQ3/zQ3Ov8lKCv/KCsu/zAzNv8wMzb/MzY5/zk8Pv89QEL/P0FE/0BCRf9AQ0X/PUBC/zc6PP84Oz7/OTw//zk8P/87PkH/PT9C/z1AQ/88P0H/Njk8/y4xNP8lKCz/HyIm/xseIv8aHSD/Gh0h/xsfIv8fIyb/KCsu/youMewmKi50HSQpCiMoLAAtMjIAHiMpABYdIQALEBkANTs6ABofJAAoLDAALDAzACQoLQAoLDEAKy8yAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFAAAAIUA+ACAjKAAeIykAJyswABggJgUpLjIwLTE0hy0wM9grLjH7Jyot/yIkKP8cHyP/HB4i/yAjJv8kJyr/JCcq/yQnKv8vMjX/MzU4/yosMP8eISX/Gh0h/xwfI/8gIyf/Ki0w/zE0N/84Oj3/NTg7/yYpLP8uMDP/MjU4/zM2Of83Ojz/PD5B/z9BRP9AQkX/QENG/0BDRv88PkH/NTg7/zg6Pf85PD7/Ojw//zw+Qf89QEL/P0FE/0BCRf8/QkX/PD9C/zY4O/8vMTT/Ki0w/ycqLf8nKi3/Ki4x/y8yNf8sLzPmJSkscxwjKQohJysAJiosACEkLAAiJi4AAAAAACAnLgAdJCwAABc2ACElKgAnKy8AMTY9ACsvNQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhJSsAHSEmAB0iJwAAAAQAIigsAC4yNQAcIyoFJywwLysvMm8uMTSyLC8y4ycqLfohJCf/HSAj/xseIf8cHyL/HiEk/x8iJuskKCvFJiot0SIlKegcHyP0HB8i/B4iJf8tMDP/OTw//z0/Qv82OTz/KSwv/zI1OP81ODv/Njk8/zo9P/8+QEP/QEJF/0BDRv9BQ0b/QUNG/zk8P/8xNDf/Njg7/zc5PP84Oz7/Oz5B/z1AQ/8/QUT/P0JF/0BDRv9BQ0b/QUNG/z9CRP89QEL/Oz5B/zo9QP82ODv9LzI1xiUpLU0WHCIIHyQpACQoLAAgJisAHyYkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEAHiUoACAnLQAeJCoAAAAAACUqLwArLzMAoIx4ACwwNRAvMzY3LjE1bS4xNJkpLDDCJikt3CUoK+YhJCfpHiImmh0iJiAgJisiICUpPR0hJVUkKCx3IyYqniUpLNEzNjn4PUBD/zg7Pv8tMDP/Njk8/zg7Pv85PD//PT9C/z9CRP9BQ0b/QURG/0JER/9BQ0b/NTg7/yotMP8sLjL/LjE0/zM2OP84Oz3/PD9B/z5BRP8/QkX/QENG/0FDRv9BREb/QUNG/z9BRP86PUD8MzY51iwvMoIkKCwrU0lGAB8kKAAfIygAICYqABomNQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACEoMAAgJisAHSMoAP/q8wAiJy0ALTE0AC8zNgBbW1cAMTU6BiQpLhotMDQpMDM2NCksMTkqLjIXHyAkACImKwAiJioAISIlAP///wAnKi8JISYqJSImKYQtMDToNjk8/y0wM/84Oz7/Oz5A/zw/Qv8/QUT/QENG/0JER/9CRUj/Q0VI/0JER/8zNjn/HyIm/xgcH/8aHSH/ICMn/ygrLv8wMjX/Njg7/zk8P/87PUD/Oz5A/jk8P/s3OT3nMjU4uysvM34lKS0vFhwhBCcrLgAgJSoAIicsACInLAAtNjUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgJSsAJCktACEmKwArMDQAO0A2ACImKwAvMjYAJiovACsvMgAwMzYAKy4yACgsLwAfJywAIyguADAyNwATHCMANDg8ACUoLAAgJCgADxMYCh4iJkknKy6tJiks8TI1OP89P0L/P0FE/0BDRf9BREb/QkVH/0NFSP9DRUj/QkVH/zQ3Ov8bHiH/ExYa/xUYHP8WGR3/Fhkd/xgbH/8fIibVKCsvkyotMZMqLjGGJiovcCUpLkEhJCkWAw0UAiouMQAjJywAXmRCACIlLAAjJiwAIiguAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWGycAIygvACcrMgAfJCoAKy4yAGViXAAAAAAAMDU3AAkSGgAjKS0AAAAAABQXGwAAAAAAHiIoABseIAAYHSEAICIkABwhJRQcICNZJSgsqzQ3OvI+QUP/QURH/0FER/9CRUf/QkVI/0NFSP9DRUj/ODs+/x4iJf8VGBz/FRkc/xYZHf8WGR38FxsfvBofIz0PFRsFDhQZBA0THAOTgVkAKy4xACUpLgAiJywAGB0lACEmKgAjKCwAJCktAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYHRsAADBhAB8lKgAgJy0AICUoACYnKwAbHyYSJCgseTI1OOg/QUT/QkRH/0JER/9CREf/QkRH/0JER/88P0H/Ki0w/x0hJP8aHSH/GBwg+BkdIZsaHiMiExQUAB0iJwAgJCgAIicsACInLwAeJS4AAAD/ACMoLQAkKS4AICUpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAICcrABMYGwAhJywAFx0hAB8jKAAWHCIHIiYqVTAzN8w+QEP9QUNG/0FER/9BQ0b/QEJF/z0/Qv8zNTj/Jiks/x0hJOsbHyOKHSInFxkdIQAfJiwAHCEnABkdJAAdISUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIioxACMpMgAdIyoAIiUpAB0iJwAAAAAAICUqKzAzNpI6PD/nPUBD/D1AQ/86PUD/MTU4/iYqLfQfIyfFHSEmWB0iJwobHyMAPVBoAB4kKgAcIScAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABoRAAAdJCoAHSInABkeJAAnKy8AGh4iDCksME8vMjaTLzI2xiwwM9UlKS2vHiMobB0hJSUmMzsBHCElAA8JAgAfJi0AHyUsABMXGwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD///////8AAAAf///////////////+AAAAD///////////////+AAAAAP///////////////AAAAAA///////////////AAAAAAH//////////////gAAAAAAf/////////////4AAAAAAH/////////////4AAAAAAAf////////////8AAAAAAAD////////////+AAAAAAAAf////////////AAAAAAAAD////////////gAAAAAAAAf///////////wAAAAAAAAD///////////8AAAAAAAAAf//////////+AAAAAAAAAD///////////AAAAAAAAAAf//////////gAAAAAAAAAH//////////wAAAAAAAAAA//////////8AAAAAAAAAAP/////////+AAAAAAAAAAB//////////gAAAAAAAAAAP/////////wAAAAAAAAAAD/////////8AAAAAAAAAAAf/////////AAAAAAAAAAAH/////////gAAAAAAAAAAB/////////4AAAAAAAAAAAP////////+AAAAAAAAAAAD/////////AAAAAAAAAAAAB////////wAAAAAAAAAAAAP///////4AAAAAAAAAAAAB///////+AAAAAAAAAAAAAf///////AAAAAAAAAAAAAD///////wAAAAAAAAAAAAA///////AAAAAAAAAAAAAAH//////gAAAAAAAAAAAAAB//////wAAAAAAAAAAAAAAf/////4AAAAAAAAAAAAAAH/////+AAAAAAAAAAAAAAA//////gAAAAAAAAAAAAAAP/////4AAAAAAAAAAAAAAD/////+AAAAAAAAAAAAAAAf/////gAAAAAAAAAAAAAAH/////4AAAAAAAAAAAAAAB/////8AAAAAAAAAAAAAAAf/////AAAAAAAAAAAAAAAH/////wAAAAAAAAAAAAAAB/////8AAAAAAAAAAAAAAAf/////AAAAAAAAAAAAAAAH/////wAAAAAAAAAAAAAAB/////8AAAAAAAAAAAAAAAf/////AAAAAAAAAAAAAAAH/////wAAAAAAAAAAAAAAB/////8AAAAAAAAAAAAAAAf/////AAAAAAAAAAAAAAAH/////wAAAAAAAAAAAAAAB/////8AAAAAAAAAAAAAAA//////AAAAAAAAAAAAAAAf/////wAAAAAAAAAAAAAAH/////8AAAAAAAAAAAAAAB//////gAAAAAAAAAAAAAAP/////4AAAAAAAAAAAAAAD//////AAAAAAAAAAAAAAAf/////+AAAAAAAAAAAAAAH//////gAAAAAAAAAAAAAB//////4AAAAAAAAAAAAAAf/////+AAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAA//////4AAAAAAAAAAAAAAP/////+AAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAA//////4AAAAAAAAAAAAAAP/////+AAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAA//////4AAAAAAAAAAAAAAf/////+AAAAAAAAAAAAAAH//////gAAAAAAAAAAAAAA//////4AAAAAAAAAAAAAAP/////+AAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAAf/////wAAAAAAAAAAAAAAH/////8AAAAAAAAAAAAAAB//////AAAAAAAAAAAAAAAf/////wAAAAAAAAAAAAAAD/////8AAAAAAAAAAAAAAA//////AAAAAAAAAAAAAAAP/////wAAAAAAAAAAAAAAD/////8AAAAAAAAAAAAAAA//////AAAAAAAAAAAAAAAP/////4AAAAAAAAAAAAAAD/////+AAAAAAAAAAAAAAA//////gAAAAAAAAAAAAAAP/////4AAAAAAAAAAAAAAD/////+AAAAAAAAAAAAAAA//////gAAAAAAAAAAAAAAP/////4AAAAAAAAAAAAAAH/////+AAAAAAAAAAAAAAB//////gAAAAAAAAAAAAAA//////4AAAAAAAAAAAAAAP/////+AAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAA//////4AAAAAAAAAAAAAAP/////+AAAAAAAAAAAAAAH//////wAAAAAAAAAAAAAB//////8AAAAAAAAAAAAAA///////AAAAAAAAAAAAAAf//////4AAAAAAAAAAAAAH//////+AAAAAAAAAAAAAD///////wAAAAAAAAAAAAB///////8AAAAAAAAAAAAA////////AAAAAAAAAAAAAH///////wAAAAAAAAAAAAB///////8AAAAAAAAAAAAAf///////gAAAAAAAAAAAAH///////4AAAAAAAAAAAAB////////gAAAAAAAAAAAAf///////4AAAAAAAAAAAAH////////gAAAAAAAAAAAB////////8AAAAAAAAAAAAf////////wAAAAAAAAAAgP////////+AAAAAAAAAAf//////////wAAAAAAAAAP///////////gAAAAAAAAH///////////+AAAAAAAAD////////////+AEAAAAAD///////////////wAAAAD////////////////AAAA/////////////////4AAA//////////////////gAAP///////4lQTkcNChoKAAAADUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAAAFvck5UAc+id5oAAIAASURBVHja7P1ntGXZcR4IfrH3Mde9+0z6qsqsrMosg0LBQyApEiJAJwIE6LslkSK7JbYMWyMJbEpDgqTUWhyq1a1Z06OWlqSlXhpqmjOcWRJlumU4JEjRgQAIsgquvENVZdm0L5+79x6zd8yP7c+972VWweR7hdxA1rvmnHOP2RE74osvIgg3x80B4L677kCjNXpZhllV4annXsSpE4fHS+PRrVrjtiLL3kFCvB0MqZmZWT+htP5ELujJtmmusMg2lVbIBCGXEpoZX3ji2Rt9WTfHNQbd6BO4OW7suO/sSeh6CikIDeVgysBal1LK7yyK4v39fv9tDDoLYEkIUTBrtG2Lpm6aVjUXoPUjSunHhZT/SQg8wExTIo3NrRnyXOLZcy/f6Eu8OfYYNxXA1/i4986TkFKgaVvUTSV65fA+kvIHl5bGf75X9k5meQ4hBACAmaG0gmpbVFWFqqpQVxXattUAHgf4V4tM/MqhpcEDFza29ePPvAqgudGXeHPsMW4qgK/hcfedt4OI8MK587jtluXDJPPv6A+GPzYcLf3xwWDYIyIADLj/slECzBqtUmibBlU1QzWrUNcVlNJaEP0WCfx91upTLWN7WGTQzHjkqXM3+nJvjgVD3ugTuDm++uNNd56ELpewVACZ0BgM+/eILP+pwXDpJ1bX1t7S7w+ysDUBIPNfMu+JBIgIQggIISGFBAkCg0lpdUop/X4iWu7l8sl+IbdaBRw9tIJDq2NcWt+80Zd/c0TjpgL4GhyH1sYYF4SSUNTI3kckfmEwXPr+1bVDy2VZgNms+kQAEfm/oEgREABmaK2htIbWGqwZzCyYeVlrfrdmvkUxnvy6245deHlrB8zApfWNG335N0c0broAXyPjHffdCWLzuHdmFYh4VWv6oaws/8pwOLp3PF6mPM+NiQ8G2Aq9H6kroC0YOJvOMJ1OUFUVlFJGEbBRBgDPpKT/UGTZ35nVzaO5kJg2Lc699OqNvh03hx03LYA38Ljv7tM4cmgFggh1q1G1LR575hyOrC4fZxJ/MS/Kn15aGt++tDSmLHNWP4NAQfjdau8tgPBd27SYTCaYTnYMGKhaaJVYA5lm3KU1nyXQeQAvlXmmjhw7gmOHVnDx8tUbfYu+5sdNBfAGHkcOrYAIKIoC0+ksJxK33Xrs0HuYxE+Wvf6PLq+sHBkMhxBSIFnsQUHwEVAAJ/xEBNaMuq6xvb2F2XQGpVpoZuM+cDgSM0tmPsvA12dSVEWRfXFyZWOKLMfayhhXrt7EBG7kuOkCvMHG6niA6XSC48dOYGnYAwiiadVtddN+Cxh/Tsrs3uFwdGhpPJZFURiBFmRhPjOMv+8mx+IpolSLra0tXLlyGdPJFEprWIwwdR2sMiBBkEJeyvPsfyuK7P8uhHiJmaE1vFLJiKCUAlihZaDICyitIYXArG7wxDPP3ejb+4Yb2Zd+iJtjv4y7T9+KzekUq0tjzJSgIpPjnap+P4P+m35/8N6mbsa9Xh/jlWXkWQYvnWzDfV5wGQDZ/y4eWmuotoXW2qz8WgOCIMhwBpxCYRirgBWDNR8G8GNa60OC6N/lebapmMcEghRiB5m8DAIk8HKr9RUGFBFYaYWylHjTXacBEB576ibD8Ms1bloAN3C8551vA5HA5pWLaOoZFAscufUkdNvggc9+4TUd6647boMkwqyqsLm5NVgaj/9Ev9f7PiHlB/qD4W0AaLKzg5XVVfQHg7AyE6VIP8ii/G79n58izMb839zcwObGBqazKZRSECRAYn4/ZgYRQUqJLMuQ5ZnOs/wlmckZMy/bzbaJcaltWyjVvgSizxRZ9mDdNI889vRz586efRMynqDMJbRiPHRTCXxZxk0F8FUa99x6FOPDRzCbTVA3DfKih9HSGFJKfOIP/ohWBWhdQ7/zbfehaSoQCXzhkaf2POapW45BKYVcChw9dgybW1tg1RxrlP6LJOR/NRgM71haWhJlWWJ9fR1KKaytHbLMPgYDEFYBgMzq7YSfsLsboFmjrowC2N7eRl3N0DRtZP4ThOUJyCxDkRfIixx5niPLcmSZBJGAEMJzC7yloLWJJrCe6Va9OJ1OnxOCPsasnqyr5oF+Ls63JFvnZjz02NM3+tEe6HFTAXyFxjd9w3vwzMMP4cjx42g0Y7C0hJceeojWTt+22ii9Upb9/tLyykAIQbPJzom6mo1AcrPolU/U9fRZKWQDAJ97+El/zFEPGI9XkAnG8RO3YjBcxm9//JO47fBycfrM2bUr6+u3a63+SyGzPzccjlaXlpYgZQbVtli/ug6AsLw8BpFRAEBsAZBVDOG92cD9SU36uqqxtbWJyWQHbdtCta3FAQhZnqEoShRFYYU+g5QZpJSWPETR78C/RuSBaNZQrYZSDVSrtqaz6WZTV58H+P+ttfr40vLgpZ2rU6a8gFYKDz/+1LUeyc2xYNxUAF+m8ea7TiOTgKYco+EQCgo7O1OIth21GvcMx+OlXtm7YzabvLOu6/uIxOGiLE8QEWnNmdJKstastXqEtfq7eS4/VlV1kwsBrQksBapZhasbl7JSivKW206tDJdWT2xtbh29enX9nrLM39Uq/f4iLw4PR6NiMDDovmpb1HWD7e0tSJlhOBwYFN+7AIhWYwqgICWwYPjDALNG0zTY3trCdDaz+wkTLRBGkRihlxBSQpCAlNKDjcK5CQ4v6EYgAHjegVMGSqGua1Sz6UbbNL/Xtu0vk9Yfv//Nb375oUcfQ54paC3whce/eKOnwoEaNxXAlzDecc/tyGWGraqCJolv/7Gfw2/9i7+XrSwvFdtb2/eXg9E3FHl+12w6+2aSYk1Kudy2baGUylSrSGlDnNHW7GWtwcxKCPxylsufLWR2tcyz5ablI1Vb382MJa1xSuv2cFGWt5RF7x6t9bhu6jWtdT4YDLLRaIyiKCCkABhoVYumrrG9vY1MZugPel7wzDACKYQACWFCfUJApFLpV2pYC6BpGkwmE9R1bRD8LPeuBRxN2CoWc2yy7kbYJnUzwvmEwSGiyAzFDN0q1HWlZ7PZets0v6NU+x+Z2/8fQZ6f7uwAJNBWU5y7ePVGT48DMW4qgNcx3nHfGSesqDWwceUl0Rse7i8vjW7REB/qD0bvZlb3aeY3EyhvmsaaySoiy6hAoWVtk2wYgoQaDPqfFlI+qVTbk0KsCSFXSYjbWet+2+qhUkpo1gAAQWaVHAyHWFlZgZSZFzrAhOvqusHm5gaklBgMBhDC0T/Yr95CBitAkIjMczfSqdIqwwJsGqcAzO8GGrGwikV64femvj3cvAKgNIRoz9GFIzSzpR8zmqa1iUjTy21b/xNi/sfD5fH59YsXMVgeo5pM8eiTz93oqbLvx00F8BrH2+46BU0EzQDPtiSXo9uKovhmDfrufn9wikjcrTUvK6XQtkbw20ZZgbcrvlJmTpNZffO8wHA4ADPQNA2DeQqgL6SkLMtARGjqBnVTo21bsNbBTydAygzj8Rhl2TPCL43JDQBaGXN9c8Nw8IejIaSQqW8vCFIICGnAOSli1l/3DpgPlFKoqgpN04AIMOfZxRaEdyecAvCCj5hvQNE+BGYNrRmaHatQe8Xiz9qeWNM0mM2ml+tq9uuTra1/nuXy06wxKXo5mIFHbiqBPcdNHsA1xpvvOQ2tDT9eQkAJQO1sCJSjk/2Vo+9jEj+UZfk7ieiwUhpK1WiVAcXcSt8qBa2MAiAiZHmOsizR6/UBsHUDGEopSCmp1+sN8jyHEBJN06CaTdG2jVEcWnu03ZnteZ7bVbExws8SYASTHADA5ryUVR4RqEeaoADv/zOH1ZkZC5SA/X0pILQwG3mhNG6CxxP871jVwYZ24ElD0RrkXCGlWrRNa87XKgAdKYE4pCilRK/XO0REf1pr/Q6t2n9MOf2S1tj6OnoOdPdpPHxTCew6biqAPcbb7jkNKQgzxZCSMNveEXm/vKVcOfptWZb/IMnsmwSJZbfSK6Xt6hX+Ka2hVAtBAoP+AHlRoCxLKGWSabQ21kHbKkghMF47hF6vB82Mpq7RNDWapjFibGXFx9stUKeVQtNU0KyRaQnWbDc1VoAL7anWCJcQYQUlEJgYAoAmASINrQWECBmBzLHZzv61IOPnM3TEIzD6wCiOxVQiIkctNhtrtvepbVHXtb2Xyt6fYAFw5A4IMlhFJjMUZYksz0V/MHzTbDb9qG4blqT/n3+E0xON4Y2eRvt63FQAu4w333UHFAPbOzVINyLv9070lsYf6pW9D4osf68QYqVpW2ra2q9OwZeHn7BEhNFohDwvkUmJVinMZhW0VmDmoCyUQm80gpTSuA5Ko21qAw7ac2qaFoKsCDKDtYKGETwj/BqcZZZ4Y/YRQth4v4DWRum4cBwRWaEiey7KKgf4Vd0v26Bk9fb5QQKwcERiKYSUAPZZiDHAz8Rga/U4Ya+bBqpp0LQNlDL3xDANUxfAWSeCBBpq0DQNiqJAUZYoe71b6wp/U7eNBvDLhJ2tM3ffjj6Ah598/kZPq303biqAznjT2VOYblVgYrSs0MvFMYjBB0WW/2Cv1//jJMQKa0bVVN41iAdbwSQQhsOhodwSoW0VZrNO0gzg/XkARkG0poSWUhqNXQmdomDWYAiwVv63jLkt7DGt3EanlGUZCECWSTCAuq6R57n1td2G5Fd5pTWMdAkI0gC7UF2gDfufcDiBtQvc4diXDzLHBnH0Oex1MJQyq37TtB4vUW1r/mplXCibWhzfZ4dNaGsJOdehVQplWaIoeqdrpo9q1Uqg+d96kNsoCPffeycevs4w4VvvOQ2gBpCj1RJFr0SeCZCQ+MMHXxtLcz+PmwogGmdPn8RjT5/DXbffBiFUzq18MzLx42XZ+/48Lw5rzQaEswLsKmZpNitZ2zQgIpS9Hvr9AcBsau1VM2/OGrkIwu/82IlScMcHjAJQKkQK3D92nP0YFCPl8u+DFYIAxAkP8JHHEhKyj13htQKILEbA5AU5dQM4GAVAWPa95iF/SCbH8SP/PVsegaktqKHaBk3borWRklYpn2PgwEB3PYh+0igBhtACLNgqSaMoe2UPRVmeqmv8lG5ZE/MvocGOSHX1NYeqAMo0lDbPCloA0Dd6mn5Zx810YAB3nzmJY2tjkBQ4emgNqlW3E2U/WvR6P1WWve+UWT7WStvVMQBRALz5qlSLPM8xWlpCv9+HUgqzqkJVzaBaFdwEhGVSKYU8zwEi1HUdzHJOabHOAmiaxisQv437Z1dctkLmzlNYYA+AEbImuABzNruV7BjAowS9dyPi+VvFZO6JCDiA34pCzpF1M5RSHo9o2xZN03gFoNrWoP9KQ2n21pJTBv5c3e8jwgYQXCqZZZBZvsyMNzOwA+jHmKjulxIr4yE2tiYL58J9Z07hxJFVbG9PgCyHID3UJP5Yluf3SSk2JjuTycUrV3Hq6Bo2dqY3eup+yeNrWgHcfcdtOLw6AjGDih4E86pS+oN5UX60LHt/sSz7dzAhM+Ae+7AdYATfgHQNQEC/PzDc/ixDXdeo68r6tAboAxhCSPTKHvr9vv03QNnroShK9Ho9lGXpGXNaazRtk6z+TdOAWXuqbKwA0F3dnBKgwMtXSqGazQAiyCwL5J7IfXDAXQgz7pUUDL/qApbZR04J6blCogk4alf71gm/an1FIef3ax3cBSfjHFsS0bXGAKELH2ZZhizLVpjwVgFssdZPPf3cy7PDa2OsLg9w7z334sWXXgEAnLn9GI4cGmN7Zwfrm9vQTTOgLPv6wWj8F/qDwU+VZe+HtNZrO1tbT505e8f6zubWTQVwkMc73nQa/UJCtYBStRTAW0HyrxRl72/2+oM/lhV57lZtF8c2fmtrhLuu7QqeodfrYzAwaLMvl13XEAB6/T6KosCgP8DS0hjjlWWMxmMMRyOMRiP0BwMM+gMMhkP0+330ej0UeYEsy5BnmRX8Gswc3Ag7Ou7+3PCLemTuV9UMzBqZdQnCcVI/nRbkBcRVgt2OLoTJLhQYIX0OrESkrIK/bn1/t/LbaIh24GnEUBQRnyANSfLCG8CRJZBnOfI8XwaJt2mtzw77+YtfPHf+1dO3n8J0soPjRw9jbWUJKyeOopnW+Ppv+k6sX3zpSH84+su9wfDnhsPRhwbD0dGiKIZVVb19Opucf/WFF/4oK3K1uTO70dP4Sx5fkwrgrffeASEIn3n0FRxdG40VxPfIrPj5fn/0PUVZrhGR9bfNMGWwW8xmM9R1Da0MCCelsNltJrd+NqtQzWbQSqEoCgxHQwyHQwyHIy/gMpMRz94JHQfBI0AIiTzPbTJNAVe4Q5ssuQCKOeQtkUmeS+ElAEJKE2FoGqOcnBvgfz+yJhArDniQz6y8FMBG+5nz1537ALBl7dlTjAuIqmD6G58/AH7umC6XIDcrOKQ0lYc9QzFyK7x7EV2/+8AoAYVMZsjzYiyz7B1F2XvLrSeOboOxvrGxPun3hyygMd3aAQnqP/vFJ/5Enpd/sz8c/thwODpZ9kphgFRCVVVZU9eXZSY/nmXZ9vrmzo2eyl/y+JoCAe85cwpSmrDYle0Z7r/r6L0t01/Oi/L7ev3BqUxmYMtAA+zk1Rpt25jQnVI+oYVA0JqNma/MykUACkvwMWh07qmwfli7mGM/OvLZg2AZGm2v10NR5CjLHgb9AXZ2tjGZTNG0tQcMnUBo1oAGtI3Lq+jaSRCKokSWZ9ATjbZpDFuQGTH9lmleeZhzEdht+KghouiGVQCEoGB8yK8xRB9luRMumkJEyGSGzGYQOmqx1g4zsGQqTSBFhiTkQoTM0JFyYMEQrFFVRrGMRoSyLFGW5TcAdLZt6z88fOTEL9fV7MG2qTeU4oxJ/Be93uAvl2Xvrn5/IPM8R2aTmZRurXKhPiAK5t3vx0EaXzMK4OTxZWxtnMdw6SiyfiYGZf72RuOnZJZ9f683yIQgtBZwC0Cfo7zWYBsjB6yPq41fS1pA5DnKssBgMESv14O0k9cDU3Z1C2G3lDlHxDYmPz+cRVAUhv0mswxF2cOsmqKuKg8watYQLD1TUGuGAENZNUC2nr+UGWQm0bQNsjYDLNWYoh+MGXdxwRCfDtgp9uF8c4Mh2LCmPYbn73sLwKz6rRVmtqXEiIRhSNp4vhN+A7IC2h5XWJzB2a4KCEQh5ii/wJAUiDWqaubPp98fUJZlR/M8+5BS6hvzLHtQ9/vn2rYd1k377VmWrfX7fRRlCUnSLxham+dY1zVPJjssxRvDeP6aUAD3nj4O1g1oeAs0q95s1n4/gB/Pi/Lre71BRkASpnP+ZtsqVPXMVrsJ6LzzqcuixGAwQq/fQ54XyKQELCmnaRor+FEIb87UNyG6kCfv/O5OlI8C/bW0wpFlElWWwyca2dCe87NduBIaXgmIWiC3OfqTyQRN2yTpv4j9f+5aJPDnF5RAjEJYH18F8pFHF6JzamxSlKE120iFFMizHEVpaghIadiMrbbAoHV9dCccaBSygIoiIe6YxAQWNgoCQlVX4E1zHqPRyFhDWbZalr1vZWattSYAImQtxgVQtacnK6VYtZpZvjHSaL4mFICAwtVaoGg3j4qs/FNCyp/IsuyOwWAAIuMXOwTaqHvYlNfag27aZOpBSkJeFBgORih7PeS5uYVt22JSVZb6a/xcD3xZy8KF6By/Pua053lulEgWWHpmxLn7ZDGEEMFzCkRZHoFzvKUQZpVVrReK2mXuSePT1o0JPUoOgCAIIMVgQYAp8gMlQkRgsZ3ieA0MFtq6N4EWrCPzX7uQqPUPpJDI8hy9skRRlCAhPOZS17V5Nj6JykUWAr4AMgrECz8DGgrQBMHmOgQba6LSlVdEo5EJ12aZJCGkdMlTc1fGjLZVqKsaVTWrlVKfbhp1obhpARyMce+Zk1BaY6mnD7WafpKBv0BEq/3+AFmWW6qtNVdtPXtjmipfMsul2PZ6fZS90ufT13WFnZ1ttG3jfVTnz7rQV8CkoklrR6DTCgv69dDr2VUwy+Zy8n1sX0i4Mv6B0w9oEYC8QpbItA71+u3EJxJW2eSYVTMoqSByEcBDR+BRUXOQeEWMKgh7SrLVar7Kr3DkoRj4c/fHrObkrsOBnUVh9zGYS13VqJvaWAsO+IywGfPTDrA0rgHbEKDTsooYxOZzYV2DpqmhtpRJsqqG6PVN1CWtVuQOYc59Optha2cLk8nkC01d/+feoFdBvzEIQW9YBXDbiTX08x601ijyLJvW7Q8w4S8S0UphkfWYteb8U+NTK7vaZijyEr1+z5ilzLYDTuvz+122WkzICa5+cBlixN/9ZnhBaOoa1axCNSswGAysdVFASrEQH3BIebAoKCENAcYKMPxfk7/PmtG2DYTNSCSXzusKgjhMghlMZCjHCojDgRISjl8QKL8+RgDA3EsfYowsIiP85vyJTL3A3JYLA2B4AW1rEqDq2mRROqJRnFsQs5Jc+N+FaglwhhCYwVBgoaGZfIESIm2xnRny7cJHW7LMREqcK6WUAUt3JjuYTHaq2bT6z7Np8zgJ7AmKHqTxhlUAw3KIuq1QT3eEWFr7EwT6CJhXMimRWz/TxNhbg6g3jUWlFZgNd77ILWreyUcXIkOeC2TS9cVTlrkWEVk8f53hZ72PjcdnapWGMvTf1iqXQdtiMByiyG11n8hHdxY2WSxA61Di2/MELDkmy3PztmaLvCu01PpafXXTQGbGnBXkioUaYBJE0NDQpKBUt2YgRxYAfPze++BWATjwz1lXsEAdCTLujpS2xJixEFz2oycFKYf0hzsW9ymMh69raKsHeVfB0raZDBhJRCBtnlfTNJhNpx6DETbL0uMWTetwlo+3bfsv+oNs+9JVhZNHc2xODj4R6A2rAKbNFFq1lBXDb2pa/XMgupuEgLSVaZnh68zVdW3ZeraSjbR8/kHfh6PiJcetfM68ddl8PswVs9qUDorAhwD9odwRkzBapWdemQwGQ4NIS+nPIa7YTyQ8DyEm47BNsyUC8jwHwygxV5WIBCEvctRW4ASR8fv9idlMQW3uExAANeNzp0i/4ftYxB8GoHP32AB5VolahN6h6LHVYrCYECHQyoQAWaf2TyAFEcgY9/6u+kIkZEKzgAtJkk1u0p7irCh2oQLhyVly9vlpZv4kwH9XSjyllMKwBK5s1Dd6in9ZxhtWAeSygJDFSBP9CDPeJ4jIxZedfxri74H/bkC+EqPRCGXp/P1g1rswodZhH621zUwzSTdSS1sJqIVC1DCTGNAdNl1nGNOTobkBeMdvaer8dYEn9quelJk9N4v5szaJMmBAAHlegBmoeWZrEZg8hNxGEpTUUZ0+J9zGArDVQkBKmQhBJDjwYUDt8xe8mnIAqLegHKvSxvd9lMQIvFMUyiuAsPrHwUfigEtIF22NbisJgoAI3AinsOOU4k41onBHg9XAzC0zfwLAR2XW/gHrnAFgpzr4K78bbzgFcHg0siuzhga+QUj5fiEEGbRdRuQSszoWRQFpPxNSorAFO6TMghxEKa1kUXkit6qY1Fm4zSiO7wsIa9JrZcKDTBq+E48fEUbgPrLc/+lk4s3SHKnvSTZ5x4XDmKWf5Fpb4XW1A4WwSkCD69qz5Iqi8Iw8jwVYDMAbLmSEVQvt8RHHHfAcAFe5hxlkU4pDvQOHjxAEghJtW53URHBC30YJQYnyBTweQhatVGB7zukddTwMTxJyx3Fh3MgaSYev53CBwf8ejH/StvRZIjMf1rfeOMIPvAEVgPPVX3npVXn0+JH35lLe4RpUODTf1Z0DTL58URS+vJZD3k0YL06YCxlxEVkPbgqZ+ndAUm/XJg8Zc9MAXEwhmeVaQ2ttQneT0LTD1d4jMrTcQNCxwJoIJboAgo5SWKUUKIoSzEBjcxmyLDOuQN1ASh0SgKySYxjFRWyoyK1VblLKQA+Os/YshZpt6E1plfjwgVLModiHZV96tp8Lm0Zxf++cWMalv0Rt/P1FoBwJQkaZcWG0hob2SsDjlzFjgXmTQH8I4AnN/EnN+jf6OV1y6dBXt99Ywg+8ARVA2cvBGijL/BYAbzIuq4C0VW8FxSto8PmUUoBSnaM5wYJf1eNyWjENnyiYpp6tJhiAhJSRAdvacCM5Dj2wKJXPCbdWjKZuMMtmPqffMnjtShYAOecOaGaT4UimtJcLaWkNSGvlsHYlyRiZzFDDEJeELQ3uRcOuklpr43trU38/riVgsqRdFp8VUFvxiH2ikLNMgl8eFIC2dQACiModDcn2JpvwoVF0JIQNIebmWuNqxlHiENsoTzWrUNdVKDnmuBNsrKi8yP9f1az5H9tWvzzo57pRjNZyQjYn1Y2e2l+R8YZTAJACZFzlMQQddh8LCgivY9sBbiLGjDb3OfxnMRXW1aKLs+S6k9UF+Akm5CSEKdIJKY1YqShU1mG3xWChszeUMkSUXOY+LBgy83yBLq+oHO2XSMcn5K/ZKQHX1FNkEkWeo2lbSJeN56MObHgBbBhxGgRNyt8TR3F25r+zAOyeQZjZgZ0cUpltKrHSyrHs7PcpXiCkSY4yXP4essy8N6HQ3PYkCN2NvALoPGdXe8AAoSa/Y2dnB7OZoQqPRsOiPFIUBC7OX9ye3Xp8gAuX1nFlfftGz+qv2HjDKYAoXXaVlDquZWZDUZarHkXUwgplCSZzq3FqqhOF6rnCuguUmJ4xyARPpDHugeHmu4q9RnYNWSXBBKLfc6nIzKaib9VUyJrMcvpl8IeJEZfkNgh8UBKmmo8TWA4cB2bUVQXWDCEFSJG5HzLgHU5wNbmKOBY/iRSYpzlHVYucme6IOdqZ3uzcBVcXQPkV2fP5rWAXeW44Ef0+ijz0FhRSmjLmrhtxJ18hdoviZ5PnOXq9vg1Xaht2bFBVNeqqQt3UP9w09dcR8EtHD49+UWteP7yygluOHAYz45Gn3ng1Bd8YfMZoDHqFm0h3AvQDIFoBjD8YM9cCeSfyT5OU2MBwm98nrsLjd04r7CRuQpDqGD9wmNSegICLd3OgDpOUyfRmsMUoY4skxhricJjfDK4oqFY6mP1sqw7HghSh/kbfxSBgWNGdSe9viydGMWJ3wLT60j4lWNm8AEGEXr+PpfEYa2trWFldxdLSEoaDIfp9UzAlL7Kk1yBJ4Vf/uIiJgzISDMc/FnstNjkqzw3wm5dFTkTHALyNiGqAHyl7mE2mGlJKrK0u4/L6xo2e4l/W8YZUAHacBuF7AKwaeq+tMqui2P2Cf3E6qzdvowT4uLCFA6/mSCpAkG6PWAXD2P1x8fo49IRoK+oe0/LeJZkGHt5ucL8T/4ozpeNjxifK/pBz121KjiOEBf3FIaEFw4VTLQgYahUEbkNQCJ2CIC5Maguo9vp9jJeXsbq2huXlZV8cJWboCeHyJJyZ313n90rQcdcX3d0o6cooC+GsjJFm3K+Uur1tdNsrsxdbpdpZ3eLQ6hjrG1tf5Vn9lRtvOAUw7BVuGqyC6P0A3YZo8rkEGV991obAWs/l72TvpXHhYA24+LeOrYbOSMx5eNacK5vlt/EkoHk40MhcmNhSSA9oeqguVkAchI8TxRNZALFVYLdVrIPCif8XJwn5ld9JXuoCBH8/rPTe97eulrKdilwNhaIosTxexsrKCsbLY1v/oECW5ZCZKQRiiD/d8Cd13u8+Ys8uPM90X4+4uPwCoiXN/C5mfrdmfZmB5zJCJVjhxJExRmUP69sTHPTxhlMAy8OeKye1RETfAqKz5ApgRqa8iTmrqDKNVQwJi0/NgViR3b7QQujEu8Lwoac48ISQwtsFA9OlycF4wQ2w10R+ybeb231ipZQoqNjdiVZFjph67ry6bcIpcgdIUCrc0KHc+UIFicTfd/0SVlfXsDQeoz/oB8F3fQtE4D6GcwgvCNeQ/F1Yl8n3sf7kcD/AcCngh9tWvVtrHirmR7+4We6sihkapXH1Zk3A/TdOHhlhfSYwHuZ3M+gHhZS3OMDOkdyc7WwmqPakGAdKuZyAbqKPGfGkmVcEcVgwKpUTFEi0XMXuqcvdT5aneDt3/sJQcUMbri5safaIqcVd3MJjH4iUhAP37A+mVYGRCpz/QzZPPwi/cQNigJV9GM5lJUopMV42q37f1VLIbPWk6PfAlNwET9q91pKPKCkrsXhSNyBwAdw5R88U4XlqpZeV1l8H8OnVvH7sju9778VLD30RG5ObNQH3zThz+wmcveUWzDRjqZ8dZpIfkTL/zl6vJ8uyRJ7nFjkOseK42KVj+MWstK4S8P6+JwSl5ndS9psiwQU6pJMIZAx7ezpt9EkihI6mGzgNERsvmuCGpWgZcB0MwJyjDsKZKDHzuafJxhhA5AK4e5Yc0ylJbavnwN63CHEHM4qih/HyGEtLSzYLL0eWSe/XU6pj0nvp/PZF/+NrKLu57+EtlYC/xAlO0TUZZZZp5nvAtLT+2At/KIt8e3m8hGOHlnH56uaNnv6ve7whFMCdp44bYElrFEWeN0p/rwb+Wpbny0Vuc+tFyGX3ee1WiFz/egcExSa0T2eNXIEFvJ0E4gtoe8qXT1iEcy9csc04woAYCbQkIwrVg2juYOFYCJNaR1ZMjG0kQCfgm4t4oG/Bip/wHzqCF4DR+YgJwdQkNJWQh7YmQWZblUfEo8STctYW+3u4UNCTf4Fj0P1O6933iyMmsZJIttMsmXCaBGaZFJ8BUGtNOLo6PrBK4A2hAG45vgKlAAZ6Sunv1Zo/SiTPuDxzz/qy4Sb2K2XwZz3pRIiI7Rdwg7lIwa45PfOIvsesOExsx5VPAEGCB8sS35S8B2DOV5JnvaU/0jkTO+nT+PuiFTLGCnSiAPzfyO8OOIMroqIT4QyfsWfu5UWOQX9gqvB44RfpaUfnEc5nFwA2FUzPLQiCnvZr1Lsohfi42MWS0Mlr3WPGPUS4kAnxOBHaJ5978UaLwOsebwgFMBoMcPdaiYs7zQdbzb/AjDe7VTxUogltpuMHCiBJ4nFWgoiLZFjOuXb/WCX7h6q/YTp7HxSBRuwzVtyki0wHZ+53hTIcNcS3ZUx7hW++FX47mtBBaHSkXDrCEIGbJoU40Jn99UdWgP/LEasP8Mw+bass+ZJnUqKwDVHyPPel0RHfrQhojTM1dxNIR+7SPhTbva7QVHT3f/AKIFba7q9rehIsJzh3YKwZ9wN4ZTkvHl1aGvFwNMDG1sFjDB54JuDRtTGUavH4xWZZafE9AN5EQoBt+SlgAc+GXfdc8sAcxRNcAAQJV62XBEGR8IVDlWKwbqBlmGDGL2ewNdMNpqCgYX6ru2I7sM698226I5px7Jf63pxMCeAGbYRUMxu2oY3Vx+W94w670UoWRQZCeDIGF31W44L73l09Q9VfV/LLVjEWjmxj0X1fcQf22lx2ZGd0LaxulORLHAk+0702ICorFJ5WvFBorc+0iv/6FT17goDPZAdUkg68BbAzrbA8HoFB7wHw3wI4DKS+WzAJQ5waiMCk2PkEktXO4QNJIlE04UNbLB+oi1Z82ImbNthI3P84UmB/2684yZUGuquvXkOdDDiK9vAg1+6rYBza9H85VOxxZKO5EedRROZ1HDIN1Y5lVO0381l7FK30wTzX4d6qmKC1O3EruGV6z2vtXvOiMOmcUtPBqohdjAh4PKGZR4Lwh63C1tHVEa5sHCwr4MArgGOHxmibZg0Qf14I8R1ElEcWqxld8xARDcYJStgYQLruJe6BB8BcqMsqAQo5AvYAbu8oZNjtCOR+ch5VdJM07ErJuXgTPcISwkIVcQs65r5f+SPwL4lIWFPAZQXSAjfAn6EOwJ/Srs4/29oDuSl2Wpiin4W1ANxv6Ljzb+SmOMFPwrO2MavjZaRlxlwdglCKrftdItj+WvcGEt25xb0K02MBzCzAdFYIfPHwUHy2UcwrSyOsbx4cJXBADRczTh8/DG1c48Oa8S4Geolv6SZ4lHXH1mx2wiOEAPsCERZtczJMqRIQEEAWhLBVIVSIujHbAYanDgmO+lEbQ0FHyUOLQoEAk0vjFZ10YQscxuQdNuE24SIIAIQ2TTRCLkLqF3sB4PgedSIOIgr5uaSmGKm3p9QVGK0NFiFtWE9Kidy2TiNbdCVB3BMFhIRAhO7fONQSMQFTqn/3swXbWPJUTJiKKcExryO2oLSjO0fugL0lA635h67s6N/VrJ/oyYMlUgfaAlhdGuJEkdNmq9+vgb8EoB/mQZjAbjJ3w1bB5I3ReTsigaDO6ksiFOhwx3BmrAvVeWDQxbCZ04mYUgjCz7rJyYiabkbX5MOYEQiYBAOicFrH53e+fhd8TC+bo+q5Ee23Q791q6OyZb5dzT9X6ZeILNqf+8zFYFovCM8lXYE5SS9eBOYlEYFEoUQgYhc8dL+hNFpXBdrVcHQsRdevMKKGK3s+3nuM/xmX7Rgzaino9xvN7cpogKsHhCZ8sNRVNI6vjFC1CudadQuAH2FgBVYY5gTWan5hl3YNDVZGm5OdHF6owKb3HBFIk6+U631w91cCRLl53VhrgBmwBTYdAs6uTj7I4wUCcU5yuKY07Odwg3gTBjhSZNDwPeosUqgh4Apfmo85If10yUdBexihce5FXHOAOfEvoqw+TkxuAL47ksMAnMVjSnsvXt19RmbHAnDn77ZbCEd2ohO7DR8VQez6xBETd7DdoEaKlGWMIQEM9DXrD0PTrwyBByfXZCrun3FgFQBsv3uYpJ/7YnM1CaF5oo8FzQQZUC5ivnkFAHjKsH1jHzJBWDPRRwtstZ2MMivQNdqmhVbKtNxy3AIpEM8vDxpGDUPdRIo+COfQmUsc/4dN5IDYhQIJDO2tnQTwciSE2NSNDh9HAZIcAB9ojE/AWQDK30MAvoIygQNQiUXCn2IQyYrufkQHhyOiSnXed1+go1A7OEo8qIvDxA4O73lg5wx1XJNTzPzBKfPDAKpTxw/j3KuXvqQp/tUYB1cBsC2CwfooE/VTf9EMl93FMG69YdERAFNEEpqhKfh8pBTgWIEQEL7aL0M7l4Ij055sx5lMIINp0mGSixQEtYblFoNoVsi01lZpACA2dTsTEC6sxAppmTK/jkXWgwtlojPZE9M4FrxOxIOc8CMFOxdZDC4w2UXhncVjDhmsJZOSHNUI8NhHpABsiTTYTWPllLormLsXyaLtlYzjVbgNogmx6N7Fr/2BGXPa1+MwnXMwY6QZ7yXglxh4/ss8279i48BiAKNhD4DOIOhDIPpOgMr0cS0IiTngLyocEbbpBN3iedM16Zxb4Wagj/PDh7EYzvogX2AjYf1Fv5Ga+PY7u+4qX6cwmARCOHcFEU4R9gtHi1ba2KROLiXl9vucew/7pdwFggvTKdva28BieYTyC9vvUETA3zxTLwCIRvADQBhbLrta5O5qIrTegZHhJnbqGcR7du8HzysbnvvfHrwB8/coA8+3tPQAocJ4VGJze38nDB1cC4C8G72rEgumt/VvlTb1Ap2Pbktgt0BKk7VFLoUQgDDFNN1kFslinkYJpJTgLLDhVNsmYJopGmp2ZqFDcU3mOcEEAnlozm9PlrDg63tjPYrTB1M79V8j5zm5Bkdi8sh4LBjuWDpCxZkN2cd2F4qvIyrPFrkQHUuEU0UVtp0HJxc9YM/oQ5Q4FSdgUfc48bE5Mpp2B0bDDXK/suBUzPksMfiujC5JElBa7//19cAqAFvnThity74MUGLm+W0DOq6UthVlnY8ukdlafy6O7VZxczhXWTcSMPsz7Gxn+4Fnv2US3JjVWygFKcjU0orMVaNUNBCTeboT1VoWmvW8O+rwO7asRocHGDNjfvV3q6o/41D409N7o/uSEIUQGf/s+igq3wQks6g/x3qJOVEAyXWx6/IbtvW/wfMCmHr+iBR1uB6KadsBnU/1SKxgIhJQ8hvRvU2sNcAq8HgGdKac8cTezZzfy4xHvsxT/isyDqwCUEoDQAHgrQB6QACwFqloC5KDESryxiE9f1wOrbw1a1DkgotODr4ryR3Hn03Pu8w3J1FKQQkB6ZxtCoAdtABBe0HsTkaX/hs8T0r0W1JPNAID/TV3QmVuR2eIJLn+IqIwd4Q+rP7mmC70x2zBPmv6cxR9iBuEdp8DOoIeWycxyBn8+c7emiMwVXgAd+54XSXiwoMu7svhGuNWZ0h+N4YgO8/Pf+NeEMC4C6BTwE0F8BUdtsW0ZsamDxKRRec7lWzcYLAvmaV1HM83aL0brc1dN3F97TtBpyQe10izQyknV7deGlabVQDOvPauCwNMGgzhGwsBSAQVgJ/c7lK6wuBeeeGPNESa7hqO7V0RBKWZgH8+LJcKleMT+EafALI8t1WIOSLVpEpnDktPVv4UuFtkhvuzZ4Sog0uNjpiZ6cEDyBgLdqII/IbJnU/u7eLn4tlR9iM794xyXWLGESEEVNt+6RP9KzwOrAJgQ79lZmwbd5SNfBGDRZwu69JX7X5WWWjWIC0AYkinMCIloJTlCxib17gPsCseC9v0wx14gf8uBYQSlkiiQUqbngUI+LIGQM6M7ayWc8LTBaU5/ci7I5EQzCuA4LqYJl1BSZr7JWDx0rmogbeKlKXrMiOTpj5h/Fu+0ClrxNZS5+LS1Tq6noWmObsCI+a1s1acdQT4k46USUeJIbo/3ZyJcMcWTLTOfb/2KAG8RbftmIB9XyTgwCoAN5ghQmonYFYKQwgSkrwZDQ6KIISjzKTSFK3QwgkBg1Ugz2ht2mPBHoM0hYYZPoQWGYyWf+ABwagKEVHw102c3IUnFwAYBL+qdmdi11eO4+SLmHAATLYiyFf+9YlOwjVB5TnXIWbSGfOfPdPPE6UiYTPbwrglKYsAEVmjY+IvAAIjnoCLFnhf33/PifLosgJTU97u1+k23LW6/GnaF15fdLWxP6T1qwQAJknA2wE6jpsK4Ksy5vSz1mzNa/KAX4rgOnab9SdJ25XMCIaEMF18OMoIcxNTa2jLlRcQ1q0wAu0JRk4huGYbjtIa8RDsaUALwwnQDAhvpcBPLkL0YfTSr+buoqMPugCgB8OIre8f0XwRUP9FfIEQSUjBvyzLfYtv5x8H93ov6yi6l970jqMUSJWDA2Q5pErHlxxHOmIqsHH1HFEquqk0r2QWDg5WmXfzFlkDXcPL+FfHASx9VWb/lzgOvAIgMs115tWAq4bjtksbXQCRjwgDKgrpMuAClZUB4wJEk5a1tj34dBBSO2Fiw90lGzlOufnetOxyeAVpNsk3HHfzCTiVO04wY+EF1WJS4Yr918b89VV6rXAlVX2jEmMOhEyyB52gaqcIbMdlZa4jz6XHLvzkt1yLpM7A3FNB+l3M/otcgm66cgB3rYWHIPDB349fh2PqGE/oKJkEvllI4XVHss/FHSfqFh1jCPYIrsEi7j51C5489/JXTgC+xHFgFYAV6IYZjwLYJvA4+tbG/h2ZRhtCjlvlvR8YJhJgzHUPClpXQDBDRc0tzNG7sXkz3EpBXulEqwgb4FJYEMkIu0PKtcEVLDMwIP+RQPj/WAuD2bbw7pwHh1bYrixXfF8EQqTEtzYjCumuSEE8895m+9liH0VehNTe5CyR+vUL7k8Q9Pj1PPgXhNlGSsndN3ekjsuwgGocbokDKO39Imf7LCJ5uT+dzyMXyln9jtgVrDQbTSA+kQm5ppj3tfADB5gJWOYS2qS4rYLogyAaOYfZodkJZsYcHjh1gMEYaQ9k/wgzSCfUwpFEG9x+kRndsQ0CUAck8zWymhmA62rEWu/NToyuk8FRJmFQWsKSlYQUScYfwL7ohUPI47JZmtk3UiFBKMrCFiUNcXeXp+8lq3te8atdFUAcBkTI0YifGTr7dkHDBRhCdNPSqEdyQ+HdomslFjkrkpK3iS2RFXnx7OGV8R8uj4etBmM2q7Efx4FVAIOiQCsByeIsiL6bgCUimBLTdpu0Vxz5VUB0Hz664LBZxuOae2nWWGdHD4J1WG6JyQ5PXYx9dY6EwRuRXR84rkjc+W2O/ml3nrEJb01/smw9323HdUsGQksvf/7sLRYP/tlyaEVRoshzUPS/5Bzt/XNXH9kRTiMGq8v77vGtDHcjVCH23/pjcaQ49hR6pESh7sIwt+F1iH/YnhIlEF6S7A/6R2SWPfT40+ee75U58lyirvdfWFB86Ye4MSPPBeqaIbMgttJy0JOH7emtMKZu1MHWjxiMcpz1KEtQ+p50MQA1D2a5Y8WFL8xwbkCManMQOh0q4bgCI9rl2XdpwtHxXT8+9y8peqpThSHcdfhuuuZzv29UNUn5CjiO82/OSUiBosg7K2e8FPL83+QjTgV+QXze3dvYoXa7xG5BokDQEX7vqsE/9+sasRVyndtzsm94I2X2JqX5I2urS3esX93eHWy8wePAYgCiAMYsQYRXCdgBkU9Akc4/jmaRX6XAvoSX8L2nKPTUcysP2/oBAp4oFGrqw2/vhgt4xcODeE5IdGTidvijBrkmkNABpfc1AzrWh9+fO5HDyKKw5rgj+EgpbX5+WLViUo9hPlqhipJ1lGvqAaAoSu8ymAsLocdENXp6opdcdM1790yivVIhiiMaREnobhGK7xTrvGk/b+ktGqkOi57soiU+zCrz/xgXgAcIhRTym8ej0feN+/k/HAyHzdZO9Zrm+FdjHFgXYGlYQBvCXg/An5RSnjJ16GxcWwrbakpYun3H/HMmObwOQDD/7NoRUWYDwSWY6qkPGI1FZmYMIu4yQRdSWLkj1LuNBasqbNgxyzJktg6/W/1jK6Tb088VUQ0KQiPPc5RlMa/mCL5Lssn7x1z0bxEot9t38XEXZTb6S50LJZohrne1XzS6JcQ659P9ICEDd+ZAv9dDnuc91twnQZ8qiuJiyQo7+8wNOLAKYHunRr8sAMaAQO/LsuzevDCx6cytdgngE63EMchkj+dj4Z45GM22aDIGIQ2ztpsVOD8CUp44BnsAeXEY0Amn//25Y2Ph9w70y7IsytWPAT7Gwg46zvy3Qi2lRFGUBjOILB8fnmT4Ul7JdXSFtnuenUtJHaYF98XuHx/L8aOu6d8v+J3OHex8uIsySH399IvAE8NgMDA5IayXCPhs2es/NDxyGJcu7K8iIQfWBQAAKA3dqvWi3/tMURTflcksNwg3efS6W1qayJj3zr/WzIYUaziyANgWCbUuAbEvDeaKdDBxZxXytn4UKgyLoctQFWzov6aYp9nAmdRuujnDxOW1x+nAXfECTDgw/cSdigX+rN+fhss4qnGXCr4TZqcYBJkKv6nwd4U4RvFTiV/o2y843zg8N/d9fI1R+DOu5BTvE7wi97spmNDdngNYAOfMUXzPu5YjgIUmXnAMfN4IkRgBuOP8c89lveFgfy3/OMAK4NQth2EfWA7QGpEQvg6dFSTBDJbS0nGFbfipIUibkBazJ+nAJ+VEcW031wlQHDIIhRC+RHQy7OrkDpMRMMoY44JRSLNi1IrRamC7Zmw27CdnyEZjaA6kJYqFLP4p+xtxXlo8+X29A5eoo1IhTFb7KOQX04dBmCvssWhwfIpz2Oo1hD/BNjg0NFmg2PzvW76CF/7EAbdNlqOdOf1k3uNgZ/BZPMZjHM635+sDEqMHENGVc0F023h1pU9CbGFzfxULPbAKwHRnAYjoLIM+QEQSLl2XYl1uogOCCEILCFIe1GpVCwEJ1Vp+O8d7hWGEge08EDaUCGhyXXrMBBcA+pKx0iMMC4GVUqDIgFwQMmk65DAISilUbYOqBaYNo1GMaWt870mjsdNyyHJjgiag1gQNCtYKwqRNASvyLcRBZFB90u5CIjOabaWuTq376Fim2xHtKvj2UIGrj71N/YVCv+iA8VsLbPrngJTAs0A37nm+15hVXohjKGOOBRyTSDpn63KtXbakMfLEHUWvtwairdd5Yl+xcSAVwG3HV309AGb6UyC6Pd0iJfqA2Re7cPnrQrWmmm/bAhn7sta70kH9JDZFMLSdFoUAMmIMC4mVfoZjSxKrwz76vR76ZWn978wm3IS8eVd8pFXGGqnbFk3boK5nqJsGWmvUrVEOVatxYUdhu2oxaRgTZbmm1AG9ErwiNAfRQYKC8d6h2qa3zyHptuVYVJBkDpgDjCKJOAT+u12Av/h0wxPrfh6BfJ2Ii5fQuTPpHJg6x54j7CBd2QP3esEU4JQwht2HS5CK0rDvUOA14v1XK/BAKgBAQ2sJInUUEN9MZAqCuJg6CVP91zW28iFBNo649FRQq60bBLO4E9bqxnldGLAgxnKfcWxUYnlQ4si4j/FoiF6v57vgSJnZ9lgiRfujZdbXBkDECbCddlpbVqyqG8yqKSbTGS7vNLi402JnOsPVaY2NmfLHARGkdX+UVj570afGdq8rAQ67dQeM9aChI4DUn3UaAnUKIOq8tMiExyJl09lmztzHvAU+x4tAZ1GOeA5dhR6UwQLAMLEqeO67BDDeY2SZKQbrIiggWpYyH2IfjgOpAJgzkGABFu8C6Fjg22vP/ycmn17XwWrNhJFRh1oGWiAqwImFK4rhEACjHLjrcB+nDo2wNh5h0O8jLwpkVtgNaUh4IA5EcB3xIEKKsq9X4Mk0cT3+kKegLJBpKg43qKoa25MZNiczXJ3U2JjOUFU1GqWwUzWY1AqblYLBE9jUH7OuinLKJg1iwQCO9r0tcOpKjscmd3JDO1GKRbUHwi3sAHBOcBOXny1ISr7ciua5gFtiIcTLfLfAaXckwk8hrpPeBZs9uNsxutVfFs5P2C5JrlCpXmJG/3rn91dzHEwFYPyrnIm+UxBOhS+ilUgwyPnz8fIQcVQEJLIsXVE8pbXzbDUDhQCOL2e458QKbj+2imF/YEEy8gLvKtE6IXITzQi2CILfeZ8UtKRUSeSAJ+VorTEYaIzHCsctW7BuWh/taJVGozRmdYPJrMLOdIbt2QyTWY3JrMHlSY1ZE/x1CtoNHuNnNt1wYJRq3WpTvGSRG5AQcdxDWODvd2XFoZj28Uh76RkYWcZYzoGZBiaN2diWakTLHqePzgdhhb4GVhdnW3rMKDrPpHrznlAC7XJNNsqjlON+uWfzJRAUvnLjQCoA6xgug+QpACKew+ZfQLVj5lsAdwguSVxAIJOZn9Rt23pmnFuRiIBhBpxZ6+FNtx3GkdVlFEURhD5ZoaIV3YOSC/4htQAo2pbiv4g5DLZAqWRkHMztPoKOc+XIiACtlMcYmrZF0zSo2hZt09o23vZusevGayIi06rG1qwGM2NWt3h1c4Zpo0OpNPcMiJDJKDzIUVKQoz3bbbuFSdxQWkMSYykHcqHRl0AvY0hbX0EDaFpgpoBWAxs1YasBGmWAUaJryrx79FFYljC3wncyK2O3J+Y9+G2jpz4HoYgoP0KHqMt+HAdSAZiqNriHgTvsJwboi3x9Uw7a/nMxWc8aCWgtKNQDZBt3dz3umQHJGkf7hHuOLeGOE4cxGgxCr7vuzIvSeOeJJAvM/ujvnPB7c9btC5/ElIb7XLw5RED8apgDuWf3he62vtutjfvbOxheeLAskIJapTCt6tBqXZsU6yLLwDC5DGBGY7MGXf2AVilobfrvmVLpKkkyatvW8g9cJ2CFtq3RtA1YKzAYpQBG9vSODRmzlrBRA1crxlZNmLahmMqiEWMb1JXa69AeryE9KMxRn6fB0MwT1jz9kib9V2gcKAVweMVMA0sNvxvgW9kZsVaBOwKPKZIJ7+0S4LsAx7x9jpYGIQQgjTAprQHd4lifcN8tqzh19BB6vZ4x981ZhNXe/0JYXeKVJu7zF1Z8l04bp7sueO+OAwDOrbA3obsidYEtX36MTcOPxHf2Fu7ilSlu5gmYCb3sVnVfJSmAi6ZBqIJSRgEY68M12DStw3VrG3LGXYWifAStzfZN06BpajRtjaqaQqkmWUH7GaOXAYd7wHYDXJ4Bl6aESjkhXyzd7l5QUhOQYm26d4gyPlbnNccfWjq1AKyS1etE2N6PPsCBUgCOzvHyhSs4dnjlNgEaJy6cmIeeQisvJ/y7j5B+SsgIODoA7rtlBbcdO4yyKMLqsSiS1Akxpa5BR1AjwQ5+a2flj/fx1sJuP44FK1l0LnZ5FAjbOqQ/3a0bTktpt+ZP+Bun9ZrPXPdds8orFXXYbVtvDWgVkrK0/d51AVZWcbRNg7ppUNcD1E2Fuq7Rtg20bq1QMTIBrPYY4xJYLoDzE+BqRdCLeDvXmyNwLSVwHcfxbig8T+IVVmprPzoBB0oBuMSFw8vDAWs+wtJ09/WmfmTZezwqXRLNH2ZbugpzC6CZ1ApHywb3HBvjxOFDKPIcsTDPy2Goq+fNTHayG0J0ASAMVoL5csHKbn8kLYZBQdEsRLzDOcQgFSFWEin2nV5+xz5OhMGqDL+Kxr/pXDCDiUhbT9GHNW37cGVNfC/0zJYPkVoDbduibRq0SqFpephVFVplPmua2iqTxrgJrEHQONTXGOWEl3eAl3cISgPC1kB01+Hi+MYTjMK9/hI7ipo79wIL9OwuwyhDAmtAtWrW1FV7/Xt/9caBVAAApAYytgLu5NgVf3QlsxYN4wpg3veFEX6lGauywdnDfdx69DB6vTLs6OPElmMQ+eduI06EPP1lL7iRme9XdgvyzQk/sKvwd+z9Dt4wrwiufwIGReCwAI5unNMLBIe12HOKSoGbUyKQBAQTWEjkyGytAheWtAqAQz0Ezbb+QNuiaQw5qixLNE2Dtm3QtMHNqJva4AVNA6Ua9Enh5BIjE4zLM8JOE+okk/URffDBcSRo3g5Kb8N1gAvdqZa6Tqy0Pl+3aoto/5XfOFAKIPBnaAjwqvmQ/VJu8AANYkuDRZztZ49B5DW7xwbsK81AplscH+e49YgV/gVJKmHE/mP8J1YO86Y9JcJplYCrzdIV/q6S6OICUTjMfnFtwd8ja87jApwew8i548mGJKWgBNy5OMq0VRycHMC0WY9KkJMQRmCk9pgCWyygLZygN2ibxgq+/c6+btrGKIemRd1UyNsap7MaR3oaz28BF6bpwyF/eZyuBoSo/Pf83aFrftC5jx4bYU0kHj127OjlV165gP02DpQC8CkdjBEYa/CmvOG1k3ARgNR6A2BXqPhDSjZgMAQr3DoE7ji2hn5/kDJVEC0IC93uzspv943KTyarflAMkZsQWQmpgKc/GocHow93F/wOPrHXiI+RlPd2l+Xsf47cAcSuluUJ2oiLue3WOoijL0wwhGqOcDjbY0AIZDaZKRMSeZZBFYV3C7RWaFtlXAXVWsygRdP2UDc1qqpCnlfIsgaZUHh1EhdxCQ8yzqXw7MYFiuC1GO7uHlkGIFjr8wz95ObWli/Btp/GgVIA7Ih6jCsgvBR3zfMkFv9J4L0HPw4dpYDgHzJjIBTOHB3h0PLS3oyv3Z5jpBi4I+uLzMkU1IsAhFiYKP2Okn3Dd5R8OK+aFp5s/DHPvbAhx5gQ4x2CSAkgUgIBM4jhA3cNzvd2bcx8GXUXno3i7Wx3dAlJUgjkmfRl01plwMTWugNKKcN1aFs0ZYO6qdErZ+iXMxzeqfHCpsbVKvL5KWUr+jyQ9EMkod1rPf/oWM7K0KxfZKW+CCGwOdl/rcIPlgJwN5a5IaaK2ZqhZM1Jdn3thHVHOeCDzAueWwgHktY4sSRxeGUZQtqGH7sJTuJtL6oi2y1OEYDDuFCp3y4ggGHbDo6w0OSfM/cpOc1F57XYegkfJLnz7mxia8ADaYssgSidF241NEcN+9lfIYqshFTIYjIxe9yBgKiPohACLDUyLaGzDK1WKJSxCpo8R93kyIscRVFiUE7Ry2d46nKD9Zlp8e60VpJO3cGNyGu33RxAhwnNzy3tsiOZH2Hg6WvQCm/YOFAKQEODiaFYVQXEFmIUMF6JrL/qV5fdwjoRSWaUady6uoSisIh/HB8GkAr+4pU23Zrm9un2lE0F33sFmDPjF73uItZ7rvo0f6hdzxt+9Z1DwSOX4NqWAMxqD4DZGdgWI3APy2MGi0wRq5wJXgkE+z0oBSkJgiQEC2hp3IUiVyjaHEWToykK1GWJsqxQZDt47MIEV6baR2q6lkAyPTx4uGA67DG8/alxFZo/L4SY7VP5P1gKAABKlBCDrK6b6hwzV8xchgIWZjIRBYqr+58vNhEnrgCe2LLaB1ZHfQSkdn5ahE8YSUHlrik/twl1hG+3Vx2bocMJWLjyx38XgnsdkPA6pnFKkrLCFl5Gl0S7WwLRb1H0XJgFAO3vB/v/dtpus0u8dk45eSee7MmkuZuugrMJqUohkEkJlWWosxx5ntssTYEvvLyFjSa6lo69559zFC50d2Whuu3uaPNRAH5SK/0bYLSvCUj4Ko4DpQDWt6cYjxSyOgeAxwG8pJnvhMX/g71PfrFyH2k2RTbi0L9b/cEKR8ZDlHn+Os+su9oDsVB60MnnAmB+u93ezzn9tOv7ebO++xktfOkHp186gA5RoRQOvbGQmPKJJRAKj6aWBME1DI2ZiCG9ONIw5MBEhM89EAl/TzvFfpLrkEKAsgxCCmSZRJFlOJVJaGY8emGKzdoAkewF1k8Mi+HSrtZBV1n7qII/BZ4S828R4Wlv8OzDsf8Ck9cYm9uGj661fpSZH2OTbpUkXTBHyiAW+dgdsK+VZhztE46NexBy9+o3vOubzlgA9u2+Ha7DtuwolmtaEmGfhdYFYfffWwAMzEMLMeZBnd26IGeknOY4DbFVFOjS8QlS5zUtPHnqCF5HDZMpApNlGcqywNJwiNuPruL0co5+LpDnhWl2UuS+p8RicHTve5YWSgGYscMaj+hWtQBwaXMb+3EcOAVgBoPBF5n5IWZdKa1DMws4MIfB0AhU1cjktxpeM0Nwi1vGJQa9vOOLXmPMzUPeQ5CD4xBdAoA4hv5afo72+JK8fM19uRDT6FgvtMvhabffpGBpeEtn0Q0K3yf7zr23r5yltMi4uoaCXcDL8YeQQmA0GODW1QGWcvZNYPOiQFmW6JVFp/fhHg8ituysguLA/32cCZ+kIjMlJ/fpOJAKQBAgiVoCf56ZL2mbSOK7/thkDK0Ruuf4Ip6By66ZMRQK4zKzra7nJfGaKoGuS37DiC3N3fak+R12/Y3X5Vtetwlw/d/v8tXC4hz8Wo/1Wpbkax9OSonDq8u4ZSmDhKmoJGxWaJbnKMsSZVkiL3KTILbrJcbRHbfOMAAoZv0Zzfqy7vR03G/jQCoAaTL6FAG/TcCzDnTRUfKJ1hps21l7mqlSJp3VJp+otsVSmWFpUMw93Y7zsOvgXVa6GAQLLgg6fzlRAh49jo0C5z9zOEa3JNbuY9Hqf51C3tl+kSvQXZWv1/u5np9/TRt27sGcBYD5W18UBY6vDLCUMRBlNQJGaZlGKD2UZQmZycSFoc49CffCF1SZaM0PtI3e0or3rfkPHFAFwDBxYBJyk4R4mog0A17I27Y1JcB1TBu1RTCsgmg1o+AWx0YSvaLYu1Dtrt/sNVvT9T2xPuIj6Gjl4Pj7+fBluvf1KoEvYbxuYabX/3VHVy746rqOlShvnlfmRAJr4xFODEWoKINUsUkhUFjXILNt1ZI8jAWBH/vYf4cIv59ltI+NfzMOpAK4tD1DLgWKTDSZFI8IKXZcCEpbPEC1rqml6QXgs9FckQalsFQKHBr18bptNIrnwW4oPRaY/RFHkbobOADTWQNRFZ0AZ6Qx+mTMmQ9zL697XNv82eVt9GpXUDUGZ+cFtqv/OP1q99Pg+V8xkQfubMQo8xwnVodYznWHIBqEnIiQWwAxz3Jfx4G8mReBFEbJbzDjX06ng2cB4Or2/uoD0B0HKgwYD5kLECDAtEwamRac5pYDkXRazr02oBsRIKBxqCcw6hd7/s7uYaB4LIoO0+Jj+TnfCX/FRPXkNUKRExsN62bmIYrHU3L0RVfAu57fXgqjq2/mm6L4LxaiFsG1iaM0SHgaziXyn7nDMC84n5BvD2CBBcfzJ+2cLBstIiExHvSw2tvG1QkCFdjf+pCbISXBdIo1SUmO77DgHv5nIvxWv7+/Bd+NA2kBmCHBkAWReIfMZD/LJPLchXKiRp5x0j/BtvgSKCRhdZD7Wv2vbdB1fLL7mF8pO5M09R0W4gKeo7+bJbAouLBnLJP33u4aFkdyjl0zfk6A51XEYvntulF778Sde5Rs11UU9m+RF1gelCisypwLA7pAhc1LyDPpG83EEQyLDWwA+PWiKF7Zx7hfMg6kBXB4eQTVarDmQuZyLIUA2Ri+kAJCCdvuy4RoBBlWWJ7nkDKD0oxSaCyPeq/D+qdd/sbfL45Nd9deYxHETPJFQmlptwSQtmxGgsl7iBqYeusA8CQalxkZoMpOyIJ4/uc6HwSB3j0awR0lAMRuSyiwyoniilb8TllxXnAsvw3gc0IWj3nfIYR/57cWUmKln2Mpq3BVZ5DCULbnCoQK2IxTiUwyWjYFTRPtQniKmT9R1zW0UhBy//fePZAKABoYLI2wtX71uGQ5ckJO0uSWK6F8o0tHAimKAnmeG0lpWxzKGYMirvTzOkeiBxZE6yMLnDj60Jr4hgcU59C7nQB0hDwixNmiJ5QoF4ry9dkrgfR39kLPF34xb/sn2yUtxSIULLxiL5Mx2GlVQnAH/PHQed9pfRYBpTx3Pki+uybsYfcd9gqMexk2Jub+CM/WdILtKEi2coQQEBI2lAx/PQS6yMBLAFAOhzh/4cprnU1f9XEgFQBJYOPyRZJZfoTBA0fDFGRMOCGEaWkFY7ZlWYa8KPzngoB+kS2OUV/XCbi/MeCXcu6vFXUzE8Y79OgsOuGwyWI3T5qNGfRevF2Ks33trQE4JbHoYhZAePHK3xH81OyP/nqBDyt82KbTPCQC+zxpK8IEYnM9CDShK9p7CXpHXSTvHEGoyHOMyhzZVEN3irfEKpM8e5FMz0QpwK2GDsdXeZZpgA6E8AMHVQEAEKaW9y0IFaOt9W2LesKYd1mW2RCOreHPhpix1MuvSwEsZODRdeywRxppOtJVOdDn2VfccdMxzr4DAyRSYXVc/aSzTWwNAIbtuIBohIUfLaIqcfjcCTqCoKdWgRPiSPjjC0WkAfzqH36Zo+8QWxp7n/017va8MpAyQy8TkGjBzgKwz9LfKnbZjKESkiABLTRIeeXtwgE4vDzCpY39G/9340AqAMBZaJHfqBmaGEK4Nt7GEvBWAZlGl1qbtuFLvSxtrHmt33KvrekdZ/rNs0M7HNbO7xghD4KfIMrk3lP0ngHS84U0NNuwVKiM1M1pS62IEGG4jlB8x5eO0P0Fq7/ZJJj34W9oo56ENWOrIHEaIn8hWfm7J3f9w6H+8XFjiJGI0M8JhWQ0FGo0eLzB3zqHyYTnYFrFe6tmiZnHADa/ZELUV2kcWAVgxYcYTJrtw7HAnxCGtNENxbta9qMMkCIxmq85unR0AkWrc7xFVO13AbswCchxmIChWk7YNiTZu5LmzsdHtNZwlIaQNu2cr8qDIKyLrJmFMft4FQ82QQLycfxZ7Men3yXWQLLvvLm/6HnvJfy8x+fR6aeXSiH5q8gkMiFMpnJSiTlkJLpkTnaPmhmCBFiwo5r3oTBc4KXs23EgFUDodo9tyagdrx+sAS1A0NBCgLSpFiS0BpMwCUNKYdQDsrny1vNC7j9MkP1uTJ0WCvuuvn+cN0+d4zBsldrwcezve0UQUwU6Ah/DCuY0rJpMFEG0wR5AYCr47rN4v65PHysFnXw2FxXg+DtEfyOX4Lpmg+VD7HYp8YXPcRfCefSKHHlWQ1emohQJp8oFXB+Czp3zhxW29Tw0KjAme9/X/TUOpAIAAN1UWhS9FzTzFmkHwxC0Y+dp7ctyKQKILP9fKfSyzFoAZsyv4unLxZoBieDPfR354c4i6KLwrkxZ18QNPnsK9yEC/JykE2kb6iObh28UiavnZw2LbuwRWCgyEW6QnFBq6i8W/Bi463wXC7SHClLFwHNCnyKgEfdp7oznZI2Q1gng5Go6IKcZUgqUEia1HLYrcjRH2F/zottmCpGw4A0WasO4BjgQ48AqAHJ3OMr9Zw1AmMQOrYKdYPw1ww3IobDSK228d3cHoJvz/hrPzvudIQoeevv5v4Kgbbks6hoW7rddme3obDkxH0Kjs1Ccw1y3VxVEoaw322q4gjs/GATOr8jWJYkBPvf7HK3kMcjnzw+RYohN/OgHrtUwc6HQX68SuK4RpFmQQEmAIJ24J0IYxapaRL5+qlDMSQgIoYeQNABoE7zv0wAAHFQFoIDL2zUOjwsFCa05AGSCTagPWiEyXEFk/LSVglHKRd5/XMgqhHv2HM5Et2650hqNYswajVppNEqhVaatt9Im9zyXEkorX74qs+yyQkoUmUSRS2RSQjoA063uBF/G2gCDUTFN/5qjqkOuYKqLYAfykAEQ02tfWFpHz/v83ZXdx/Kjz8J2EUAYC77ZIDle+OI1jtcl/Zy4Sv6pRyXjNAxYrB0mAPimpjFA6f5jgecxSxwC8CodEJLtwVQAGji8vAQwv8zgLTDZuL/R0hoMCJtmpwDXeqvVGrkkA/b4cf1A4Nx2VvAndYutWYuNaY2rOxU2pw0aK/SmUIn7HWMF+H/C/JMkIG2n3UGZYdQrMOoXGJYFenmG0ioFISxCbWcuRxWFPbYA+71HrJy1EAEH3V4HHQni9D+dZKQIuY+snJjg08UPgvnf+Z25KEOsJDrmvz1/o+i7kOfezy/VEQu0hb1FmRQQtkQYAdBWUVNkeZnW8WantJYLgwinAXoPQI8cFBDgYCoAD7hTDYYCuVUotAVnbUxYDW2RXUCwxkqvQJmLCISLuwvMh+wW/z6h0YxpVePydo0rOxWu7tSYtQqt0mi1Nj4hAKX03FRwzTJCMgn5z6UQKKxV0MszDMsc40GBQVlgUOQY90sM+wUECS/cRt7JgFdkP/Phqhh7CD6+AzW76q8rqP79nK8eAXneErB7sBf5VAF0ju3ufnx27OPsSJKewrGwy6q/tykQogEUlE30LQPo5wQpCG3s9lCoHuXATe7sF1kES8x8TF1aR3Z0DcdXRnj16v7mAhxIBXBpexuHV5YAs75fDXF12H4AJgoAzRDC+m6kMcwYS8XuppnX9Z5r2/nevt+pFC5tV3hlY4ILW1M0KnId7GijOlCLAML59FQjG63teoO6wQaMQsilcRXKLMPaqIdbDy3h2PIIZZZ5AJBsWNPFsIlCn8LQjCcNXHJ0UWmU0F5PJMixSc9gQAchMr4x4BSxb8oWWRHuM9P/z9RiNLwMbdK1tVMrpnhrCNMCkkxLMSKO1VjHaZkX/uCfE+wPJNsRCDpSBYUUpnUZM+BaljkrxwLNmsNi0/0hZuTMfFKOhyXXdfU6p/dXdRxIBRANDfAlAJrZ1vN2cus1trEEmIFRIbBUxqv/4rEooscMTGqFKzs1Xr46w+VJhVmrrI9otosx+tdiAfIeHyql0SozeTdR4cr2BJe3J3jLScath5ZsdiPAyv617xMlwO6vFUx/gWY1jLNgY/OfgWhVj834OEEnWi3tew027bqscLdao1EaVd1iWjeYNQp1qyxGoj1G4sQqlwJSCGjWEEQo8wz9TKLMJfpFhkFhsjmD0trlZs+BjLzHO6DIBKQASAUcKKU52/1MAkDCJI0U5AoIQwA3FcBXdvgHImIQO455h25B5uGUUiKXMjX5F440ZMcwq/659Qle2Zhhe9ZAI2bbBtNaR0web9q6ELQ9x8AW3H34ye2DEWb11gxs7FS4vDXBkXEfRSbt1w4AtKukI7N4UktwM2J3IBb+ubsbuwIJYUcbF6uD/gNA0ypszWpsTGbYntao2hZNq1E1CrOmxaxp0SgNpWPhSp4nQmNRWNo3QRIhzyRyITAoMxxd6mFtWGJYSmQimPgx4S+c+y4zJwX0fYovxxWK2WBKczUMPC8gMAMtHqKJdtNI+28cYAUwP9iBRNQxaRnoSWC1oDDjF8b1o2PBsH01A+s7Db54eQfnt2bQ2uxsrIIACGXCoPiZNOi+iyJIEVpiuarFWmtUrbaCEMFY81alVRjBHCaCFXq2tQ8DIGZsIJG0H/MchLjJSPRjuymjJO6/S1KPVwhWSLamNc5d2sCr6zvYsSu9ji0xd0GMayhAJ5l2G2UaidRKgRm4OgU2pxWGZYZDwxLHlvoY9WRwqzhENZLf3O13rJlvLAACFHesObdNZzf3gSD/E9Y2+HJN6a/4ONAKYCG5C8EYMAaBCenkkjDsSbtNlIO/qzIgKAauTGo8c3EHl7ZrtAZgAMDIpEA/z9EvjGk6KnMMyxz9IkMhJaQkZDJCkAFoxWi1WQ23pjU2ZjU2pzUmVYOq7RSmjE5Fw2AZAoR+keHIuI+1YWmuTSl7usLyewznwa1goQ9hJPLdEOe1ZBHzq31abIVRNQrPnr+KZy6sY1q1uy6BPk3iuhbJKAwABDeBgc1pjauTCuc3prgwmuKWlT6OLZUoZVCWiRWT8ooQfxXfh5Q+zpFFMU9+YsvKFDrinDBI7WVc7rNxYBWAbyTB8YMmS+FMLQABxqFSYlRmnfwWttRbu0f04BjAle0az1zewYWtCsyGLTYoJJbKAsuDAiuDEku9Av1CIreVY8kKV5joKcGG7e8eGffQtBqTusXVyQzrOxXWJzWmdYvMdsNttFEKuSCjcIoca8MSR8Z9rAwKMCILQLAP/zlA1LU5C8oAiGdm8n63CRu5U8H3h3/trm1aNVjfmWJat3v45AuEbv6nooe8+G1A9IFGaby6McH6pML26hAnV/sYFtKddHJsXvBDLqbhwnruU6domE0kKSlagvAcAWdr+J4A3YTDfT0OrAIQEJa+EmV1uS87c1oSsNwT187+iw6wNVN48sIWrkwa5FJg3M+xOihxaNTD8qDAsMiQSVNejATNmdZzB3ZIPNhSR43LMCgzrA1L1Ksa06bFpGpQt8qg5DDzSRChtGHBQWl4AVLA0Fad36pt4M+FAEWYoItandMuN2tRxMKtp3MkoEjAtNYYlQasmzat23VXq8Z9DxgL2pGepJh30Yz7ZHs9IF3U3Xo/qxWeubiFjWmNM0eGWO1n4RwWPWsHBAcEHyCgLzS2fAQjwimsJRkEP94RlqXFAOMyat4yYYvrmMg3eBxYBQDA+5Lej6WQoxendOYSWOpJXM8TITJKZXPaYNYyxv0cR8d9HFvqYXlYoMwyyETouxmBiwUuQv9SRN3yxnuFRC8XWO7nNkTmCEThKIYdaI7F3up0fe07hCAdzHzXsjte8RPBpHjCL7jN0YRn3cUDzN9CEo4u9aGUxoWtKSZVa64hXKZR2FaYCUCeCQyKzP/rFxl6eeZxE22TvBqlMWsUJnWL7VmDWatQNxq1UsHiAlArjQtbMzAzTh8a4PAw91hNnPgT/687nwoL2LAL77h9/N9g9XjAObaSCFsgUugRUO1/M+BgK4BomNUgCH6o3gKs5EBPCszZfovk1JpyvVzi7JERhmWG1VGJni02mgi3b18VKQP/Pc0d1+gABy+5WDlbrosr3AFkri6dR92BOdF0SiThv3QvipMNjAzM1y/g7nmmP+T/BPTbKaCgyKQAlgc5BA2w1MuxMakxa1uzajuht7dLEKGXSyz1coz7BfpF5rkOMnpu7rK0ZijWUIpRK+M2re9UuLw9w7RW2K4aKG2Or7TGK5tTtEqDjg6x1t+j4aslBcVmQpnZZ5RYOwgak8MzCZigdb8YUwAXYbwzXNrZ3yQg4AArgEh/B4QrLrIBs1oJApZKQ6P1puyuRzX7CiKsDgscIkKRSZPuGQlIqmQ677sgW+y4kpssAVTzYUpK/UsXOQjTjObOPXTZ5Q4gyogLgrpYorszscDP65e9FcB8JCC4GpJMoZVBIXFoWKB2UQ57PwQZ5ZZnEmUmzUp/HREJKRg5CyADBmCMezmOjHqoDo2wOa3wysYMl7dn2JzWsD1icXmnRnYZKI4OMSpk5OtHV8bztoCwfoH2hKbo+yhLMmAEAUcgYAvgS9cPct74cWAVgFmCWDHEiyCqAOqbuu0UHhYbBTAqSvNgPWAIW2xzEcpEnokmRDiesS7EQsGHA/+S2oC7IFiBsGD+UrwC2fCVFWZy770lQIkaSJKDvb/f9bvD70Wxjz0UQHxfIhCNw80zL3Xy3m0viSAlkAmJAaQ/ihBRqa3oHiUKYFcMJToH2HwK+xv9vI+VfoH1SQ+vbkxwcWuGzVkDxYwLWxV6mcBdRwbIRHTBC8BIXxhERveY4Uk/YclZgCqEJKdtAi693il9I8aBVQD2ESgGzhNQE9BPpo5VACslMMgtUBbt2B0JaB+996QaEfn3XTcjmdgdHCCuzYcF09vU+46+i0EwK7jsBDuAnYn5GR01VgTguEIQ+0MDWJj8R4sEPwK7krBaZBF0rYRwu6KqTCEsEu6REIGnkDyJ6Eb5vAVG6Pai4WobCjB6ucSxpRLjnsTaIMdL61Nc2jZMzQubFVZ6GY4tFf7KvCBb/RorsNyGER3Gol1eyZzcd9wrAMR8GcznUrdsf48DqwA0M4bDE2pn59VzRDQDsNytc68ZGOSGS58K3+6B2q45799H33mhp2h7jwEgwgSSAyNUAO4s0ywCigwBkAZ0TGjyJoEVumsmKvs1H25/9+Ge+yQGbvikk6GX1gFInZTUVYqsInsPwr2NlCmSHTtqKLKYhHU9YKo+mVMz35u6fhInlvsY5MYNeenqBDuNwsubM4x7Ev28kwfCYVV3QF+ZCWQEzLT2AKJjAvqEJ05O0CldBfBDgH6RmUDlMWDrudcwo2/MOLAKoG1b7ExehWZ9SYCqRfBXTzLW+gKZpIXxZxf/p2S9jw6UfJSy6Sjaz9cPIETvacHvmf/6VTv2FTmg9YbNp1M/HvCCz2ke6i6ja8pfb0wqti0QhH8ufz8I/6IrTSnHHeXYcZUo1Ryd46UrbVBMlFQ6cgVRM0FYG+YosyFySTh3ZQc7lcLWTKGXieSoi0oRCBcK9DqOo38LHmj4bB2MTwNUAQTMXr3O+31jx4FVAHmeuxj5RQYuEfgUc2rEDjNgmAt0n1Q83Nzz//xn1udPwordjYNF4OMQ8aoWWwEei2NfmMM19gi6gKMFL1q1F+FyFK/EC4b9vdTq2XXTzge88LsEREsQWET3AHOrvBd4AZCtzeBDtkSJkk2fjYmMhEQK57cIezbGNneWhnOymBmDQuDkah8ZARvTxgq8KQzTKUOQEpviVd0h/h1uT+L1mO8aAL8P4NOsqIUALm/PcBDGgVUAl65u4/DqEsA8A3C5KyjEwLCQ6Bdy98WPMP8dxSs7Uq0wbyskh0o/3GPFtf65M119KDD2/90sm1/8osOkVYC/coM7yqbzm3PCHz6Pk5E8nuJcJ7eNu8/unofAhS1lBq8EvJhH2EKIlth7av/bzwVuXelhZZD5+jwRlplenccvGP2MANtFOmwc/etaYIxNgH+XwY9CEtNX45F8mcaBVQAAnOqegPl5JtZknGkwgEIwlgsB6fqz7WkBB7H2kzLh0MciH5v8kSsQ4wDxYReed/ySo+NGKy8FYTDvsbiP4CLjhubX0r2vnuMjpgftBr1TDRTOnbp/00zELn6S3Kvu+cbYhxU2dz98PIPDHSOKayqa4xqhJuSZwBJlpo8f65S448IB0aUKsqBxh/TjE78WCjd/ghn/Kc+paZrrd7b2wzgYhct2GVYsFYAZOhhWJhi9rLOA7xECCPKeru+RMT9nDaRnEkYiK2EOofvfNB0Wc7+50NzowAuJMooAy93Obfc7uculzR2G5t6n3KfIFeooy/g845U/HKrji0VnFRb8Dm4TNLb/NDlTi7n6Ar/Jit5FPAxHQ4ooUsAhANh9wJFKeJgZLzWN+fzK9sFoDQ4ccAUgTB/AHhEdY2YRG2qFFOjlXfrvtZdkrwiiv4FmvGDBJWCRYuFogvlXDPB8PGnuLFJvJrJCFoXLANCu15UqkkRJpJoR16codjm+P4sOGOrlOVIC8Tl3WZWITynCBjpaKTyX2C6LNomjMJ3LWnTnA7EJADFKYSzI1F0IAcT4+YLoGSL6jbyUk7YFrh4g4QcOsAtwaNw3PhpolUi8mVlTsO8IhSTj/+8ysaN1PXwWzazdvX0kEy8G9+b4IZ0PEmYfR993GGapY/BaQsodIZlbrYOyYP+6A/hxF3yLDuE/6gpjKtipgokjJkB3nd5bdQVgz4B3wQkI94ZsVDXSFkmxjqDD4+t0UQBf1ciZ+QwIYhRkO3x0nln6Gkzgp4noJSiNA9ANfG4cWAWgNSPv5Wjr5jgJWon9uFwwVop0xVk8nBjQdWyb7ubr7CEYAXulwc59290+Nk2TGPvesae5QR3lRsFN6B7F/G4INXoOHEfw4qKiC3MHQXQPkzV89x2u6/P0cuNT8R8nAh9BgWED7KrIF7gBbkaI+IvO68i6Y9b8PGt9CQRs7Exx0MaBUADP/0/fh1dnOQ73NL7w7Mt49Imn8Y8+NwEuXyE5Hh9mUO7LYwMAGLnoeIRzdnvqq7rPI+wvbEkLJhEHNJqjCRrRQv3+4AXEu852cVw9eT0fo9v9RiXg2SLBX8D1863IXE6ClRwmfz0cZQsSdRmNnRU9uVWLAdGEwgwHQsbv97hECv383Pk7P99Y8FFFZNc00V4SRdu7Vd+b9lG2oMOPUC+484kxwNtEeFDmxXrdHIywX3fsewzg733fm/Fv/ugJ/NYjz+H9/+yzuLVoqfm6P4v333MMs35fatanAO4JMrRSZnNRvVzgehf1bgIforfdQ3B3Q5s0QmRy4uumRVU3qOoGdd1gVteomgZKtaayrNbQWtl0Xw32/xwoyJaeyga13l0TzF+HE5+O8IduRPZiSfi8BkFBgD3rgVLFQXO/cx33tPtB5xqul3uw52X7Jb/zpPYyKFxPhRijSdwxUz+i6Jjzi06DgOcJeJh1uwcOs7/HvrUA/tGffieWBgUmswqTK+eIR/3y3/zZN9/2/PlLt2eP/cqzf+Lu2178//7BM2pteSSkZq/KmDWkIAwKkT6Ua2iDgJ53EMDObnG2WNsyLm9PceHqNs5vTDCtajRNa/oCkA1SEXB4NMDxtSWsjQYY9ArkmQlPzq3G3RGFE+yKsyA9uEuACK5PQk92Zm18PW61dJrTrabxKhc3E4mslsVGfkDsQ1Te/U0JUHHxVg8A8u4KYrd7NG/R7PmQzZkkYUC7dxTqY3vfkuSpzm9apfEMMT8LEK4eEOJPd+xbBSAAtE2LH//lP41/8Kf+P29nFn/hky9svR0oV+WR0+stq//4Dz50+y/9/O9ebBSgpS1/JQCs5iYrLYxdgLwobBXQ/vA2hpaFnRBVo/DK1R089uJlXN6a4ur2Dja2p9icVtA6ySwxP0NAv8gx6hUYljmOr4xw8sgyTqyOcWg8QJ5n/oT2Km8do9FzE9iVNfMGgBUoihWA+Q2KJSZGMv3+wQ82XwVBYCzYt2smLbjVXeF3VOYYWDR++2JwMCYh7d1PMMVHFgQF53EYX7DUlUE3GaQubcABjYn1Yl42AB7WRJcO5tpvxr5UAP+P//rrMZvVQFWLf/RD/+qtMyr/lkL24a1KZ3leoBgMUKv6vp185Z6zhzY/89SVeltrXgaATBgih++b54/KaajIjoAQx/y/AAQwTJmqrVmFFy9v44mXL+O5S5u4ujXBdFaBtdrzWpiBSdVgUpkg8QuXNvDwuQs4vjLEncdXcebEIRxeHqHIsoWc+HTB79bji77ziLv9IBH+6G8EDnr/u+t4M6J8g+uIQ3SUSQQn2tXeHzT1/yNF4POk4svt/Mi1mommTzW8tohAer6JS+JwgeDgCSEAXwSscxvM64vE9FmyzecO6tiXCqBuFVgI1KJY3an5xyca35XllCV99fqj5VLp/+K997Snz3/m3HCjMk0kmE1WmLClubvY35wSSCJlcXjJdIyVgnBhY4JPPvUKnn5lHZNZhaqqjU9vy28tLy/jtpO3YTqZ4uL5V9E2M1/0g8j0LVSK0ShGqxlbsxrb52s8d3EDT718GW+94xjuPH4IK8O+nXiwINYCBTAXblwAm7k8BtdL0B8xKEavEP3KHCoTBURt9wCA2WxBOCSyTmKZSWTHlzFz18lBGSFWGPHDSgOk8xG5xWOx+gpFPmIasD8yGRwgIwveLvwBvqhYPWIu5/oDtftt7DsF8LfeWkAQcHy5J565Mn3Pdq2/hYUoJLs6+Nr6+RlG47X+ZDr7xrNHr4oHz62DGRiXJgcg5OPP/8ac/M+xz4zJXzUtnnh5HZ87dxkvXt5AXVVomsYgxVmGd73rXfjGb/xGHDq0hp2dHTzw6U+Bp+toK+3bjwOmw2yjGNPGdPmZ1qboZ6M0nr24gSvbU7xwcQPvvPMWHF8bo8izZKV0Y45X4H3Urk3uLicG9eJYvPmvWXkjQbPCz6TgD+t2iMKsnRhHekZsYvZBnCMlEYXZXBtzVyEphCO7R45xgXSlTr99HYPnFazDYQsBlIIx0R3zP+z0LEDnvwxncUPHvlMAW8/WOHf0Ml5SzfK0GP35huTZTPr2yxBaQSijCMreEKtrh+T9p6e4PGnw3MUtLOUCWYTgznuVEdTXYfjFJBZmxpOvrOP3nngZm5MKTV2jbVv0ej3ce++9+NCHPoQPfPCDuPOOO/CpT34S/+Kf/zM8/ejnQazw9d/0fnzbd/xJTKcT/Mq//Fd47PFHjeLSBqPo5wJKw/YCYFyd1Pj8cxexPW3wnrtuwenja8izLJi8Vpg5WfLiMKL1VBOuvbBtw5wrEKXoJrF99uWvSWvb8ciYvyaMFkchIp6C1xdRCI+j0mQclIDp6hs95AikdI1DlDY9E5StbpxJY8FkQvgOyg6HMasyd+7H9Q72OmRRdeMoNtCZP8nP7BDh81KKCgAuXT1Y7L947DsFcOjtR/E7Wz18fT45ua2qu5WQyIQpLgkyvpmULbRWgCD0hss4cWiKP3ZHA9lWWC0ZDhDsjkWgUGwBOB9cCoFnL27i08+cx+a0Ql0bBXDmzBn80A/9ED74wQ/i/vvvR5bl+MQnfh///v/43/Hw5x4Aqxrf/YM/jL/4V/467rr7biilcPd9b8NP/MR/h8efeNy7H1KYvPVRL0OjDLDYao2nz6+jahvUSuHsicMoc5n40x5P70z4hZnDFF8XmW7CHicIXZSDd6zBgkAaCX7i1r8gNPbwDjCMuvcujNFbPyw+N601pnWD9a0ptmY1dmY1XlnfNoq2Nd2EMinRKwusLfUxLAvcsraEtaUBBmXmKd5qUWpfZ/iafp0UPY4UgX9/zXAru//XYFwiZnV9QdH9O/adAuitHcLPnxrQ7z7HZy5vVKuTyRTMjLqpATCEkJAyg1YKrBRkXqIcLGFtaQN3HR2gbep5Vl/A9AIIkEQIycTAydQBvDqp8MmnXsX5qzto6gp1XePuu+/G3/k7fwcf+MAHMBgMoJTCxYsX8KlPfgIPfvoTUPUUS6MlfM/3/yDufdOb0LYtpJT4pve+F9/7fd+L/9v//D+jqWuAgVYZTEBrYNDLMShz7FQNZnWLc5e20bTn0DQt7rv9mLUEuncpWvmC5R5ZMsKv+AYHMHH/mJwTlIA9ENkGe9AgRSAW1gKgyOwOK2MoyDFvjnuvPXHUGdO6xfrWFK+sb+HFy5s4d3ED21UDrRmNUr5NWvxcMiEgM4l+WWI06OHOoys4c3wVx1cGGPUKCGEa/15z8KLXEa6wAFMVFDliHO3HvMNaP7y1NamHo/5XUhy+4mPfKYCLM8bHnp2KaaPv0sCq1hpVXWFWTaG1thaARJbnUG0NmefI8gKCjNnIWkbEEAc02dGN9vnVEYAVFAB46IXLeOHSJlTboG0b3HvvvfjZn/1ZfPjDH4YQAkopKKXw6KOP4uEvfB5b6xcgBcxE7fej+vGAlBLj8XiuKQnD1LHnWYO18QBHByUubUwwmdV4eX0Hv//YCwAB9508ZjgDFDsB0XpqzfC0zr8BMIUj/IhQzNSzGjmEvQgmTVZrU5qMXHMODr/hgTL/006wA3xP2tkSwb5iAFXT4tLGNp58+TKeu3AVr16doLYr/V6D2SiGRinMqhpXt3Zw/vIGvnDuAu48vorTh5dx59ExDo16xhp4Lb6AuybHAPSQoDnvTADZgspL9pPHieiJpfHQEosO7th3CmCFr2KkWvHYbHxfyzSSmYRoBep6hvWNqxBCIJMZirxA09SQeemBMOPDi2R+djGAubr99rXz/xulsTVtTFfbpsFdd92Nn/mZn8EHP/hBMLNf2eu6xmOPP4qnn3wMxEYxzaoZHnjwAdz/tnei3++BiPDcc8/hYx/7GKpqcbfoRmls7sxwy2AVtx5dxauXN7C1M8OFrRk++fiL6Bc57jx+CELEZkx0gXBxdEowg64LQBEeYG8EyDURcRiAsf/tveieaWQt+KXeCj+nMXZ3GlorrO9M8fiLF/HYi5dxfmMHdRuWa3eKuTSsTSnIdwbSzKhajVaHZ2aYljWajQZfmM7wzKtX8eShMd5++2GcOTpGkQmrCK410gRfr1YTHbLIZWCAuQHz5wi8BRAube3/2v97jX2nAI5mFXLSy4MMh5TKjA9q6bN1XeHq5lWURYmyLFEUNVReQyuLCUSlqNK4P3lUHHDgH/xrImHDhjb2S0BTNzhz5gx+5md+Bh/4wAf8yk9EUEphfX0dzz7zRWxZpSQlYXtnhn/wv/xDXLqygQ9/+MPY2dnBP/2n/xSf+tSn9rzmqlHYntY4cWQVtx3N8OL5K9iaTHFhc4o/fPplLA1KHF9ZMiWq/UV1JqgrUo/IuhEUrAAKZc7t7bGGgAYgIASDNUOT8MQinwvg/mmO1siQqRdXyHGtzJpW4bkL63jo+fN4+tWr2KlMu7DxeIylpSVsbW6gmk5QZML0QpSEIstQ5BbsY0bdajQKWDt2AsdvOYlnvvhFXL50CZPJBG1dY8KMZ5oW6zszrO8cwttOHsagzKB5F5+gi6EmBT/SDZ1Ki4FGawVtMfMf5BlvSxL41E9/C3Ih8O7/4TdvtOi8rrHvEhi/644S0Hr5CpZ+UMnyjBRh8jIDVV1BaY1+r48izyGlQNNUuHp1HZPZDNpWc3X7BAE37017LVf7X0JKgynITEIKiUYzHj13AaPDx/HRn/5pfNd3fZevKuSOqbXGSy+9hP/93/xrvPLi88gEQEJge9rgpVcv4YEHHsCv//qv49/+23+LT3/606jres9rZgCZlFheGmE46KFX5qhbhVnVYGNSQSuNE6sjlK6+gZf/AA16gRfS4CRCQkjrBgjh78Fc1ePkPKwZzOzzFlyugtYuLyGNTMxHAhlbkxkeeu5V/P7jL+K5i5uoWo3RaIS3vOV+/PiP/zh+4iMfAcD43Oc/j7pRaJRG3bKPAOS5RJHnKHJpW3YLvPktb8OP/OiP4tSpU9ja2sLGxgbqugazRtUqvLIxxdaswa1rQxRSJEVMnYWjbZkvrTWU1r7foPkuKDowG+tlqrDTUijbZu7NfwD4F1f65daT//23YVrXGBYC33znAD/4juP4lc+ev9Ei9JrGvrMA1lUGgi61EL08kwAb89AW/wCDMZlNsbm1heFgiCyv0NQV2lalajwB+UJMPHwQhcyckpASJQn0eiW+6wf/DL7jO77D+KFNgyzLPMqtlMJsNkU1m0KrFiQlwITW+sDb29t46qmnXtN1mwYUhCzLsTQc4q6lZWzuVHj6mWfwyAuXsDYq8a6zt6LMs/mVjNBB3+EFlESqCBOmITGYhamfDg3XWLQbhU/DZTaSzx0mn936ytYEn37iRTzy4mVMasMnOHH8OH7kR34EP/xn/yzuvusu9PqmlsMnP/UH+MIXvuB/qW41pnWLqlFYGQ/QL3OQYFTTbTzy+Qfxlre+FX/1r/5V/PAP/zB+/ud/Hr/6q7+Ktm39uT51fgMr/QLvuuMIioygfJ/uDlmqAxd0Q3+xMaAVg4QRfqX4St3qf/cD77nrpf/le++VQDMsBFe//fykkm1mMIMDNvadBfDWW/vYaXFK58M/WxT9o1JKs2rbf0QCTVOjVQqDQR+ZlGiaGpPZFFVVhx50kQVgVkUKx3EWgBSQQiLLMmsJSJR5hmG/h/WZwomTt+PosaOBMwAX6tK4dPEifvd3fhuXXn0JRS4BEtiZNpg1r48ZWpYFDq2uYNAvwWAcOnwM3/N9P4DJZIJzL76IrWmFw+M+Vkf9yIxPfVkSwlyTNNcjhAQJCRLChgEjt8BcDBJk1INi2pKuTKTFE7Ac3O45VsHdYgAXrm7j9x45h4dfuIyq1RCCkBHwoQ/+SfxffuF/wO2nTwdeghD4+Mc/PqcoNcN3R+6XBYoihxQCk8kEk1mFe+69D+94xzvw9re/HUVRYGNjAxcvXrR7C1yeVFgdlji6PAi5GW5VZ23cnIhQ5jMxrTXgXIJWKVyaKGw35tYozVjpiX919vDwF7/rrbe+7YFXpj/2xavqv/zcq9V7t6fV8HivOUeqab7tTUfxI3e1+NePH4zkoP2XDqwZrLUWJFhmGfI8R1EUKPIcZVlg0O9j0B+iqitsbm2iqiq0reMJLEJkY9Av5cIBkWDbzzQz7jwyRnb5Wfyv/+Qf4fd+7+No2zYhCEmZoShK5EUBEsLAj2R63l2zBfkuZ5hnGcqygMwyZNIwAe9/y/34uZ/9WbznPe/B5a0pnnjxInZmdWp1Rwh28qG5OKRNSwIeABKJ9dO9W25F1Ik7EMpkmy3C/86vb+F3H34ej710Ga1mFJnA6iDH4VGO6dYGLl66aBSyVcqPP/YYnnnmmd2mALamNTZ2ZgAJ5EWJPJP44pNP4LMPPojNzU3cc889+Nt/+2/jox/9KM6cOYO2bdE0NbamNT79zAWc35gYQDG9KMR+/SJ+g9vCIcmuQ7HSfPHMavHQ977jth+9PMP/Wmn5My9u6j+3XdNHGpZ/72pF3/Te6lHK2hk+Nzn85ZaKr9jYdxbA999VYpzpsi1X/iQVg9NZJjtGqRHaqp4BTOiVJTQzZlWFpjUx5RjYc5aAtKujsMwy8p8ZCyC2MECEw0t9bK9fxsd+9xN44ZVXcccdd2I8XjKx6SzDxsYGHn3kEbzw7NMQApAyQ6s1Jjau/VqGEITDqys4csgyAAHkZR/v/RPvw9d/wzfg6NGj+PxDD+PlVy/g2HIfq0sDT9ZxU1lYso8UDtPIjOUjJQRJj4EE4Y8jIuw5+qwZrE2YU9u/SivzuY0a+Np/Npx4YWMbv//oOTz56jpkluPEieNYHuToZRpFkePcCy9je9rgyNGjqKoKjz76KP7ZP/tn+P3f//09E3y01hgO+uj3eibKMpthvLqG+9/yVozHy8jzHHfddRaHDh3Cgw8+iPX1dUghMK0Vjq/0cWTJxOhdCFPrFAMw1xqBnFFNBoLGxlRjozbbLxUSbzu5dvdgOPpOUQ5PZlkmJDGYNRqlD+1U7R1fbHqPbm1cfqlfSPzmU5s3WpSua+w7BfB9Z3soSA92itXvFsXgTCZlBDY5kArQSqNuGuR5DkECVVN7S8BM7gB6BcGXvkmlaTAprRKwCiCKmUshcXRliCWp8eijj+GLL76Cl89fRL/fw2g4RJ7nuHjxIh763Geg2gZFnoOEwKxuUb9GN6BXlrjtxHGsriybLsYMHDp6HN/67d+OI0eO4OzZsxgOh/it3/s42tkUtx9ZQZ65xpt2wlpXR2ZWocnMCL9bdYWIsIAQFUm5OmZCs46E3yoCZ/4nTT8AXNzcwacefwGPvrQOWRR4//vfj7vPnsGVCy8CqgWRwOXNCT7z+Yfwa7/2a/jN3/xN/NIv/RIefPBBNK6M7i5DM6NflhiPhpDSWCkyL/HWt78DJ0/eCqUUpJQ4c+YMnnvuOTz00ENQShllUSucOrTkowLMQQEopf1n/po7CoBZY1YrXJ0xFANnjgyLu285fKg/Wu71yhIEhtKtVZAas0bfMlGyPrK28tuc9dsfffcR/NvPX8R+H/sOBGRTv52EmdHGdxWAYPKrdCYFyrLErKowqypIKUPddgBd3n+I88egX2hUEXfbtS9ggmPAyaOrOLI6xuPPP4L//MRD+MynP4U777obq2uHsDOdoT9ew9bLW5BSochzLA37mFYNWnU99DQDbh5eW8WRQ2volQWaukbZH+DMXXdhZWUFrDVICLzvfe/DN733m/Hg7/1nXN7cwS2HlxO+QzpC3D9UAxKR2e9WRXj3gLv9Br01oP0qGdKNzZ3dmdV4+LlX8fT5Tdxx9iy+7Vu+Bd/27d+OX/vV/witDDdCaYLSjMlsB88888yuZv/CucBA0yrjBkgBlRvlVNu8DGZAKYUsy/DX/tpfw4ULF/Drv/7rUFrh0vYMk7rF6rC090LD10wIjIX5GxgRnsoMWCoJK8MB3nLqEJbGy+j1BxCkoVsNpTRaqyQbpbKS6N77jxTD9RlP7z28/7zrRWPfKQCtTVIKWaBI2Kw6oSl8JiUyu7rVTYO8aXz4b9G4LmqIJ4Vz4m9oZvSKHO++8zimtcK5S6/ixQdewgsgHDt+HN98/53YPrlq/E3dYn1zC+cvX8XG1g4ubU6wPjVhLm2BtYgHAyLC0cOHcPfZO3FobRWsFNqmxfFbT+Jd7/pjGA6GxmRtGhw/fhw/+ZP/HX7uwqs4d+lFnDg0TlbipG9hpNxioZ+ryQ/YLLwO8Ycj796vkC7xx4ymVXj6lct46NxlnD57N37u534O73vfN+OJJ57EbDrz58P2Hr6e4U5JSomsyCCVMkxLrdHUDbI8t2Ae49SpU/iJn/gJXLhwAZ/9zGdxfNxDmUmj5KLr3b2TUprsxADGpcSbjxU4uraG1eUVFL0BMiHAqrWYQ4OmaTCratRNA0363t97tvrGWpf/x0OvHAwQcN8pgEYxSGmtNasM1pQnQ1ARZMpaOfM9yzIopdAq5eO4PjbuGKoimvwRDz42ZRNCCOaCRib0ZxXBm04eNce0+CmN1yBOHgEAaKXQNA3qtkXTtphUNbamDba3NnFlYwOX1jfw4sVNXNxpUGuFldVV3Hfvvbj1xDEQMyY7O+gPR7jz7F247777UPZ6foJrrXHfm96E93/Hd+I3/+U/D/54JNgiBvaEUwKIAMBwzexLlkV3JaIYBLAvWi1Z+PtxcWMbn332Am654yw++tGP4ru/+7sNCUgItK017d0z88U1XtsgIuR5jizLvcLPiwJCSO/L++ejFO677z588IMfxCOPPILNaW0VW0iHvt7hLKMsE1ga9rE0HKAs+zB4lEarWrStqfk4mU4xmc3QtC1yKQ7XDc784995Av+n9995Q+TntY59pwAUZSBdbWiRXQlx+ojGaiesACHPcqN5VUCou8KL+H2UCOSTgJ3sL0TT0/0ZJmVV2Jp2RBKkGRrGTCeZo8wL9GwxDkECAlYxtA3qRmFW19iaTPDKpStAMcRg9QiElNjc3gaEwOkzZ/HH3/terB06ZH4zAqiICN/yLd+CjWcfQr3+HGSvtEkrRtBIuLh/rASi+9ZVemRbkHs2r00rBoKpHPcGsPetbls8+fJloL+Mn/rpn8aHP/xhf9wsy0woVgiwJsjMhFYnVYvXOrJMYtDvIbeELyEk+r0+ev1ecl8AeDzg/e9/Pz72G7+B5x5/xIRBSSSWS3pJeysFIoE8M9GnsiggCVDKRBtmVYWtnR1sbW9hVlUACKrIe7Wgtf/6G051sjP279h3CuD86A40TaMKRU2uFJDlqc/uNvQrC0N1y3LN8bnjlTJQgU3oO6nyfs30UlrwCnBJNY51pkEQYCgoGDNc5iUGBWE4GmJtdQW3HT9mAKm2NckytcZyMcLdt9+Kw8tjbG9uICtKZHmBvMihLNHpzjvP4P4334/Hf/dZu8IH4FJQSv11F+lpvRTdQUvzNXZAfGc7obPI73fXuD2t8PzlHXzrh38Af/I7vgNEhLquIaXEcDjE2tohK5iETEoMegW2pvV14yJu9HslxktjyQ9VFQAASppJREFUlGUJsIaQGZbGy1hZXkZm6yXESqBtG2xsbuHE2jLOvvUOHF0ZApbPME+e7hCD/DXCK0cio8CKooSQBGiFtqkxnc6wubWNK1fXMZ1NIIiQ56WdZyLPc4m2fe0Wz40Y+04BFFJAaOJc4goBmowPkIJ3BBvKM++1xQyCCdBJirFvuoQe+wJ+7Y+TXTj4A2mb7QVWRpwk3904ot4z61BjyrozlGXIpMSwV0BrjezKOTzx8V+DyEv0hkPkRYmyV6JtaghZIButotnZRK8szMrvkH0b2iQhAPdZoAR6BeqLcbhVn4Lpj0hRJApTGIvLEWReuryJP/6+b8VHPvIRnxrtOBKra6u4/Y7TyMs+2qlJnBoN+tieNticTK97XcwyibWVFayuLKMoczRVjcFgiBO33ILx8jKklH7VV0rh6tWr+NQffBq/+u9+BYfVFdx5+xFzvkmucFAW3ecZuADhexctyvPcr/6z2QxbO9u4vH4ZO5OJiSpZ7oaUEoKIVTtfzWm/jn2nAIRuINoZUyavAFwT0PMrWZTJ5x6QUQAMIRCFCtObH1zAIPxOGAIYZv4zTwZ9rcNxc+d1QUicSer7eMebhEA7m2D9hafhz0a70Jw2lkRviHrzMgaDnnULRFithPS5DgndGX5R8+doLjdgJhyde/deuWIiGhpt0+Lud3wDPvRf/ThOnTwJpYz15XCKQX+At7/9nfj0XffhsS/8ETSAsldidXkJlXWBuqO7OgshcPTIYZy+/RSWl8cAa9RVjbXDR3Dvm+5Dv9dD2xph3N7exhceegi/8bGP4dwTj+DMEnDnsRUT94+Sgq7T6u/MGxsSBgNaoa5m2NrexqUrl7E92YEUxjooLFlNkPD3wdV23O9j3ymAyWyG6c4WBiRV3l/STuhFvHLbCepi98qi1LGvHHJWQqpvDAYmwg/A8QsCEGj+Nz9f9p5BRoTsvnGT+9jEjiwFJ5zxCxE3mZNhZdJKoZ1sAKpBnhcWBIsEVVrqL4nweXLOsQKNSo3H0udo1BTVFHAlFrQRzpOnT2NteRk7O9sgEsjy3HIpAJlluPPMWbzrPV+HF599CqraQT/PMDo8xrDMsbE98e4BEbBSEkoJTFtgszbntDQa4fSpk7jtluMgANPpFNsg9PpD7Ewm+PxDD+Hypct46Aufx+OPPox6ZxNH8hbvvqWPtVHfK8zERXBzI7oNXdZj+oo8gKlUC4CxM5ng0voVbE8mFhvoocgL5HmOPMsAZrRKk8sdOQhj353lWl6jnZ7X2droUSFxkYHbgZSAAiBMVJudB4RQ3sKJbQ4S9rV/U3N9rhH0LoPm953fIpyAQ9rm7QH/H7NCd3oDOKvE8vMdYUWQSRpynHYAUdJPmvATHShRaKmtE9qDuf85zoWQEqxDlCGTGXj9VTz8W/8BS4eOgGSGwXCE/nBkLDEpoFWLO48s4Y+/5R6025exNOhhNOhDZgV6ZQGZ5f48M2GUkWZTMRls6gKYazHg3uVNxgAN2q2L+I1f+SVUjYJuW0BVODXKceS2EUb93PSSUK3P8PPEHqSQ3OK7Y19FGICLnrRti6qusH71Kja3t5FlGYb9AcqiRJ5lyPLMLERKsdZqtrmxjqNHj71OCfjqjn2nAG4vp/i1d/1Vfv/6v3/uMvEGA2l4KwIDQ8VbIDViO/HeyAfuWgJxcNANDg7hwrEr3yCiEMQd9GhBZZn4aPMRqqComDWEAFi7UJ0AyQyCGUBA1g0/wpYCj0FQeykUXZMz/0P7MYtPuFBdRKUW7EqJGZM2kxl4ehWb5x7HzitfnCMX2d1BILzzzK0A3WrP295pkSrycJu1T0Yy6cfKUKqFwC1rYxxfGYG1htIKWik4pUX23LVl5CG6dCfMQRHMP4Yk2LEAA3BFYLYmO7i6uQFJhNFwhF6vhyLLfOIVAGSkLw8Enirvfg/3p8+9xpl/Y8a+UwB1XSFvt1DVFdqshSwYJAmkKalyOxfWQpjYsW8LhMU6KJAFlkByEPuhMxs75ADPoFs0mK1179SQj7Glo4sVdsFJfzjyIU4ibQA+tsg/S5/N5XL+3a8SG/fArPpsAUgGu8QfR491yT4+aw5wWYMkBCRLMIfcgSwzRVo0a5BWMPCAZRJGNzMUACd3W4yFpdGxhkLkJaXmwl+3B+fI4j5SWjOfA8033P6IyKT9diHCE9n/nccSG40OWGVmE7rd2kLbNhgMhr4WRZZJZJnJVjS8hHorU9NLpK8iVztfKRH5so59pwBYVbjj6oOYanmp1bwlneTFVgCsgNloABA/+HR0vIbUCuhu0JXK7rlh4bzp/GBn6wQMjM17WgwSxi89jhGZpP5rq/xcI5HI7/ernmYAygqDsQ5C479I2GxqbAyCECz4JwKuIqSAkDl8AVEnnTHVjhZci3+7SOMuusuIluSIpBWzNRdulvL5Y37HrgYdd95EZgwRQWmNnckOJtMpiqJEr+yhyDNj+tt/hvKs0WrNk8m2kr3j2N45GMlA+04BAEArelgvbplJyiasNSizIGCU3eeZbx7+jyY2ogcPJBGEOCJArh9uJxQGhH3jd6Z7zqJmHItGZH8kVsFuI0amEukPsemYout3i3P7dZjoGtAO7HNhUh0TgZxgxPiCBrOCKw5iaNjC1w6UttqQARuDj5zgDp3rTGowLjK3/OrvXK/wDINLwD66m6p4th+mFp+T45D3H2Dd5F77zRcTwEyuQYvpbIa2bbA0GtsqVNJmkUpbd8FgOALi4hKp5/T2yxB0MDqG7TsF8N/8+gw//YEptFYN6d55lCWzKT4PAfKhvxCvTv1PAMlKlgxPhImwgwQNXCSgvFjUd5H/a6mF5HS6rxatjt4kDv/ieeyVljOXSRlqD2kQK0AFKuxcCS8nUE4I4yIZjiacRF+cDy/CP+sqWFbVAoR9r2sL9zepMeBJGekDjFoQzH/nLZoQwUnSfF38f/Ej3kUFAHXdoKoqZHluacmujJwtJuMjNgokxbMyK1+BAGYHpFrwvlMAANDONqDappVi5RWtxzUzlzHZJa7q45hvDhBLGj6wM2djb9QCPJ5c1OHPR6myfsQYQLyIzDOCwgdJ5K+z9vv31xL8qBiHVqYRqfVn3f7OjA/uD4NIARAgTWFFjsKf/gQj0MsX+4COzGgDwLLrPkzzSnJOuewGsfPcmwBG+vNJ0LgObBdufDdSkqD47vxdDcOOzWDXjfmT9BZW9EjAaNoWWmv0ej3kWeZDo75+hLVAiWebUk0/v10MGxISf/+P9k513i9jXyqAk/0ZsumlWVWOPjNhvcOM0mSzuvBUSHN1/1Q8+9wkonm9HhJD5rkBqYrY3R4wRF/3Pt0juMCL9qZ01V7kLycrYcgi7Ma1Od6eU1PXXafDBby15IU4CL3/PU5XYncN/r4QzBKcCGkUNhNd6Z/H2xMd0Fn5vXsTxe2DcC8wzx3bIl75ma1+dEqAsVdEJ4IOwq9weKLaRh2EEEb4u5Rrm3fBTNBKTarJxst657IS5fD6Jvo+GPuSrjTdmOJjZ/6K3ticXqzqunErnIlPWyUg0yq3gIsGuolkOsaEhzs/CZLQYpw1GLkK1+fn7zYokXO6lvD7mDWHajU6mORp9Zww+V39Pq1aX8TDFPJowbq135n3WjWmjLpqbb0/5cuqm/3NP1cEJC4DHvKIovNjPbdy7327ou04rO5JxeHruuPclVx/jIBLdlf/8Dx95HjRb9rrdFWDM0v1FS7RyiddCb9saKKLCtmn7vkbv9fu1gNiP459aQE8/tIE95X/EVMtXymY11nrY+yF3JlgEkIoCBnFlimsavHfRVBAEPa4Ym54bRZPuj49sHDQNf7GI0a1g+nvQlxgnQhLvB9HBTy10nBkHyEI2obvAh+hG2J0xyNrbThU39xnkgyhEXz8yH0IEQSGJoZgBs0pttQ475r+4TzCaj93lYm+iBRNZB2wNfsREYB2ZjWIGVK4YibhOc4/ga6lYOeSXUGElL7IqmsZb5qVmoKrbVOzbpsXqLd84al/8WNz93k/j32pAI6tFODeAKT1DlTzilbtvcL5WhTV9xfCd40VgqBUFAbroMLpiAx+5xRSABgDapBsCbc5dnn3+sa88IdJHvzSuUuwq7DWOqzcWhnPh4xZKoSjvi5SPmlozFkSTlgECUhkYEmGBxBdshFgDWYBzRqSHQC4QNklpcMJ6K7015sd5I8RYRcxdwFelaFqWjx87hKYNe69ZRWFBBwXYz70Gw7hsA9C6LJEQiATrjVbWDScK2pXnalsth4otl6eiXKEf/DZg+H/A/vUBfifPjfDdOsyJhsXZtVk8+WmbZQTDBf+M+WvQyHPpNiF/U8c/uHOCpPUFiBKQUHXJzBKqY0ndYc58BrVQDRb/WLGAXmPEOzEz+4ehW2jC62gbIUa1VrzndUcVpAwHylaPbW27kFUB7A1rDqtbaGVRe6HO2fLI/AFOnSkwOKbFIcB91ohOQi4jiyG1DoI5xMIQw4IZbStxtWdCk+/ehXPnL+K3a2v6D4n7kQ4F9c8Js66NOBf4KRo5p1W8Wf+r5+uqtn0YLUK35cKAADGzTqObF1ZL1T1h03TVkopS1eFjz9LIT0I6MEur72dP+3mVOCFu3+BShwEvVsvMGQNO7/hy7Hud2LZkU8cQmCYlyEEwU2F3zQxbW0Nf2cFOGtJiMz8k7ZKsMggSSatwpwFoFSLVhll0ioVWIK7Xsp8ws0CQz65hl2tku5tSV5Eq73z+SNeRMz/6BWmo1DTalzZnvlf6UK7Ee3A/kI8R8xwC01SX1GQ77egWaOuZlu1KJ//yLed3Vu57cOxL10AALilzPGZ0d31WG0/KqqqKotyQHnmV7A4WYVEyg9wFFHBooMJYH45QWDVJWBih3Icb72nO+9HN0YYUnE8uajrB0cg1jyRGeF7GxbUrRH+pjHCL0iAslAB2WToSV8wJBzGuQ+G9KPQAraqkrLkGS1Mo1ApFYSWYCG8pMQ2kBcarcGOach7xFGsF+ARAuK555FYSfZ8EzcJkaLsRgsYkEJgqV+aZjBEKQ7SfUoLog9kAICE5OSIUSYEHSwCMCNTs8/3282LJDL8j380/fILw1dw7FsF8ExxBCvqKkD8RamrB5q2+XZhTf6ABZhuP1LI6CELDwql/d4QzMY9fzkKEfr37pvos4RjvEvIDzDC5o61wMo0m6RodhCOzj4u1KU1tNKmMGXdoGlbMDOEFX7XF0BKUx6cSCbWjDsGaQHymZShqIpS2hZZEdb81RC86PqiJZRcvgEA/4xiJXidvj6CPnBZgt4xSkKWkSJIXDyjXe47uQZBjIHtp0jEQNBh4ZdYJ+cW2y7Supoi6i0pIh6K0XualWofrTdeXZe90XVf434Z+1YBnKYr6OU1Bpi98nCTPTid9b9VSilcjz4AHozJpEFnAUMZbhNKaejuwh0lsCAwGKIJ5l1ItvERAYcd+F3i3TE/4XePjadouI4mX2ybMkymnEvcMeE6s/LXqG2bNOerZj5DLYfMctMfIKFMG+9auFJZNted2ZS5JrKlzFoFogaZlCYDkEPdxc4Fh4uJLQxoBLds11uwxxe8QCyjTzsuAhFATBbAA/pFjredPurr9tunmxzRTxMdANhgBQrTMFamvST8gmMtorapryjO/mB01/snj/zmb7+GGb4/xr7FAKaTCjs7Df7MS5hOprMnqnq22TQNtDIAl/PRhYh8NMATXUKX13lKaKCGLpqNHcc7Jg51pL2bRhyW6RDacqtM0nzCg1YWuIoy1uKEl8CPD4CbI6e0bYO6bdC0ylZEEhFX3zUGySGyHCLPIfICMjevZVaYz6VVELaHoAe3YHrhNY0FFy0LsWtBBQspgK8JmLnHPfe+duR/L1ICmFOGix5bZKWRi4J0nlKUA2Fvb1gYIkDTb0LwYT8XdpYOQ5Em/s8AC10/VvD0HG88j5N39r7qcvKljn1rAbhw3N9aWcOK3vnYlar/O5Ms/14hBDI2rEAAfuK71E1EZq6ZMtrHuLucgHmsrcP777rxyVj0JYNdxWDu0lDSX4o/Svj4sZnrBT8iBWkNZWvS13WDtmmR5ZlvcyaktQCy3P7LPGDlU5SZjflvW4QxM4RSUbzbbNe0ClnbIG9zqCyHTPgICy7NMXDY3hvqKovoLnPntdvPKc1dblfyvT+ys9cAjlie7KouUccKc/c6CiW60xfWVXKRJu9mShE6Ldnj1U3D1M6+cLx59XmVlfiFBw5GL4B47FsL4G98fIa//vEWPT3D27PtV6ne/g/VbHphOqvRtA2Ucug0+fLXTpubyjo66gabEms072YVIAUMEa3AMUIcx+bnSEex4O7Sf86TfdLwVZqey2A2KHzK9GvQtqExRatVlKob/H7hcQCjBGSWQWQZhFUKfjsRegi6cKqrZ6e0RtMqNE1rQ4XRNXllal9TrEaDAkNyb1Lh744YyNtzdDIME2IXQiHTuIis+wUGwvPXwUJ0FobDkpyv7xSr9NwT6X9ftc1W1bSf/dzo3RtjPljgnxv71gJwY0gKn9Er+gTt/KfnpuWHtiG+D+ijyBkkTEHQplVodWhi6ZhtMUfcC5iPUwOw+AA5ZJ1EtK47ge9QRyM/F+D5DDVrP/qVz+ECyaJF0THcfhH63zWbfazeNLU0telb1I3x3w3zT9pVKigAv/LHZcIBAAK2ojogNYR2LoD0tfQBowDqxvQ9VFFIMBZsA+mnNhTFK/rC6w2X7fe6XowwQkjJCixHIVy34hPH1aIi8z9S9t2egM6FdP0kHa5iQoHmNZFJIldagVT9PLeTR47xi2j2X5vN6xr7XgEoEA5jgr925c+d/3Ojf/0PNfNJrdp39nt9IaVE3TbYmUwxmU7QNHWHQGOpsp4ua+PnjvWm2Re8MKu5BmsrvIJMGa04Rm9sTB+6YtY+KsgL+P1u8zQERYiLcgC7uAA6JtmENF0T+9doVIvGduAx8iYs2h/XBIyEVae/6+XNLJehMapnuMEKPdv+d63HH0gIMBO0JpAkU55ME0Datku3wKVnHEUB0CSyEVb7lDjcGUlYxBr7ZNUzm65DggjaU7o5UjrhMB5K8D5/sOxCV2kD9mU+5deAzFnmlKNx7Zq2wc5k9szV9Y1n83KAv/vJg0UAcmPfK4C/8YkZ/v439vHnh/8Sl1r58UM8+cmqrT8ync6+lQShqavprK7rum2nAI8zQSOGGDBDxKu+1o43b90BbVZ/wQ6kE/79QlILuxbaOrTVAgCKVnt30na1DbVAnU1hVUXi4sYmr+P+I7EAEpNVBSVQNw1cXwSQUVAaITmIlACgTHkwu6oHOm3AFEKuvLBRgFALzxTFNEi60gpCKWghIYRTLDb+79qpso7vRLjQRViK98XD3UgGEbyJZS0KclaXjdGwUCDtSpJZHsgc1ZeTld4l+XiXxi4URNJzQkLn6CgPIOpDoZumhW4fLYrepbJ3cLL/umPfKwAA+D9/YoofftcAh2SjfvGBzd/7M/cPNxTqTxUSegD1fAZ98ULLF/uZfNNQ8v1Trf50w3Rv19d3qK9XBtYyMPX10m2Jo+o6NoDsw0RMnenKUWjQmaGmbBbb8JQf8eTsgJKAdVE6CHoAqXQUztRmhWaL1jcKbd7CVAgK5CXt4vsxyQlBKLQyhCLlfXzzedO2qJoGubTttbX29yCclzbXxkb4GdoKrOFjeGUTuMfzyiAB/XazAeJMgiSrAPO2QxSb6MYgE98/xWeAwJ40hT5Mua/cNm6RbvVn04ewqqYvc731yWJ6UYl830Jp1xwHQgEAwC8/eBn/7bv7+PPvGOLVdfGFI0v1Y4Vk/LHVvP1LvzvVH7irj1vL0WNZsf2rl2o+39b4BdZ8qOsC+PfOpGYbE4ey81QErADWRYAGaddGaxdTNS4kElkIRBTKgUXcmXgYUzb2/4N/Ci98UbZeNJqmxayuULc1ZJPDB75sKExI9hETj5QjgJtatVBt4+m/qlW2DLZhGEohokicEyB7TmY9hoatQCSELyzMpAMAZxWmR+kjsz/1CdjbA0ExxGFZu4dXwC7aElD/FOvoRlScdZTOARf+88CflMiltHX/HEBK9j5oNG2Nqm4eV636Q7FykusXXrjR4vG6x4FRAGYQNmcCa2MwibxWYDy2Dfzku0Z4fIvxaj3hQ1JPVzL+d1rR12+39CNaszArv/amf5gMbDoPCzOZhRZg0tAC9r0Vfusn84Ly3rH577rRArDEm+ACxKmy86RU9pGz4HaEXgcpAcexIM2kVKrFZDJFv9eHFHnCH9CZhtSBOJWychisDLjYqgZtW6OtG1R1hemswnQ2g1ItCKUXqlj3hFi/zT3w3wd+hAnDRWHRmA6JeAWPPmEHv8b3+hoIYReIdWcX6ctQAbnjAsBhOSE1PMsksjyzHYml7bRkjqG0Qj2bTdvJ5gPNrJ7IHCiOLgPPbHwV5eDLNw6UAvgnD+wNtPyldw1wb0/jJz5x6Pxfeef6L1aa729Zvyuzq6mKLAGlGFJoaNIQmsAkoEibwpmAD5ASu4ncXZniYc1+x3wjAmmOGMMuNj2/j7GQw7HTwEAn4QXWTBUBnGIwJrMJ8q3cNkkpUVicQyoNmbWWJUmIdJBRMbZQSNsYBdA0DWazGXYmE8xmUxDB5hMILwRm3+ACaBgQUAMgrf1q7NB09grQ3bb/f3tfHizpddX3u8u3dPd7b+bNe7NoNKMZGckSlrElW3YwGHDFhC0JSwKVFEWRcgVCKoEUJBVSFAmElAtjlgABTLEYjF2YJYBDsFkCmMUb3mTZEpJsySNrJM2MNMvbevmWe8/JH3f57tfvSV7l0cz0UbVeT093v+6ePuee5ff7naclUCQWJg1IerppRsC915JyBHpj2ZjxOcfvvgPdhRkJrdwtP8m0juM/+NSfmNC2LWZVdaaqZ3/0qvdfnL7+BTl+/p4rh/47b1fm7OIp7INnW3zDczLcdKjGWoHHd1q2BPkyCDUMTZ0wLus26QQKsIyn9Hz9yKE23zXn78/8ge7Lh5jCd0iz/uPDtzrFE3S/MTm6eo2q0Lgicnvqm6ZB09YwpnVEnrnXxJY6hSBrYCkw/VqY1sOJmxp17VZej6cTbO1so2lq5HmOpeEIZVm4BZk68wswZbesJQH87FY97t5j73ovywlvmva8b7fUI6Tz/ZS+u18fVRmavdY3TK21MNaVN60xMMZlPkS2C3RKo8hyDMsSZVE4WHUC/LHWYjarWjvb/i1lZ799z+t/orGmxV1PXBkKwHvZFZUBfCr2RAVstAIZYG5dobfdv8P/bEr0NamEVWgAha3CJAmCvIi2EGDJfhlnSOuBMNvn+L+9jGK63Nfh6zuHkAFajKRG9qky+iddxCL4h0vpZ9RaochzFEWBpq3RtDW2dwh1U2NYDlGWJYo8R54FuK+MAJ8QiKx3iKZp0TQu7Z9MJ6ibClIK5LlzfK10lGDr5gghSBHgBUNCKu0/uKT34RGS/h2lP3pNkd5dUuzAHIAKvTQpKUe4FyDmAT/W4yhcELXxsQKuZHMr1zSyLOuyHv/vQUQu2NbTM2TrP6jLtZ2DzWP4uY9cOfJfe9lVFwB+5L0OjvndLx6iJVxqiR8BunTPWgaprhkkhfSyVg5RB+rjyjs6cDihkxp2r0CQEIXSXQRpGSBI7i4ZIpQ1PHf3u3rpv89YtNbI8xzDwQBN02BWTSMtuKkb5LMMeVYgz3O3vUalAcBNB4xP/5u2Qd3UaJoGxrjRYp4PMChLp4Pv1XAjvNc7WQA7C3KjUfYTksDLYHTBc7786IGA+h/rXMBMP+8kq6L5DKzf6Etvo6QRHJGV1t0GZgih4ucbpL+FDAHfPZ8xBuPplG09fcs+TO/KbYsGOYArD/6b2lUXAIIZBk7P0Bws+E/Pt/x1xHSc0i+DxwSQdLcJv4IL8UvEbtYdbG5m3YMNJ3+DZO4fKTIJezEVIu1KEH/PkDEkv7PDq/vHSwWpgIwZlDN4yFELcDabRfZbYxpIOevQbJ7sE56X/Bgx7NqzvjMupUSeF1gauBVYmV+EkeII4jRDJOM45uj8HBt+QFwZtmt0mgbQp2iuhnm/6D6L+bIqbeyFCcU8ACyc/NZ6xyfyG6X9v6Nf7KF85195EhCDYXz5MKtr1LPJx0Uzeesjttw+lDf4yXdfGdt/ns6u2gDwP++c4dX3DEgL+rsnGn6MiY9HAU1L0fGdFFboAHtcPScnsJB7VLZdvd6dSukYL53vh153stMgbPEF+2We3ehuLx0CALGxFsDK8c/SiZkqpbAlFWazKRpj4pfewO6RiQTYMZI02JFeiqLE0mgJo9ESijz36bBKSgjhO/rO8fr7GZPrSToT4bpA751xklW5EiJ9w9377k/65zgUYZyXbAGyIbhTkDbjzvGpKwEd+Mc/J3OUg2MGrHU9CWMJVV1jZzxpqZ7+wbFi9q4DmUJNV+7sP7WrNgC84eM5NloBAWwPJL+3YnoRERXh1IjQYP9FZhngoOSd1aED4XntaUbazdH9GCn58oUZM1PSuUeYMbvTmH0Xn1hCBC2DBCXLwg8h5mSzAubfHeRuMWWeWRRFgeFggNFohMl0gp3xDqazGVpP5SU7H466pw6w1zzLURYlhsMhRuUARVkiz3KvL9DJh4WJRHhFu6XK0XvNT2fzxKAUERhBvz3hFcQeyW56tbvNejnz2PyjNAuwSaPUxid1/3YGVV1hOisgIaCUAhGhbltMZzMj6vFbV3n6a5tNXo0y8ym9vyvBro538RT24y8f4HtvnIn/+tHRP3m4yn4ZMj+SZxp5liPzzR6H9lJxzXP4srvFmHLuhOssXTzhsojwpetS6uAc4fR06LJAMOkac05eWiRipB5HNydRFn5GQE9oThK5Wt6LhNS+mTedTVHXFUxrPFnKzeyDCKpUEkq6XkJZlMjzAkWeIdMZsjw0/1TchNM7lRPATRcbo4eGD+kpAYB7fZ6pxeZpCuwJ2QB3qMTu9Lc+u7O+42860lRjUMc+R4vWuLEnkQVYkBC4IAUuKimF1Pnx4XA0yrMclhltXU2Urf7fcV390F/t7L/3m/adx396T3O5v9qfM7tqMwAAKATjpe/ax69cax8VzBeJ6AixOw1UrykkIYVrZJHv+hOEmwwICQ47AoD45e54+2HG7EoLG0dMLg2P5BLtPupIWxUeecgCLFwnPWACAmhG+vq0myyEpmEyvvRcBKkzSGORFRZ5McRgtIzWN/XatqMQBzhz3LDkg11QEtJaefKLP/lF3/mixd6H8BDguTQ9NAo5rO7ey8E7aGTMBlLFpdgonQ8A3eiP95jrx1Pf+otninbNQev6PuDTBPx2JuQHRxrnpLBis65eCjKvoEwPMonzksw7l2He+vKl6hNL8iK26aqanF/dAYAAvHilxVbLTyrQ45bptgAHtkRQ1AFEAi1YsFsvJeEINAxyjLNwQs2LS8Afep5paKxF62W6jTWAby4FsZJwngVAj0xOvpRMJBMwTQwAYRNNxDB0Ul9KaejMd6xzJ+llCpcRRJlva5G0KwEgNiKVUtAqQGE99933KfZudoruU04cOCVgOZadkwqnFNuw13i0e/O9nkWgJu/OwrqmXy8AJP2Ajj5tY3M0NH81+KySeLUFv4mZq6kFlBQA2XeVTL9bUpXvl7R9Mm8vPGSW7N3THBACP/LeK5P191R2VQeA73tHhf/8kgGGii6eq/kvnmzpK5ioiPV6enqIsOdNui+QlA4KLDs2WoqoD/P5tOkVRS9CL8DXoM75BYSRUOH09QGIPTE/FZ3cBUyKTiB94y8BL0UGn+sbMANaE2xGIJujNYXD+PvypOvaOwdLA4DrMSCCfNy4gBzaPyHNhAlAitDrwEwJ6zIpj8LFv5Ho3CI55UXv9A8ZDkUSTtrE7Ig93chvPhNIJwB95B+ZUuD/HsnF718yqKZE+L37ZvgXzxtBSWWE4EcgHDr0Agoczhr8l6so7U/tqg4AALDZCpyeZfVQ8UeYaUrsAoAlC0kS0v8kKX0W4Bhtktl1ujk4er+OjeKh1J3UYWmkkhKkVFQoajzENtMaVeY667nOkPsuu9IKmXb9CKkCN195iS7nJIGQEjj73Toz9zpU6Fl4wFLmA1xmnYAI+ZFfp2Ai4B4uIyApQHwE4DMhci3QwFYS4RTnPWp2d8p3ikYech3GjNY15cg3TqXPZALLTqpOuESG9+loRvCIInRaDP3GX5f22xh0rSUY6kadNsipEUELfv9Khl/69ba59G/zEq/90BgA8Dv3TS731/Xzbld9APiVu6f4zjuGkMCpkaL3zoi+moiEGwUmIiGxF8Bg4YVBhCMDAXBlQHLah3xASs8eZCefnWnvTJ5VZo3G+e0L2NjagSWJUaFRxkabA+lopaAzFdWNw7hQae0XUyooP49XSnlJLydOqXUGnWUeyqriY934TMWUPpyQHa++Gy2KpJ+RypJJ7np6IRgyBQeWsRzo4fE5JdvYpCln3apt67YNhcmIUl7PkFWclMBnSBT4BD76poSqDgg0B/BJSoH05A/CKpJplgn+sy8/Ut89vFBgp+JP/ct0FdpVHwAA4KYh4asOtade94nyD2YtfYklWpHEsMRJKk4x9RchR2Z24JyAzPXeEOm2gMeRd42hsLk48/cjS9ja2MLWjPHwdoO1fTmOH17FQDLk1gZ0lrkpRJA3904QmoWAgEomBKH+19oFgix3gSTLNLIsR1GWKIrSS4KrDrMvHYMwImzYE3kjmCbhKgQqNNDpGsDPzBPtBGJXIkgIEAuvoeBJQtRtKTbWN0Z9I9L1IlxWo5WNDVJoxAyGpEQqYRLZRGFOCvfnLuCEjGNuGhNqf38R4HuWNP/uW06XfLhkDLLL/e28vHZNBICPTwR+9MHCDiWdlqANIrtCJEHWp/4+NZSBEyA8Xp/YnXNBE4ClO418J8/VrjISgQQAlhIaGaQAlNYgC6zuX8XKxgzt5g4uWo0j+49ged8yMB2DTItm5zy4mkIrASksFBrXhPMlALGCsIAQ/vdIgbZxzhmkvF02oJAXbqRXDgfIiwJZlkMp3WteOlCMb1S2bq2YNZ0gSGiUAh0Qp5NgVz676UgyYTTXpeGJ8/kVY8H5Gy/tDiFc4PX9EdcX8VMY+KwkCBf65aPdSLHTR4iqRtShPFPkn6VOS1EwNSNNf1MqfmS9dM/3Ux+69tL+1K6JADCSjOPLjJnBhx6p+N1j4hMqUdu15FNO4jgOZEFuRBdT2z6ePUXuARJKwtet7m/dko4MpjVYWlrG6tIQQz3Gxs4Ozp47hyzLsbp6CEWeQ4uT4LYGGwOzdQHNxpNuesACqBoImkVmWkj1XUXiHZUAaQmmtWjqFlNVIR+PkZeOLKS1Q/PBd+VN26JpHP3XmnQZqMt6olJu0tnvGnBdMEgZlRBIRoY++/FjOuuJVykoJzT9QnoeTvKIr/OlSk9+DXuUG/E57R5NQJs2/mCZZ0rg/qFGM7PAz33g6urofyZ2TQSATABfWwDfca588ov3N39Yt/QKS/Y6SQrWEqSwvnkXSoBOG7AvE8Zd6o+EnCMlAAXpIbVS+jm6zsBcYzBcwvr+fVgdbeP8pSkeefgRXHjyAp57y824+bnPRTEYQqn9bgZ/4kZQa9DWFdi0aDYvoNm65Km8hGYyhp2M3X216jTr/W4EKwREa9E2DWbTKmYGUkqvAUCwxo0Ew6jOdfj36OajYyZGaHQY+Xmbp+YSd91/5qBG5FiDUinkRQGlnfaeEqJHt+1kvfvaCSlCMFAyuwkAJ5mLDzK2awKmAUGDHmDmd52ZCrN8jaf+wa6JAPDjH6xw9EtKfNVajdWM33GpsR9tWVynPA+AOCkDqFOY7br/wjPHABmyAtEFgEiygU9llYbOMkjp1GXK4Qj79+3D2tIFZBtTGCLs7Ozg/vs/iulkihtuuAHHjh1DVhbQmUY+WkJYgabUTbDGoqkrwBLqrUtox5swbYt6OnWvz7SYXHgSXE98hiDiadwH0gVhjm4GHxt5CZ9hvqEXfS8GBgLFdVpdIzUg8ljlsCpHVTcYj3cwMxYNWRwcSBxZW8H6wfVItw1lRSDgxNHmPG4wCoKgK1Oo7/wB8x+BP7Zbc85MO6Xk13/BkE+dqzuy0rVu10QAAIDvfXeF77q9xMRiG4IfEkxfZskqQQLCygh3DXvg4hjKO7yIjbOOkQbmDpXnv7jdOm4FN5lzQWC0vIKbj6zh4Ys7ODdpIAFMJxPc/8BH8djjZ3D06HW48eRJHDx4EEeOHEaWaeR51nHT5T7X/LvxJBiANQZ1VQEM2LbBbPMSqKlQzWaoplMIAPVkgnq8jdnFsx5wlICZOLAUg5SHu97JpyUqOx5CrMsheLDc1d5CQOYFhM5c0CSCEgItC9SG8NCDD+HipQaGGCSAUS6hpcKgLKG17kGlUxj2vIhpj20Qso09UYBdyh8WnIbbCkkfzDW9/dQMZiCA1921SP+BaygAAEAmBQaSp+vg3zvX0CuJ6EayBCsIVjo8gLLSy4T5MRQcQciBAf02XdmdnAHQImV/hBex80KCqEVeDnDd+hpOrF7ExeklGD8KAzN2trfxsZ0dPProoxgUBU6ePIHV1VVcd911uOHECQyHQ5cZZBlynxmIPMdoOIzQWDp8GABg2ha2Nc6RjUFdzWDqmUcrusaZtRbVbBYDWlGUbte9572TF/wM2IGgPsxCwvrJhqu5fcCAk1hzOwsN6skUG+fO4dLOBBW595kJYHkwwOr+A1garUAp4aDJvmwSUiTyYyGjmqf/dsGJ9uwDcDcBiJMAApjGSuJ3/tXN7am3PZpjhy73N/HZY9dUALhvLHDTELSW0Xu3jPjzsaVXWbKZJAlrXe1upXN+4WfmEp1GSECkxdVhnAQBoFusEVRkEZB2DKEkBqMl3HbDEZzenOLseJY0FN1zTSdT1JMp7tvegZISw9EQh48cwcq+fVheWcbR66/HddcfRVEUKIsCg+EQo+GwG0MKAGWJsOnXQXH3e+ove0RgkO1NxDOApFkWxoBOAiusYbOe32ACr8ATbdqmAciiaSpsbm5hc2MDlzY2cO7cOdSzGcICovVS48j+ZSwvr6AsB9CZctMHa2M2IjyQKoL90H3GEXEYflIf+RegzjYBAgXefyHp1L6M7n7jgwUvZQyxCADRrqkA8PaPTfE1Lyvx/Q8Vm//+WPs7E0tfSySOW3LLJaS1MOEED3JhHigTgTRBuosJkmX8Uva+wIm52xjWtNBFiSPra7j1yAYunqrQEvcqXQlASwHJLgBV29t4ZHs78gLycoC1QweRFwUGgwFWD6zi+I0nsW//fiipXGAoSywtjVCWJZRSyItOFTjV/QcQT+y0lg74fTIWVklo5RaDGGWgrUIrXflgTItqNsPOzg52dnZw/vx5nHn8LDY2N3sbnAHnyPuXhzi0uh+j0RKUksgL9/ocQSnoKXbVCSccg/S/btMyRcDRLspvyACYIEHbmeC3M+E0mPGz71uk/qldUwEAAMYW+IEbG2iBD29b+rPNVnxHxO0LAykETISjugahYAY8OMZtpnHlgRUWgmQCF97dWQqYfeYaEArlaIQvOnk9zmxP8eCFbTDRLvErHX8/AAgEWX9qKjz56Gl/Zwakwr13fwh5UQLMyLIceVlidW0Na4cOQmuN5ZVlZNrtC9C5Ax05IJGOjiYg/UjOIfZCqdC2Bk1d+8mBRVXXqKoKs+kU5y9cwNb2NmazCtOJox6b1rj3jL781/4yw82HVrF//yrK0RKUYugsj7wH36TrDntyasPMAQOweyLTof/8nN/a5NKNBTOm00uK/5gIZ6/g/R3PmF1zAeB/vK/CaK3Ec0by4peu0VvGhr6ayB63wjcDpYUiCUsSwoqOGCPcLJzc/q049yZy1NKoKuOpwzF9FU7EQ4BhqYVUOdZX9+Plt94I+vhZPPLEBbTG9PRyHKegG4tFLc5EHitYvbON2da2dxLAAjh96pRzcHAEAQXJq7DeSocyRfTJP6Hr3wmdWLj4x55j7xiPs7pB48sHoO/0qUkAz11fwc1HD6NYWgbAEeIcJi2BqxBwCnF5SJBh62kvpJc52a+I/HNBQLAdDzW/BYy7lAbbK1e89xmzay4AAMDkYoWvPFliX4b3Tgy/ZcvQv7FEpRAG0goY2Y2jpOftQyrXF0A3XosZgP/iSY8HANATxQhTAmpqB6XNcxxbX8UXW2B7UuGJzc3oPBKA9MEljPL6Iz3RA+UoSLCKBbMT12a38QfMsSHIAmjDEADJzx4bd7fyUTfFdw8Oq8kUXKZi50hBqTGAQ0slbjl6CKPlZQf55RZKlR6YJOJ0Qgg4RaZk1BdZfoGjEElGtof4MwnsOOxOZLbQgj+RSX7vhzdw8Y61y/2te3ba1aVu8GnYP3+Oxg++Z2n2pdeb0xMj7iDmEzJ6RCLcmXDye0xAIPl7P9NOdsiFLbKI1GADY1q/i9CNCfcVGgLAmY1tNJ6qq4TAQEnkSkFLzwOITMOQEYhuXCncuuouY+iCR3ycDBtvHfBGe/CQ9rz/oAUQdAACuMhd71iOMSj5bMHs1vKMxgCWc40vv+l63HzDURSjJQAtlBIoBgNIpbs7hsdQf7SXQny7YMC9xp+TNm8j3yBgAMC2WdL0mwOFNx8eorIM/PKHFvX/vF2TGQAANAT8hxdPMMrlAzNLv7XZii8yJFYhrEv9pXMWmzQEI0+dOpy8tQQhLSRZKGtBipKU2pkbc7nau20aMAFaD5CVBW4/dgjVbIZ3P/w4qsbAMkNLiaHW0EqEroNLw+d+BosryANrD3CZR9o170bribTYHteR+GQidCrYr+4g9xdWdKPQnvlyQyuBF99wBLfecBTFaAQIBtkWqhj40x9R24C5KyC63YNzY789uP4p2ScAflztb6kQ9GEBvJ2Bbesmtwvbw67ZDOAVxzRecZjw0Db4+gEevdjg+S3hVtFb4jd3+stOtjtCgQEAHKW1HCZARBGPLgPoa9UBAkJpZDrDkZURtBA4uzVGbS2WMo2VMscozzDMM5SZRqk1ikwhUxqZlNCeIeheVtcrCBlClzUg/lT+takkowiIPHfSy93PhQ6WG+XLAbTEaKmbpzGALMuwfvAgBoMBblnfhy997gmMVlYgtYYxU0gJlMMRtM7cc7EPb9xRh8maDsATtAX2cHqTbPoxxkbRE7/0Y1JK/OjzVvD72y2sBfAri9N/T7tmA8BfPWbwRYcylAK4bYlmZys5m1p8iWXsB/oqNQGoEq93dMBoHeVWQAjlnRCJeKWFJeM71sYv3lQ+CGgcWR5hqCQ2xhNMW4MDgwL7yhLDPMMgyzDINAZZ7n9qFFmGQmkUWiNTKjpwLEuQ6g92ZYEKDj9XHqSrvkLQEKnzo9NAYGbURDCpnJmUOLC2hvX1ddxycB9eevwgVlaWIbIMlmpYWyMvChTFwOEk/OM6II+NW4rJBoHPbpY/P+83MZhaGOPHfmRAZFEI/pvlDD+/0eKiYKcJsbC97ZoNAADwF6cN/sH1GveOFa9nOLNNYtBYfokA8nSBB6IjhdS+7xjBBIJkV5D0cllAh5l3BBxLBGNbJ7ohXBDQWuHovmUcGBTYHM+gAOwrcgx8FjDQGmWmfTDI4vVh1mUJhdbItUbuSUJp9iKC0ycnfSDjhFpf+exAK4XcX7SUyKRE5nsCAoBhwtQQLLomYV4UOHL4EG46sITnr42wsjyCyHIQG7T1GEorDwDKHXkqZBNRTLWFaZvo1NaG8V5f6NONKsmDlPzpHx9jAOYql+J1b7rnpj/9j7dfwg++c+H8T2fXbA8g2H4JqCHw+I7cWdb4TWv5ZVPirxZsYWzaDPQpvn9cj6IakWwtpBSwUrlgoecyB48JUErCGIHGVGAGch468lCR47nHr8PyYIAHHj0H2xpoKTDMMmR+hBeCj2VEEo4FYInQEjnnYEJjCFXbojYGxpIX15rLDCB6WYLwfQQhRKTlxsYbMxprMG1azIyJqj5OX0TgxKF1vPjIKk6uDDAoc0BlIDJomrHryOvSj0PRjffAfoLi0IUhMwpAnlTJJ8z6g/P37u9rfwGelop/e6jk2771tlP48MYC8vfJ7JoPAN//ngrfc+cQNw4EvuN4fuqHPla/vmn4FmvpJNAPAs6Z0Y3iqJsGkLUOQGQSrrwApP+IhVf6CVh3pRSstajbKZwzDJHpHEJrHFlfxbAs8OSFDczGUygAw8zNzsPpHUi55DFKlt1GHEvs9OytRWMsGmOcNl6QAUOnZ7grGCBI/vlmYyKr1RJh0sA9Jzm8AQAoKfGcg6v48huvw7HVJUitwFqDyaCqd0DUoijdpl3ZO/lds8/66Yj1sOCuyZc0/noKQyaKi6SrzYgsCkl/uy8Xr3ls1n78xCDD+dk1//X+pLb4hOCEIf70lUv4kYcqWsnx1k3Dz7EG309EB+BXa6X9AACA0NDhuhRgEhA+CAi/rksIAQ1AyKC4K2MgUMpCKwVLhKqZer0BuBRZa+xfGWF5UODixjamO1MwEXIpUWRZTNt9bRK79dYDdghupVVjLZrgVJHKG079OaZdnL+7cZxlAlmG8Sn3pKlRtQKTxmDHI/5WhyVeeOwwXnTj9dg/GoD91iNrW9T1GI2pUGSZEyRRuhMxBcBk/eKONqoSdbV8t+QjpP/GeLn11q/3TrIFSwQFPrue41dfdf30428+M8DEAm/4yPhyf7We9bYIAN7euQOcqQj7tJhJgV8ZaD5cWfp3RCisFZ38VlzKQeg2bnlEG/xp2poIrwUApTiWEUoqN1r0WYBm8tt9J2ACCgBZloOUggSwvrYf1XCAyfbE6RVAINcamdLQYbnHXGFCCCWBRZso8fYItj5ohPQ+cu1Dj8I7fmsMpnWNCgLbVYMzkylyrXDT2j685DnHcezgKrJMg6STSzO2QV1P0TRTKK280rGKn11Y6GGt9c7feOc3IDK7JLzjrN/6XQc2rfldwFCgjaHGrx/M8Jd/cG7AGy3jjfcsnP9TsUUA8Pbq943xnbcPcawgvPW8uPTlq/yGT0zFnTXRywWssJ4jgDgDEO7Tc/PBeLu1rjWWUNrBzH7DbqcWTKQgiaCVBmtCZRtMqh2f2C95QREFCIHBaICiyNHMajSthTQWg7xwu/uU2zXgdPTgxf7d77REMF6wI1g89TmUED7dhifWWEJrCA21aBoDMo72uz2rcHFa4fj6Km67/hC+8LpDGJSZO/GldEtRmhpVNUblnb/UGkp5xWKvWARfz5u2gWlqtG2Dtm0iDTk4fMfrnx/5td2eAyf3bXOFN69k+NknWrEpmHHnCvDGy/2FukLsmp4CzNtd51p82fUaN4+AQzkubhjxmAWeZxlHu2Q5bZz15HZ2PV/sF8yr2iX8duauJneimTUEw3fxVdjU4dd2ZxBKgQTQtBa51CjzEnlZoigGyIsSWdh7qBQy7Tr5hXYTgjLLUOQZyix3Y8RMI9cZMu2zCf9+GAyyjLppsFPVuDibgpTCc64/hJc99yS+4NAaVKZBSoKlA0O1TYVptYNZPYVS0m0WDpcsh8qyqAFoTIumqdG2dXR+m6T7/etBUbh1y06thfHjPmJCIfH3yxleU1k8cGgI/OwHZ/iTR83l/ipdMbYIAHP2t48bvPx6jQtG0EsOy1OPjnncEl7GjOUONy/iBpuorR9Vgv09QoDgWKbHU9dd7RZcpPqCrTGomsrBgqXX+fcjSIYj9KhMwQiGhRP3yHUGlecohiMUwyHysoj7BjLpRnm5dupCWZYjLwro3Dll3PrLji5sLKFqGkyaGjt1DauBtbV9uOHIOk4ePoA8Uw4FqKQvNQzaZobxdAtVPXNU3zz8rgw661aMMzlatPFLTE3TJM28p0j9jRv3taHr753f1f04vT/Ha7/+sPrjKYE2DPCBs+3l/gpdUbYIAHvYLQdzWAh8bIvBwCkGNhjiDmKsRIpMcPgICOrpBT+1pQIXYfcA+vqClixm1dTJkvvGIQK60JXR0FoBSsCAUNkWO9MJmNiBbLRGXhbI8hLaO6EqCmRFAV0OoPICMsvAgBf2aFE3DWZNi1nbYtw2aCVjtDLC6uoy9i+PUOQZLJzsOctwkrvexXi8ibqpkWUaZVE459dZd/orp0jsTvPGnfze+bvTv58BhEtrDNpkTEgeTKWB08sZfmwpx29/ZIerfTnw0+9fzPw/XVsEgD3srnMtPni2xYuO5ABEmyl9jxT5gdbaOxmk48w87A/AvEx4B5t114E+6yVVuO3fFoIAkcW0moLIcQtcF124QOAVfgE4ZwSDBGFqaoynY0ynU7TWwLJFy4Q2GQ3WbYtZNcN0OsF4PMa0mmFmGszaBmPTwiiBclSiHBbI88zvJQBIeucHg6xF21SYTHewPdlEaw3KsnBpf9hmpHXi/K43YnzTrzVBVai/sDNu8k2c36kGBee3sMRQAo8t53jtgRxvaAiTr9ivcL4B3vn44vT/dG3RBHwa22kZUytwMLPNDQP8wmPEqzuGv93CDmIWMFf7xwl9GLIDEffu6n/lx2Hokgk/Okz1KsRgACEEpvUYTVtjxa6iLIdQWjtqchAJIEcAEn5+T9yiaQ22N91pqKWEhIAWMs72g/qPZc+9VwLIJbIsBxD3cLilaAIg4Tb/kV/0Udcz7Ey2ULUVlJIYDErkOofSYZ+h8stGnahH27ax9g8df7tH6t91/E0MEG3P+Qla8CeWMvzkSo43Ti2myxnwN5sWv7aA+35GtsgAnsbuP2/wzTcNcecBxoNjuX2s5LtnFvsry88XYB2Xg4d1W0DU4RbJnwW6nZzpht3eks05Yl1cviEEmrbBbDYBOCkJYsc/DPVdQGIvRhJkry0Yhi0atjBMMCBY4VR6WfrHwLEFSXjnTy6UjO2apsJ4soXN7Uuo2wp5nmE4GCDzuwq1UlBhyal0Uw+nJuTn9unJH2S7wkqvJO03xkTHt8l4UAs8vpThNYdK/MbMYvKrZ4HbRwuiz2djiwDwSeydj9d43nqOLzvQ4K1P6O1jA35wasVzDeE5QkB2pzhity8utohou7QcSIRFvYWpgLveqXWHtd1KSRhrMK1maNvWIQxltxkYgF9ZJoCwJdiPA2OQkMJvPNp9CYEjBBOfq0RhkbZtMJuNcWnrInYm24AAhsOhl/d2r8+9Tt0tKfHvkzzgJ574yWW+6++CRALzpZ7zf2I5w0+uZHhTRZgMFHD7EvBLC3nvz8oWAeBTsHeeafGCQzmuKwVODPWl8w0eIsYNhvgEBKtucw5648DevnvsLhci+GaP39k1BrstukII1E2FyXQCY1qvRJyOGANHn5OAMHfB7tscHT9ZtBmAOqbBdDrG9s4GNrc3YDysdzgcupVmXsZbJTDnQD7iHny3o/AGuS7rV3mHPkAv9Y/UXndfJXB6OcNrDpR448xgvJIDP/O+KT646Ph/1rYIAJ+i/dVjBi86nOOJGjheqjNT5gcscIOxdCPP600kDELsmhL0LUpdpxt6Etyee2Sn46eUAjFhWk1RVVO0bQvB7IVH+xgDmsMbhK0+PZ3d3kpv8vDcBtPpDra2N7A93sKsmSHLNYblwHX5/Z7CuAMhbPTx770n251IdaVOHQNBQu01Xg+gI/gQtMCjyxo/uZbjDRVhkisn5rIY931ubBEAPg37u7MtvuhQjh1mHF2RZ2tDDxLjhCGcBBCpgnF3YAIaApIMIIkFIQtIw0Oyjcs/H3dyX17RN9MaRISqqVA3Nep6hrZtEFdmk921Oy/IanUXr03gqbhVNcXWziY2ty9hZ7qFuq2gtMJw4Bw/z3MvLKr8JqW+YEpodlKgP3Mf1Ue9075L+6OUl3Fpf3B+JfDwcobXLud4U20xBgGQi7T/c2mLKcBnYI1gPDG2/II1fv9HLoofRstUk/0qBmuEjWF7NQZTx5ep2Ofu0WFYxsnJXuy0MaikRJZlrlNuDEzboG4rTKsxtHKNOC1dUy7U5P5Z3PN6/b3WtKjqGeq2ds7KTv5MZxnyLPONPef0KpKi0PU+wzP6jUPd6/dZhX/OcNrHOb+xnm9g/HZim3b7OZe4ZzXjVxe5eFtjMF0vge0G+MWF839ObaGU9hnad9wxhBLAegHx2BR3Tlr8QE34GiHUwHXE/SxcZ9CZ/6n9EsyYOieIQSCCizpLUvekX9BNDroNvp1oho2LM8N23lTJJ3VMwLEH4acASkpopSCVjspB8XXKbnPvrr5G8ro7UpGjIMfV3SHdp5TUY70CkAP3GDJg4iaX/LbDuXjdVx+0f/03m9LUQqBpgV9djPo+57YoAT5Du+tcixcdyTA1AJQ8ezij97UkViqL5zE4S+v4npTYfBXQ4+Tutm4+MLcqyz1xD0Ho8P8dDNdBcXWcJCgl3bpwvzLcgXU0sjxHkecoMtfYC0s6QwCIQSRx/H46g17/IdCPwx7CSOn10N6Oyus7/TYKemxqwb8rJX74N7776Afe9J4xrWrGk7XA6z+8cP5nwhYB4LOwu861eNF1GZYl488v6s2X7hd3zyyWK8u3AYhBoKcjgKQc2CXD240EAxjHgQhT+DDisky3qQiRcNQJl8huLu9/Sq2hk9uUUn6E12UkaTCJG5ITBmRfB5HjyrQ0s2AKQYAjmy86f9u6dWQB3JOo+gJ8fqTxi8u5+DEtxen33T3BgxOB4wPgxz8wu9z/1FetLQLAZ2l3nWvx9TcovHQ/cKbC9nopPtISZy3zCctYDq4quF/rB6JQytIPf9fZU0wOen/qokiQ5+o15pLb5k3s8Ts6peNO/Wj3b5p7LekGH06cP+Xy207EI+r+OUafzSU+uC8XPz3M8GszgycLxfi5D01x34UWf/7Ygtn3TNoiAHwO7C8fM3jxkQKHS4H//sJy+/0XzHs2Wr4E4MXEvJym+/OTASDxsXT6x3uTinq3JdOCtDfQpePondBIb6cA9+mgy71mZDq95N6v7F8PGQsSbQHiRLzTRPFOY9so62XJgplrJfivC43vf+VB9bYzFcZrBUAQizHf58kWAeBzZO94vMFXHMvx8DbhgTHVDeN+CWwJ4KRlXnesX45elXIHRfS0uB4jiQpid59gL0li7v+MDo9ElXh+yebce5ifRuzVnkgRjCkAKo7+iOOMP0h3tZH1F9B9xBJ8dqjx5kLj1afG9u5MSntjqVEx42c+sKj3P1+2mAI8A/Yttw0gAGQSmYL4yrHBq1sWL3IsOU+V9Zj5OBlQMtHmx96NN289bYHUkRNA0V7Wgx8j4A/2Yi+K+QfOCZokz8DJyK+n4mPQtv2UP1B+heB792fiNUcH8k8f3uRLIicYAn7/vkWt//m2RQbwDNhthxzXfqgEHSzwiZbxuGXcZCwfddqfPDcGwFNMAsLob48TPwSGpN7v9heI/lM+heNHSvOejMb519ChFrvxZHB+6ju/F/BwYp8dm4+Zq0ziL5XAayrGH35iypNjS+75f+vehfNfDlsEgGfA7jtv8PxDGdYyiQmB1gqcaggPtyRuJqLriLm3qV7MQX+BtPcmIESCFhRPkbSJPtAoTeN37SlMAsrTy5d0KX4kLCWTCIonv43d/dYYNIHya1vv/MRS4PRKhl9byeSP7cvEe4hBr1jTeOGSwpkaeP+i5r8stigBnmH7rjuGYAhYVkoQvWjH0qsqwj+F1Mcyj9jLdAbldfzchmEPs5Vh1ZeLF7t7BZ3x/J9SOPEnKQ32sr7DhwYi4m0UO/6diEfQ7jMJpBfMdSbwrkzh5w9p/MV7p2LnziGwaYA33zu53P8817wtMoBn2O44kqFliUIw//KDOPOSdXpXLsW5lvj5huhA2Ogr9vDP3SyBLtV/+tjddfH3Kg2ezjrEYYdCxNxEgfZ0fOOUfrx8lyGCBJ8aSPzydYV47aDEuwWJ6oVDgVIK/MLdC+d/NtgiADzDdte5Fnc/0eAfXp/hKw8DmxbV4RL3zyx2WovnWeZ9AMuOALT3lB/wWgLJrWKvO30S65UA3nY1B1Nk3x7jxEDyscbGDn+Q7zLGgJmmhRTvHmV4TZnh9VstzmoBft1XLeHn/r7CLy1Qfc8aWwSAz5O962yLWw5lKCSw3QqbCfFgS7hbC9pi5hOGeGl+xr4n7Dbe9EmCwCeBF+95e2+ywL2xYU+xN1Hu6WS+WhiyJhP8kSUlfmKoxM/ftk+8cz0TDSwwEgLvfsTgFxd4/meVLXoAl8G+4dYl7MsYhhn7MxzYavGdYyteJaQ6oaQug6hmIBR1ohvSbyjqy4+7a/7/e/2L7tEDSEFD7i4c9wL2HN/v8Ev39IW035Kr+YksBNP5TOJ/Q4hf/7Zj6kP/5wzZYcY4PbNYyyV+Y3HqPyttkQFcBvvohQbPO5Qhl8BdG5gdH+LDhvD2QpJqLN1qiYpeEw/p+K4rFTqKgL9FPPWxz3NPuAs1mMzze6f+vKKPTdJ9ayDYnpfgv13N8VMHC/GrzOKhJ2rm5Qw4OwPecv8MH35i0eF/ttoiAFwmu/fJFl9yNMMtK8DYoLlQy3PrBe6tLV9ipiERHSYizSBQdHQ8JYqvu+0p0vskAPTqfDBA6G3jtal0V7KLr01TfmtZwr5vSePHDuXiZ5j4PTPCeNsAp2bALcNFo+9KsEUJ8Cywb33+EKUSuNQaMLRY1vyFkxZfJ4X4Rgt1h1J6oHUmtGf0pXRdkbD40n0Fe+KEGXMovkS9h4KOHyXaAhTRe07BxxARVQr8MWL+o6ESby01PrDdMK3nwD86muHRMeH73rFzuT/ShX2KtlAEehbYSgZcrDTWc4Edw2wl7jtQ4GNTQ3/WEr8SRP+ybuwLjFUDp/YT4MMKUooIIZYyVR56igDgrxAlmoB+IzAROSEP7/hhNx8zgYk2Sknv0Er8ccviQ0OFjxiIyjDjaw4rPF4xvvlPti73R7mwT9MWGcCzyL75tiE2DXBdDrQM5JKxVoj88ak4ISV/Y23lt0CqL5RCLSmlI68/8vkhICTm9Af6FvUGiBMYb9AHtN18nywk0zYTXQT4wdUMv8UCf/5Tt2ZnvvvvLTMYlgS0clFlAeq5Mm0RAJ6l9vW3DvFNx4F3ngfGRmAlo3KrFSeY8U0Nia/LdHYrsVgTUko9L+qxh3RXME7T/jje8xLdRBBsKzBPFejugcYfHdDi7y41fPaWFfn4AztkbhlJ/Ld/PcO3/a8hfvPeRap/pdsiADzL7VtuG8GSwHJOeKICRpKyQqobdV68rGraV1jmO1sWt0opdZoJSCmxuxxIuvxEsHFNGJlc0IOl4HsawgOWxcNHcvEuI9tTT8ykzSRwpJC4Z5Nw26rALyyEOa8aWwSAK8S+7QVDaAHMDFCTwg3DZWHN9tpFS7dWLV5SKnFbC7ywZXFcCDEUQuiesg/ipKBlZsvMk1zxgyXw4bHhjw0133fHEu7faeX2K9dG1ffcfwm3r2a4aaDw+NR1Dn7pnkWaf7XZIgBcQfaPbxni0anF8/cpFNkAyjSoyeL2XMtTRGvnjb2+sbhhScuXWeALBJic8lhYTAgeCvHwjPjslqEH9hV49KZSnfmRD0y2v/35A5wsBDYbgUcb4IZC4valMR6YDvHauxaOf7Xa/wfo6ZMlL6BsQgAAAABJRU5ErkJggg==
-"""
-
-## Delete the tempfile
-
 def center_window(window, width, height):
     screen_width = window.winfo_screenwidth()
     screen_height = window.winfo_screenheight()
@@ -70,429 +31,6 @@ def center_window(window, width, height):
     window.geometry(f'{width}x{height}+{x}+{y}')
 
 
-def adjust_column_width(ws, col):
-    max_length = 0
-    column = get_column_letter(col)
-    for cell in ws[column]:
-        if cell.value:
-            max_length = max(max_length, len(str(cell.value)))
-    adjusted_width = max_length + 2  # Add some extra space
-    ws.column_dimensions[column].width = adjusted_width
-timestamp = datetime.now().strftime("%d_%H_%M")  # Get current timestamp
-output_filename = f"CSAT {timestamp}.xlsx"
-def process_and_export_to_excel(file_path, output_path):
-
-
-    # Load the CSV file
-    data = pd.read_csv(file_path)
-
-    # Remove leading/trailing spaces from column names
-    data.columns = data.columns.str.strip()
-
-    # Replace 'No_Answer' with 0 and convert 'Answer' to numeric
-    data['Answer'] = data['Answer'].replace('No_Answer', 0)
-    data['Answer'] = pd.to_numeric(data['Answer'], errors='coerce')
-
-    # Drop rows where 'Answer' is NaN
-    data = data.dropna(subset=['Answer'])
-
-    # Ensure 'Answer' column is integer
-    data['Answer'] = data['Answer'].astype(int)
-
-    # Create the pivot table
-    pivot_table = data.pivot_table(index='Agent Name', columns='Answer', values='Customer Phone Number', aggfunc='count', fill_value=0).reset_index()
-
-    # Rename columns
-    pivot_table.columns.name = None
-    pivot_table = pivot_table.rename(columns={0: 'No_Answer', 1: 'Good', 2: 'Bad'})
-    
-    # Drop the 'No_Answer' column
-    pivot_table = pivot_table.drop(columns=['No_Answer'])
-    
-    # Create the Surveys column
-    pivot_table['Surveys'] = pivot_table['Good'] + pivot_table['Bad']
-    
-    # Create the CSAT column
-    pivot_table['CSAT'] = (pivot_table['Good'] / pivot_table['Surveys']).apply(lambda x: f"{x:.0%}" if not pd.isna(x) else None)
-    
-    # Drop rows with NaN CSAT
-    pivot_table = pivot_table.dropna(subset=['CSAT'])
-    
-    # Convert CSAT to numeric for sorting and conditional formatting
-    pivot_table['CSAT_numeric'] = pivot_table['CSAT'].str.rstrip('%').astype(float)
-    
-    # Sort by CSAT
-    pivot_table = pivot_table.sort_values(by='CSAT_numeric', ascending=False)
-    
-    # Append the Grand Total row
-    grand_total = pivot_table[['Good', 'Bad', 'Surveys']].sum()
-    grand_total['Agent Name'] = 'Grand Total'
-    grand_total['CSAT'] = f"{grand_total['Good'] / grand_total['Surveys']:.0%}"
-    grand_total['CSAT_numeric'] = float(grand_total['CSAT'].rstrip('%'))
-    grand_total = pd.DataFrame(grand_total).transpose()
-    pivot_table = pd.concat([pivot_table, grand_total], ignore_index=True)
-    
-    # Export to Excel
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Pivot Table'
-    fill = PatternFill(start_color='5FACC7', end_color='5FACC7', fill_type='solid')
-
-    # Write DataFrame to Excel
-    for r in dataframe_to_rows(pivot_table, index=False, header=True):
-        ws.append(r)
-    
-    # Apply formatting
-    for cell in ws["1:1"]:
-        cell.font = Font(bold=True)
-    
-    # Center align all cells
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-        for cell in row:
-            cell.alignment = Alignment(horizontal='center')
-
-
-    # Apply gradient color scale to the CSAT_numeric column
-    first_data_row = 2
-    last_data_row = ws.max_row - 1  # Exclude the Grand Total row from conditional formatting
-
-    rule = ColorScaleRule(
-        start_type='num', start_value=0, start_color='FF0000',
-        end_type='num', end_value=100, end_color='00FF00'
-    )
-    ws.conditional_formatting.add(f"F{first_data_row}:F{last_data_row}", rule)
-# Add '%' symbol to the end of each CSAT_numeric value
-    for row in range(first_data_row, last_data_row + 1):
-        ws[f"F{row}"].number_format = '0%'
-    # Hide the CSAT_numeric column
-    ws.column_dimensions['F'].hidden = True
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = (max_length + 2)
-        ws.column_dimensions[column].width = adjusted_width    
-    # Save the workbook
-    wb.save(output_path)
-
-def read_csv_skip_rows(file_path, skip_rows=4):
-    # Read the CSV file and skip the first 4 rows
-    df = pd.read_csv(file_path, skiprows=skip_rows)
-    return df
-
-def filter_by_hour(df, hour):
-    # Convert "Ticket Closed Time" to datetime with the correct format
-    df['Ticket Closed Time'] = pd.to_datetime(df['Ticket Closed Time'], format='%d %b %Y %I:%M %p')
-    
-    # Filter the DataFrame to only include rows where "Ticket Closed Time" is within the specified hour
-    filtered_df = df[df['Ticket Closed Time'].dt.hour == hour]
-    return filtered_df
-
-def filter_by_day(df, day):
-    # Convert "Ticket Closed Time" to datetime with the correct format
-    df['Ticket Closed Time'] = pd.to_datetime(df['Ticket Closed Time'], format='%d %b %Y %I:%M %p')
-
-    # Filter the DataFrame to only include rows where "Ticket Closed Time" is within the specified hour
-    filtered_df = df[df['Ticket Closed Time'].dt.day == day]
-    return filtered_df
-def create_pivot_table(df):
-    # Create a pivot table similar to the provided image
-    pivot_table = pd.pivot_table(df, index='Ticket Owner', columns='Team', values='Ticket Id', aggfunc='count', margins=True, margins_name='Grand Total', fill_value=0)
-    
-    # Sort the pivot table rows by the row totals in descending order (excluding 'Grand Total' row)
-    pivot_table = pivot_table.sort_values(by='Grand Total', ascending=False)
-    
-    # Move 'Grand Total' row to the last row
-    grand_total_row = pivot_table.loc['Grand Total']
-    pivot_table = pivot_table.drop(index='Grand Total')
-    pivot_table = pd.concat([pivot_table, grand_total_row.to_frame().T])  # Concatenate the pivot table with grand_total_row
-
-    return pivot_table
-
-def style_pivot_table(ws):
-    # Apply some basic styling to the pivot table
-    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-
-    for row in ws.iter_rows():
-        for cell in row:
-            if cell.row == 1 or cell.column == 1 or cell.row == ws.max_row:
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="D9EAD3", end_color="D9EAD3", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            else:
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-            cell.border = thin_border
-
-def save_to_excel(df, pivot_table, output_file):
-    # Create a new workbook
-    wb = Workbook()
-
-    # Write the filtered data to the first sheet
-    ws_filtered = wb.active
-    ws_filtered.title = "Filtered Data"
-
-    for r in dataframe_to_rows(df, index=False, header=True):
-        ws_filtered.append(r)
-
-    # Create a new sheet for the pivot table
-    ws_pivot = wb.create_sheet(title="Pivot Table")
-
-    # Write the pivot table to the new sheet
-    pivot_table.reset_index(inplace=True)
-    pivot_table.columns.name = None  # Remove the name of the columns
-    pivot_table.rename(columns={'index': 'Ticket Owner'}, inplace=True)
-
-    for r in dataframe_to_rows(pivot_table, index=False, header=True):
-        ws_pivot.append(r)
-
-    # Apply styling to the pivot table
-    style_pivot_table(ws_pivot)
-
-    # Adjust column widths
-    for col in ws_pivot.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = (max_length + 2)
-        ws_pivot.column_dimensions[column].width = adjusted_width
-
-    # Reorder sheets so that Pivot Table sheet is the first one
-    wb.move_sheet(ws_filtered, offset=1)  # Move Filtered Data sheet to the second position
-    
-    # Save the workbook to a file
-    wb.save(output_file)
-
-def automate_process(csv_file, hour, output_file):
-    df = read_csv_skip_rows(csv_file)
-    filtered_df = filter_by_hour(df, hour)
-    pivot_table = create_pivot_table(filtered_df)
-    save_to_excel(filtered_df, pivot_table, output_file)
-
-
-timestamp = datetime.now().strftime("%d_%H_%M")  # Get current timestamp
-output_filename = f"CSAT {timestamp}.xlsx"
-def automate_process(csv_file, hour, output_file):
-    df = read_csv_skip_rows(csv_file)
-    filtered_df = filter_by_hour(df, hour)
-    pivot_table = create_pivot_table(filtered_df)
-    save_to_excel(filtered_df, pivot_table, output_file)
-
-
-timestamp = datetime.now().strftime("%d_%H_%M")  # Get current timestamp
-output_filename = f"CSAT {timestamp}.xlsx"
-def process_and_export_to_excel(file_path, output_path):
-
-
-    # Load the CSV file
-    # Load the CSV file
-    data = pd.read_csv(file_path)
-
-    # Remove leading/trailing spaces from column names
-    data.columns = data.columns.str.strip()
-
-    # Replace 'No_Answer' with 0 and convert 'Answer' to numeric
-    data['Answer'] = data['Answer'].replace('No_Answer', 0)
-    data['Answer'] = pd.to_numeric(data['Answer'], errors='coerce')
-
-    # Drop rows where 'Answer' is NaN
-    data = data.dropna(subset=['Answer'])
-
-    # Ensure 'Answer' column is integer
-    data['Answer'] = data['Answer'].astype(int)
-
-    # Create the pivot table
-    pivot_table = data.pivot_table(index='Agent Name', columns='Answer', values='Customer Phone Number', aggfunc='count', fill_value=0).reset_index()
-
-    # Rename columns
-    pivot_table.columns.name = None
-    pivot_table = pivot_table.rename(columns={0: 'No_Answer', 1: 'Good', 2: 'Bad'})
-
-    # Drop the 'No_Answer' column
-    pivot_table = pivot_table.drop(columns=['No_Answer'])
-
-    # Handle cases where 'Good' or 'Bad' columns might be missing
-    if 'Good' not in pivot_table.columns:
-        pivot_table['Good'] = 0
-    if 'Bad' not in pivot_table.columns:
-        pivot_table['Bad'] = 0
-
-    # Create the Surveys column
-    pivot_table['Surveys'] = pivot_table['Good'] + pivot_table['Bad']
-
-    # Create the CSAT column
-    pivot_table['CSAT'] = (pivot_table['Good'] / pivot_table['Surveys']).apply(lambda x: f"{x:.0%}" if not pd.isna(x) else None)
-
-    # Drop rows with NaN CSAT
-    pivot_table = pivot_table.dropna(subset=['CSAT'])
-
-    # Convert CSAT to numeric for sorting and conditional formatting
-    pivot_table['CSAT_numeric'] = pivot_table['CSAT'].str.rstrip('%').astype(float)
-
-    # Sort by CSAT
-    pivot_table = pivot_table.sort_values(by='CSAT_numeric', ascending=False)
-
-    # Append the Grand Total row
-    grand_total = pivot_table[['Good', 'Bad', 'Surveys']].sum()
-    grand_total['Agent Name'] = 'Grand Total'
-    grand_total['CSAT'] = f"{grand_total['Good'] / grand_total['Surveys']:.0%}"
-    grand_total['CSAT_numeric'] = float(grand_total['CSAT'].rstrip('%')) / 100
-    pivot_table['CSAT_numeric'] = pivot_table['CSAT'].str.rstrip('%').astype(float) / 100
-
-
-    grand_total = pd.DataFrame(grand_total).transpose()
-    pivot_table = pd.concat([pivot_table, grand_total], ignore_index=True)
-
-    # Export to Excel
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Pivot Table'
-
-    # Write DataFrame to Excel
-    for r in dataframe_to_rows(pivot_table, index=False, header=True):
-        ws.append(r)
-    
-    # Apply formatting
-        # Apply background color to the first row and first column of the last row
-    fill = PatternFill(start_color='538DD5', end_color='538DD5', fill_type='solid')
-    
-    # Apply background color to the first row
-    for cell in ws[1]:
-        cell.fill = fill
-    
-    # Apply background color to the first column of the last row
-    for row in ws.iter_rows(min_row=ws.max_row, max_row=ws.max_row, min_col=1, max_col=1):
-        for cell in row:
-            cell.fill = fill
-    for cell in ws["1:1"]:
-        cell.font = Font(bold=True)
-    
-    # Center align all cells
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-        for cell in row:
-            cell.alignment = Alignment(horizontal='center')
-
-
-    # Apply gradient color scale to the CSAT_numeric column
-    first_data_row = 2
-    last_data_row = ws.max_row+1 # Exclude the Grand Total row from conditional formatting
-    rule = ColorScaleRule(
-        start_type='min', start_value=0, start_color='f8696b',
-        mid_type='percentile', mid_value=50, mid_color='fede81',
-        end_type='max', end_value=100, end_color='63be7b'
-    )
-    ws.conditional_formatting.add(f"E{first_data_row}:F{last_data_row}", rule)
-
-    
-    # Hide the CSAT_numeric column
-    #ws.column_dimensions['F'].hidden = True
-    ws.delete_cols(5)
-    for row in range(first_data_row, last_data_row + 2):
-           ws[f"E{row}"].number_format = '0%'
-    ws['E1'] = ' CSAT '
-
-    # Adjust column widths
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass                        
-            adjusted_width = (max_length + 2)
-        if(column == 'A'):                    
-            adjusted_width = (max_length + 10)
-        ws.column_dimensions[column].width = adjusted_width        
-    
-    # Save the workbook
-    wb.save(output_path)
-def generate_break_schedule(agent_names, start_time, break_schema):
-    # Define the columns for the DataFrame
-    if break_schema == '1':
-        columns = ['Agent Name', 'Start Time', '15 Min Break', '30 Min Break', '15 Min Break', 'End Time']
-    elif break_schema == '2':
-        columns = ['Agent Name', 'Start Time', '30 Min Break', '30 Min Break', 'End Time']
-    else:
-        raise ValueError("Invalid break schema. Choose '1' for schema: 15-30-15 or '2' for schema : 30-30.")
-    
-    data = []
-    
-    start = datetime.strptime(start_time, '%I:%M %p')
-    end = start + timedelta(hours=9)
-    
-    # Initial break times for the first agent
-    break_time = start + timedelta(hours=2)
-
-    for i, agent_name in enumerate(agent_names):
-        if break_schema == '1':
-            first_break = break_time
-            second_break = first_break + timedelta(minutes=15) + timedelta(hours=2)
-            third_break = second_break + timedelta(minutes=30) + timedelta(hours=2)
-            break_time += timedelta(minutes=15)  # Next agent's first break is 15 mins later
-            row = [agent_name, start.strftime('%I:%M %p'), first_break.strftime('%I:%M %p'), 
-                   second_break.strftime('%I:%M %p'), third_break.strftime('%I:%M %p'), end.strftime('%I:%M %p')]
-        elif break_schema == '2':
-            first_break = break_time
-            second_break = first_break + timedelta(minutes=30) + timedelta(hours=3)
-            break_time += timedelta(minutes=30)  # Next agent's first break is 30 mins later
-            row = [agent_name, start.strftime('%I:%M %p'), first_break.strftime('%I:%M %p'), 
-                   second_break.strftime('%I:%M %p'), end.strftime('%I:%M %p')]
-        
-        data.append(row)
-    
-    df = pd.DataFrame(data, columns=columns)
-    return df
-def save_to_excel_break(df, filename):
-    wb = Workbook()
-    ws = wb.active
-    
-    # Apply styles for the header
-    header_font = Font(bold=True, color="000000")
-    header_fill = PatternFill(start_color="93c47d", end_color="93c47d", fill_type="solid")  # Green fill
-    black_border = Border(left=Side(style='thin', color='000000'),
-                          right=Side(style='thin', color='000000'),
-                          top=Side(style='thin', color='000000'),
-                          bottom=Side(style='thin', color='000000'))  # Black border
-                            # Apply alignment to center
-    centered_alignment = Alignment(horizontal='center', vertical='center')
-    
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), 1):
-        for c_idx, value in enumerate(row, 1):
-            cell = ws.cell(row=r_idx, column=c_idx, value=value)
-            if r_idx == 1:  # Apply styles only to the header row
-                cell.font = header_font
-                cell.fill = header_fill
-            cell.border = black_border
-            cell.alignment = centered_alignment
-    
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), 1):
-        for c_idx, value in enumerate(row, 1):
-            cell = ws.cell(row=r_idx, column=c_idx, value=value)
-            if r_idx == 1:  # Apply styles only to the header row
-                cell.font = header_font
-                cell.fill = header_fill
-            cell.border = black_border
-    
-    # Adjust column widths
-    for column_cells in ws.columns:
-        max_length = max(len(str(cell.value)) for cell in column_cells)
-        adjusted_width = max_length + 2
-        ws.column_dimensions[column_cells[0].column_letter].width = adjusted_width
-    
-    wb.save(filename)
-
 def prompt_delete_old_files():
     choice = input("Do you want to delete old files? Choose (c)sv/(x)lsx/(a)ll/(n)o: ").strip().lower()
     return choice
@@ -501,8 +39,10 @@ def delete_files(file_extension):
     files = glob.glob(f'*.{file_extension}')
     for file in files:
         os.remove(file)
-    if(file_extension != 'ico'):
-        print(f"All old .{file_extension} files have been deleted.")
+        if file_extension == 'csv':
+            from csv_cache import clear_cache
+            clear_cache(file)
+    print(f"All old .{file_extension} files have been deleted.")
 
 def center_window(window, width, height):
     screen_width = window.winfo_screenwidth()
@@ -540,25 +80,91 @@ def delete_files(file_type):
     files = glob.glob(f"*.{file_type}")
     for file in files:
         os.remove(file)
-    if(file_type != 'ico'):
-        messagebox.showinfo("Delete Files", f"All {file_type} files deleted.")
-
-def base64_to_photoimage(base64_string: str) -> PhotoImage:
-    # Decode the base64 string to bytes
-    image_data = base64.b64decode(base64_string)
-    # Create a BytesIO stream from the decoded bytes
-    image_stream = BytesIO(image_data)
-    # Open the image using PIL
-    pil_image = Image.open(image_stream)
-    # Convert the PIL image to a PhotoImage object
-    photo_image = ImageTk.PhotoImage(pil_image)
-    return photo_image
+        if file_type == 'csv':
+            from csv_cache import clear_cache
+            clear_cache(file)
+    messagebox.showinfo("Delete Files", f"All {file_type} files deleted.")
+
+def load_reports():
+    # First call imports pandas/openpyxl and the pipelines; later calls get the cached module
+    import reports
+    return reports
+
+def warm_up_reports():
+    # Import the pipelines on a background thread after the window is drawn, so the first
+    # report does not wait for pandas; a report started meanwhile just waits on the import lock
+    threading.Thread(target=load_reports, daemon=True).start()
+
+# What the hourly/daily windows offer for the filtered rows -> reports' filtered_data values.
+# Kept here so the windows open without importing reports
+FILTERED_DATA_CHOICES = {
+    "Rows in a Filtered Data sheet": 'sheet',
+    "Rows in a .csv.gz next to it": 'csv',
+    "Pivot only (fastest)": 'none',
+}
+
+def filtered_data_box(window):
+    # Read-only dropdown for the filtered rows, defaulting to the Filtered Data sheet
+    choice = tk.StringVar(window, value=next(iter(FILTERED_DATA_CHOICES)))
+    ttk.Combobox(window, textvariable=choice, values=list(FILTERED_DATA_CHOICES), state='readonly', width=30).pack(pady=5)
+    return choice
 
+def show_done(message, summary=''):
+    # The per-stage timings of the report, slowest first, go under the message
+    if summary:
+        message += "\n\nTimings:\n" + summary
+    messagebox.showinfo("Done", message)
+
+def run_report_job(window, job, on_done, buttons=()):
+    # Run job() (the pandas/openpyxl pipeline) on a worker thread so the main loop keeps
+    # running, show an indeterminate progress bar meanwhile, and hand the result back to
+    # on_done(result, timing summary) on the Tk thread through after(); Tk itself is never
+    # touched from the worker
+    if getattr(window, 'job_running', False):
+        return
+    window.job_running = True
+    root = window.nametowidget('.')
+
+    progress = ttk.Progressbar(window, mode='indeterminate', length=200)
+    progress.pack(pady=5)
+    progress.start(10)
+    for button in buttons:
+        button.state(['disabled'])
+
+    outcome = {}
+    title = window.title()
+    def worker():
+        # Stage timings recorded on this thread are grouped under the window's title
+        with timings.run(title) as run:
+            try:
+                outcome['result'] = job()
+            except Exception as e:
+                outcome['error'] = e
+        outcome['summary'] = run.summary()
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+
+    def check():
+        if thread.is_alive():
+            root.after(100, check)
+            return
+        if window.winfo_exists():
+            window.job_running = False
+            progress.stop()
+            progress.destroy()
+            for button in buttons:
+                button.state(['!disabled'])
+        if 'error' in outcome:
+            messagebox.showerror("Error", f"The report could not be generated:\n{outcome['error']}")
+        else:
+            on_done(outcome['result'], outcome['summary'])
+    root.after(100, check)
 
 def main():
     def on_exit(event = None):
+        if watch['stop'] is not None:
+            watch['stop'].set()
         root.destroy()
-        delete_files("ico")
     def show_tool_info(event = None):
         info = ("For productivity, please make sure the file name is 'ghassan' and the hour is set to the hour you want to start from,"
                 "\n for example:"
@@ -586,128 +192,145 @@ def main():
     def productivity_for_hour(event = None):
         def on_exit(e):
             productivity_window.destroy()
+        def done(output_files, summary):
+            show_done("The output file has been saved as: " + ", ".join(output_files), summary)
+            if productivity_window.winfo_exists():
+                productivity_window.destroy()
         def run(e = None):
             csv_file = 'ghassan.csv'
             hour = int(hour_entry.get())
             output_file = 'Prod elsa3a ' + str(hour) + ' yabasha.xlsx'
-            automate_process(csv_file, hour, output_file)
-            messagebox.showinfo("Done", f"The output file has been saved as: {output_file}")
-            productivity_window.destroy()
+            filtered_data = FILTERED_DATA_CHOICES[filtered_data_choice.get()]
+            run_report_job(productivity_window, lambda: load_reports().automate_process(csv_file, hour, output_file, filtered_data=filtered_data), done, buttons)
+        def run_all_hours(separate_files=False):
+            csv_file = 'ghassan.csv'
+            if separate_files:
+                job = lambda: load_reports().automate_day_by_hour(csv_file, 'Prod elsa3a {hour} yabasha.xlsx', separate_files=True)
+            else:
+                job = lambda: load_reports().automate_day_by_hour(csv_file, 'Prod kol sa3a yabasha.xlsx')
+            run_report_job(productivity_window, job, done, buttons)
+        def run_live(e = None):
+            # Only the rows appended to ghassan.csv since the last live refresh are read
+            csv_file = 'ghassan.csv'
+            hour = int(hour_entry.get())
+            output_file = 'Prod elsa3a ' + str(hour) + ' live.xlsx'
+            def job():
+                load_reports().automate_live_process(csv_file, hour, output_file)
+                return [output_file]
+            run_report_job(productivity_window, job, done, buttons)
 
         productivity_window = tk.Toplevel()
         productivity_window.title("Productivity for an Hour")
-        productivity_window.geometry("300x150")
-        icondata= base64.b64decode(icon)
-        tempFile= "icon.ico"
-        iconfile= open(tempFile,"wb")
-        ## Extract the icon
-        iconfile.write(icondata)
-        iconfile.close()
-        productivity_window.wm_iconbitmap(tempFile)
-        os.remove(tempFile)
+        productivity_window.geometry("300x420")
 
         productivity_window.configure(bg='#252525')
-        center_window(productivity_window, 300, 150)
+        center_window(productivity_window, 300, 420)
 
         ttk.Label(productivity_window, text="Enter the hour you want to filter by (0-23):", background='#252525', foreground='#CBCF0C').pack(pady=6)
         hour_entry = ttk.Entry(productivity_window)
         hour_entry.pack(pady=5)
-        ttk.Button(productivity_window, text="Run", command=run).pack(pady=10)
+        filtered_data_choice = filtered_data_box(productivity_window)
+        buttons = [
+            ttk.Button(productivity_window, text="Run", command=run),
+            ttk.Button(productivity_window, text="All hours in one workbook", command=run_all_hours),
+            ttk.Button(productivity_window, text="All hours, a workbook each", command=lambda: run_all_hours(True)),
+            ttk.Button(productivity_window, text="Live refresh (new rows only)", command=run_live),
+        ]
+        buttons[0].pack(pady=10)
+        buttons[1].pack(pady=3)
+        buttons[2].pack(pady=3)
+        buttons[3].pack(pady=3)
         hour_entry.focus_set()
         productivity_window.bind("<Enter>",run)
         productivity_window.bind("<Escape>",on_exit)
 
     def productivity_for_day(event = None):
-        def run():
+        def done(output_files, summary):
+            show_done("The output file has been saved as: " + ", ".join(output_files), summary)
+            if productivity_day_window.winfo_exists():
+                productivity_day_window.destroy()
+        def run(e = None):
             csv_file = glob.glob('L2*.csv')[0]
             day = int(day_entry.get())
             output_file = 'Prod elyom ' + str(day) + ' yabasha.xlsx'
-            df = read_csv_skip_rows(csv_file)
-            filtered_df = filter_by_day(df, day)
-            pivot_table = create_pivot_table(filtered_df)
-            save_to_excel(filtered_df, pivot_table, output_file)
-            messagebox.showinfo("Done", f"The output file has been saved as: {output_file}")
-            productivity_day_window.destroy()
+            filtered_data = FILTERED_DATA_CHOICES[filtered_data_choice.get()]
+            run_report_job(productivity_day_window, lambda: load_reports().automate_day_process(csv_file, day, output_file, filtered_data=filtered_data), done, buttons)
+        def run_shifts():
+            # Every shift that started on the day, a pivot sheet each (pivot only)
+            csv_file = glob.glob('L2*.csv')[0]
+            day = int(day_entry.get())
+            output_file = 'Prod shifts ' + str(day) + ' yabasha.xlsx'
+            run_report_job(productivity_day_window, lambda: [load_reports().automate_shift_process(csv_file, output_file, day=day)], done, buttons)
 
         productivity_day_window = tk.Toplevel()
-        icondata= base64.b64decode(icon)
-        tempFile= "icon.ico"
-        iconfile= open(tempFile,"wb")
-        ## Extract the icon
-        iconfile.write(icondata)
-        iconfile.close()
-        productivity_day_window.wm_iconbitmap(tempFile)
-        os.remove(tempFile)
 
         productivity_day_window.title("Productivity for a Day")
-        productivity_day_window.geometry("300x150")
+        productivity_day_window.geometry("300x270")
         productivity_day_window.configure(bg='#252525')
-        center_window(productivity_day_window, 300, 150)
+        center_window(productivity_day_window, 300, 270)
     
         ttk.Label(productivity_day_window, text="Enter the day you want to filter by (1-31):", background='#252525', foreground='#CBCF0C').pack(pady=6)
         day_entry = ttk.Entry(productivity_day_window)
         day_entry.pack(pady=5)
-
-        ttk.Button(productivity_day_window, text="Run", command=run).pack(pady=10)
+        filtered_data_choice = filtered_data_box(productivity_day_window)
+
+        buttons = [
+            ttk.Button(productivity_day_window, text="Run", command=run),
+            ttk.Button(productivity_day_window, text="All shifts of the day", command=run_shifts),
+        ]
+        buttons[0].pack(pady=10)
+        buttons[1].pack(pady=3)
         day_entry.focus_set()
         productivity_day_window.bind("<Enter>",run)
         productivity_day_window.bind("<Escape>",on_exit)
 
     def csat_overday(event=None):
-        ivr_file = glob.glob('IVR*.csv')[0]  # Assuming there's only one file starting with "IVR" in the directory
+        ivr_files = sorted(glob.glob('IVR*.csv'))  # Every file starting with "IVR", merged into one report
+        if not ivr_files:
+            messagebox.showerror("Error", "No file starting with IVR was found in this folder.")
+            return
+        source_name = ivr_files[0] if len(ivr_files) == 1 else f"{len(ivr_files)} IVR files"
         timestamp = datetime.now().strftime("%d_%H_%M")  # Get current timestamp
         output_filename = f"CSAT {timestamp}.xlsx"
-        process_and_export_to_excel(ivr_file, output_filename)
-        messagebox.showinfo("Done", f"The output file has been saved as: {output_filename}")
-        icondata= base64.b64decode(icon)
-        tempFile= "icon.ico"
-        iconfile= open(tempFile,"wb")
-        ## Extract the icon
-        iconfile.write(icondata)
-        iconfile.close()
-        os.remove(tempFile)
-        csat_overday.bind('<Escape>', on_exit(None,csat_overday))
-
-
-        center_window(messagebox, 600, 500)
+
+        csat_window = tk.Toplevel()
+        csat_window.title("C-SAT Overday")
+        csat_window.geometry("300x90")
+        csat_window.configure(bg='#252525')
+        center_window(csat_window, 300, 90)
+        ttk.Label(csat_window, text=f"Generating C-SAT from {source_name}...", background='#252525', foreground='#CBCF0C').pack(pady=6)
+
+        def done(result, summary):
+            show_done(f"The output file has been saved as: {output_filename}", summary)
+            if csat_window.winfo_exists():
+                csat_window.destroy()
+        run_report_job(csat_window, lambda: load_reports().process_and_export_to_excel(ivr_files, output_filename), done)
     def generate_break_schedule_tool(event=None):
         def run():
-            shift_start_times = {
-                9: '09:00 AM',
-                7: '07:00 AM',
-                11: '11:00 AM',
-                10: '10:00 PM',
-                4: '04:00 PM',
-                1: '01:00 PM'
-            }
-
             today = datetime.today()
             shift_choice = int(shift_entry.get())
-            start_time = shift_start_times.get(shift_choice)
             filename = 'Breaks shift ' + str(shift_choice) +' '+ str(today.day) + '-' +str(today.month)+'.xlsx' 
-            if not start_time:
-                messagebox.showerror("Invalid Shift Time", "Invalid shift start time.")
-                return
 
             agent_names = agent_entry.get().split()
             break_schema = schema_entry.get()
-            schedule_df = generate_break_schedule(agent_names, start_time, break_schema)
-            save_to_excel_break(schedule_df, filename)
-            messagebox.showinfo("Done", f"Break schedule saved to {filename}")
-            break_schedule_window.destroy()
+            def job():
+                reports = load_reports()
+                # The shifts come from reports, so they are looked up on the worker, not the Tk thread
+                start_time = reports.SHIFT_START_TIMES.get(shift_choice)
+                if not start_time:
+                    raise ValueError("Invalid shift start time.")
+                schedule_df = reports.generate_break_schedule(agent_names, start_time, break_schema)
+                reports.save_to_excel_break(schedule_df, filename)
+            def done(result, summary):
+                show_done(f"Break schedule saved to {filename}", summary)
+                if break_schedule_window.winfo_exists():
+                    break_schedule_window.destroy()
+            run_report_job(break_schedule_window, job, done, [run_button])
 
         break_schedule_window = tk.Toplevel()
         break_schedule_window.title("Generate Break Schedule")
         break_schedule_window.geometry("350x470")
         break_schedule_window.configure(bg='#2e2e2e')
-        icondata= base64.b64decode(icon)
-        tempFile= "icon.ico"
-        iconfile= open(tempFile,"wb")
-        ## Extract the icon
-        iconfile.write(icondata)
-        iconfile.close()
-        break_schedule_window.wm_iconbitmap(tempFile)
-        os.remove(tempFile)
         
         center_window(break_schedule_window, 350, 470)
 
@@ -724,18 +347,53 @@ def main():
         schema_entry = ttk.Entry(break_schedule_window)
         schema_entry.pack(pady=5)
 
-        ttk.Button(break_schedule_window, text="Run", command=run).pack(pady=20)
-
+        run_button = ttk.Button(break_schedule_window, text="Run", command=run)
+        run_button.pack(pady=20)
+
+    def generate_all_reports_tool(event=None):
+        all_window = tk.Toplevel()
+        all_window.title("Generate All Reports")
+        all_window.geometry("300x90")
+        all_window.configure(bg='#252525')
+        center_window(all_window, 300, 90)
+        ttk.Label(all_window, text="Generating all reports...", background='#252525', foreground='#CBCF0C').pack(pady=6)
+
+        def done(results, summary):
+            show_done(describe_results(results), summary)
+            if all_window.winfo_exists():
+                all_window.destroy()
+        run_report_job(all_window, lambda: load_reports().generate_all_reports(), done)
+
+    def toggle_watch(event=None):
+        # Watch mode: reports are regenerated on worker threads as exports land in the folder.
+        # Results come back through a queue that the Tk thread drains with after()
+        if watch['stop'] is not None:
+            watch['stop'].set()
+            watch['stop'] = None
+            button_9.config(text="Watch folder: off")
+            canvas.itemconfig(watch_status, text="")
+            return
+        from folder_watcher import start_watching
+        results = queue.Queue()
+        watch['stop'] = start_watching(on_result=lambda name, output_file, error: results.put({name: (output_file, error)}))
+        button_9.config(text="Watch folder: on")
+        canvas.itemconfig(watch_status, text="Waiting for new exports...")
+
+        def show_results(stop_event=watch['stop']):
+            if stop_event.is_set():
+                return
+            while not results.empty():
+                canvas.itemconfig(watch_status, text=datetime.now().strftime("%H:%M ") + describe_results(results.get()))
+            root.after(500, show_results)
+        show_results()
+    watch = {'stop': None}
    
-    icondata= base64.b64decode(icon)
-    tempFile= "icon.ico"
-    iconfile= open(tempFile,"wb")
-## Extract the icon
-    iconfile.write(icondata)
-    iconfile.close()
 #designer
     root = Tk()
 
+    # Decoded once, in memory; iconphoto(True, ...) makes every Toplevel inherit it
+    root.iconphoto(True, photo_image('icon'))
+
     root.geometry("820x404")
     root.configure(bg = "#252525")
 
@@ -786,14 +444,14 @@ def main():
         font=("JosefinSansRoman Bold", 17 * -1)
     )
 
-    image_image_1 = base64_to_photoimage(me)
+    image_image_1 = photo_image('me')
     image_1 = canvas.create_image(
         137.0,
         208.0,
         image=image_image_1
     )
 
-    button_image_1 = base64_to_photoimage(img1)
+    button_image_1 = photo_image('img1')
     button_1 = Button(
         image=button_image_1,
         borderwidth=0,
@@ -808,7 +466,7 @@ def main():
         height=32.0
     )
 
-    button_image_2 = base64_to_photoimage(img2)
+    button_image_2 = photo_image('img2')
     button_2 = Button(
         image=button_image_2,
         borderwidth=0,
@@ -823,7 +481,7 @@ def main():
         height=32.0
     )
 
-    button_image_3 = base64_to_photoimage(img3)
+    button_image_3 = photo_image('img3')
     button_3 = Button(
         image=button_image_3,
         borderwidth=0,
@@ -838,7 +496,7 @@ def main():
         height=32.0
     )
 
-    button_image_4 = base64_to_photoimage(img4)
+    button_image_4 = photo_image('img4')
     button_4 = Button(
         image=button_image_4,
         borderwidth=0,
@@ -853,7 +511,7 @@ def main():
         height=32.0
     )
 
-    button_image_5 = base64_to_photoimage(img5)
+    button_image_5 = photo_image('img5')
     button_5 = Button(
         image=button_image_5,
         borderwidth=0,
@@ -868,7 +526,7 @@ def main():
         height=32.0
     )
 
-    button_image_6 = base64_to_photoimage(img6)
+    button_image_6 = photo_image('img6')
     button_6 = Button(
         image=button_image_6,
         borderwidth=0,
@@ -883,7 +541,7 @@ def main():
         height=32.0
     )
 
-    button_image_7 = base64_to_photoimage(img7)
+    button_image_7 = photo_image('img7')
     button_7 = Button(
         image=button_image_7,
         borderwidth=0,
@@ -898,6 +556,52 @@ def main():
         height=32.0
     )
 
+    button_8 = Button(
+        text="Generate all reports",
+        bg="#CBCF0C",
+        fg="#252525",
+        activebackground="#CBCF0C",
+        font=("JosefinSansRoman Bold", 13 * -1),
+        borderwidth=0,
+        highlightthickness=0,
+        command=generate_all_reports_tool,
+        relief="flat"
+    )
+    button_8.place(
+        x=488.0,
+        y=150.0,
+        width=143.0,
+        height=32.0
+    )
+
+    button_9 = Button(
+        text="Watch folder: off",
+        bg="#CBCF0C",
+        fg="#252525",
+        activebackground="#CBCF0C",
+        font=("JosefinSansRoman Bold", 13 * -1),
+        borderwidth=0,
+        highlightthickness=0,
+        command=toggle_watch,
+        relief="flat"
+    )
+    button_9.place(
+        x=654.0,
+        y=150.0,
+        width=143.0,
+        height=32.0
+    )
+
+    watch_status = canvas.create_text(
+        488.0,
+        190.0,
+        anchor="nw",
+        text="",
+        width=309.0,
+        fill="#CBCF0C",
+        font=("JosefinSansRoman Regular", 12 * -1)
+    )
+
     canvas.create_rectangle(
         517.0,
         241.0,
@@ -906,8 +610,6 @@ def main():
         fill="#CBCF0C",
         outline="")
    
-    root.wm_iconbitmap(tempFile)
-    os.remove(tempFile)
     root.title("Moon's Tool")
     center_window(root, 820, 404)
 
@@ -932,10 +634,18 @@ def main():
     root.bind('<Escape>', on_exit)
     
     root.bind('<Delete>', delete_old_files)
+    root.bind('<a>', generate_all_reports_tool)
+    root.bind('<A>', generate_all_reports_tool)
+    root.bind('<w>', toggle_watch)
+    root.bind('<W>', toggle_watch)
     
     if (getattr(sys, 'frozen', False)): # if running in a PyInstaller bundle
         pyi_splash.close()
+    root.after_idle(warm_up_reports)
     root.mainloop()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    # Stage timings cost next to nothing and make slow reports explainable from the Done dialog
+    timings.enable()
+    main()
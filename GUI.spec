@@ -5,7 +5,7 @@ a = Analysis(
     ['GUI.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('assets.bin', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
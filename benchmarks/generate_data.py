@@ -0,0 +1,106 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+# Synthetic exports shaped like the real ones, for the benchmarks:
+# - Zoho L2 / ghassan.csv: 4 preamble lines, then one row per closed ticket
+# - IVR: padded column names, Answer 1 (good) / 2 (bad) / No_Answer
+# Rows are built with numpy and written in chunks, so 10M rows stay within a few hundred MB.
+AGENTS = 120
+TEAMS = ['L2 UAE', 'L2 KSA', 'L2 EG', 'L2 Premium', 'L2 Social']
+STATUSES = ['Closed', 'Closed', 'Closed', 'Resolved']
+CHANNELS = ['Chat', 'Email', 'Phone', 'Web']
+DAYS = 3
+START = pd.Timestamp('2024-05-01')
+CHUNK_ROWS = 500_000
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1M': 1_000_000, '10M': 10_000_000}
+
+
+def parse_size(text):
+    # '100k' / '1M' or a plain number of rows
+    if text in SIZES:
+        return SIZES[text]
+    return int(float(text.lower().replace('k', 'e3').replace('m', 'e6')))
+
+
+def _minute_strings(fmt):
+    # Every minute of the covered days, formatted once; rows just pick one by index
+    minutes = pd.date_range(START, periods=DAYS * 24 * 60, freq='min')
+    return np.array(minutes.strftime(fmt), dtype=object)
+
+
+def _agent_names():
+    return np.array([f"Agent {i:03d}" for i in range(AGENTS)], dtype=object)
+
+
+def _busy_minutes(rng, size):
+    # More tickets during the day shifts than overnight
+    minute_of_day = np.clip(rng.normal(14 * 60, 4 * 60, size), 0, 24 * 60 - 1).astype(np.int64)
+    return rng.integers(0, DAYS, size) * 24 * 60 + minute_of_day
+
+
+def generate_zoho_export(path, rows, seed=1):
+    rng = np.random.default_rng(seed)
+    closed_times = _minute_strings('%d %b %Y %I:%M %p')
+    agents = _agent_names()
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.write("Report Name,L2 Intraday\nGenerated,Benchmark\nRows,%d\n\n" % rows)
+        for start in range(0, rows, CHUNK_ROWS):
+            size = min(CHUNK_ROWS, rows - start)
+            ids = np.arange(start, start + size) + 493567000000000
+            chunk = pd.DataFrame({
+                'Ticket Id': ids,
+                'Subject': np.char.add('Customer issue #', (ids % 100000).astype(str)),
+                'Ticket Owner': agents[rng.integers(0, AGENTS, size)],
+                'Team': np.array(TEAMS, dtype=object)[rng.integers(0, len(TEAMS), size)],
+                'Status': np.array(STATUSES, dtype=object)[rng.integers(0, len(STATUSES), size)],
+                'Channel': np.array(CHANNELS, dtype=object)[rng.integers(0, len(CHANNELS), size)],
+                'Ticket Closed Time': closed_times[_busy_minutes(rng, size)],
+            })
+            chunk.to_csv(f, index=False, header=start == 0)
+    return path
+
+
+def generate_ivr_export(path, rows, seed=2):
+    rng = np.random.default_rng(seed)
+    call_times = _minute_strings('%Y-%m-%d %H:%M:%S')
+    agents = _agent_names()
+    answers = np.array(['1', '1', '1', '2', 'No_Answer'], dtype=object)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        for start in range(0, rows, CHUNK_ROWS):
+            size = min(CHUNK_ROWS, rows - start)
+            chunk = pd.DataFrame({
+                ' Agent Name ': agents[rng.integers(0, AGENTS, size)],
+                ' Answer': answers[rng.integers(0, len(answers), size)],
+                'Customer Phone Number ': np.char.add('05', rng.integers(10**7, 10**8, size).astype(str)),
+                ' Call Time': call_times[_busy_minutes(rng, size)],
+            })
+            chunk.to_csv(f, index=False, header=start == 0)
+    return path
+
+
+def dataset_paths(folder, rows):
+    return (os.path.join(folder, f"L2 bench {rows}.csv"), os.path.join(folder, f"IVR bench {rows}.csv"))
+
+
+def ensure_datasets(folder, rows):
+    # Generated once per size and reused by later runs
+    os.makedirs(folder, exist_ok=True)
+    zoho_path, ivr_path = dataset_paths(folder, rows)
+    if not os.path.exists(zoho_path):
+        generate_zoho_export(zoho_path, rows)
+    if not os.path.exists(ivr_path):
+        generate_ivr_export(ivr_path, rows)
+    return zoho_path, ivr_path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Write synthetic Zoho L2 and IVR exports for the benchmarks.")
+    parser.add_argument('sizes', nargs='+', help="rows per export: 10k, 100k, 1M, 10M or a number")
+    parser.add_argument('--folder', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+    args = parser.parse_args()
+    for size in args.sizes:
+        for path in ensure_datasets(args.folder, parse_size(size)):
+            print("Written", path)
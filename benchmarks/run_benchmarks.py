@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+from generate_data import SIZES, parse_size, dataset_paths, ensure_datasets  # noqa: E402
+
+# Times each report pipeline end to end on the synthetic exports and records throughput and
+# peak memory as JSON, so releases can be compared:
+#   python benchmarks/run_benchmarks.py --sizes 10k 100k 1M
+#   python benchmarks/run_benchmarks.py --sizes 100k --baseline benchmarks/results/<older>.json
+# Every measurement runs in a fresh interpreter with the parse caches cleared, so nothing carries
+# over between runs. Time and memory come from separate runs because tracemalloc slows pandas down.
+# peak_mb is what the pipeline itself allocated (tracemalloc); peak_rss_mb is the whole worker
+# process, which also sees memory tracemalloc cannot (pyarrow buffers), where the OS reports it.
+DEFAULT_SIZES = ['10k', '100k']
+DEFAULT_DATA_FOLDER = os.path.join(HERE, 'data')
+DEFAULT_RESULTS_FOLDER = os.path.join(HERE, 'results')
+# A pipeline more than this much slower than the baseline counts as a regression
+DEFAULT_THRESHOLD = 0.15
+BENCH_HOUR = 14
+BENCH_DAY = 2
+MAX_BREAK_AGENTS = 100_000
+
+
+# Each setup does the untimed preparation and returns the callable that is timed
+def _setup_csat(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    return lambda: reports.process_and_export_to_excel(ivr_file, os.path.join(out_dir, 'csat.xlsx'))
+
+
+def _setup_hourly(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    return lambda: reports.automate_process(zoho_file, BENCH_HOUR, os.path.join(out_dir, 'hourly.xlsx'))
+
+
+def _setup_hourly_pivot_only(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    return lambda: reports.automate_process(zoho_file, BENCH_HOUR, os.path.join(out_dir, 'hourly_lean.xlsx'), filtered_data='none')
+
+
+def _setup_daily(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    return lambda: reports.automate_day_process(zoho_file, BENCH_DAY, os.path.join(out_dir, 'daily.xlsx'))
+
+
+def _setup_create_pivot_table(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    df = reports.read_zoho_export(zoho_file)
+    return lambda: reports.create_pivot_table(df)
+
+
+def _setup_save_to_excel(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    filtered_df = reports.filter_by_hour(reports.read_zoho_export(zoho_file), BENCH_HOUR)
+    pivot_table = reports.create_pivot_table(filtered_df)
+    return lambda: reports.save_to_excel(filtered_df, pivot_table.copy(), os.path.join(out_dir, 'save.xlsx'))
+
+
+def _setup_generate_break_schedule(zoho_file, ivr_file, rows, out_dir):
+    import reports
+    agent_names = [f"Agent {i}" for i in range(min(rows, MAX_BREAK_AGENTS))]
+    return lambda: reports.generate_break_schedule(agent_names, '09:00 AM', '1')
+
+
+PIPELINES = {
+    'process_and_export_to_excel': _setup_csat,
+    'automate_process': _setup_hourly,
+    'automate_process_pivot_only': _setup_hourly_pivot_only,
+    'automate_day_process': _setup_daily,
+    'create_pivot_table': _setup_create_pivot_table,
+    'save_to_excel': _setup_save_to_excel,
+    'generate_break_schedule': _setup_generate_break_schedule,
+}
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (2**20 if sys.platform == 'darwin' else 2**10), 1)
+
+
+def run_worker(pipeline, rows, data_folder, trace):
+    # One measurement in this (fresh) process; prints {"seconds", "peak_rss_mb"} or, traced, {"peak_mb"}
+    from csv_cache import clear_cache
+    zoho_file, ivr_file = dataset_paths(data_folder, rows)
+    with tempfile.TemporaryDirectory() as out_dir:
+        clear_cache(zoho_file)
+        clear_cache(ivr_file)
+        job = PIPELINES[pipeline](zoho_file, ivr_file, rows, out_dir)
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        job()
+        seconds = time.perf_counter() - start
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(json.dumps({'peak_mb': round(peak / 2**20, 1)}))
+        else:
+            print(json.dumps({'seconds': seconds, 'peak_rss_mb': _peak_rss_mb()}))
+        clear_cache(zoho_file)
+        clear_cache(ivr_file)
+
+
+def _measure(pipeline, rows, data_folder, trace):
+    command = [sys.executable, os.path.abspath(__file__), '--worker', pipeline, str(rows), '--data', data_folder]
+    if trace:
+        command.append('--trace')
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed'}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _environment():
+    import numpy
+    import openpyxl
+    import pandas
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'pandas': pandas.__version__,
+        'numpy': numpy.__version__,
+        'openpyxl': openpyxl.__version__,
+    }
+
+
+def run_benchmarks(sizes, pipelines, data_folder=DEFAULT_DATA_FOLDER, memory=True):
+    results = []
+    for rows in sizes:
+        print(f"Preparing {rows:,} row exports...", flush=True)
+        ensure_datasets(data_folder, rows)
+        for pipeline in pipelines:
+            result = {'pipeline': pipeline, 'rows': rows}
+            result.update(_measure(pipeline, rows, data_folder, trace=False))
+            if 'seconds' in result:
+                result['seconds'] = round(result['seconds'], 4)
+                result['rows_per_second'] = round(rows / result['seconds']) if result['seconds'] else None
+                if memory:
+                    result.update(_measure(pipeline, rows, data_folder, trace=True))
+            results.append(result)
+            print(_format_result(result), flush=True)
+    return {'created': datetime.now().isoformat(timespec='seconds'), 'environment': _environment(), 'results': results}
+
+
+def _format_result(result):
+    if 'error' in result:
+        return f"  {result['pipeline']:<30} {result['rows']:>11,} rows  FAILED: {result['error']}"
+    peak = f"{result['peak_mb']:>9.1f} MB peak" if 'peak_mb' in result else ''
+    if result.get('peak_rss_mb') is not None:
+        peak += f"{result['peak_rss_mb']:>9.1f} MB RSS"
+    return (f"  {result['pipeline']:<30} {result['rows']:>11,} rows  {result['seconds']:>9.3f} s"
+            f"  {result['rows_per_second'] or 0:>12,} rows/s{peak}")
+
+
+def compare_to_baseline(report, baseline, threshold=DEFAULT_THRESHOLD):
+    # Prints the time ratio per pipeline/size; returns the regressions (slower than 1 + threshold)
+    previous = {(r['pipeline'], r['rows']): r for r in baseline['results'] if 'seconds' in r}
+    regressions = []
+    print(f"Compared with {baseline.get('environment', {}).get('commit')} ({baseline.get('created')}):")
+    for result in report['results']:
+        before = previous.get((result['pipeline'], result['rows']))
+        if before is None or 'seconds' not in result:
+            continue
+        ratio = result['seconds'] / before['seconds'] if before['seconds'] else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions.append(result)
+        print(f"  {result['pipeline']:<30} {result['rows']:>11,} rows  {before['seconds']:>9.3f} s -> {result['seconds']:>9.3f} s  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the report pipelines on synthetic exports.")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help=f"rows per export: {', '.join(SIZES)} or a number")
+    parser.add_argument('--pipelines', nargs='+', choices=sorted(PIPELINES), default=list(PIPELINES))
+    parser.add_argument('--data', default=DEFAULT_DATA_FOLDER, help="folder for the generated exports (reused between runs)")
+    parser.add_argument('--output', help="results JSON (default: benchmarks/results/<date>_<commit>.json)")
+    parser.add_argument('--baseline', help="earlier results JSON to compare with; exits 1 on a regression")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="allowed slow-down before it counts as a regression (0.15 = 15%%)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the (slower) tracemalloc peak-memory runs")
+    parser.add_argument('--worker', nargs=2, metavar=('PIPELINE', 'ROWS'), help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker[0], int(args.worker[1]), args.data, args.trace)
+        return 0
+
+    report = run_benchmarks([parse_size(size) for size in args.sizes], args.pipelines, args.data, memory=not args.no_memory)
+
+    output = args.output
+    if output is None:
+        os.makedirs(DEFAULT_RESULTS_FOLDER, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output = os.path.join(DEFAULT_RESULTS_FOLDER, f"{stamp}_{report['environment']['commit'] or 'local'}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print("Results written to", output)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare_to_baseline(report, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
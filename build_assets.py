@@ -0,0 +1,43 @@
+import glob
+import json
+import os
+import struct
+from gui_assets import BUNDLE_MAGIC, BUNDLE_NAME
+
+# Packs the GUI images into one binary bundle that gui_assets memory-maps at runtime.
+# Layout: magic, little-endian uint32 index length, JSON index {name: [offset, size]}, raw files.
+# Re-run after changing anything in assets/:  python build_assets.py
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def collect_assets():
+    return {os.path.splitext(os.path.basename(path))[0]: path
+            for path in sorted(glob.glob(os.path.join(HERE, 'assets', '*.png')))}
+
+
+def build_bundle(output_path=os.path.join(HERE, BUNDLE_NAME)):
+    blobs = {}
+    for name, path in collect_assets().items():
+        with open(path, 'rb') as f:
+            blobs[name] = f.read()
+
+    # Offsets are relative to the end of the index so the index can be written first
+    index = {}
+    offset = 0
+    for name, data in blobs.items():
+        index[name] = [offset, len(data)]
+        offset += len(data)
+    index_bytes = json.dumps(index, sort_keys=True).encode('utf-8')
+
+    with open(output_path, 'wb') as f:
+        f.write(BUNDLE_MAGIC)
+        f.write(struct.pack('<I', len(index_bytes)))
+        f.write(index_bytes)
+        for data in blobs.values():
+            f.write(data)
+    return output_path
+
+
+if __name__ == '__main__':
+    print("Bundle written to", build_bundle())
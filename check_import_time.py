@@ -0,0 +1,54 @@
+import re
+import subprocess
+import sys
+
+# Startup guard for the entry points: importing them must stay under a time budget and must not
+# pull in the report stack (pandas/openpyxl/PIL), which only loads through reports.py on first use.
+# Run before a release, exits non-zero on a regression:  python check_import_time.py [budget_ms]
+ENTRY_POINTS = ('GUI', 'source', 'insider')
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'PIL', 'pyarrow', 'xlsxwriter')
+DEFAULT_BUDGET_MS = 300
+
+# python -X importtime writes "import time: self [us] | cumulative | imported package" to stderr
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_import(module):
+    # Imports the module in a fresh interpreter; returns (cumulative ms of the top-level
+    # import, heavy modules that got imported along the way)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    heavy = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        if name.split('.')[0] in HEAVY_MODULES:
+            heavy.add(name.split('.')[0])
+        if name == module:
+            total_us = int(match.group(2))
+    return total_us / 1000, sorted(heavy)
+
+
+def main(budget_ms=DEFAULT_BUDGET_MS):
+    failed = False
+    for module in ENTRY_POINTS:
+        elapsed_ms, heavy = measure_import(module)
+        status = 'ok'
+        if heavy:
+            status = 'FAIL (imports ' + ', '.join(heavy) + ')'
+            failed = True
+        elif elapsed_ms > budget_ms:
+            status = f'FAIL (over the {budget_ms} ms budget)'
+            failed = True
+        print(f"{module:<10} {elapsed_ms:8.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS))
@@ -0,0 +1,197 @@
+import argparse
+import glob
+import os
+from datetime import datetime, timedelta
+import reports
+from history_store import DEFAULT_DB, PERIODS, period_bounds, ingest_export
+from report_jobs import run_report_jobs, describe_results
+import timings
+from xlsx_writers import ENGINES, DEFAULT_ENGINE
+
+# Non-interactive entry point behind `python source.py <command> ...` (and insider.py), for
+# Task Scheduler/cron. Every report asked for in one invocation is a separate job, fanned out
+# over --jobs worker processes. Exits with 1 if any report failed.
+
+
+def _output_pattern(parser, output, default, field, values):
+    # One output per hour/day, so with several of them the name needs a {hour}/{day} field
+    output = output or default
+    if len(values) > 1 and '{' + field + '}' not in output:
+        parser.error(f"-o/--output needs a {{{field}}} field when more than one {field} is given")
+    return output
+
+
+def hourly_jobs(parser, args):
+    output = _output_pattern(parser, args.output, 'Prod elsa3a {hour} yabasha.xlsx', 'hour', args.hour)
+    jobs = []
+    for hour in args.hour:
+        output_file = output.format(hour=hour)
+        jobs.append((f"Productivity for hour {hour}", reports.automate_process,
+                     (args.input, hour, output_file, None, args.engine, args.filtered_data, args.date), output_file))
+    return jobs
+
+
+def daily_jobs(parser, args):
+    output = _output_pattern(parser, args.output, 'Prod elyom {day} yabasha.xlsx', 'day', args.day)
+    jobs = []
+    for day in args.day:
+        output_file = output.format(day=day)
+        jobs.append((f"Productivity for day {day}", reports.automate_day_process,
+                     (args.input, day, output_file, None, args.engine, args.filtered_data), output_file))
+    return jobs
+
+
+def csat_jobs(parser, args):
+    output_file = args.output or f"CSAT {datetime.now().strftime('%d_%H_%M')}.xlsx"
+    ivr_files = args.input or reports.ivr_exports()
+    if not ivr_files:
+        parser.error("no IVR export given and no IVR*.csv in the current folder")
+    return [("C-SAT overday", reports.process_and_export_to_excel, (ivr_files, output_file), output_file)]
+
+
+def breaks_jobs(parser, args):
+    today = datetime.today()
+    output_file = args.output or 'Breaks shift ' + str(args.shift) + ' ' + str(today.day) + '-' + str(today.month) + '.xlsx'
+    start_time = reports.SHIFT_START_TIMES[args.shift]
+    return [("Break schedule", reports.automate_break_schedule, (args.agents, start_time, args.schema, output_file), output_file)]
+
+
+def range_jobs(parser, args):
+    if args.end <= args.start:
+        parser.error("--to must be after --from")
+    output_file = args.output or f"Prod {args.start:%d-%m %H%M} to {args.end:%d-%m %H%M}.xlsx"
+    return [(f"Productivity from {args.start:%d %b %H:%M} to {args.end:%d %b %H:%M}", reports.automate_range_process,
+             (args.input, args.start, args.end, output_file, None, args.engine, args.filtered_data), output_file)]
+
+
+def shifts_jobs(parser, args):
+    output_file = args.output or ('Prod shifts ' + (str(args.day) if args.day else 'all days') + ' yabasha.xlsx')
+    title = f"Productivity per shift for day {args.day}" if args.day else "Productivity per shift"
+    return [(title, reports.automate_shift_process, (args.input, output_file, args.day), output_file)]
+
+
+def history_jobs(parser, args):
+    when = args.at or datetime.now() - timedelta(hours=1 if args.period == 'hour' else 0)
+    start = period_bounds(args.period, when)[0]
+    output_file = args.output or f"History {args.period} {start:%Y-%m-%d %H%M}.xlsx"
+    return [(f"History ({args.period} from {start:%d %b %Y %H:%M})", reports.automate_history_report,
+             (args.period, when, output_file, args.db), output_file)]
+
+
+def ingest_exports(args):
+    csv_files = args.input or sorted(set().union(*(glob.glob(pattern) for pattern in reports.EXPORT_PATTERNS)))
+    if not csv_files:
+        print("No exports found (ghassan.csv, L2*.csv or IVR*.csv).")
+        return 1
+    failed = False
+    for csv_file in csv_files:
+        try:
+            print(f"{csv_file}: {ingest_export(csv_file, args.db):,} rows added or updated")
+        except Exception as e:
+            print(f"{csv_file}: failed ({e})")
+            failed = True
+    return 1 if failed else 0
+
+
+def all_jobs(parser, args):
+    return reports.all_report_jobs(args.hour, args.day)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Moon's Tool reports without the menu. Run with no arguments for the interactive menu.")
+    parser.add_argument('--timings', action='store_true', help=f"log per-stage timings to {timings.LOG_FILE}")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_command(name, help_text, build_jobs):
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.set_defaults(build_jobs=build_jobs)
+        subparser.add_argument('-j', '--jobs', type=int, default=None,
+                               help="worker processes to spread the reports over (default: one per report, up to the CPU count)")
+        return subparser
+
+    hourly = add_command('hourly', "productivity for one or more hours", hourly_jobs)
+    hourly.add_argument('input', nargs='?', default='ghassan.csv', help="Zoho export (default: ghassan.csv)")
+    hourly.add_argument('--hour', type=int, nargs='+', required=True, choices=range(24), metavar='HOUR', help="hour(s) to report, 0-23")
+    hourly.add_argument('--date', type=datetime.fromisoformat, metavar='YYYY-MM-DD',
+                        help="only that date's hour (default: the hour on every day in the export)")
+    hourly.add_argument('-o', '--output', help="output workbook; use {hour} when giving several hours")
+    hourly.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE)
+    hourly.add_argument('--filtered-data', choices=reports.FILTERED_DATA, default='sheet',
+                        help="where the filtered rows go: the Filtered Data sheet (default), a .csv.gz next to the workbook, or nowhere (pivot only, reads just the pivot's columns)")
+
+    daily = add_command('daily', "productivity for one or more days", daily_jobs)
+    daily.add_argument('input', help="Zoho L2 export")
+    daily.add_argument('--day', type=int, nargs='+', required=True, choices=range(1, 32), metavar='DAY', help="day(s) of the month to report, 1-31")
+    daily.add_argument('-o', '--output', help="output workbook; use {day} when giving several days")
+    daily.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE)
+    daily.add_argument('--filtered-data', choices=reports.FILTERED_DATA, default='sheet',
+                        help="where the filtered rows go: the Filtered Data sheet (default), a .csv.gz next to the workbook, or nowhere (pivot only, reads just the pivot's columns)")
+
+    csat = add_command('csat', "C-SAT by agent, hour and day from one or more IVR exports", csat_jobs)
+    csat.add_argument('input', nargs='*', help="IVR export(s), merged into one report (default: every IVR*.csv)")
+    csat.add_argument('-o', '--output', help="output workbook (default: CSAT <day>_<hour>_<minute>.xlsx)")
+
+    breaks = add_command('breaks', "break schedule for a shift", breaks_jobs)
+    breaks.add_argument('--shift', type=int, required=True, choices=sorted(reports.SHIFT_START_TIMES), help="shift start (1 = 1 PM, 4 = 4 PM, 10 = 10 PM)")
+    breaks.add_argument('--agents', nargs='+', required=True, help="agent names in break order")
+    breaks.add_argument('--schema', choices=('1', '2'), default='1', help="1 = 15-30-15, 2 = 30-30")
+    breaks.add_argument('-o', '--output', help="output workbook")
+
+    everything = add_command('all', "hourly, daily and C-SAT reports for the exports in the current folder", all_jobs)
+    everything.add_argument('--hour', type=int, choices=range(24), metavar='HOUR', help="hour for the hourly report (default: last full hour)")
+    everything.add_argument('--day', type=int, choices=range(1, 32), metavar='DAY', help="day for the daily report (default: today)")
+
+    window = add_command('range', "productivity for the tickets closed between two times (16:30-17:30, a shift, several days)", range_jobs)
+    window.add_argument('input', nargs='?', default='ghassan.csv', help="Zoho export (default: ghassan.csv)")
+    window.add_argument('--from', dest='start', type=datetime.fromisoformat, required=True, metavar='YYYY-MM-DD[ HH:MM]')
+    window.add_argument('--to', dest='end', type=datetime.fromisoformat, required=True, metavar='YYYY-MM-DD[ HH:MM]')
+    window.add_argument('-o', '--output', help="output workbook")
+    window.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE)
+    window.add_argument('--filtered-data', choices=reports.FILTERED_DATA, default='none',
+                        help="where the tickets' rows go (default: none, a pivot-only workbook)")
+
+    shifts = add_command('shifts', "productivity per shift, every shift as a sheet of one workbook", shifts_jobs)
+    shifts.add_argument('input', help="Zoho L2 export")
+    shifts.add_argument('--day', type=int, choices=range(1, 32), metavar='DAY',
+                        help="day of the month the shifts started on, 1-31 (default: every day in the export)")
+    shifts.add_argument('-o', '--output', help="output workbook")
+
+    history = add_command('history', "productivity and C-SAT for an hour, day, week or month-to-date from the history store", history_jobs)
+    history.add_argument('--period', choices=PERIODS, required=True)
+    history.add_argument('--at', type=datetime.fromisoformat, metavar='YYYY-MM-DD[ HH:MM]',
+                         help="a time inside the period (default: now, or the last full hour for --period hour)")
+    history.add_argument('--db', default=DEFAULT_DB, help=f"history store (default: {DEFAULT_DB})")
+    history.add_argument('-o', '--output', help="output workbook")
+
+    ingest = subparsers.add_parser('ingest', help="add exports to the history store (default: every export in the current folder)")
+    ingest.add_argument('input', nargs='*', help="ghassan.csv, L2*.csv or IVR*.csv exports")
+    ingest.add_argument('--db', default=DEFAULT_DB, help=f"history store (default: {DEFAULT_DB})")
+
+    watch = subparsers.add_parser('watch', help="regenerate reports as exports land in a folder (Ctrl+C to stop)")
+    watch.add_argument('folder', nargs='?', default='.')
+    watch.add_argument('--db', help=f"history store every export is also added to (default: {DEFAULT_DB} in the folder)")
+    return parser
+
+
+def run_cli(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.timings:
+        timings.enable()
+
+    if args.command == 'watch':
+        from folder_watcher import watch_folder
+        print(f"Watching {os.path.abspath(args.folder)} for new exports (Ctrl+C to stop)...")
+        try:
+            watch_folder(args.folder, on_result=lambda name, output_file, error: print(describe_results({name: (output_file, error)})),
+                         history_db=args.db)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.command == 'ingest':
+        return ingest_exports(args)
+
+    results = run_report_jobs(args.build_jobs(parser, args), args.jobs)
+    print(describe_results(results))
+    return 1 if any(error is not None for _, error in results.values()) else 0
@@ -0,0 +1,105 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from csv_cache import read_csv_cached
+from timings import stage
+
+# Numeric C-SAT over the IVR exports. One grouped pass counts Good (Answer 1) and Bad (Answer 2)
+# per (agent, day, hour); every view (agent, hour, day, agent by hour) is then summed from those
+# counts instead of going back to the export, and CSAT stays a number (0-1) all the way to the
+# sheet, where it is shown as a percentage.
+GOOD = 1
+BAD = 2
+# Sheet title -> the columns the view is grouped by. Hour and day need the Call Time column
+CSAT_VIEWS = {
+    'By Agent': ['Agent Name'],
+    'By Hour': ['Hour'],
+    'By Day': ['Day'],
+    'Agent by Hour': ['Agent Name', 'Hour'],
+}
+CSAT_COLUMN = ' CSAT '
+# The same survey exported twice (overlapping per-day or per-queue exports) is counted once
+DUPLICATE_KEYS = ['Customer Phone Number', 'Call Time']
+
+
+def apply_ivr_schema(data):
+    # Stripped column names, Answer as a small integer (No_Answer = 0, anything else unreadable is
+    # left empty), Call Time parsed once and agents as categories
+    data.columns = data.columns.str.strip()
+    data['Answer'] = pd.to_numeric(data['Answer'].replace('No_Answer', 0), errors='coerce').astype('Int8')
+    if 'Call Time' in data.columns:
+        data['Call Time'] = pd.to_datetime(data['Call Time'], errors='coerce')
+    data['Agent Name'] = data['Agent Name'].astype('category')
+    return data
+
+
+def read_ivr_export(file_path):
+    return read_csv_cached(file_path, prepare=apply_ivr_schema)
+
+
+def read_ivr_exports(file_paths, max_workers=None):
+    # Every IVR export as one frame. Several files are parsed in parallel processes (each through
+    # its own cache), then concatenated and de-duplicated on phone number + call time
+    file_paths = [file_paths] if isinstance(file_paths, str) else list(file_paths)
+    if not file_paths:
+        raise FileNotFoundError("No IVR export found.")
+    if len(file_paths) == 1:
+        frames = [read_ivr_export(file_paths[0])]
+    else:
+        workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(read_ivr_export, file_paths))
+
+    with stage('concat+dedup') as s:
+        data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        data['Agent Name'] = data['Agent Name'].astype('category')
+        if all(column in data.columns for column in DUPLICATE_KEYS):
+            # Calls without a readable time cannot be matched, so they are all kept
+            duplicated = data.duplicated(subset=DUPLICATE_KEYS) & data['Call Time'].notna()
+            data = data[~duplicated]
+        s.rows = len(data)
+    return data
+
+
+def csat_counts(data):
+    # Good/Bad counts indexed by (Agent Name, Day, Hour), or just Agent Name without a Call Time column.
+    # Calls without a readable time still count for the agent
+    answered = data[data['Answer'].isin([GOOD, BAD]) & data['Customer Phone Number'].notna()]
+    keys = [answered['Agent Name']]
+    if 'Call Time' in answered.columns:
+        call_time = answered['Call Time']
+        keys += [call_time.dt.normalize().rename('Day'), call_time.dt.hour.astype('Int8').rename('Hour')]
+    counts = answered.groupby(keys + [answered['Answer']], observed=True, dropna=False).size()
+    counts = counts.unstack('Answer', fill_value=0).reindex(columns=[GOOD, BAD], fill_value=0)
+    counts.columns = ['Good', 'Bad']
+    return counts
+
+
+def csat_view(counts, dims):
+    # One sheet's table: dims, Good, Bad, Surveys and the numeric CSAT, then a Grand Total row.
+    # Agents are ranked by CSAT, hours and days stay in order
+    view = counts.groupby(level=dims, observed=True).sum()
+    view['Surveys'] = view['Good'] + view['Bad']
+    view = view[view['Surveys'] > 0]
+    view[CSAT_COLUMN] = view['Good'] / view['Surveys']
+    if dims == ['Agent Name']:
+        view = view.sort_values(CSAT_COLUMN, ascending=False, kind='stable')
+    view = view.reset_index()
+    if 'Day' in view.columns:
+        view['Day'] = view['Day'].dt.strftime('%Y-%m-%d')
+    if 'Hour' in view.columns:
+        view['Hour'] = view['Hour'].astype('int64')
+
+    grand_total = {dim: None for dim in dims}
+    grand_total[dims[0]] = 'Grand Total'
+    grand_total.update(view[['Good', 'Bad', 'Surveys']].sum())
+    grand_total[CSAT_COLUMN] = grand_total['Good'] / grand_total['Surveys'] if grand_total['Surveys'] else None
+    view[dims[0]] = view[dims[0]].astype(object)
+    return pd.concat([view, pd.DataFrame([grand_total])], ignore_index=True)
+
+
+def csat_views(data, views=CSAT_VIEWS):
+    # Every view that the export has the columns for, from a single grouped pass
+    counts = csat_counts(data)
+    return {title: csat_view(counts, dims) for title, dims in views.items()
+            if all(dim in counts.index.names for dim in dims)}
@@ -0,0 +1,114 @@
+import glob
+import hashlib
+import os
+import tempfile
+import pandas as pd
+from timings import stage
+
+# Parsed exports are cached next to the CSV as Feather when pyarrow is available,
+# otherwise as a pickle (still much faster than re-parsing the CSV)
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'feather'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+
+def cache_path_for(file_path, prepare=None, **read_csv_kwargs):
+    # The key covers the path, size and modification time of the export plus the
+    # read options, so replacing the export (or reading it differently) misses the cache
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    prepare_name = f"{prepare.__module__}.{prepare.__qualname__}" if prepare else None
+    key = f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}|{sorted(read_csv_kwargs.items())!r}|{prepare_name}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    folder, name = os.path.split(file_path)
+    return os.path.join(folder, f".{name}.{digest}.{CACHE_FORMAT}")
+
+
+def clear_cache(file_path, stale_only=False):
+    # Remove the cached copies of this export; with stale_only, only the ones written
+    # before the export itself was last replaced. The incremental ingest state (.state) is
+    # meant to outlive re-exports, so it only goes when everything is cleared. Temp files left
+    # by an interrupted write (.tmp) go with the caches
+    folder, name = os.path.split(os.path.abspath(file_path))
+    export_mtime = os.path.getmtime(file_path) if stale_only else None
+    extensions = ('.feather', '.pickle', '.tmp') if stale_only else ('.feather', '.pickle', '.tmp', '.state')
+    for cache_file in glob.glob(os.path.join(folder, f".{glob.escape(name)}.*.*")):
+        if not cache_file.endswith(extensions):
+            continue
+        try:
+            if export_mtime is None or os.path.getmtime(cache_file) < export_mtime:
+                os.remove(cache_file)
+        except OSError:
+            pass
+
+
+def _pickle_path(cache_file):
+    # Where a frame Feather cannot hold (e.g. an object column of mixed types) is cached instead
+    return os.path.splitext(cache_file)[0] + '.pickle'
+
+
+def _load_cache(cache_file):
+    if cache_file.endswith('.feather'):
+        return pd.read_feather(cache_file)
+    return pd.read_pickle(cache_file)
+
+
+def _write_cache(df, cache_file):
+    # Write to a temporary file first so a concurrent reader never sees half a cache. The name is
+    # unique, so jobs caching the same export at once never write into each other's file
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), prefix=os.path.basename(cache_file), suffix='.tmp')
+    os.close(fd)
+    try:
+        if cache_file.endswith('.feather'):
+            df.to_feather(tmp_file)
+        else:
+            df.to_pickle(tmp_file)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+def _store_cache(df, cache_file):
+    # Caching is best effort (read-only share, ...). A frame Feather cannot write is pickled instead
+    try:
+        _write_cache(df, cache_file)
+    except Exception:
+        if not cache_file.endswith('.feather'):
+            return
+        try:
+            _write_cache(df, _pickle_path(cache_file))
+        except Exception:
+            pass
+
+
+def read_csv_cached(file_path, prepare=None, **read_csv_kwargs):
+    # Drop-in replacement for pd.read_csv that reuses the parsed frame while the export is unchanged.
+    # prepare(df) runs once after parsing (e.g. to apply a schema) and its result is what gets cached
+    cache_file = cache_path_for(file_path, prepare, **read_csv_kwargs)
+    for cached in dict.fromkeys((cache_file, _pickle_path(cache_file))):
+        if os.path.exists(cached):
+            try:
+                with stage('load_cache') as s:
+                    df = _load_cache(cached)
+                    s.rows = len(df)
+                return df
+            except Exception:
+                pass
+
+    with stage('read_csv') as s:
+        df = pd.read_csv(file_path, **read_csv_kwargs)
+        s.rows = len(df)
+    if prepare is not None:
+        df = prepare(df)
+
+    # Caches of earlier versions of this export are stale now
+    clear_cache(file_path, stale_only=True)
+    with stage('store_cache'):
+        _store_cache(df, cache_file)
+    return df
@@ -0,0 +1,129 @@
+import glob
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+
+# Watch mode: poll the folder for new or changed exports and regenerate the report each one
+# feeds (see reports.export_report_job). Polling keeps it dependency-free and works the same
+# on network shares, where file-system notifications are unreliable.
+POLL_INTERVAL = 1.0
+# An export counts as written once its size and modification time stay put this long
+SETTLE_SECONDS = 2.0
+# Every IVR export feeds the same C-SAT report, so they share one job
+IVR_PATTERN = 'IVR*.csv'
+CSAT_JOB = 'C-SAT'
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _job_key(path):
+    # What a generation is keyed on: the export itself, or the C-SAT for any IVR export
+    return CSAT_JOB if fnmatch(os.path.basename(path), IVR_PATTERN) else path
+
+
+def _readable(path):
+    # Zoho/Excel can still hold the file open while the size is stable
+    try:
+        with open(path, 'rb'):
+            return True
+    except OSError:
+        return False
+
+
+def watch_folder(folder='.', on_result=None, stop_event=None, process_existing=False,
+                 poll_interval=POLL_INTERVAL, settle_seconds=SETTLE_SECONDS, max_workers=None,
+                 history_db=None):
+    # Runs until stop_event is set (or forever). on_result(name, output_file, error) is called
+    # from a worker thread after every generation, error None on success.
+    # - Every export is also added to the history store (history_db, by default the one in the
+    #   folder); only a failed ingest is reported through on_result.
+    # - Partial writes are debounced: an export is picked up only after it settles.
+    # - Bursts are coalesced: changes made while an export is settling or its report is being
+    #   generated end up as a single (re)generation with the latest file.
+    # - Each generation runs on a worker thread, so a slow report never delays the others.
+    # - IVR exports that land together (one per queue) give a single C-SAT over all of them; at
+    #   most one C-SAT runs at a time, and it runs once more if IVR exports change meanwhile.
+    import reports  # only loaded once watching actually starts
+    from history_store import DEFAULT_DB, ingest_export
+    history_db = history_db or os.path.join(folder, DEFAULT_DB)
+
+    stop_event = stop_event or threading.Event()
+    seen = {}       # export -> (signature, time it was first seen with that signature)
+    generated = {}  # export -> signature its report was last generated from
+    running = {}    # export, or CSAT_JOB -> future of the generation in progress
+
+    def generate(paths, name, function, args, output_file):
+        try:
+            function(*args)
+            error = None
+        except Exception as e:
+            error = e
+        if on_result is not None:
+            on_result(name, output_file, error)
+        for path in paths:
+            try:
+                ingest_export(path, history_db)
+            except Exception as e:
+                if on_result is not None:
+                    on_result(f"History ({os.path.basename(path)})", history_db, e)
+
+    def scan():
+        paths = set()
+        for pattern in reports.EXPORT_PATTERNS:
+            paths.update(glob.glob(os.path.join(glob.escape(folder), pattern)))
+        return paths
+
+    def settled(path, signature, now):
+        return (signature is not None and seen.get(path, (None,))[0] == signature
+                and now - seen[path][1] >= settle_seconds and _readable(path))
+
+    if not process_existing:
+        for path in scan():
+            generated[path] = _signature(path)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(4, os.cpu_count() or 1)) as pool:
+        while not stop_event.is_set():
+            now = time.monotonic()
+            paths = sorted(scan())
+            signatures = {path: _signature(path) for path in paths}
+            for path in paths:
+                signature = signatures[path]
+                if signature is None:
+                    continue
+                if seen.get(path, (None,))[0] != signature:
+                    seen[path] = (signature, now)
+                    continue
+                if generated.get(path) == signature or not settled(path, signature, now):
+                    continue
+                key = _job_key(path)
+                if key in running and not running[key].done():
+                    continue
+
+                covered = [path]
+                if key == CSAT_JOB:
+                    # The C-SAT reads every IVR export, so this run covers all that have settled
+                    covered = [other for other in paths if _job_key(other) == CSAT_JOB
+                               and settled(other, signatures[other], now)]
+                for other in covered:
+                    generated[other] = signatures[other]
+                job = reports.export_report_job(path)
+                if job is not None:
+                    running[key] = pool.submit(generate, covered, *job)
+            stop_event.wait(poll_interval)
+
+
+def start_watching(folder='.', on_result=None, **kwargs):
+    # watch_folder on a daemon thread; returns the Event that stops it
+    stop_event = threading.Event()
+    thread = threading.Thread(target=watch_folder, args=(folder, on_result, stop_event),
+                              kwargs=kwargs, daemon=True)
+    thread.start()
+    return stop_event
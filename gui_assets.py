@@ -0,0 +1,52 @@
+import functools
+import json
+import mmap
+import os
+import struct
+import sys
+
+# GUI images live in assets.bin (built by build_assets.py). The bundle is memory-mapped once and
+# each image is only decoded the first time a window asks for it, then reused.
+BUNDLE_NAME = 'assets.bin'
+BUNDLE_MAGIC = b'MOONRES1'
+
+_bundle = None
+
+
+def bundle_path():
+    # PyInstaller unpacks data files into sys._MEIPASS
+    base = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, BUNDLE_NAME)
+
+
+def _open_bundle():
+    global _bundle
+    if _bundle is None:
+        with open(bundle_path(), 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            raise ValueError(f"{bundle_path()} is not a Moon's Tool asset bundle.")
+        header_end = len(BUNDLE_MAGIC) + 4
+        (index_size,) = struct.unpack('<I', data[len(BUNDLE_MAGIC):header_end])
+        index = json.loads(data[header_end:header_end + index_size].decode('utf-8'))
+        _bundle = (data, index, header_end + index_size)
+    return _bundle
+
+
+def asset_bytes(name):
+    data, index, start = _open_bundle()
+    offset, size = index[name]
+    return data[start + offset:start + offset + size]
+
+
+@functools.lru_cache(maxsize=None)
+def photo_image(name):
+    # Tk 8.6 decodes PNG itself; PIL is only imported if it cannot
+    import tkinter as tk
+    png = asset_bytes(name)
+    try:
+        return tk.PhotoImage(data=png)
+    except tk.TclError:
+        from io import BytesIO
+        from PIL import Image, ImageTk
+        return ImageTk.PhotoImage(Image.open(BytesIO(png)))
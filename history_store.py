@@ -0,0 +1,177 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from fnmatch import fnmatch
+import pandas as pd
+from csat_engine import read_ivr_export
+from timings import stage
+from zoho_schema import PIVOT_COLUMNS, read_zoho_export
+
+# Local history of every export the tool has seen, in one SQLite file next to the exports.
+# Tickets are keyed by Ticket Id and surveys by phone number + call time, so re-exports and
+# overlapping exports only add what is new. Times are stored as naive local seconds since 1970
+# and indexed (alone and per owner/agent), so an hour, day, week or month-to-date is a range scan
+# instead of a re-parse of the CSVs.
+DEFAULT_DB = 'moon_tool_history.sqlite'
+ZOHO_PATTERNS = ('ghassan.csv', 'L2*.csv')
+IVR_PATTERNS = ('IVR*.csv',)
+PERIODS = ('hour', 'day', 'week', 'mtd')
+# Rows per executemany batch while ingesting
+BATCH_ROWS = 50_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    ticket_id INTEGER PRIMARY KEY,
+    owner TEXT,
+    team TEXT,
+    closed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tickets_closed_at ON tickets (closed_at);
+CREATE INDEX IF NOT EXISTS tickets_owner_closed_at ON tickets (owner, closed_at);
+CREATE TABLE IF NOT EXISTS surveys (
+    phone TEXT NOT NULL,
+    call_at INTEGER NOT NULL,
+    agent TEXT,
+    answer INTEGER,
+    PRIMARY KEY (phone, call_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS surveys_call_at ON surveys (call_at);
+CREATE INDEX IF NOT EXISTS surveys_agent_call_at ON surveys (agent, call_at);
+CREATE TABLE IF NOT EXISTS exports (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    rows INTEGER,
+    ingested_at TEXT
+);
+"""
+
+
+def connect(db_path=DEFAULT_DB):
+    # The watcher ingests from several threads, so writers wait for each other instead of failing
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _seconds(times):
+    # datetime64 Series -> naive seconds since 1970, the unit every time column is stored in
+    return times.astype('datetime64[s]').astype('int64')
+
+
+def _to_seconds(when):
+    return int((when - datetime(1970, 1, 1)).total_seconds())
+
+
+def _ticket_rows(csv_file):
+    df = read_zoho_export(csv_file, columns=PIVOT_COLUMNS)
+    df = df[df['Ticket Closed Time'].notna() & df['Ticket Id'].notna()]
+    return zip(df['Ticket Id'].astype('int64').tolist(), df['Ticket Owner'].astype(object).tolist(),
+               df['Team'].astype(object).tolist(), _seconds(df['Ticket Closed Time']).tolist())
+
+
+def _survey_rows(csv_file):
+    df = read_ivr_export(csv_file)
+    if 'Call Time' not in df.columns:
+        raise ValueError(f"{csv_file} has no Call Time column, so its surveys cannot be dated.")
+    # Surveys without a phone number or a readable time cannot be de-duplicated or dated
+    df = df[df['Call Time'].notna() & df['Customer Phone Number'].notna()]
+    answers = df['Answer'].astype(object).where(df['Answer'].notna(), None)
+    return zip(df['Customer Phone Number'].astype(str).tolist(), _seconds(df['Call Time']).tolist(),
+               df['Agent Name'].astype(object).tolist(), answers.tolist())
+
+
+def _insert(conn, sql, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_ROWS:
+            conn.executemany(sql, batch)
+            batch = []
+    if batch:
+        conn.executemany(sql, batch)
+
+
+def ingest_export(csv_file, db_path=DEFAULT_DB):
+    # Adds a Zoho (ghassan.csv / L2*.csv) or IVR export to the store; returns how many rows were
+    # added or updated. An export already ingested with the same size and modification time is skipped
+    name = os.path.basename(csv_file)
+    path = os.path.abspath(csv_file)
+    stat = os.stat(csv_file)
+    conn = connect(db_path)
+    try:
+        known = conn.execute('SELECT size, mtime_ns FROM exports WHERE path = ?', (path,)).fetchone()
+        if known == (stat.st_size, stat.st_mtime_ns):
+            return 0
+
+        with stage('history_ingest') as s:
+            with conn:
+                before = conn.total_changes
+                if any(fnmatch(name, pattern) for pattern in ZOHO_PATTERNS):
+                    # A later export of the same ticket wins (it may have been reassigned)
+                    _insert(conn, 'INSERT INTO tickets (ticket_id, owner, team, closed_at) VALUES (?, ?, ?, ?) '
+                                  'ON CONFLICT (ticket_id) DO UPDATE SET owner = excluded.owner, '
+                                  'team = excluded.team, closed_at = excluded.closed_at',
+                            _ticket_rows(csv_file))
+                elif any(fnmatch(name, pattern) for pattern in IVR_PATTERNS):
+                    _insert(conn, 'INSERT OR IGNORE INTO surveys (phone, call_at, agent, answer) VALUES (?, ?, ?, ?)',
+                            _survey_rows(csv_file))
+                else:
+                    raise ValueError(f"{name} is not a Zoho (ghassan.csv, L2*.csv) or IVR export.")
+                rows = conn.total_changes - before
+                conn.execute('INSERT OR REPLACE INTO exports (path, size, mtime_ns, rows, ingested_at) VALUES (?, ?, ?, ?, ?)',
+                             (path, stat.st_size, stat.st_mtime_ns, rows, datetime.now().isoformat(timespec='seconds')))
+            s.rows = rows
+        return rows
+    finally:
+        conn.close()
+
+
+def period_bounds(period, when=None):
+    # [start, end) of the hour, day, week (from Monday) or month-to-date that contains `when`
+    when = when or datetime.now()
+    if period == 'hour':
+        start = when.replace(minute=0, second=0, microsecond=0)
+        return start, start + timedelta(hours=1)
+    day_start = when.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == 'day':
+        return day_start, day_start + timedelta(days=1)
+    if period == 'week':
+        start = day_start - timedelta(days=day_start.weekday())
+        return start, start + timedelta(days=7)
+    if period == 'mtd':
+        return day_start.replace(day=1), day_start + timedelta(days=1)
+    raise ValueError(f"Unknown period {period!r}; expected one of {', '.join(PERIODS)}.")
+
+
+def ticket_counts(start, end, db_path=DEFAULT_DB, owner=None):
+    # Tickets closed in [start, end) per (Ticket Owner, Team), the shape pivots.pivot_from_counts takes
+    sql = 'SELECT owner, team, COUNT(*) FROM tickets WHERE closed_at >= ? AND closed_at < ?'
+    params = [_to_seconds(start), _to_seconds(end)]
+    if owner is not None:
+        sql += ' AND owner = ?'
+        params.append(owner)
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(sql + ' GROUP BY owner, team', params).fetchall()
+    finally:
+        conn.close()
+    counts = pd.DataFrame(rows, columns=['Ticket Owner', 'Team', 'Ticket Id'])
+    return counts.set_index(['Ticket Owner', 'Team'])['Ticket Id'].astype('int64')
+
+
+def survey_counts(start, end, db_path=DEFAULT_DB, agent=None):
+    # Good/Bad surveys taken in [start, end) per Agent Name, the shape csat_engine.csat_view takes
+    sql = ('SELECT agent, SUM(answer = 1), SUM(answer = 2) FROM surveys '
+           'WHERE call_at >= ? AND call_at < ? AND answer IN (1, 2)')
+    params = [_to_seconds(start), _to_seconds(end)]
+    if agent is not None:
+        sql += ' AND agent = ?'
+        params.append(agent)
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(sql + ' GROUP BY agent', params).fetchall()
+    finally:
+        conn.close()
+    counts = pd.DataFrame(rows, columns=['Agent Name', 'Good', 'Bad'])
+    return counts.set_index('Agent Name').astype('int64')
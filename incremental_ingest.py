@@ -0,0 +1,184 @@
+import io
+import os
+import tempfile
+import zipfile
+import numpy as np
+import pandas as pd
+from zoho_schema import ZOHO_SKIP_ROWS, PIVOT_COLUMNS, CATEGORY_COLUMNS, apply_zoho_schema, drop_repeated_ids
+
+# Incremental ingest for an export that is re-exported during the shift as a superset of the
+# previous one. The state file next to the CSV remembers how many bytes were already counted,
+# which Ticket Ids were seen (as a sorted int64 array) and the Ticket Id counts per (Date, Hour,
+# Ticket Owner, Team), so a refresh only parses the rows appended since the last one. Those
+# counts are the count cube every pivot-only report (an hour, a day, a shift, several days) is
+# cut from without the rows. The state is plain arrays in an .npz file, loaded without pickle, so
+# a state file planted in a shared export folder cannot run code on whoever opens a report there.
+STATE_SUFFIX = '.incremental.state'
+STATE_VERSION = 3
+# Bytes just before the saved offset that must still match for the old rows to count as unchanged
+SAMPLE_BYTES = 4096
+COUNT_LEVELS = ['Date', 'Hour', 'Ticket Owner', 'Team']
+# Bytes parsed at a time, so building the cube from a big export never holds the whole file
+READ_BLOCK_BYTES = 4 * 1024 * 1024
+
+
+def state_path_for(csv_file):
+    folder, name = os.path.split(os.path.abspath(csv_file))
+    return os.path.join(folder, f".{name}{STATE_SUFFIX}")
+
+
+def _state_arrays(state):
+    counts = state['counts']
+    levels = {name: counts.index.get_level_values(name) for name in COUNT_LEVELS} if len(counts) else None
+    return {
+        'version': np.int64(state['version']),
+        'offset': np.int64(state['offset']),
+        'header': np.frombuffer(state['header'], dtype=np.uint8),
+        'sample': np.frombuffer(state['sample'], dtype=np.uint8),
+        'seen_ids': state['seen_ids'],
+        'dates': levels['Date'].to_numpy(dtype='datetime64[s]') if levels else np.empty(0, dtype='datetime64[s]'),
+        'hours': levels['Hour'].to_numpy(dtype=np.int64) if levels else np.empty(0, dtype=np.int64),
+        'owners': levels['Ticket Owner'].to_numpy(dtype=str) if levels else np.empty(0, dtype=str),
+        'teams': levels['Team'].to_numpy(dtype=str) if levels else np.empty(0, dtype=str),
+        'counts': counts.to_numpy(dtype=np.int64),
+    }
+
+
+def _state_from_arrays(data):
+    if not len(data['counts']):
+        counts = pd.Series(dtype='int64')
+    else:
+        index = pd.MultiIndex.from_arrays([pd.DatetimeIndex(data['dates']), data['hours'],
+                                           data['owners'].astype(object), data['teams'].astype(object)],
+                                          names=COUNT_LEVELS)
+        counts = pd.Series(data['counts'], index=index)
+    return {'version': int(data['version']), 'offset': int(data['offset']),
+            'header': data['header'].tobytes(), 'sample': data['sample'].tobytes(),
+            'seen_ids': data['seen_ids'], 'counts': counts}
+
+
+def load_state(csv_file):
+    try:
+        with np.load(state_path_for(csv_file), allow_pickle=False) as data:
+            if int(data['version']) != STATE_VERSION:
+                return None
+            return _state_from_arrays(data)
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
+
+
+def save_state(csv_file, state):
+    # Same atomic replace as the parse cache, so a crash never leaves half a state file. The temp
+    # name is unique, so refreshes of the same export running at once (parallel report jobs, the
+    # watcher) never write into each other's file
+    state_file = state_path_for(csv_file)
+    tmp_file = None
+    try:
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(state_file), prefix=os.path.basename(state_file), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **_state_arrays(state))
+        os.replace(tmp_file, state_file)
+    except Exception:
+        # Best effort like the parse cache (read-only folder, state file locked by another
+        # process): the counts are already up to date, the next refresh just parses more
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+
+def reset_state(csv_file):
+    try:
+        os.remove(state_path_for(csv_file))
+    except OSError:
+        pass
+
+
+def _header_end(data, skip_rows):
+    # Offset just past the column header line (the preamble lines plus the header)
+    end = 0
+    for _ in range(skip_rows + 1):
+        end = data.index(b'\n', end) + 1
+    return end
+
+
+def _parse_rows(header, body):
+    df = pd.read_csv(io.BytesIO(header + body), usecols=PIVOT_COLUMNS,
+                     dtype={column: 'category' for column in CATEGORY_COLUMNS})
+    return apply_zoho_schema(df)
+
+
+def _count_rows(df):
+    closed = df['Ticket Closed Time']
+    # Date and Hour in the dtypes the state file stores them in, so saved and new counts line up
+    keys = [closed.dt.normalize().astype('datetime64[s]').rename('Date'), closed.dt.hour.astype('int64').rename('Hour'),
+            df['Ticket Owner'].astype(object), df['Team'].astype(object)]
+    return df.groupby(keys)['Ticket Id'].count().astype('int64')
+
+
+def update_hourly_counts(csv_file, skip_rows=ZOHO_SKIP_ROWS):
+    # Bring the persisted counts up to date with csv_file and return (counts, new_row_count).
+    # When the bytes already counted are unchanged only the appended tail is parsed; otherwise
+    # (a rewritten export) the counts are rebuilt from the whole file, so they always match it.
+    # Ticket Ids are counted once either way.
+    state = load_state(csv_file)
+    if state is None:
+        state = {'version': STATE_VERSION, 'offset': 0, 'header': b'', 'sample': b'',
+                 'seen_ids': np.empty(0, dtype=np.int64), 'counts': pd.Series(dtype='int64')}
+
+    with open(csv_file, 'rb') as f:
+        head = f.read(64 * 1024)
+        header_end = _header_end(head, skip_rows)
+        header = head[:header_end]
+        header_line = header[header.rindex(b'\n', 0, header_end - 1) + 1:] if skip_rows else header
+
+        offset = state['offset']
+        unchanged = False
+        if offset >= header_end and state['header'] == header_line and os.path.getsize(csv_file) >= offset:
+            f.seek(offset - len(state['sample']))
+            unchanged = f.read(len(state['sample'])) == state['sample']
+            if unchanged and not state['sample'].endswith(b'\n'):
+                # The last line was counted without a newline; if the export has since written
+                # more of that same line, it was not finished, so everything is counted again
+                unchanged = f.read(1) in (b'', b'\n', b'\r')
+        if not unchanged:
+            offset = header_end
+            state['seen_ids'] = np.empty(0, dtype=np.int64)
+            state['counts'] = pd.Series(dtype='int64')
+
+        # The export may still be growing; anything written after this point waits for the next refresh
+        end = os.fstat(f.fileno()).st_size
+        sample = state['sample'] if unchanged else header
+        new_rows = 0
+        carry = b''
+        f.seek(offset)
+        while offset + len(carry) < end:
+            block = f.read(min(READ_BLOCK_BYTES, end - offset - len(carry)))
+            if not block:
+                break
+            block = carry + block
+            # Complete lines only; the rest is carried into the next block. At the end of the file
+            # the last line counts without a newline too, as pd.read_csv counts it (a finished
+            # export need not end in one)
+            body = block if f.tell() >= end else block[:block.rfind(b'\n') + 1]
+            carry = block[len(body):]
+            if not body:
+                continue
+            df, state['seen_ids'] = drop_repeated_ids(_parse_rows(header_line, body), state['seen_ids'])
+            if len(df):
+                new_rows += len(df)
+                counts = _count_rows(df)
+                if len(state['counts']):
+                    counts = state['counts'].add(counts, fill_value=0).astype('int64')
+                counts.index.names = COUNT_LEVELS
+                state['counts'] = counts.sort_index()
+            # The bytes just before the new offset, checked on the next refresh
+            sample = (sample + body[-SAMPLE_BYTES:])[-SAMPLE_BYTES:]
+            offset += len(body)
+
+    state['sample'] = sample
+    state['offset'] = offset
+    state['header'] = header_line
+    save_state(csv_file, state)
+    return state['counts'], new_rows
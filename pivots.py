@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from timings import stage
+
+CLOSED_TIME_FORMAT = '%d %b %Y %I:%M %p'
+
+
+def parse_closed_time(df):
+    # Parse "Ticket Closed Time" in place unless it is already a datetime column
+    if not pd.api.types.is_datetime64_any_dtype(df['Ticket Closed Time']):
+        with stage('to_datetime', rows=len(df)):
+            df['Ticket Closed Time'] = pd.to_datetime(df['Ticket Closed Time'], format=CLOSED_TIME_FORMAT)
+    return df
+
+
+def order_pivot_table(pivot_table):
+    # Sort the pivot table rows by the row totals in descending order (excluding 'Grand Total' row)
+    pivot_table = pivot_table.sort_values(by='Grand Total', ascending=False)
+
+    # Move 'Grand Total' row to the last row
+    grand_total_row = pivot_table.loc['Grand Total']
+    pivot_table = pivot_table.drop(index='Grand Total')
+    pivot_table = pd.concat([pivot_table, grand_total_row.to_frame().T])
+
+    return pivot_table
+
+
+def _codes(values):
+    # Integer codes and the labels they stand for, in the order pd.pivot_table would use
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    codes, labels = pd.factorize(values, sort=True)
+    return codes, labels
+
+
+def _keyed_codes(df, keyed):
+    # Owner/team codes of the rows in keyed (owner and team both present), and which of them count
+    owner_codes, owners = _codes(df['Ticket Owner'][keyed])
+    team_codes, teams = _codes(df['Team'][keyed])
+    counted = df['Ticket Id'].notna().to_numpy()[keyed]
+    return owner_codes.astype(np.int64), owners, team_codes.astype(np.int64), teams, counted
+
+
+def _pivot_tables(groups, group_count, owner_codes, owners, team_codes, teams, counted, weights=None):
+    # One pivot per group from a single bincount over (group, owner, team). Rows without a Ticket
+    # Id still put their owner and team in their group's table, but are not counted; groups
+    # without rows are left out. weights are per-row counts when the rows are already counted
+    owner_count, team_count = len(owners), len(teams)
+    cells = (groups * owner_count + owner_codes) * team_count + team_codes
+    matrices = np.bincount(cells[counted], weights=None if weights is None else weights[counted],
+                           minlength=group_count * owner_count * team_count).astype(np.int64)
+    matrices = matrices.reshape(group_count, owner_count, team_count)
+    # observed=True: only the owners and teams that occur (unused categories are left out)
+    owners_seen = np.bincount(groups * owner_count + owner_codes, minlength=group_count * owner_count) > 0
+    teams_seen = np.bincount(groups * team_count + team_codes, minlength=group_count * team_count) > 0
+    owners_seen = owners_seen.reshape(group_count, owner_count)
+    teams_seen = teams_seen.reshape(group_count, team_count)
+
+    pivot_tables = {}
+    for group in range(group_count):
+        rows, columns = owners_seen[group], teams_seen[group]
+        if not rows.any():
+            continue
+        matrix = matrices[group][rows][:, columns]
+        pivot_table = pd.DataFrame(matrix, index=pd.Index(owners[rows], name='Ticket Owner'),
+                                   columns=pd.Index(teams[columns], name='Team'))
+        pivot_table['Grand Total'] = matrix.sum(axis=1)
+        pivot_table.loc['Grand Total'] = pivot_table.sum()
+        pivot_tables[group] = order_pivot_table(pivot_table.astype('int64'))
+    return pivot_tables
+
+
+def count_pivot_table(df):
+    # The Ticket Id count of every (Ticket Owner, Team) as a pd.pivot_table(..., aggfunc='count',
+    # margins=True, observed=True) would give it, without the generic groupby: both keys become
+    # integer codes, one np.bincount fills the owner x team matrix and the Grand Totals are its sums
+    keyed = (df['Ticket Owner'].notna() & df['Team'].notna()).to_numpy()
+    owner_codes, owners, team_codes, teams, counted = _keyed_codes(df, keyed)
+    if not len(owner_codes):
+        raise ValueError("No tickets were closed in the selected hour/day.")
+    groups = np.zeros(len(owner_codes), dtype=np.int64)
+    return _pivot_tables(groups, 1, owner_codes, owners, team_codes, teams, counted)[0]
+
+
+def shift_pivot_tables(counts, shift_starts, shift_hours, day=None):
+    # One pivot per shift from the count cube (Ticket Id counts indexed by (Date, Hour, Ticket
+    # Owner, Team)), for shifts starting at the shift_starts hours and lasting shift_hours (a shift
+    # that starts late runs past midnight). Shifts overlap, so a ticket counts towards every shift
+    # it was closed in; every cell of the cube is matched against every shift in one vectorized
+    # pass. day (day of the month) keeps the shifts that started on that day, so the night shift
+    # includes its tickets from after midnight; without it each shift covers every day.
+    # Returns {shift start: pivot} for the shifts that have tickets
+    counts = counts[counts > 0]
+    dates = counts.index.get_level_values('Date')
+    hours = counts.index.get_level_values('Hour').to_numpy(dtype=np.int64)
+    owner_codes, owners = _codes(counts.index.get_level_values('Ticket Owner'))
+    team_codes, teams = _codes(counts.index.get_level_values('Team'))
+
+    starts = np.asarray(shift_starts, dtype=np.int64)
+    # Hours since each shift's start, wrapping past midnight: cells x shifts
+    in_shift = (hours[:, None] - starts[None, :]) % 24 < shift_hours
+    if day is not None:
+        # Closed before the shift's start hour means the shift started the day before
+        started_day_before = hours[:, None] < starts[None, :]
+        today = dates.day.to_numpy()[:, None]
+        yesterday = (dates - pd.Timedelta(days=1)).day.to_numpy()[:, None]
+        in_shift &= np.where(started_day_before, yesterday, today) == day
+
+    rows, groups = np.nonzero(in_shift)
+    pivot_tables = _pivot_tables(groups.astype(np.int64), len(starts), owner_codes.astype(np.int64)[rows], owners,
+                                 team_codes.astype(np.int64)[rows], teams, np.ones(len(rows), dtype=bool),
+                                 weights=counts.to_numpy()[rows])
+    return {shift_starts[group]: pivot_table for group, pivot_table in pivot_tables.items()}
+
+
+def pivot_from_counts(counts):
+    # Build the same table as create_pivot_table from Ticket Id counts indexed by (Ticket Owner, Team)
+    pivot_table = counts.unstack('Team', fill_value=0).sort_index().sort_index(axis=1)
+    pivot_table['Grand Total'] = pivot_table.sum(axis=1)
+    pivot_table.loc['Grand Total'] = pivot_table.sum()
+    pivot_table.columns.name = 'Team'
+    return order_pivot_table(pivot_table.astype('int64'))
+
+
+def pivot_tables_by_hour(df):
+    # One groupby over (hour, Ticket Owner, Team) instead of one pivot_table per hour
+    hours = df['Ticket Closed Time'].dt.hour.rename('Hour')
+    counts = df.groupby([hours, 'Ticket Owner', 'Team'], observed=True)['Ticket Id'].count()
+    counts = counts[counts > 0]
+    return {hour: pivot_from_counts(counts.xs(hour, level='Hour'))
+            for hour in counts.index.get_level_values('Hour').unique().sort_values()}
+
+
+def pivot_for_slice(counts, hour=None, day=None, start=None, end=None):
+    # counts are Ticket Id counts indexed by (Date, Hour, Ticket Owner, Team); hour and day
+    # (day of the month) select the same tickets as filter_by_hour / filter_by_day, and
+    # start/end select the whole hours overlapping [start, end) (a shift, several days, ...)
+    selected = counts
+    if hour is not None:
+        selected = selected[selected.index.get_level_values('Hour') == hour]
+    if day is not None:
+        selected = selected[selected.index.get_level_values('Date').day == day]
+    if start is not None or end is not None:
+        hours = selected.index.get_level_values('Date') + pd.to_timedelta(selected.index.get_level_values('Hour'), unit='h')
+        in_range = hours.notna()
+        if start is not None:
+            in_range &= hours >= pd.Timestamp(start).floor('h')
+        if end is not None:
+            in_range &= hours < pd.Timestamp(end)
+        selected = selected[in_range]
+    selected = selected[selected > 0]
+    if selected.empty:
+        raise ValueError("No tickets were closed in the selected hours.")
+    return pivot_from_counts(selected.groupby(level=['Ticket Owner', 'Team'], observed=True).sum())
@@ -0,0 +1,46 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def run_report_jobs(jobs, max_workers=None):
+    # Run independent report pipelines in separate processes so the total wall time is the
+    # slowest report rather than the sum. Each job is (name, function, args, output_file); the
+    # function must live at module level so the worker processes can import it.
+    # Returns {name: (output_file, error)} with error None for the reports that succeeded.
+    results = {}
+    if not jobs:
+        return results
+
+    if max_workers == 1:
+        # Nothing to fan out; skip the worker process start-up
+        for name, function, args, output_file in jobs:
+            try:
+                function(*args)
+                results[name] = (output_file, None)
+            except Exception as e:
+                results[name] = (output_file, e)
+        return results
+
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(function, *args): (name, output_file) for name, function, args, output_file in jobs}
+        for future in as_completed(futures):
+            name, output_file = futures[future]
+            try:
+                future.result()
+                results[name] = (output_file, None)
+            except Exception as e:
+                results[name] = (output_file, e)
+    return results
+
+
+def describe_results(results):
+    if not results:
+        return "No exports found (ghassan.csv, L2*.csv or IVR*.csv)."
+    lines = []
+    for name, (output_file, error) in results.items():
+        if error is None:
+            lines.append(f"{name}: saved as {output_file}")
+        else:
+            lines.append(f"{name}: failed ({error})")
+    return "\n".join(lines)
@@ -0,0 +1,503 @@
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.formatting.rule import ColorScaleRule
+from openpyxl.utils import get_column_letter
+from datetime import datetime, timedelta
+import glob
+import os
+from fnmatch import fnmatch
+from csv_cache import read_csv_cached
+from pivots import count_pivot_table, pivot_tables_by_hour, pivot_for_slice, pivot_from_counts, shift_pivot_tables
+from incremental_ingest import update_hourly_counts
+from csat_engine import CSAT_COLUMN, read_ivr_exports, csat_views, csat_view
+from history_store import DEFAULT_DB, period_bounds, ticket_counts, survey_counts
+from zoho_schema import PIVOT_COLUMNS, read_zoho_export, closed_time, filter_rows, take_rows
+from time_index import cached_time_index
+from stream_ingest import should_stream, stream_filtered_pivot
+from xlsx_writers import DEFAULT_ENGINE, save_report
+from report_jobs import run_report_jobs
+from timings import stage
+from sheet_styles import style_pivot_sheet, style_csat_sheet, style_break_sheet, column_widths, set_column_widths
+
+# The report pipelines shared by GUI.py, source.py and insider.py. This is the module that pulls in
+# pandas and openpyxl, so the entry points only import it when a report is actually run
+# (the GUI also warms it up in the background once its window is on screen).
+
+# Where save_to_excel puts the filtered rows: the "Filtered Data" sheet, a compressed CSV next to
+# the workbook, or nowhere (pivot only, the lean mode)
+FILTERED_DATA = ('sheet', 'csv', 'none')
+
+def read_csv_skip_rows(file_path, skip_rows=4):
+    # Read the CSV file and skip the first 4 rows
+    df = read_csv_cached(file_path, skiprows=skip_rows)
+    return df
+
+def filter_by_hour(df, hour, date=None):
+    # Without a date this is the hour of every day in the export (ghassan.csv covers one day);
+    # with one, just that date's hour, cut by filter_by_window
+    if date is not None:
+        start = pd.Timestamp(date).normalize() + pd.Timedelta(hours=hour)
+        return filter_by_window(df, start, start + pd.Timedelta(hours=1))
+
+    # "Ticket Closed Time" is already parsed by read_zoho_export; raw frames are parsed on a copy
+    closed = closed_time(df)
+
+    # Filter the DataFrame to only include rows where "Ticket Closed Time" is within the specified hour
+    with stage('filter') as s:
+        filtered_df = filter_rows(df, closed.dt.hour == hour, closed)
+        s.rows = len(filtered_df)
+    return filtered_df
+
+def filter_by_window(df, start, end):
+    # Tickets closed in [start, end) (16:30-17:30, a date's hour, a shift, ...), in export order.
+    # Sorting costs several scans, so one window is a plain mask; callers cutting many windows
+    # from one frame build time_index.closed_time_index(df) first and get two binary searches each
+    closed = closed_time(df)
+    index = cached_time_index(df)
+    with stage('filter') as s:
+        if index is None:
+            filtered_df = filter_rows(df, (closed >= start) & (closed < end), closed)
+        else:
+            filtered_df = take_rows(df, index.positions(start, end), closed)
+        s.rows = len(filtered_df)
+    return filtered_df
+
+def filter_by_day(df, day):
+    # "Ticket Closed Time" is already parsed by read_zoho_export; raw frames are parsed on a copy
+    closed = closed_time(df)
+
+    # Filter the DataFrame to only include rows where "Ticket Closed Time" is within the specified day
+    with stage('filter') as s:
+        filtered_df = filter_rows(df, closed.dt.day == day, closed)
+        s.rows = len(filtered_df)
+    return filtered_df
+def create_pivot_table(df):
+    # Create a pivot table similar to the provided image: Ticket Ids counted per owner and team,
+    # owners sorted by their Grand Total with the Grand Total row last. Owners/teams with no
+    # tickets in this slice (unused categories) do not show up as zero rows
+    with stage('pivot', rows=len(df)):
+        pivot_table = count_pivot_table(df)
+
+    return pivot_table
+
+def style_pivot_table(ws):
+    # Apply the registered pivot styles (highlighted header/owner/Grand Total, bordered body)
+    style_pivot_sheet(ws)
+
+def filtered_data_path(output_file):
+    # Where filtered_data='csv' puts the rows: next to the workbook, gzip-compressed
+    return os.path.splitext(output_file)[0] + ' Filtered Data.csv.gz'
+
+def save_to_excel(df, pivot_table, output_file, engine=DEFAULT_ENGINE, filtered_data='sheet'):
+    # filtered_data: 'sheet' writes the rows to the "Filtered Data" sheet, 'csv' to a compressed
+    # CSV next to the workbook instead, 'none' nowhere (pivot only). Returns the files written
+    if filtered_data not in FILTERED_DATA:
+        raise ValueError(f"Unknown filtered_data '{filtered_data}'. Choose one of: {', '.join(FILTERED_DATA)}.")
+    output_files = [output_file]
+    if filtered_data == 'csv':
+        csv_path = filtered_data_path(output_file)
+        with stage('filtered_csv', rows=len(df)):
+            df.to_csv(csv_path, index=False, compression={'method': 'gzip', 'compresslevel': 1})
+        output_files.append(csv_path)
+    if filtered_data != 'sheet':
+        df = None
+
+    # Prepare the pivot table for writing
+    pivot_table.reset_index(inplace=True)
+    pivot_table.columns.name = None  # Remove the name of the columns
+    pivot_table.rename(columns={'index': 'Ticket Owner'}, inplace=True)
+
+    # Streaming engines write the same sheets straight to disk
+    if engine != 'openpyxl':
+        save_report(df, pivot_table, output_file, engine)
+        return output_files
+
+    # Create a new workbook
+    wb = Workbook()
+
+    # Write the filtered data to the first sheet
+    ws_filtered = wb.active
+    ws_filtered.title = "Filtered Data"
+
+    with stage('dataframe_to_rows', rows=(len(df) if df is not None else 0) + len(pivot_table)):
+        if df is not None:
+            for r in dataframe_to_rows(df, index=False, header=True):
+                ws_filtered.append(r)
+
+        # Create a new sheet for the pivot table
+        ws_pivot = wb.create_sheet(title="Pivot Table")
+
+        # Write the pivot table to the new sheet
+        for r in dataframe_to_rows(pivot_table, index=False, header=True):
+            ws_pivot.append(r)
+
+    # Apply styling to the pivot table
+    with stage('styling', rows=len(pivot_table)):
+        style_pivot_table(ws_pivot)
+
+    # Adjust column widths
+    with stage('column_widths'):
+        set_column_widths(ws_pivot, column_widths(pivot_table))
+
+    # Reorder sheets so that Pivot Table sheet is the first one
+    if df is not None:
+        wb.move_sheet(ws_filtered, offset=1)  # Move Filtered Data sheet to the second position
+    else:
+        wb.remove(ws_filtered)
+    
+    # Save the workbook to a file
+    with stage('wb.save'):
+        wb.save(output_file)
+    return output_files
+
+def cube_counts(csv_file):
+    # The export's count cube, brought up to date first (only rows appended since the last
+    # refresh are parsed). Every pivot-only report over whole hours is cut from it
+    with stage('incremental_ingest') as s:
+        counts, s.rows = update_hourly_counts(csv_file)
+    return counts
+
+def automate_process(csv_file, hour, output_file, streaming=None, engine=DEFAULT_ENGINE, filtered_data='sheet', date=None):
+    # Very large exports are streamed in chunks unless streaming is forced on/off.
+    # Without the rows in the output (filtered_data='none') the pivot comes from the count cube.
+    # date limits the report to that date's hour instead of the hour of every day in the export
+    if date is not None:
+        start = pd.Timestamp(date).normalize() + pd.Timedelta(hours=hour)
+        return automate_range_process(csv_file, start, start + pd.Timedelta(hours=1), output_file,
+                                      streaming, engine, filtered_data)
+    if filtered_data == 'none':
+        with stage('pivot'):
+            pivot_table = pivot_for_slice(cube_counts(csv_file), hour=hour)
+        return save_to_excel(None, pivot_table, output_file, engine, filtered_data)
+    if streaming is None:
+        streaming = should_stream(csv_file)
+    if streaming:
+        with stage('stream_ingest') as s:
+            filtered_df, pivot_table = stream_filtered_pivot(csv_file, hour=hour)
+            s.rows = len(filtered_df)
+    else:
+        df = read_zoho_export(csv_file)
+        filtered_df = filter_by_hour(df, hour)
+        pivot_table = create_pivot_table(filtered_df)
+    return save_to_excel(filtered_df, pivot_table, output_file, engine, filtered_data)
+
+def automate_day_process(csv_file, day, output_file, streaming=None, engine=DEFAULT_ENGINE, filtered_data='sheet'):
+    # Pivot only (filtered_data='none') comes from the count cube without the rows
+    if filtered_data == 'none':
+        with stage('pivot'):
+            pivot_table = pivot_for_slice(cube_counts(csv_file), day=day)
+        return save_to_excel(None, pivot_table, output_file, engine, filtered_data)
+    if streaming is None:
+        streaming = should_stream(csv_file)
+    if streaming:
+        with stage('stream_ingest') as s:
+            filtered_df, pivot_table = stream_filtered_pivot(csv_file, day=day)
+            s.rows = len(filtered_df)
+    else:
+        df = read_zoho_export(csv_file)
+        filtered_df = filter_by_day(df, day)
+        pivot_table = create_pivot_table(filtered_df)
+    return save_to_excel(filtered_df, pivot_table, output_file, engine, filtered_data)
+
+def automate_live_process(csv_file, hour, output_file):
+    # Live refresh during the shift: only the rows appended to the export since the last refresh
+    # are parsed and merged into the saved counts, then the hour's pivot is written on its own
+    with stage('incremental_ingest') as s:
+        counts, new_rows = update_hourly_counts(csv_file)
+        s.rows = new_rows
+    with stage('pivot'):
+        pivot_table = pivot_for_slice(counts, hour=hour)
+    save_hourly_pivots_to_excel({hour: pivot_table}, output_file)
+    return new_rows
+
+def automate_range_process(csv_file, start, end, output_file, streaming=None, engine=DEFAULT_ENGINE, filtered_data='none'):
+    # Productivity for the tickets closed in [start, end) (a shift, several days, 16:30-17:30, ...).
+    # A pivot-only report over whole hours is cut from the export's count cube without the rows;
+    # anything else comes from the rows cut by filter_by_window
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    if filtered_data == 'none' and start == start.floor('h') and end == end.floor('h'):
+        with stage('pivot'):
+            pivot_table = pivot_for_slice(cube_counts(csv_file), start=start, end=end)
+        return save_to_excel(None, pivot_table, output_file, engine, filtered_data)
+
+    columns = PIVOT_COLUMNS if filtered_data == 'none' else None
+    if streaming is None:
+        streaming = should_stream(csv_file)
+    if streaming:
+        with stage('stream_ingest') as s:
+            filtered_df, pivot_table = stream_filtered_pivot(csv_file, start=start, end=end, usecols=columns,
+                                                             keep_rows=filtered_data != 'none')
+            s.rows = len(filtered_df) if filtered_df is not None else None
+    else:
+        df = read_zoho_export(csv_file, columns=columns)
+        filtered_df = filter_by_window(df, start, end)
+        pivot_table = create_pivot_table(filtered_df)
+    return save_to_excel(filtered_df, pivot_table, output_file, engine, filtered_data)
+
+def save_hourly_pivots_to_excel(pivot_tables, output_file):
+    # One styled pivot sheet per hour, in hour order, in a single workbook
+    wb = Workbook()
+    wb.remove(wb.active)
+
+    for hour, pivot_table in pivot_tables.items():
+        write_pivot_sheet(wb.create_sheet(title=f"Hour {hour}"), pivot_table)
+
+    with stage('wb.save'):
+        wb.save(output_file)
+
+def write_pivot_sheet(ws_pivot, pivot_table):
+    # A styled pivot-only sheet, owners as the first column
+    pivot_table = pivot_table.reset_index()
+    pivot_table.columns.name = None
+    pivot_table.rename(columns={'index': 'Ticket Owner'}, inplace=True)
+
+    with stage('dataframe_to_rows', rows=len(pivot_table)):
+        for r in dataframe_to_rows(pivot_table, index=False, header=True):
+            ws_pivot.append(r)
+
+    with stage('styling', rows=len(pivot_table)):
+        style_pivot_table(ws_pivot)
+    with stage('column_widths'):
+        set_column_widths(ws_pivot, column_widths(pivot_table))
+
+def automate_history_report(period, when, output_file, db_path=DEFAULT_DB):
+    # Productivity (and C-SAT, when surveys were ingested) for the hour, day, week or month-to-date
+    # containing `when`, answered from the history store instead of the exports
+    start, end = period_bounds(period, when)
+    with stage('history_query'):
+        tickets = ticket_counts(start, end, db_path)
+        surveys = survey_counts(start, end, db_path)
+    if tickets.empty and surveys.empty:
+        raise ValueError(f"The history has no tickets or surveys between {start:%d %b %Y %H:%M} and {end:%d %b %Y %H:%M}.")
+
+    wb = Workbook()
+    wb.remove(wb.active)
+    if not tickets.empty:
+        with stage('pivot'):
+            pivot_table = pivot_from_counts(tickets)
+        write_pivot_sheet(wb.create_sheet(title='Productivity'), pivot_table)
+    if not surveys.empty:
+        write_csat_sheet(wb.create_sheet(title='C-SAT'), csat_view(surveys, ['Agent Name']))
+
+    with stage('wb.save'):
+        wb.save(output_file)
+    return output_file
+
+def automate_day_by_hour(csv_file, output_file, separate_files=False, engine=DEFAULT_ENGINE):
+    # Parse the export once and cut it into every hour of the day with a single groupby.
+    # With separate_files, output_file is a pattern like 'Prod elsa3a {hour} yabasha.xlsx'.
+    if not separate_files:
+        # Pivots only: cut from the export's count cube, so the rows are only parsed when the
+        # export is new or was rewritten (appended rows are parsed on their own)
+        counts = cube_counts(csv_file)
+        with stage('pivot', rows=len(counts)):
+            hours = counts.index.get_level_values('Hour').unique().sort_values()
+            pivot_tables = {hour: pivot_for_slice(counts, hour=hour) for hour in hours}
+        save_hourly_pivots_to_excel(pivot_tables, output_file)
+        return [output_file]
+
+    df = read_zoho_export(csv_file)
+    with stage('pivot', rows=len(df)):
+        pivot_tables = pivot_tables_by_hour(df)
+
+    output_files = []
+    for hour, filtered_df in df.groupby(df['Ticket Closed Time'].dt.hour):
+        hour_file = output_file.format(hour=hour)
+        save_to_excel(filtered_df, pivot_tables[hour], hour_file, engine)
+        output_files.append(hour_file)
+    return output_files
+
+def shift_title(start_time):
+    # Sheet title of the shift starting at start_time ('10:00 PM' -> '10 PM-7 AM')
+    start = datetime.strptime(start_time, '%I:%M %p')
+    end = start + timedelta(hours=SHIFT_HOURS)
+    return f"{start:%I %p}-{end:%I %p}".lstrip('0').replace('-0', '-')
+
+def automate_shift_process(csv_file, output_file, day=None):
+    # Productivity per shift: one pivot sheet for every shift in SHIFT_START_TIMES, earliest start
+    # first, all in one workbook. Shifts start on the hour, so they are cut from the export's count
+    # cube, every shift in a single vectorized pass; with day, only the shifts that started that
+    # day (the 10 PM shift keeps its tickets from after midnight). Shifts overlap, so a ticket
+    # counts in each shift it falls in
+    shifts = sorted((datetime.strptime(start_time, '%I:%M %p'), start_time) for start_time in SHIFT_START_TIMES.values())
+    starts = [start.hour for start, _ in shifts]
+    counts = cube_counts(csv_file)
+    with stage('pivot', rows=len(counts)):
+        pivot_tables = shift_pivot_tables(counts, starts, SHIFT_HOURS, day=day)
+    if not pivot_tables:
+        raise ValueError("No tickets were closed in any shift of the selected day.")
+
+    wb = Workbook()
+    wb.remove(wb.active)
+    for start, (_, start_time) in zip(starts, shifts):
+        if start in pivot_tables:
+            write_pivot_sheet(wb.create_sheet(title=shift_title(start_time)), pivot_tables[start])
+
+    with stage('wb.save'):
+        wb.save(output_file)
+    return output_file
+
+# The exports each report is generated from, in the order all_report_jobs runs them
+EXPORT_PATTERNS = ('ghassan.csv', 'L2*.csv', 'IVR*.csv')
+
+def export_report_job(csv_file, hour=None, day=None, now=None):
+    # The report job an export feeds: ghassan.csv the hourly report (last full hour by default),
+    # L2*.csv the daily one (today) and IVR*.csv the C-SAT. Outputs go next to the export.
+    # Returns None for any other file
+    now = now or datetime.now()
+    if hour is None:
+        hour = (now - timedelta(hours=1)).hour
+    if day is None:
+        day = now.day
+
+    folder, name = os.path.split(csv_file)
+    if fnmatch(name, 'ghassan.csv'):
+        output_file = os.path.join(folder, 'Prod elsa3a ' + str(hour) + ' yabasha.xlsx')
+        return ("Productivity for an hour", automate_process, (csv_file, hour, output_file), output_file)
+    if fnmatch(name, 'L2*.csv'):
+        output_file = os.path.join(folder, 'Prod elyom ' + str(day) + ' yabasha.xlsx')
+        return ("Productivity for a day", automate_day_process, (csv_file, day, output_file), output_file)
+    if fnmatch(name, 'IVR*.csv'):
+        # The C-SAT covers every IVR export next to this one, not just the file that changed
+        ivr_files = ivr_exports(folder) or [csv_file]
+        output_file = os.path.join(folder, f"CSAT {now.strftime('%d_%H_%M')}.xlsx")
+        return ("C-SAT overday", process_and_export_to_excel, (ivr_files, output_file), output_file)
+    return None
+
+def ivr_exports(folder='.'):
+    # Every IVR export in the folder (CZ may split them per queue or per day), in name order
+    return sorted(glob.glob(os.path.join(glob.escape(folder), 'IVR*.csv')))
+
+def all_report_jobs(hour=None, day=None):
+    # Hourly (last full hour), daily (today) and C-SAT reports for whichever exports are in the folder
+    now = datetime.now()
+    jobs = []
+    for pattern in EXPORT_PATTERNS:
+        csv_files = glob.glob(pattern)
+        if csv_files:
+            jobs.append(export_report_job(csv_files[0], hour, day, now))
+    return jobs
+
+def generate_all_reports(hour=None, day=None, max_workers=None):
+    # All reports at once, each in its own process
+    return run_report_jobs(all_report_jobs(hour, day), max_workers)
+
+
+def process_and_export_to_excel(file_path, output_path):
+    # Load the IVR export (parsed once into numbers and cached); file_path can also be a list of
+    # exports, which are parsed in parallel and merged without duplicate surveys
+    data = read_ivr_exports(file_path)
+
+    # Every C-SAT view from one grouped pass over the export
+    with stage('csat_pivot', rows=len(data)):
+        views = csat_views(data)
+
+    # Export to Excel, one sheet per view
+    wb = Workbook()
+    wb.remove(wb.active)
+    for title, view in views.items():
+        write_csat_sheet(wb.create_sheet(title), view)
+
+    # Save the workbook
+    with stage('wb.save'):
+        wb.save(output_path)
+
+def write_csat_sheet(ws, view):
+    with stage('dataframe_to_rows', rows=len(view)):
+        # Write DataFrame to Excel
+        for r in dataframe_to_rows(view, index=False, header=True):
+            ws.append(r)
+
+    # Apply gradient color scale to the CSAT column, which is the last one
+    percent_col = view.columns.get_loc(CSAT_COLUMN) + 1
+    letter = get_column_letter(percent_col)
+    rule = ColorScaleRule(
+        start_type='min', start_value=0, start_color='f8696b',
+        mid_type='percentile', mid_value=50, mid_color='fede81',
+        end_type='max', end_value=100, end_color='63be7b'
+    )
+    ws.conditional_formatting.add(f"{letter}2:{letter}{ws.max_row}", rule)
+
+    with stage('styling', rows=len(view)):
+        # Apply formatting: highlighted header and Grand Total label, everything centered
+        style_csat_sheet(ws, percent_col=percent_col)
+
+    # Adjust column widths; CSAT is shown as a percentage, which never outgrows its header.
+    # The agent column gets some extra room
+    with stage('column_widths'):
+        widths = column_widths(view.drop(columns=[CSAT_COLUMN])) + [len(CSAT_COLUMN) + 2]
+        if view.columns[0] == 'Agent Name':
+            widths[0] += 8
+        set_column_widths(ws, widths)
+
+# Shift start as typed by the team leads (1 = 1 PM, 4 = 4 PM, 10 = 10 PM), every shift is 9 hours
+SHIFT_HOURS = 9
+SHIFT_START_TIMES = {
+    9: '09:00 AM',
+    7: '07:00 AM',
+    11: '11:00 AM',
+    10: '10:00 PM',
+    4: '04:00 PM',
+    1: '01:00 PM'
+}
+
+def generate_break_schedule(agent_names, start_time, break_schema):
+    # Define the columns for the DataFrame
+    if break_schema == '1':
+        columns = ['Agent Name', 'Start Time', '15 Min Break', '30 Min Break', '15 Min Break', 'End Time']
+    elif break_schema == '2':
+        columns = ['Agent Name', 'Start Time', '30 Min Break', '30 Min Break', 'End Time']
+    else:
+        raise ValueError("Invalid break schema. Choose '1' for schema: 15-30-15 or '2' for schema : 30-30.")
+    
+    data = []
+    
+    start = datetime.strptime(start_time, '%I:%M %p')
+    end = start + timedelta(hours=SHIFT_HOURS)
+    
+    # Initial break times for the first agent
+    break_time = start + timedelta(hours=2)
+
+    for i, agent_name in enumerate(agent_names):
+        if break_schema == '1':
+            first_break = break_time
+            second_break = first_break + timedelta(minutes=15) + timedelta(hours=2)
+            third_break = second_break + timedelta(minutes=30) + timedelta(hours=2)
+            break_time += timedelta(minutes=15)  # Next agent's first break is 15 mins later
+            row = [agent_name, start.strftime('%I:%M %p'), first_break.strftime('%I:%M %p'), 
+                   second_break.strftime('%I:%M %p'), third_break.strftime('%I:%M %p'), end.strftime('%I:%M %p')]
+        elif break_schema == '2':
+            first_break = break_time
+            second_break = first_break + timedelta(minutes=30) + timedelta(hours=3)
+            break_time += timedelta(minutes=30)  # Next agent's first break is 30 mins later
+            row = [agent_name, start.strftime('%I:%M %p'), first_break.strftime('%I:%M %p'), 
+                   second_break.strftime('%I:%M %p'), end.strftime('%I:%M %p')]
+        
+        data.append(row)
+    
+    df = pd.DataFrame(data, columns=columns)
+    return df
+def save_to_excel_break(df, filename):
+    wb = Workbook()
+    ws = wb.active
+
+    with stage('dataframe_to_rows', rows=len(df)):
+        for r in dataframe_to_rows(df, index=False, header=True):
+            ws.append(r)
+
+    # Green bold header, centered cells with black borders
+    with stage('styling', rows=len(df)):
+        style_break_sheet(ws)
+
+    # Adjust column widths
+    with stage('column_widths'):
+        set_column_widths(ws, column_widths(df))
+    
+    with stage('wb.save'):
+        wb.save(filename)
+
+def automate_break_schedule(agent_names, start_time, break_schema, output_file):
+    with stage('break_schedule', rows=len(agent_names)):
+        schedule_df = generate_break_schedule(agent_names, start_time, break_schema)
+    save_to_excel_break(schedule_df, output_file)
@@ -0,0 +1,96 @@
+from openpyxl.styles import NamedStyle, Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
+
+# Every style is registered once per workbook as a NamedStyle; cells then only reference
+# it by name instead of getting their own Font/PatternFill/Alignment/Border objects.
+PIVOT_HEADER = 'Pivot Header'
+PIVOT_CELL = 'Pivot Cell'
+CSAT_HEADER = 'CSAT Header'
+CSAT_TOTAL = 'CSAT Total'
+CSAT_CELL = 'CSAT Cell'
+CSAT_PERCENT = 'CSAT Percent'
+BREAK_HEADER = 'Break Header'
+BREAK_CELL = 'Break Cell'
+
+PIVOT_FILL_COLOR = "D9EAD3"
+CSAT_FILL_COLOR = "538DD5"
+BREAK_FILL_COLOR = "93c47d"
+
+
+def _thin_border(color=None):
+    side = Side(style='thin', color=color)
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def _solid_fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def _build_styles():
+    centered = Alignment(horizontal="center", vertical="center")
+    return [
+        NamedStyle(name=PIVOT_HEADER, font=Font(bold=True), fill=_solid_fill(PIVOT_FILL_COLOR), alignment=centered, border=_thin_border()),
+        NamedStyle(name=PIVOT_CELL, alignment=centered, border=_thin_border()),
+        NamedStyle(name=CSAT_HEADER, font=Font(bold=True), fill=_solid_fill(CSAT_FILL_COLOR), alignment=Alignment(horizontal='center')),
+        NamedStyle(name=CSAT_TOTAL, fill=_solid_fill(CSAT_FILL_COLOR), alignment=Alignment(horizontal='center')),
+        NamedStyle(name=CSAT_CELL, alignment=Alignment(horizontal='center')),
+        NamedStyle(name=CSAT_PERCENT, alignment=Alignment(horizontal='center'), number_format='0%'),
+        NamedStyle(name=BREAK_HEADER, font=Font(bold=True, color="000000"), fill=_solid_fill(BREAK_FILL_COLOR), alignment=centered, border=_thin_border('000000')),
+        NamedStyle(name=BREAK_CELL, alignment=centered, border=_thin_border('000000')),
+    ]
+
+
+def register_styles(wb):
+    # Safe to call more than once per workbook
+    for style in _build_styles():
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+
+def style_range(ws, style_name, min_row, max_row, min_col, max_col):
+    for row in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+        for cell in row:
+            cell.style = style_name
+
+
+def style_pivot_sheet(ws):
+    # Header row, owner column and Grand Total row are highlighted; the body is centered and bordered
+    register_styles(ws.parent)
+    max_row, max_col = ws.max_row, ws.max_column
+    style_range(ws, PIVOT_CELL, 2, max_row - 1, 2, max_col)
+    style_range(ws, PIVOT_HEADER, 1, 1, 1, max_col)
+    style_range(ws, PIVOT_HEADER, 2, max_row, 1, 1)
+    style_range(ws, PIVOT_HEADER, max_row, max_row, 2, max_col)
+
+
+def style_csat_sheet(ws, percent_col):
+    # Highlighted header row and Grand Total label, centered body, CSAT column as a percentage
+    register_styles(ws.parent)
+    max_row, max_col = ws.max_row, ws.max_column
+    style_range(ws, CSAT_CELL, 2, max_row, 1, max_col)
+    style_range(ws, CSAT_PERCENT, 2, max_row, percent_col, percent_col)
+    style_range(ws, CSAT_HEADER, 1, 1, 1, max_col)
+    style_range(ws, CSAT_TOTAL, max_row, max_row, 1, 1)
+
+
+def style_break_sheet(ws):
+    register_styles(ws.parent)
+    max_row, max_col = ws.max_row, ws.max_column
+    style_range(ws, BREAK_CELL, 2, max_row, 1, max_col)
+    style_range(ws, BREAK_HEADER, 1, 1, 1, max_col)
+
+
+def column_widths(df, padding=2):
+    # Width of each column from the frame itself: longest rendered value or header, plus padding.
+    # Done with vectorized string lengths so it never walks the worksheet cells.
+    widths = []
+    for position, column in enumerate(df.columns):
+        lengths = df.iloc[:, position].dropna().astype(str).str.len()
+        longest = lengths.max() if len(lengths) else 0
+        widths.append(int(max(len(str(column)), longest)) + padding)
+    return widths
+
+
+def set_column_widths(ws, widths):
+    for col, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
@@ -0,0 +1,55 @@
+import os
+import pandas as pd
+from pivots import CLOSED_TIME_FORMAT, pivot_from_counts
+from zoho_schema import drop_repeated_ids
+
+# Exports bigger than this are streamed instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+CHUNK_ROWS = 100_000
+
+
+def should_stream(csv_file):
+    return os.path.getsize(csv_file) > STREAMING_THRESHOLD_BYTES
+
+
+def stream_filtered_pivot(csv_file, hour=None, day=None, skip_rows=4, chunksize=CHUNK_ROWS, usecols=None, start=None, end=None, keep_rows=True):
+    # Read the export chunk by chunk, keep only the rows closed in the requested hour/day and
+    # add each chunk's Ticket Id counts to a running total. Peak memory is one chunk plus the
+    # matching rows (needed for the "Filtered Data" sheet), not the whole file.
+    # usecols projects the chunks down to those columns (the pivot's, when no rows are written);
+    # start/end keep the tickets closed in [start, end). Without keep_rows (nothing writes the
+    # rows out) only the counts are kept, so peak memory is one chunk, and None comes back as the rows
+    filtered_chunks = []
+    counts = None
+    seen_ids = None
+
+    for chunk in pd.read_csv(csv_file, skiprows=skip_rows, chunksize=chunksize, usecols=usecols):
+        # A Ticket Id already seen in an earlier chunk is counted once, as in the loaded export
+        chunk, seen_ids = drop_repeated_ids(chunk, seen_ids)
+        closed_time = pd.to_datetime(chunk['Ticket Closed Time'], format=CLOSED_TIME_FORMAT)
+        mask = pd.Series(True, index=chunk.index)
+        if hour is not None:
+            mask &= closed_time.dt.hour == hour
+        if day is not None:
+            mask &= closed_time.dt.day == day
+        if start is not None:
+            mask &= closed_time >= start
+        if end is not None:
+            mask &= closed_time < end
+        if not mask.any():
+            continue
+
+        chunk = chunk[mask].copy()
+        chunk['Ticket Closed Time'] = closed_time[mask]
+        if keep_rows:
+            filtered_chunks.append(chunk)
+
+        chunk_counts = chunk.groupby(['Ticket Owner', 'Team'])['Ticket Id'].count()
+        counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+
+    if counts is None:
+        raise ValueError(f"No tickets in {csv_file} were closed in the selected hours.")
+
+    filtered_df = pd.concat(filtered_chunks) if keep_rows else None
+    pivot_table = pivot_from_counts(counts[counts > 0])
+    return filtered_df, pivot_table
@@ -0,0 +1,178 @@
+import logging
+import os
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+# Per-stage instrumentation for the report pipelines: wall time, rows and process memory for
+# each stage (parse, dates, pivot, rows, styling, widths, save), written to a rotating log.
+#   with timings.run("Productivity for an hour") as run:   # groups the stages of one report
+#       with timings.stage('read_csv') as s:
+#           df = ...
+#           s.rows = len(df)
+#   run.summary()  -> one line per stage, for the Done dialog
+# Disabled (the default outside the GUI) stage() hands back one shared no-op object, so the
+# instrumented code pays a function call per stage and nothing else. MOON_TOOL_TIMINGS=1 turns
+# it on, and enable() sets it so worker processes started afterwards record too.
+ENV_VAR = 'MOON_TOOL_TIMINGS'
+LOG_FILE = 'moon_tool_timings.log'
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+logger = logging.getLogger('moon_tool.timings')
+_enabled = os.environ.get(ENV_VAR) == '1'
+_local = threading.local()
+_log_attached = False
+
+
+def enable(log_file=LOG_FILE):
+    global _enabled
+    _enabled = True
+    os.environ[ENV_VAR] = '1'
+    _attach_log(log_file)
+
+
+def disable():
+    global _enabled
+    _enabled = False
+    os.environ.pop(ENV_VAR, None)
+
+
+def is_enabled():
+    return _enabled
+
+
+def _attach_log(log_file=LOG_FILE):
+    # Once per process: worker processes started with spawn inherit MOON_TOOL_TIMINGS but not
+    # the handler, so their first stage() attaches it
+    global _log_attached
+    if _log_attached or logger.handlers:
+        return
+    _log_attached = True
+    try:
+        handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8')
+    except OSError:
+        return  # read-only folder: still measured and summarised, just not logged
+    handler.setFormatter(logging.Formatter('%(asctime)s pid=%(process)d %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _rss_mb():
+    # Current resident memory of this process; None where it cannot be read cheaply
+    try:
+        if sys.platform.startswith('linux'):
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def _format_stage(record):
+    text = f"{record['name']}: {record['seconds']:.3f} s"
+    if record['rows'] is not None:
+        text += f", {record['rows']:,} rows"
+    if record['rss_mb'] is not None:
+        text += f", {record['rss_mb']:.0f} MB ({record['rss_delta_mb']:+.0f})"
+    return text
+
+
+class _NullStage:
+    # What stage() returns while disabled; setting .rows on it is harmless
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self):
+        self.rss_before = _rss_mb()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        rss = _rss_mb()
+        record = {'name': self.name, 'seconds': seconds, 'rows': self.rows, 'rss_mb': rss,
+                  'rss_delta_mb': rss - self.rss_before if rss is not None and self.rss_before is not None else 0.0}
+        stages = getattr(_local, 'stages', None)
+        if stages is not None:
+            stages.append(record)
+        else:
+            logger.info(_format_stage(record))
+        return False
+
+
+def stage(name, rows=None):
+    if not _enabled:
+        return _NULL_STAGE
+    if not _log_attached:
+        _attach_log()
+    return _Stage(name, rows)
+
+
+class _Run:
+    def __init__(self, title):
+        self.title = title
+        self.stages = []
+        self.seconds = None
+
+    def __enter__(self):
+        if _enabled:
+            _attach_log()
+            self.outer = getattr(_local, 'stages', None)
+            _local.stages = self.stages
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if not _enabled:
+            return False
+        self.seconds = time.perf_counter() - self.start
+        _local.stages = self.outer
+        status = 'failed' if exc_info[0] is not None else 'done'
+        logger.info(f"{self.title} {status} in {self.seconds:.3f} s")
+        for record in self.stages:
+            logger.info('  ' + _format_stage(record))
+        return False
+
+    def summary(self):
+        # Slowest stages first; '' when timings are off
+        if self.seconds is None:
+            return ''
+        lines = [f"Total: {self.seconds:.2f} s"]
+        lines += [_format_stage(record) for record in sorted(self.stages, key=lambda r: r['seconds'], reverse=True)]
+        return "\n".join(lines)
+
+
+def run(title):
+    return _Run(title)
@@ -0,0 +1,98 @@
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils.dataframe import dataframe_to_rows
+from timings import stage
+from sheet_styles import PIVOT_FILL_COLOR, PIVOT_HEADER, PIVOT_CELL, register_styles, column_widths, set_column_widths
+
+try:
+    import xlsxwriter
+except ImportError:  # optional, only needed for engine='xlsxwriter'
+    xlsxwriter = None
+
+# 'openpyxl' builds the whole workbook in memory (Cell object per value) and is handled by
+# save_to_excel itself; the other engines stream rows to disk with constant memory
+ENGINES = ('openpyxl', 'write_only', 'xlsxwriter')
+DEFAULT_ENGINE = 'write_only'
+
+def _is_highlighted(r_idx, c_idx, last_row):
+    # Header row, owner column and Grand Total row are bold and filled
+    return r_idx == 1 or c_idx == 1 or r_idx == last_row
+
+
+def _blank_missing(row):
+    # NaN/NaT are written as empty cells, like openpyxl does
+    return [None if value is None or value != value else value for value in row]
+
+
+def save_report_write_only(df, pivot_table, output_file):
+    wb = Workbook(write_only=True)
+
+    # Sheets are created in their final order since write-only sheets cannot be moved
+    ws_pivot = wb.create_sheet(title="Pivot Table")
+    with stage('column_widths'):
+        set_column_widths(ws_pivot, column_widths(pivot_table))
+
+    # Styling happens while the pivot rows are written, so it is part of this stage
+    register_styles(wb)
+    last_row = len(pivot_table) + 1
+    with stage('pivot_rows+styling', rows=len(pivot_table)):
+        for r_idx, row in enumerate(dataframe_to_rows(pivot_table, index=False, header=True), 1):
+            cells = []
+            for c_idx, value in enumerate(row, 1):
+                cell = WriteOnlyCell(ws_pivot, value=value)
+                cell.style = PIVOT_HEADER if _is_highlighted(r_idx, c_idx, last_row) else PIVOT_CELL
+                cells.append(cell)
+            ws_pivot.append(cells)
+
+    # Write-only sheets are streamed to a temporary file as rows are appended
+    if df is not None:
+        ws_filtered = wb.create_sheet(title="Filtered Data")
+        with stage('dataframe_to_rows', rows=len(df)):
+            for r in dataframe_to_rows(df, index=False, header=True):
+                ws_filtered.append(r)
+
+    with stage('wb.save'):
+        wb.save(output_file)
+
+
+def save_report_xlsxwriter(df, pivot_table, output_file):
+    if xlsxwriter is None:
+        raise ImportError("The 'xlsxwriter' engine needs the xlsxwriter package (pip install xlsxwriter).")
+
+    wb = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd h:mm:ss'})
+    highlighted = wb.add_format({'bold': True, 'bg_color': '#' + PIVOT_FILL_COLOR, 'align': 'center', 'valign': 'vcenter', 'border': 1})
+    plain = wb.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1})
+
+    ws_pivot = wb.add_worksheet("Pivot Table")
+    with stage('column_widths'):
+        for c_idx, width in enumerate(column_widths(pivot_table)):
+            ws_pivot.set_column(c_idx, c_idx, width)
+
+    last_row = len(pivot_table) + 1
+    with stage('pivot_rows+styling', rows=len(pivot_table)):
+        for r_idx, row in enumerate(dataframe_to_rows(pivot_table, index=False, header=True), 1):
+            for c_idx, value in enumerate(_blank_missing(row), 1):
+                cell_format = highlighted if _is_highlighted(r_idx, c_idx, last_row) else plain
+                if value is None:
+                    ws_pivot.write_blank(r_idx - 1, c_idx - 1, None, cell_format)
+                else:
+                    ws_pivot.write(r_idx - 1, c_idx - 1, value, cell_format)
+
+    if df is not None:
+        ws_filtered = wb.add_worksheet("Filtered Data")
+        with stage('dataframe_to_rows', rows=len(df)):
+            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True)):
+                ws_filtered.write_row(r_idx, 0, _blank_missing(row))
+
+    with stage('wb.save'):
+        wb.close()
+
+
+def save_report(df, pivot_table, output_file, engine):
+    # pivot_table must already have 'Ticket Owner' as its first column; df None writes the pivot only
+    if engine == 'write_only':
+        save_report_write_only(df, pivot_table, output_file)
+    elif engine == 'xlsxwriter':
+        save_report_xlsxwriter(df, pivot_table, output_file)
+    else:
+        raise ValueError(f"Unknown Excel engine '{engine}'. Choose one of: {', '.join(ENGINES)}.")
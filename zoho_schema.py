@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+from csv_cache import read_csv_cached
+from pivots import CLOSED_TIME_FORMAT, parse_closed_time
+from timings import stage
+
+# Typed ingest for the Zoho ticket exports (ghassan.csv / L2*.csv). The export is parsed once
+# into this schema and cached that way, so the filters and pivots never re-parse dates and
+# group on category codes instead of Python strings.
+ZOHO_SKIP_ROWS = 4
+PIVOT_COLUMNS = ['Ticket Id', 'Ticket Owner', 'Team', 'Ticket Closed Time']
+CATEGORY_COLUMNS = ('Ticket Owner', 'Team')
+
+
+def apply_zoho_schema(df):
+    # Dates parsed once, Ticket Id in the smallest integer type that holds it
+    parse_closed_time(df)
+    if pd.api.types.is_integer_dtype(df['Ticket Id']):
+        df['Ticket Id'] = pd.to_numeric(df['Ticket Id'], downcast='integer')
+    return df
+
+
+def drop_repeated_ids(df, seen_ids=None):
+    # Every Ticket Id is counted once, as the count cube counts it: a row whose Ticket Id already
+    # appeared (earlier in df, or in seen_ids, the sorted int64 ids of the rows handled before) is
+    # dropped and the first one kept. Rows without a Ticket Id stay. Returns the rows and the seen
+    # ids with df's merged in, still sorted
+    seen_ids = np.empty(0, dtype=np.int64) if seen_ids is None else seen_ids
+    present = df['Ticket Id'].notna().to_numpy()
+    ids = df['Ticket Id'][present].to_numpy(dtype=np.int64)
+    repeated = pd.Series(ids).duplicated().to_numpy()
+    if len(seen_ids):
+        repeated = repeated | np.isin(ids, seen_ids)
+    # Merged in place of a re-sort: the new ids go where a binary search puts them
+    new_ids = np.sort(ids[~repeated])
+    seen_ids = np.insert(seen_ids, np.searchsorted(seen_ids, new_ids), new_ids)
+    if not repeated.any():
+        return df, seen_ids
+    keep = np.ones(len(df), dtype=bool)
+    keep[present] = ~repeated
+    return df[keep], seen_ids
+
+
+def prepare_zoho_export(df):
+    # What the cache holds: the typed export with repeated Ticket Ids dropped
+    df, _ = drop_repeated_ids(apply_zoho_schema(df))
+    return df.reset_index(drop=True)
+
+
+def read_zoho_export(file_path, columns=None, skip_rows=ZOHO_SKIP_ROWS):
+    # columns projects the export down to just those columns (e.g. PIVOT_COLUMNS when no
+    # "Filtered Data" sheet is written); None keeps every column
+    dtype = {column: 'category' for column in CATEGORY_COLUMNS}
+    return read_csv_cached(file_path, prepare=prepare_zoho_export, skiprows=skip_rows, usecols=columns, dtype=dtype)
+
+
+def closed_time(df):
+    # "Ticket Closed Time" as datetimes without touching the caller's frame
+    closed = df['Ticket Closed Time']
+    if not pd.api.types.is_datetime64_any_dtype(closed):
+        with stage('to_datetime', rows=len(closed)):
+            closed = pd.to_datetime(closed, format=CLOSED_TIME_FORMAT)
+    return closed
+
+
+def filter_rows(df, mask, closed):
+    # The selected rows as a new frame, with parsed dates for the "Filtered Data" sheet
+    filtered_df = df[mask]
+    if filtered_df['Ticket Closed Time'].dtype != closed.dtype:
+        filtered_df = filtered_df.assign(**{'Ticket Closed Time': closed[mask]})
+    return filtered_df
+
+
+def take_rows(df, positions, closed):
+    # filter_rows for row positions (e.g. from a time_index window) instead of a boolean mask
+    filtered_df = df.iloc[positions]
+    if filtered_df['Ticket Closed Time'].dtype != closed.dtype:
+        filtered_df = filtered_df.assign(**{'Ticket Closed Time': closed.iloc[positions]})
+    return filtered_df